@@ -4,20 +4,20 @@
 
 from __future__ import annotations
 
-from typing import Literal
+from typing import Literal, Optional
 
 from fastapi import APIRouter, Depends, Header, Query, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import extract_bearer_token
-from app.db.database import get_db
+from app.db.database import get_async_db
 from app.schemas.closet import (
     ClosetItemsResponse,
     DeleteClosetItemResponse,
     SaveClosetItemRequest,
     SaveClosetItemResponse,
 )
-from app.services.auth_service import get_user_from_token
+from app.services.auth_service import get_authenticated_user_async
 from app.services.closet_service import delete_closet_item, get_closet_items, save_closet_item
 
 router = APIRouter(prefix="/closet", tags=["Closet"])
@@ -35,8 +35,10 @@ async def get_closet_items_endpoint(
     category: CategoryFilter = Query(default="all", description="카테고리 필터"),
     page: int = Query(default=1, ge=1, description="페이지 번호"),
     limit: int = Query(default=20, ge=1, le=50, description="페이지당 개수"),
+    cursor: Optional[str] = Query(default=None, description="이전 응답의 nextCursor (있으면 page 대신 사용)"),
+    include_total: bool = Query(default=False, alias="includeTotal", description="cursor 조회 시 전체 개수 포함 여부"),
     authorization: str = Header(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> ClosetItemsResponse:
     """
     옷장에 저장된 아이템 목록을 조회합니다.
@@ -48,7 +50,7 @@ async def get_closet_items_endpoint(
     token = extract_bearer_token(authorization)
     
     # 토큰 검증 및 사용자 조회
-    user = get_user_from_token(db, token)
+    user = await get_authenticated_user_async(db, token)
     
     # 옷장 아이템 목록 조회
     items, pagination, category_counts = await get_closet_items(
@@ -57,6 +59,8 @@ async def get_closet_items_endpoint(
         category=category,
         page=page,
         limit=limit,
+        cursor=cursor,
+        include_total=include_total,
     )
     
     # 응답 반환
@@ -77,7 +81,7 @@ async def get_closet_items_endpoint(
 async def save_closet_item_endpoint(
     request: SaveClosetItemRequest,
     authorization: str = Header(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> SaveClosetItemResponse:
     """
     아이템을 옷장에 저장합니다.
@@ -88,10 +92,10 @@ async def save_closet_item_endpoint(
     token = extract_bearer_token(authorization)
     
     # 토큰 검증 및 사용자 조회
-    user = get_user_from_token(db, token)
+    user = await get_authenticated_user_async(db, token)
     
     # 옷장에 아이템 저장
-    saved_at = save_closet_item(
+    saved_at = await save_closet_item(
         db=db,
         user_id=user.user_id,
         item_id=request.item_id,
@@ -114,7 +118,7 @@ async def save_closet_item_endpoint(
 async def delete_closet_item_endpoint(
     item_id: int,
     authorization: str = Header(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> DeleteClosetItemResponse:
     """
     옷장에서 아이템을 삭제합니다.
@@ -126,10 +130,10 @@ async def delete_closet_item_endpoint(
     token = extract_bearer_token(authorization)
     
     # 토큰 검증 및 사용자 조회
-    user = get_user_from_token(db, token)
+    user = await get_authenticated_user_async(db, token)
     
     # 옷장에서 아이템 삭제
-    deleted_at = delete_closet_item(
+    deleted_at = await delete_closet_item(
         db=db,
         user_id=user.user_id,
         item_id=item_id,
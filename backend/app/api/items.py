@@ -12,7 +12,7 @@ from sqlalchemy.orm import Session
 from app.core.security import extract_bearer_token
 from app.db.database import get_db
 from app.schemas.items import ItemDetailPayload, ItemDetailResponse, ItemDetailResponseData
-from app.services.auth_service import get_user_from_token
+from app.services.auth_service import get_authenticated_user
 from app.services.item_service import get_item_by_id
 
 # 아이템 관련 라우터(접두사: /items)
@@ -66,7 +66,7 @@ def read_item_detail(
     token = extract_bearer_token(authorization)
     
     # 사용자 조회
-    get_user_from_token(db, token)
+    get_authenticated_user(db, token)
 
     # 아이템 조회
     item = get_item_by_id(db, item_id)
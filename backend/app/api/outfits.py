@@ -4,13 +4,13 @@
 
 from __future__ import annotations
 
-from typing import Literal
+from typing import Literal, Optional
 
 from fastapi import APIRouter, Depends, Header, Query, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import extract_bearer_token
-from app.db.database import get_db
+from app.db.database import get_async_db
 from app.schemas.recommendation_response import (
     RecommendationsResponse,
     RecommendationsResponseData,
@@ -18,20 +18,29 @@ from app.schemas.recommendation_response import (
 from app.schemas.outfits import (
     AddFavoriteResponse,
     AddFavoriteResponseData,
+    RecordSwipesRequest,
+    RecordSwipesResponse,
+    RecordSwipesResponseData,
     RecordViewLogRequest,
     RecordViewLogResponse,
     RecordViewLogResponseData,
+    RecordViewLogsRequest,
+    RecordViewLogsResponse,
+    RecordViewLogsResponseData,
     RemoveFavoriteResponse,
     RemoveFavoriteResponseData,
     SkipOutfitResponse,
     SkipOutfitResponseData,
+    SwipeResult,
 )
-from app.services.auth_service import get_user_from_token
+from app.services.auth_service import get_authenticated_user_async
 from app.services.outfits_service import (
     add_favorite,
     get_favorite_outfits,
     get_outfits_list,
+    record_swipes,
     record_view_log,
+    record_view_logs,
     remove_favorite,
     skip_outfit,
 )
@@ -60,8 +69,10 @@ async def get_outfits(
     gender: GenderFilter = Query(default="all", description="성별 필터"),
     page: int = Query(default=1, ge=1, description="페이지 번호"),
     limit: int = Query(default=20, ge=1, le=50, description="페이지당 개수"),
+    cursor: Optional[str] = Query(default=None, description="이전 응답의 nextCursor (있으면 page 대신 사용)"),
+    include_total: bool = Query(default=False, alias="includeTotal", description="cursor 조회 시 전체 개수 포함 여부"),
     authorization: str = Header(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> RecommendationsResponse:
     """
     필터링된 코디 목록을 조회합니다.
@@ -73,7 +84,7 @@ async def get_outfits(
     token = extract_bearer_token(authorization)
     
     # 토큰 검증 및 사용자 조회
-    user = get_user_from_token(db, token)
+    user = await get_authenticated_user_async(db, token)
     
     # 코디 목록 조회
     outfits, pagination = await get_outfits_list(
@@ -84,6 +95,8 @@ async def get_outfits(
         gender=gender,
         page=page,
         limit=limit,
+        cursor=cursor,
+        include_total=include_total,
     )
     
     # 응답 반환
@@ -103,22 +116,22 @@ async def get_outfits(
 async def skip_outfit_endpoint(
     outfit_id: int,
     authorization: str = Header(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> SkipOutfitResponse:
     """
     코디를 스킵으로 기록합니다.
     
-    이미 좋아요한 코디는 스킵으로 변경되지 않으며, 예외 없이 기존 레코드를 반환합니다.
+    이미 좋아요한(또는 선호로 선택한) 코디는 스킵으로 변경되지 않으며, 예외 없이 기존 레코드를 반환합니다.
     이미 스킵된 코디는 idempotent하게 처리되어 기존 레코드를 반환합니다.
     """
     # 헤더에서 토큰 추출
     token = extract_bearer_token(authorization)
     
     # 토큰 검증 및 사용자 조회
-    user = get_user_from_token(db, token)
+    user = await get_authenticated_user_async(db, token)
     
     # 스킵 기록
-    interaction = skip_outfit(
+    interaction = await skip_outfit(
         db=db,
         user_id=user.user_id,
         coordi_id=outfit_id,
@@ -143,7 +156,7 @@ async def record_view_log_endpoint(
     outfit_id: int,
     request: RecordViewLogRequest,
     authorization: str = Header(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> RecordViewLogResponse:
     """
     코디 조회 로그를 기록합니다.
@@ -154,10 +167,10 @@ async def record_view_log_endpoint(
     token = extract_bearer_token(authorization)
     
     # 토큰 검증 및 사용자 조회
-    user = get_user_from_token(db, token)
+    user = await get_authenticated_user_async(db, token)
     
     # 조회 로그 기록
-    recorded_at = record_view_log(
+    recorded_at = await record_view_log(
         db=db,
         user_id=user.user_id,
         coordi_id=outfit_id,
@@ -173,6 +186,90 @@ async def record_view_log_endpoint(
     )
 
 
+@router.post(
+    "/view-logs",
+    status_code=status.HTTP_200_OK,
+    response_model=RecordViewLogsResponse,
+)
+async def record_view_logs_endpoint(
+    request: RecordViewLogsRequest,
+    authorization: str = Header(...),
+    db: AsyncSession = Depends(get_async_db),
+) -> RecordViewLogsResponse:
+    """
+    여러 코디 조회 로그를 한 번에 기록합니다 (최대 100건).
+    
+    존재하지 않는 코디는 오류 없이 ignoredOutfitIds로 반환되며,
+    같은 코디의 짧은 시간 내 반복 조회는 하나의 로그로 병합됩니다.
+    """
+    # 헤더에서 토큰 추출
+    token = extract_bearer_token(authorization)
+    
+    # 토큰 검증 및 사용자 조회
+    user = await get_authenticated_user_async(db, token)
+    
+    # 조회 로그 일괄 기록
+    accepted_count, ignored_outfit_ids = await record_view_logs(
+        db=db,
+        user_id=user.user_id,
+        views=[(view.outfit_id, view.duration_seconds, view.viewed_at) for view in request.views],
+    )
+    
+    # 응답 반환
+    return RecordViewLogsResponse(
+        data=RecordViewLogsResponseData(
+            acceptedCount=accepted_count,
+            ignoredOutfitIds=ignored_outfit_ids,
+        )
+    )
+
+
+@router.post(
+    "/swipes",
+    status_code=status.HTTP_200_OK,
+    response_model=RecordSwipesResponse,
+)
+async def record_swipes_endpoint(
+    request: RecordSwipesRequest,
+    authorization: str = Header(...),
+    db: AsyncSession = Depends(get_async_db),
+) -> RecordSwipesResponse:
+    """
+    한 스와이프 세션의 좋아요/스킵을 한 번에 기록합니다 (최대 100건).
+    
+    개별 좋아요/스킵 API와 같은 규칙(좋아요 우선, 기존 좋아요/선호 기록 유지)으로 처리되며,
+    이미 좋아요한 코디나 존재하지 않는 코디(ignoredOutfitIds)도 오류 없이 처리됩니다.
+    """
+    # 헤더에서 토큰 추출
+    token = extract_bearer_token(authorization)
+    
+    # 토큰 검증 및 사용자 조회
+    user = await get_authenticated_user_async(db, token)
+    
+    # 좋아요/스킵 일괄 기록
+    results, ignored_outfit_ids = await record_swipes(
+        db=db,
+        user_id=user.user_id,
+        swipes=[(swipe.outfit_id, swipe.action) for swipe in request.swipes],
+    )
+    
+    # 응답 반환
+    return RecordSwipesResponse(
+        data=RecordSwipesResponseData(
+            results=[
+                SwipeResult(
+                    outfitId=result.coordi_id,
+                    actionType=result.action_type,
+                    interactedAt=result.interacted_at,
+                    changed=result.changed,
+                )
+                for result in results
+            ],
+            ignoredOutfitIds=ignored_outfit_ids,
+        )
+    )
+
+
 @router.get(
     "/favorites",
     status_code=status.HTTP_200_OK,
@@ -181,8 +278,10 @@ async def record_view_log_endpoint(
 async def get_favorite_outfits_endpoint(
     page: int = Query(default=1, ge=1, description="페이지 번호"),
     limit: int = Query(default=20, ge=1, le=50, description="페이지당 개수"),
+    cursor: Optional[str] = Query(default=None, description="이전 응답의 nextCursor (있으면 page 대신 사용)"),
+    include_total: bool = Query(default=False, alias="includeTotal", description="cursor 조회 시 전체 개수 포함 여부"),
     authorization: str = Header(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> RecommendationsResponse:
     """
     사용자가 좋아요한 코디 목록을 조회합니다.
@@ -193,7 +292,7 @@ async def get_favorite_outfits_endpoint(
     token = extract_bearer_token(authorization)
     
     # 토큰 검증 및 사용자 조회
-    user = get_user_from_token(db, token)
+    user = await get_authenticated_user_async(db, token)
     
     # 좋아요한 코디 목록 조회
     outfits, pagination = await get_favorite_outfits(
@@ -201,6 +300,8 @@ async def get_favorite_outfits_endpoint(
         user_id=user.user_id,
         page=page,
         limit=limit,
+        cursor=cursor,
+        include_total=include_total,
     )
     
     # 응답 반환
@@ -220,7 +321,7 @@ async def get_favorite_outfits_endpoint(
 async def add_favorite_endpoint(
     outfit_id: int,
     authorization: str = Header(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> AddFavoriteResponse:
     """
     코디에 좋아요를 추가합니다.
@@ -231,10 +332,10 @@ async def add_favorite_endpoint(
     token = extract_bearer_token(authorization)
     
     # 토큰 검증 및 사용자 조회
-    user = get_user_from_token(db, token)
+    user = await get_authenticated_user_async(db, token)
     
     # 좋아요 추가
-    interaction = add_favorite(
+    interaction = await add_favorite(
         db=db,
         user_id=user.user_id,
         coordi_id=outfit_id,
@@ -258,7 +359,7 @@ async def add_favorite_endpoint(
 async def remove_favorite_endpoint(
     outfit_id: int,
     authorization: str = Header(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> RemoveFavoriteResponse:
     """
     코디 좋아요를 취소합니다.
@@ -269,10 +370,10 @@ async def remove_favorite_endpoint(
     token = extract_bearer_token(authorization)
     
     # 토큰 검증 및 사용자 조회
-    user = get_user_from_token(db, token)
+    user = await get_authenticated_user_async(db, token)
     
     # 좋아요 취소
-    coordi_id, unfavorited_at = remove_favorite(
+    coordi_id, unfavorited_at = await remove_favorite(
         db=db,
         user_id=user.user_id,
         coordi_id=outfit_id,
@@ -5,15 +5,15 @@
 from __future__ import annotations
 
 from fastapi import APIRouter, Depends, Header, Query, status
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.security import extract_bearer_token
-from app.db.database import get_db
+from app.db.database import get_async_db
 from app.schemas.recommendation_response import (
     RecommendationsResponse,
     RecommendationsResponseData,
 )
-from app.services.auth_service import get_user_from_token
+from app.services.auth_service import get_authenticated_user_async
 from app.services.recommendations_service import get_recommended_coordis
 
 # 코디 추천 관련 라우터(접두사: /recommendations)
@@ -29,7 +29,7 @@ async def get_recommendations(
     page: int = Query(default=1, ge=1, description="페이지 번호"),
     limit: int = Query(default=20, ge=1, le=50, description="페이지당 개수"),
     authorization: str = Header(...),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ) -> RecommendationsResponse:
     """
     사용자 맞춤 코디 목록을 조회합니다.
@@ -41,7 +41,7 @@ async def get_recommendations(
     token = extract_bearer_token(authorization)
     
     # 토큰 검증 및 사용자 조회
-    user = get_user_from_token(db, token)
+    user = await get_authenticated_user_async(db, token)
     
     # 추천 코디 조회
     outfits, pagination = await get_recommended_coordis(
@@ -21,7 +21,7 @@ from app.schemas.users import (
     ProfilePhotoUploadResponseData,
     UserPreferencesRequest,
 )
-from app.services.auth_service import get_user_from_token
+from app.services.auth_service import get_authenticated_user
 from app.services.users_service import (
     delete_profile_photo,
     get_preferences_options_data,
@@ -49,7 +49,7 @@ def get_preferences_options(
     token = extract_bearer_token(authorization)
 
     # 토큰 검증 및 사용자 조회
-    user = get_user_from_token(db, token)
+    user = get_authenticated_user(db, token)
 
     # 선호도 설정 옵션 데이터 조회 (사용자 성별에 따라 필터링)
     hashtags, sample_outfits = get_preferences_options_data(db, user.gender)
@@ -80,7 +80,7 @@ def set_preferences(
     token = extract_bearer_token(authorization)
 
     # 토큰 검증 및 사용자 조회
-    user = get_user_from_token(db, token)
+    user = get_authenticated_user(db, token)
 
     # 선호도 설정
     updated_user = set_user_preferences(db, user.user_id, payload)
@@ -114,7 +114,7 @@ async def upload_profile_photo_endpoint(
     token = extract_bearer_token(authorization)
 
     # 토큰 검증 및 사용자 조회
-    user = get_user_from_token(db, token)
+    user = get_authenticated_user(db, token)
 
     # 프로필 사진 업로드
     user_image = await upload_profile_photo(db, user.user_id, photo)
@@ -144,7 +144,7 @@ async def delete_profile_photo_endpoint(
     token = extract_bearer_token(authorization)
 
     # 토큰 검증 및 사용자 조회
-    user = get_user_from_token(db, token)
+    user = get_authenticated_user(db, token)
 
     # 프로필 사진 삭제
     deleted_at, had_photo = await delete_profile_photo(db, user.user_id)
@@ -4,6 +4,8 @@
 
 from __future__ import annotations
 
+from typing import Optional
+
 from fastapi import APIRouter, BackgroundTasks, Depends, Header, Query, status
 from sqlalchemy.orm import Session
 
@@ -16,7 +18,7 @@ from app.schemas.virtual_fitting import (
     VirtualFittingRequest,
     VirtualFittingResponse,
 )
-from app.services.auth_service import get_user_from_token
+from app.services.auth_service import get_authenticated_user
 from app.services.virtual_fitting_service import (
     _process_virtual_fitting_async,
     delete_virtual_fitting_history,
@@ -61,6 +63,8 @@ router = APIRouter(prefix="/virtual-fitting", tags=["Virtual Fitting"])
 async def get_virtual_fitting_history_endpoint(
     page: int = Query(default=1, ge=1, description="페이지 번호"),
     limit: int = Query(default=20, ge=1, le=50, description="페이지당 개수"),
+    cursor: Optional[str] = Query(default=None, description="이전 응답의 nextCursor (있으면 page 대신 사용)"),
+    include_total: bool = Query(default=False, alias="includeTotal", description="cursor 조회 시 전체 개수 포함 여부"),
     authorization: str = Header(...),
     db: Session = Depends(get_db),
 ) -> FittingHistoryResponse:
@@ -73,7 +77,7 @@ async def get_virtual_fitting_history_endpoint(
     token = extract_bearer_token(authorization)
     
     # 토큰 검증 및 사용자 조회
-    user = get_user_from_token(db, token)
+    user = get_authenticated_user(db, token)
     
     # 가상 피팅 이력 조회
     history_data = get_virtual_fitting_history(
@@ -81,6 +85,8 @@ async def get_virtual_fitting_history_endpoint(
         user_id=user.user_id,
         page=page,
         limit=limit,
+        cursor=cursor,
+        include_total=include_total,
     )
     
     # 응답 반환
@@ -110,7 +116,7 @@ async def start_virtual_fitting_endpoint(
     token = extract_bearer_token(authorization)
     
     # 토큰 검증 및 사용자 조회
-    user = get_user_from_token(db, token)
+    user = get_authenticated_user(db, token)
     
     # 가상 피팅 작업 시작
     # 유효성 검증, 예외 처리, 기본 레코드 생성 등 필요한 작업을 수행
@@ -170,7 +176,7 @@ async def get_virtual_fitting_status_endpoint(
     token = extract_bearer_token(authorization)
     
     # 토큰 검증 및 사용자 조회
-    user = get_user_from_token(db, token)
+    user = get_authenticated_user(db, token)
     
     # 가상 피팅 상태 조회
     status_payload = get_virtual_fitting_status(
@@ -205,7 +211,7 @@ async def delete_virtual_fitting_history_endpoint(
     token = extract_bearer_token(authorization)
     
     # 토큰 검증 및 사용자 조회
-    user = get_user_from_token(db, token)
+    user = get_authenticated_user(db, token)
     
     # 가상 피팅 이력 삭제
     deleted_at = delete_virtual_fitting_history(
@@ -329,6 +329,16 @@ class InvalidPersonImageError(AppException):
     def __init__(self) -> None:
         super().__init__(message="사진에 사람이 포함되어 있지 않거나 포즈가 적절하지 않습니다")
 
+# 잘못된 페이지네이션 커서 예외
+class InvalidCursorError(AppException):
+    """cursor 값이 손상되었거나 다른 목록의 커서일 때 발생하는 예외."""
+
+    code = "INVALID_CURSOR"
+    status_code = status.HTTP_400_BAD_REQUEST
+
+    def __init__(self) -> None:
+        super().__init__(message="유효하지 않은 커서입니다")
+
 # 커스텀 예외 핸들러 등록
 def register_exception_handlers(app: FastAPI) -> None:
     """커스텀 예외를 FastAPI 인스턴스에 바인딩."""
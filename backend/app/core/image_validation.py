@@ -4,22 +4,34 @@
 
 from __future__ import annotations
 
+import threading
 from io import BytesIO
 
-import mediapipe as mp
 import numpy as np
 from PIL import Image
 
 from app.core.exceptions import InvalidPersonImageError
 
-# MediaPipe Pose 초기화 (모듈 레벨에서 한 번만 초기화)
-mp_pose = mp.solutions.pose
-pose = mp_pose.Pose(
-    static_image_mode=True,
-    model_complexity=1,
-    enable_segmentation=False,
-    min_detection_confidence=0.5,
-)
+# MediaPipe Pose (첫 사용 시 한 번만 초기화, 서버 시작 시간 단축)
+_pose = None
+_pose_lock = threading.Lock()
+
+
+def get_pose():
+    """MediaPipe Pose 인스턴스를 반환합니다 (최초 호출 시 mediapipe import 및 모델 로드)."""
+    global _pose
+    if _pose is None:
+        with _pose_lock:
+            if _pose is None:
+                import mediapipe as mp
+
+                _pose = mp.solutions.pose.Pose(
+                    static_image_mode=True,
+                    model_complexity=1,
+                    enable_segmentation=False,
+                    min_detection_confidence=0.5,
+                )
+    return _pose
 
 
 def validate_person_in_image(image_bytes: bytes) -> None:
@@ -36,6 +48,11 @@ def validate_person_in_image(image_bytes: bytes) -> None:
     Raises:
         InvalidPersonImageError: 사람이 포함되어 있지 않거나 포즈가 적절하지 않은 경우
     """
+    import mediapipe as mp
+
+    mp_pose = mp.solutions.pose
+    pose = get_pose()
+
     try:
         # 이미지 로드 및 RGB 변환
         image = Image.open(BytesIO(image_bytes))
@@ -0,0 +1,116 @@
+"""
+목록 API 공통 페이지네이션 (page 번호 / keyset 커서).
+
+무한 스크롤 목록(코디 목록, 좋아요 목록, 옷장, 가상 피팅 이력)은 `(정렬 시각, ID)` 내림차순으로 정렬되므로
+마지막으로 받은 행의 `(정렬 시각, ID)`를 불투명한 커서(nextCursor)로 돌려주고, 다음 요청에서는
+`OFFSET` 대신 `WHERE (정렬 시각, ID) < (커서 시각, 커서 ID)`로 이어서 조회합니다.
+복합 인덱스를 그대로 타므로 얼마나 깊이 스크롤했는지와 관계없이 같은 비용으로 다음 페이지를 가져옵니다.
+
+hasNext는 limit + 1개를 조회해 판단하므로 커서 모드에서는 COUNT(*)를 생략합니다
+(includeTotal=true일 때만 전체 개수를 계산). 기존 page 파라미터는 그대로 동작하며,
+page 모드 응답에도 nextCursor가 포함되어 클라이언트가 언제든 커서 모드로 넘어갈 수 있습니다.
+
+사용법:
+    position = decode_cursor("closet", cursor) if cursor else None
+    if position is not None:
+        query = query.where(keyset_before(UserClosetItem.added_at, UserClosetItem.item_id, position))
+    rows = (await db.execute(query.limit(limit + 1))).all()
+    rows, has_next, next_cursor = split_page(rows, limit, "closet", lambda r: (r.added_at, r.item_id))
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Callable, Optional, Sequence, Tuple, TypeVar
+
+from sqlalchemy import tuple_
+
+from app.core.exceptions import InvalidCursorError
+from app.schemas.common import PaginationPayload
+
+T = TypeVar("T")
+
+# (정렬 시각, 행 ID)
+CursorPosition = Tuple[datetime, int]
+
+
+def encode_cursor(scope: str, sort_value: datetime, row_id: int) -> str:
+    """목록 종류(scope)와 마지막 행의 (정렬 시각, ID)를 URL-safe 문자열로 인코딩합니다."""
+    raw = json.dumps([scope, sort_value.isoformat(), row_id], separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).rstrip(b"=").decode()
+
+
+def decode_cursor(scope: str, cursor: str) -> CursorPosition:
+    """
+    encode_cursor로 만든 커서를 (정렬 시각, ID)로 되돌립니다.
+
+    손상된 커서나 다른 목록(scope)의 커서는 InvalidCursorError(400)로 거부합니다.
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        cursor_scope, sort_value, row_id = json.loads(raw)
+        if cursor_scope != scope or not isinstance(row_id, int):
+            raise ValueError(cursor_scope)
+        return datetime.fromisoformat(sort_value), row_id
+    except (binascii.Error, UnicodeDecodeError, TypeError, ValueError):
+        raise InvalidCursorError()
+
+
+def keyset_before(sort_column, id_column, position: CursorPosition):
+    """`(sort_column, id_column) < position` 조건 (두 컬럼 모두 내림차순 정렬일 때의 다음 페이지)."""
+    return tuple_(sort_column, id_column) < tuple_(*position)
+
+
+def split_page(
+    rows: Sequence[T],
+    limit: int,
+    scope: str,
+    key: Callable[[T], CursorPosition],
+) -> Tuple[Sequence[T], bool, Optional[str]]:
+    """limit + 1개로 조회한 행을 (페이지 행, hasNext, nextCursor)로 나눕니다."""
+    has_next = len(rows) > limit
+    rows = rows[:limit]
+    next_cursor = encode_cursor(scope, *key(rows[-1])) if has_next and rows else None
+    return rows, has_next, next_cursor
+
+
+def page_pagination(
+    page: int,
+    limit: int,
+    total_items: int,
+    next_cursor: Optional[str] = None,
+) -> PaginationPayload:
+    """page 번호 모드의 페이지네이션 정보 (기존 응답과 동일한 필드 + nextCursor)."""
+    total_pages = (total_items + limit - 1) // limit if total_items > 0 else 0
+    return PaginationPayload(
+        currentPage=page,
+        totalPages=total_pages,
+        totalItems=total_items,
+        hasNext=page < total_pages,
+        hasPrev=page > 1,
+        nextCursor=next_cursor,
+    )
+
+
+def cursor_pagination(
+    has_next: bool,
+    next_cursor: Optional[str],
+    limit: int,
+    total_items: Optional[int] = None,
+    cursor: Optional[str] = None,
+) -> PaginationPayload:
+    """
+    커서 모드의 페이지네이션 정보 (currentPage 없음, 전체 개수는 요청한 경우에만).
+    hasPrev는 요청에 커서(cursor)가 있었는지로 결정합니다 (첫 페이지는 False).
+    """
+    return PaginationPayload(
+        currentPage=None,
+        totalPages=(total_items + limit - 1) // limit if total_items is not None else None,
+        totalItems=total_items,
+        hasNext=has_next,
+        hasPrev=cursor is not None,
+        nextCursor=next_cursor,
+    )
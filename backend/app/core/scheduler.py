@@ -4,38 +4,55 @@ from apscheduler.triggers.cron import CronTrigger
 import sys
 import os
 
-from app.services.training_service import run_night_training
+from app.services.training_jobs import run_training_job
 
 # 로깅 설정
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# API 프로세스 안에서 Night 학습을 실행할지 여부.
+# 기본값(false)에서는 별도 학습 워커(`python training_worker.py`)가 학습하며, API는 새 모델 버전만 읽습니다.
+# true로 켜더라도 advisory lock으로 여러 uvicorn 워커 중 하나만 학습합니다.
+NIGHT_TRAINING_IN_PROCESS = os.getenv("NIGHT_TRAINING_IN_PROCESS", "false").lower() in ("1", "true", "yes")
+
+# Night 학습 실행 시각 (매일)
+NIGHT_TRAINING_HOUR = int(os.getenv("NIGHT_TRAINING_HOUR", "3"))
+NIGHT_TRAINING_MINUTE = int(os.getenv("NIGHT_TRAINING_MINUTE", "0"))
+
 # Scheduler 인스턴스 생성
 scheduler = BackgroundScheduler()
 
 def train_night_model_job():
     """
-    매일 새벽 실행되는 Night Model 학습 작업.
+    매일 새벽 실행되는 Night Model 학습 작업 (API 프로세스 내 실행 모드).
     1. Night Model 재학습 (User & Item Embedding Update)
     2. 학습 결과로 DB의 'night_v1' 데이터 갱신
     3. 'day_v1' 데이터를 'night_v1' 값으로 초기화 (Reset)
+    4. 새 모델 버전으로 모든 유저의 Top-N 추천을 사전 계산 (멀티 프로세스 배치 스코어링)
+    5. 새로 발행된 모델 버전을 서빙 중인 Warm 추천 서비스에 반영 (백그라운드 로드)
     """
+    from app.services.warm_recommendation_service import request_warm_model_reload
+
     logger.info("[Scheduler] Starting Night Model Training Job...")
     
-    try:
-        run_night_training()
+    status = run_training_job(on_published=request_warm_model_reload)
+    if status == "succeeded":
         logger.info("[Scheduler] Night Model Training Job Completed Successfully.")
-    except Exception as e:
-        logger.error(f"[Scheduler] Night Model Training Job Failed: {e}")
+    elif status == "failed":
+        logger.error("[Scheduler] Night Model Training Job Failed.")
 
 
 def start_scheduler():
     """
     스케줄러 시작 함수. main.py에서 호출됨.
+    NIGHT_TRAINING_IN_PROCESS가 꺼져 있으면 (학습 워커 사용) 아무것도 하지 않습니다.
     """
+    if not NIGHT_TRAINING_IN_PROCESS:
+        logger.info("[Scheduler] In-process night training disabled. Run `python training_worker.py` to train.")
+        return
+
     if not scheduler.running:
-        # 매일 새벽 3시에 실행
-        trigger = CronTrigger(hour=3, minute=0)
+        trigger = CronTrigger(hour=NIGHT_TRAINING_HOUR, minute=NIGHT_TRAINING_MINUTE)
     
         scheduler.add_job(
             train_night_model_job,
@@ -45,7 +62,10 @@ def start_scheduler():
         )
         
         scheduler.start()
-        logger.info("[Scheduler] Background Scheduler Started. Night Training scheduled at 03:00 AM.")
+        logger.info(
+            f"[Scheduler] Background Scheduler Started. Night Training scheduled at "
+            f"{NIGHT_TRAINING_HOUR:02d}:{NIGHT_TRAINING_MINUTE:02d}."
+        )
 
 def shutdown_scheduler():
     """
@@ -7,6 +7,9 @@ from __future__ import annotations
 import hashlib
 import hmac
 import os
+import threading
+import time
+from collections import OrderedDict
 from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, Optional
 
@@ -20,6 +23,12 @@ ALGORITHM = os.getenv("JWT_ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("JWT_ACCESS_TOKEN_EXPIRE_MINUTES", "60"))
 PASSWORD_SALT = os.getenv("PASSWORD_SALT", "")
 
+# 검증된 토큰의 클레임을 보관할 최대 개수 (같은 토큰의 반복 서명 검증 방지)
+TOKEN_CLAIMS_CACHE_SIZE = int(os.getenv("JWT_CLAIMS_CACHE_SIZE", "10000"))
+
+_token_claims_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+_token_claims_lock = threading.Lock()
+
 
 def hash_password(password: str) -> str:
     """
@@ -78,7 +87,19 @@ def create_access_token(
 
 
 def decode_access_token(token: str) -> Dict[str, Any]:
-    """JWT 액세스 토큰을 복호화하고 검증한다."""
+    """
+    JWT 액세스 토큰을 복호화하고 검증한다.
+
+    검증에 성공한 토큰의 클레임은 만료 시각(exp)까지 메모리에 보관하여 재사용한다.
+    """
+
+    with _token_claims_lock:
+        payload = _token_claims_cache.get(token)
+        if payload is not None:
+            if payload.get("exp", 0) > time.time():
+                _token_claims_cache.move_to_end(token)
+                return payload
+            del _token_claims_cache[token]
 
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
@@ -87,6 +108,13 @@ def decode_access_token(token: str) -> Dict[str, Any]:
     except jwt.InvalidTokenError as exc:
         raise UnauthorizedError(message="유효하지 않은 토큰입니다") from exc
 
+    # exp가 없는 토큰은 만료 시점을 알 수 없으므로 보관하지 않음
+    if "exp" in payload:
+        with _token_claims_lock:
+            _token_claims_cache[token] = payload
+            while len(_token_claims_cache) > TOKEN_CLAIMS_CACHE_SIZE:
+                _token_claims_cache.popitem(last=False)
+
     return payload
 
 
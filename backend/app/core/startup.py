@@ -0,0 +1,150 @@
+"""
+애플리케이션 시작(startup) 단계 관리.
+
+무거운 리소스(임베딩 모델, Warm 추천 모델, MediaPipe Pose, DB 스키마 등)를 이름으로 등록해 두고
+lifespan에서는 백그라운드 스레드로 로드를 시작만 합니다. 로드가 끝나기 전에 요청이 들어오면
+`ensure_loaded()`가 같은 로드를 기다리거나(진행 중) 직접 실행합니다(아직 시작 전).
+
+각 단계(import, 리소스 로드)의 소요 시간은 기록되어 `/health/ready` 응답에 포함됩니다.
+`/health/ready`는 READINESS_REQUIRED_RESOURCES에 지정된 리소스가 모두 로드되었을 때만 200을 반환하므로
+Cloud Run 시작 프로브로 사용하면 필요한 모델이 준비된 인스턴스에만 트래픽이 전달됩니다.
+
+사용법:
+    register_resource("embedding_model", lambda: EmbeddingService())
+    load_in_background(["embedding_model"])
+
+    with startup_phase("import:app.api"):
+        from app.api import api_router
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# /health/ready가 200을 반환하기 위해 로드되어 있어야 하는 리소스 (쉼표 구분)
+READINESS_REQUIRED_RESOURCES = [
+    name.strip()
+    for name in os.getenv("READINESS_REQUIRED_RESOURCES", "database_schema,embedding_model").split(",")
+    if name.strip()
+]
+
+PENDING = "pending"
+LOADING = "loading"
+READY = "ready"
+FAILED = "failed"
+
+
+class StartupResource:
+    """이름이 붙은 지연 로드 리소스. 로더는 한 번만 (성공할 때까지) 실행됩니다."""
+
+    def __init__(self, name: str, loader: Callable[[], object]):
+        self.name = name
+        self.loader = loader
+        self.state = PENDING
+        self.error: Optional[str] = None
+        self.load_seconds: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def ensure_loaded(self) -> None:
+        """리소스를 로드합니다. 다른 스레드가 로드 중이면 끝날 때까지 기다립니다."""
+        if self.state == READY:
+            return
+        with self._lock:
+            if self.state == READY:
+                return
+            self.state = LOADING
+            start = time.perf_counter()
+            try:
+                self.loader()
+            except Exception as e:
+                self.state = FAILED
+                self.error = str(e)
+                logger.error(f"[Startup] Failed to load {self.name}: {e}")
+                raise
+            finally:
+                self.load_seconds = time.perf_counter() - start
+            self.state = READY
+            self.error = None
+            logger.info(f"[Startup] Loaded {self.name} in {self.load_seconds:.2f}s")
+
+
+_resources: Dict[str, StartupResource] = {}
+_phase_timings: Dict[str, float] = {}
+_started_at = time.perf_counter()
+
+
+@contextmanager
+def startup_phase(name: str):
+    """블록 실행 시간을 시작 단계 타이밍으로 기록합니다."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        _phase_timings[name] = time.perf_counter() - start
+        logger.info(f"[Startup] {name} took {_phase_timings[name]:.2f}s")
+
+
+def register_resource(name: str, loader: Callable[[], object]) -> StartupResource:
+    """지연 로드 리소스를 등록합니다 (이미 등록된 이름이면 기존 리소스를 반환)."""
+    if name not in _resources:
+        _resources[name] = StartupResource(name, loader)
+    return _resources[name]
+
+
+def ensure_loaded(name: str) -> None:
+    """등록된 리소스를 첫 사용 시점에 로드합니다 (등록되지 않은 이름은 무시)."""
+    resource = _resources.get(name)
+    if resource is not None:
+        resource.ensure_loaded()
+
+
+def is_loaded(name: str) -> bool:
+    resource = _resources.get(name)
+    return resource is not None and resource.state == READY
+
+
+def load_in_background(names: Iterable[str]) -> threading.Thread:
+    """
+    리소스들을 데몬 스레드 하나에서 순서대로 로드합니다.
+    하나가 실패해도 나머지는 계속 로드하며, 실패한 리소스는 다음 ensure_loaded 호출 때 다시 시도합니다.
+    """
+    names = [name for name in names if name in _resources]
+
+    def _run() -> None:
+        for name in names:
+            try:
+                _resources[name].ensure_loaded()
+            except Exception:
+                pass  # ensure_loaded에서 로그를 남김
+        _phase_timings["background_load_total"] = time.perf_counter() - _started_at
+
+    thread = threading.Thread(target=_run, name="startup-loader", daemon=True)
+    thread.start()
+    return thread
+
+
+def readiness(required: Optional[List[str]] = None) -> dict:
+    """필수 리소스의 준비 여부와 리소스별 상태, 단계별 타이밍을 반환합니다."""
+    required = READINESS_REQUIRED_RESOURCES if required is None else required
+    missing = [name for name in required if name in _resources and not is_loaded(name)]
+    return {
+        "ready": not missing,
+        "missing": missing,
+        "resources": {
+            name: {
+                "state": resource.state,
+                "load_seconds": resource.load_seconds,
+                "error": resource.error,
+            }
+            for name, resource in _resources.items()
+        },
+        "phases": dict(_phase_timings),
+        "uptime_seconds": time.perf_counter() - _started_at,
+    }
@@ -9,8 +9,6 @@ from pathlib import Path
 from typing import Optional
 
 import aiofiles
-from google.cloud import storage
-from google.oauth2 import service_account
 
 logger = logging.getLogger(__name__)
 
@@ -93,6 +91,10 @@ class GCSStorageService(StorageService):
     """Google Cloud Storage 서비스"""
 
     def __init__(self, bucket_name: str, credentials_path: Optional[str] = None):
+        # 로컬 모드에서는 google-cloud-storage를 import하지 않도록 지연 import
+        from google.cloud import storage
+        from google.oauth2 import service_account
+
         self.bucket_name = bucket_name
         
         if credentials_path and os.path.exists(credentials_path):
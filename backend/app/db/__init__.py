@@ -1,4 +1,11 @@
-from app.db.database import Base, engine, SessionLocal, get_db
-
-__all__ = ["Base", "engine", "SessionLocal", "get_db"]
+from app.db.database import (
+    AsyncSessionLocal,
+    Base,
+    SessionLocal,
+    async_engine,
+    engine,
+    get_async_db,
+    get_db,
+)
 
+__all__ = ["Base", "engine", "SessionLocal", "get_db", "async_engine", "AsyncSessionLocal", "get_async_db"]
@@ -1,5 +1,6 @@
 import os
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
@@ -23,6 +24,36 @@ engine = create_engine(
 # SessionLocal 생성(Application에서 공유할 DB session 생성)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# 비동기 API 핸들러용 DATABASE_URL (드라이버만 asyncpg로 교체)
+ASYNC_DATABASE_URL = os.getenv(
+    "ASYNC_DATABASE_URL",
+    DATABASE_URL.replace("postgresql+psycopg2://", "postgresql://", 1).replace("postgresql://", "postgresql+asyncpg://", 1),
+)
+
+# AsyncEngine 생성 (비동기 핸들러가 이벤트 루프를 막지 않도록 별도 connection pool 사용)
+async_engine = create_async_engine(
+    ASYNC_DATABASE_URL,
+    pool_pre_ping=True,
+    pool_size=int(os.getenv("ASYNC_DB_POOL_SIZE", "10")),
+    max_overflow=int(os.getenv("ASYNC_DB_MAX_OVERFLOW", "20")),
+    echo=False
+)
+
+
+@event.listens_for(async_engine.sync_engine, "connect")
+def _register_vector_codec(dbapi_connection, connection_record):
+    """
+    asyncpg는 vector 타입의 코덱이 없으므로 텍스트 형식 코덱을 등록합니다.
+    (pgvector.sqlalchemy.Vector가 '[1.0,2.0,...]' 문자열 변환을 담당)
+    """
+    dbapi_connection.run_async(
+        lambda conn: conn.set_type_codec("vector", encoder=str, decoder=str, schema="public", format="text")
+    )
+
+
+# AsyncSession 생성 (commit 후에도 응답 생성에 객체 속성을 사용하므로 expire하지 않음)
+AsyncSessionLocal = async_sessionmaker(async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False)
+
 # Base 클래스 생성
 Base = declarative_base()
 
@@ -37,3 +68,11 @@ def get_db():
     finally:
         db.close()
 
+
+
+async def get_async_db():
+    """
+    비동기 데이터베이스 세션 의존성 주입
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,272 @@
+"""
+NeMF 배치 스코어링 및 유저별 Top-N 사전 계산 (Materialization).
+
+Night 모델은 하루에 한 번(03:00)만 바뀌므로, 학습 직후 모든 유저의 Top-N 추천을
+미리 계산해 모델 버전 디렉토리에 `topn.npz`로 저장합니다.
+Warm 추천 서비스는 유저의 Day 임베딩이 계산 시점 이후 변경되지 않았다면
+전체 카탈로그를 다시 스코어링하지 않고 이 결과를 사용합니다.
+
+스코어링은 유저 배치 단위(`NeMFScoringEngine.score_logits_batch`)로 수행하고,
+여러 프로세스에 유저 청크를 나누어 병렬 처리합니다. 각 워커 프로세스는 시작 시
+서빙 아티팩트(memmap, 없으면 체크포인트)를 직접 열므로 큰 가중치 배열을 프로세스 간에 전송하지 않습니다.
+
+Top-N 계산 시점에는 이미 본 아이템을 제외하지 않습니다. 서빙 시점에 최신 상호작용을
+기준으로 제외하므로, 제외 후에도 페이지를 채울 수 있도록 N을 넉넉하게 잡습니다.
+"""
+
+from __future__ import annotations
+
+import logging
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterable, Optional, Tuple, Union
+
+import numpy as np
+import torch
+
+from app.ml.id_index import IdIndex
+from app.ml.model_artifact import MODEL_ARTIFACT_DIRNAME, ModelArtifact
+from app.ml.model_registry import ModelRegistry, get_model_registry
+from app.ml.scoring_engine import NeMFScoringEngine, top_k_indices
+
+logger = logging.getLogger(__name__)
+
+TOPN_FILENAME = "topn.npz"
+
+# 유저별로 저장할 추천 개수
+DEFAULT_TOP_N = int(os.getenv("WARM_TOPN_SIZE", "500"))
+
+# 한 번에 스코어링할 유저 수 (메모리: batch x num_items x 4 bytes)
+DEFAULT_BATCH_SIZE = int(os.getenv("WARM_TOPN_BATCH_SIZE", "64"))
+
+# 병렬 스코어링 프로세스 수
+DEFAULT_WORKERS = int(os.getenv("WARM_TOPN_WORKERS", str(max((os.cpu_count() or 2) - 1, 1))))
+
+
+@dataclass
+class MaterializedTopN:
+    """모델 버전 하나에 대한 유저별 Top-N 추천 결과."""
+
+    model_version: str
+    materialized_at: float  # 계산 시작 시각 (epoch seconds)
+    user_ids: np.ndarray  # 오름차순 user_id (num_users,)
+    item_indices: np.ndarray  # 점수 내림차순 모델 아이템 인덱스 (num_users, N)
+    coordi_ids: np.ndarray  # item_indices에 대응하는 coordi_id, 변환 불가 아이템은 -1
+    scores: np.ndarray  # item_indices에 대응하는 점수 (num_users, N)
+
+    def lookup(self, user_id: int) -> Optional[np.ndarray]:
+        """유저의 Top-N 모델 아이템 인덱스 배열을 반환합니다. 계산 대상이 아니었으면 None."""
+        pos = int(np.searchsorted(self.user_ids, user_id))
+        if pos >= len(self.user_ids) or self.user_ids[pos] != user_id:
+            return None
+        return self.item_indices[pos]
+
+    def save(self, file: Union[str, Path, BinaryIO]) -> None:
+        if isinstance(file, (str, Path)):
+            with open(file, "wb") as f:
+                self.save(f)
+            return
+
+        np.savez(
+            file,
+            model_version=np.array(self.model_version),
+            materialized_at=np.array(self.materialized_at, dtype=np.float64),
+            user_ids=self.user_ids,
+            item_indices=self.item_indices,
+            coordi_ids=self.coordi_ids,
+            scores=self.scores,
+        )
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "MaterializedTopN":
+        with np.load(path, allow_pickle=False) as data:
+            return cls(
+                model_version=str(data["model_version"]),
+                materialized_at=float(data["materialized_at"]),
+                user_ids=data["user_ids"],
+                item_indices=data["item_indices"],
+                coordi_ids=data["coordi_ids"],
+                scores=data["scores"],
+            )
+
+
+def score_users(
+    engine: NeMFScoringEngine,
+    user_indices: np.ndarray,
+    top_n: int,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    체크포인트 유저 벡터로 유저별 Top-N 아이템 인덱스와 점수를 계산합니다.
+
+    Returns:
+        (item_indices, scores): 각각 (len(user_indices), min(top_n, num_items))
+    """
+    n = min(top_n, engine.num_items)
+    top_items = np.empty((len(user_indices), n), dtype=np.int64)
+    top_scores = np.empty((len(user_indices), n), dtype=np.float32)
+
+    for start in range(0, len(user_indices), batch_size):
+        batch = user_indices[start : start + batch_size]
+        logits = engine.score_logits_batch(engine.user_embedding[batch])
+        for row, row_logits in enumerate(logits):
+            indices = top_k_indices(row_logits, n)
+            top_items[start + row] = indices
+            top_scores[start + row] = row_logits[indices]
+
+    # 서빙 경로(`NeMFScoringEngine.score`)와 같은 sigmoid 점수로 저장
+    with np.errstate(over="ignore"):
+        top_scores = 1.0 / (1.0 + np.exp(-top_scores))
+    return top_items, top_scores
+
+
+# ----------------------------------------------------------------------
+# 워커 프로세스
+# ----------------------------------------------------------------------
+_worker_engine: Optional[NeMFScoringEngine] = None
+
+
+def _load_engine(model_path: str) -> NeMFScoringEngine:
+    """서빙 아티팩트 디렉토리(memmap, 프로세스 간 페이지 공유) 또는 체크포인트 파일에서 엔진을 생성합니다."""
+    if Path(model_path).is_dir():
+        return ModelArtifact.load(model_path).engine
+    checkpoint = torch.load(model_path, map_location="cpu")
+    return NeMFScoringEngine.from_checkpoint(checkpoint)
+
+
+def _init_worker(checkpoint_path: str) -> None:
+    global _worker_engine
+    torch.set_num_threads(1)
+    _worker_engine = _load_engine(checkpoint_path)
+
+
+def _score_chunk(user_indices: np.ndarray, top_n: int, batch_size: int) -> Tuple[np.ndarray, np.ndarray]:
+    return score_users(_worker_engine, user_indices, top_n, batch_size)
+
+
+def materialize_top_n(
+    checkpoint_path: Union[str, Path],
+    model_version: str,
+    user_ids: Optional[Iterable[Union[int, str]]] = None,
+    top_n: int = DEFAULT_TOP_N,
+    workers: int = DEFAULT_WORKERS,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> MaterializedTopN:
+    """
+    체크포인트의 유저들에 대해 Top-N 추천을 계산합니다.
+
+    Args:
+        checkpoint_path: Night 모델 체크포인트 경로 또는 서빙 아티팩트 디렉토리
+        model_version: 결과에 기록할 모델 버전
+        user_ids: 계산할 user_id 목록 (None이면 체크포인트의 모든 유저)
+        top_n: 유저별 저장 개수
+        workers: 병렬 프로세스 수 (1이면 현재 프로세스에서 계산)
+        batch_size: 한 번에 스코어링할 유저 수
+    """
+    materialized_at = time.time()
+    start = time.perf_counter()
+
+    artifact = ModelArtifact.load(checkpoint_path) if Path(checkpoint_path).is_dir() else None
+    if artifact is not None:
+        user_index = artifact.user_index
+        item_index = artifact.item_index
+        num_items = artifact.engine.num_items
+    else:
+        checkpoint = torch.load(str(checkpoint_path), map_location="cpu")
+        num_items = checkpoint["num_items"]
+        user_index = IdIndex.from_mapping(checkpoint["user_id_to_index"], checkpoint["num_users"])
+        item_index = IdIndex.from_mapping(checkpoint["item_id_to_index"], num_items)
+
+    # 대상 유저 (모델에 없는 유저는 제외, user_index.ids는 이미 오름차순)
+    if user_ids is None:
+        target_ids = np.asarray(user_index.ids)
+    else:
+        targets = []
+        for uid in user_ids:
+            if uid in user_index:
+                targets.append(int(uid))
+            else:
+                logger.warning(f"[BatchScoring] User {uid} is not in the model. Skipping.")
+        target_ids = np.unique(np.array(targets, dtype=np.int64))
+    target_indices = user_index.lookup(target_ids)
+
+    n = min(top_n, num_items)
+    top_items = np.empty((len(target_indices), n), dtype=np.int64)
+    top_scores = np.empty((len(target_indices), n), dtype=np.float32)
+
+    if workers <= 1 or len(target_indices) <= batch_size:
+        engine = artifact.engine if artifact is not None else NeMFScoringEngine.from_checkpoint(checkpoint)
+        checkpoint = None
+        top_items[:], top_scores[:] = score_users(engine, target_indices, top_n, batch_size)
+    else:
+        checkpoint = None
+        # 워커당 여러 배치를 묶어 전송 (프로세스 간 통신 횟수 감소)
+        chunk_size = batch_size * 4
+        chunks = [
+            (offset, target_indices[offset : offset + chunk_size])
+            for offset in range(0, len(target_indices), chunk_size)
+        ]
+        context = multiprocessing.get_context("spawn")
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=context,
+            initializer=_init_worker,
+            initargs=(str(checkpoint_path),),
+        ) as executor:
+            futures = [
+                (offset, executor.submit(_score_chunk, chunk, top_n, batch_size))
+                for offset, chunk in chunks
+            ]
+            for offset, future in futures:
+                items, scores = future.result()
+                top_items[offset : offset + len(items)] = items
+                top_scores[offset : offset + len(items)] = scores
+
+    elapsed = time.perf_counter() - start
+    rate = len(target_ids) / elapsed if elapsed > 0 else float("inf")
+    logger.info(
+        f"[BatchScoring] Materialized top-{n} for {len(target_ids)} users "
+        f"in {elapsed:.1f}s ({rate:.0f} users/sec, workers={workers})"
+    )
+
+    return MaterializedTopN(
+        model_version=model_version,
+        materialized_at=materialized_at,
+        user_ids=target_ids,
+        item_indices=top_items,
+        coordi_ids=item_index.to_ids(top_items),
+        scores=top_scores,
+    )
+
+
+def run_nightly_materialization(registry: Optional[ModelRegistry] = None, force: bool = False) -> Optional[Path]:
+    """
+    현재 모델 버전의 모든 유저에 대해 Top-N을 계산하여 버전 디렉토리에 저장합니다.
+    스케줄러의 Night 학습 작업 직후 호출됩니다.
+
+    Args:
+        registry: 모델 레지스트리 (기본: 전역 레지스트리)
+        force: 이미 계산된 결과가 있어도 다시 계산할지 여부
+    """
+    registry = registry or get_model_registry()
+    version = registry.current_version()
+    checkpoint_path = registry.checkpoint_path(version)
+
+    if checkpoint_path is None:
+        logger.warning("[BatchScoring] No published model found. Skipping top-N materialization.")
+        return None
+    if version.startswith("legacy-"):
+        logger.warning("[BatchScoring] Legacy (unversioned) checkpoint cannot store top-N artifacts. Skipping.")
+        return None
+    if not force and registry.artifact_path(TOPN_FILENAME, version) is not None:
+        logger.info(f"[BatchScoring] Top-N already materialized for model version {version}.")
+        return registry.artifact_path(TOPN_FILENAME, version)
+
+    # 서빙 아티팩트가 있으면 워커 프로세스들이 같은 memmap 페이지를 공유
+    model_path = registry.artifact_path(MODEL_ARTIFACT_DIRNAME, version) or checkpoint_path
+    result = materialize_top_n(model_path, model_version=version)
+    return registry.write_artifact(version, TOPN_FILENAME, result.save)
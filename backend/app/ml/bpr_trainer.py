@@ -0,0 +1,201 @@
+"""
+NeMF BPR 학습 루프 (텐서 기반 데이터 파이프라인).
+
+Night 학습의 (유저, 아이템) positive 상호작용을 Python 튜플 리스트 대신 int64 텐서 두 개로 보관하고,
+에폭마다 `torch.randperm`으로 섞은 인덱스를 잘라 배치를 만듭니다.
+
+    - Negative 샘플링: 에폭 단위로 한 번에 `torch.randint`로 뽑은 뒤, 이미 아는 positive
+      (`user * num_items + item` 키의 정렬된 int64 텐서)와 겹치는 항목만 `searchsorted`로 찾아 다시 뽑습니다.
+    - BPR 손실: sigmoid 확률을 로짓으로 되돌리지 않고 `NeMF.logits`의 원래 로짓으로
+      `-logsigmoid(pos - neg)`를 계산합니다 (clamp/log 왕복으로 인한 gradient 소실 없음).
+    - 한 배치의 positive/negative 쌍은 forward 한 번으로 계산합니다.
+    - 임베딩을 sparse로 만든 모델(`NeMF(..., sparse=True)`)이면 임베딩은 SparseAdam으로,
+      나머지 레이어는 Adam으로 갱신하여 배치에 나온 행만 업데이트합니다.
+      (dense Adam은 스텝마다 전체 임베딩 테이블을 갱신하므로 유저/아이템 수에 비례해 느려집니다.)
+
+사용법:
+    stats = train_bpr(model, users, items, num_items, epochs=5, batch_size=1024,
+                      known_users=all_users, known_items=all_items)
+    logger.info(f"{stats.interactions_per_second:,.0f} interactions/s")
+"""
+
+from __future__ import annotations
+
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+import torch
+import torch.nn.functional as F
+import torch.optim as optim
+
+from app.ml.neumf_model import NeMF
+
+logger = logging.getLogger(__name__)
+
+# positive와 겹친 negative를 다시 뽑는 최대 횟수 (남은 충돌은 그대로 사용)
+MAX_NEGATIVE_RESAMPLES = 10
+
+
+class NegativeSampler:
+    """
+    positive로 알려진 (유저, 아이템) 쌍을 제외하고 아이템을 균등 샘플링합니다.
+
+    positive 쌍은 `user * num_items + item` int64 키로 정렬해 두고, 샘플마다 searchsorted로 확인합니다.
+    """
+
+    def __init__(
+        self,
+        users: torch.Tensor,
+        items: torch.Tensor,
+        num_items: int,
+        generator: Optional[torch.Generator] = None,
+    ):
+        self.num_items = num_items
+        self.generator = generator
+        self.positive_keys = torch.unique(users.to(torch.int64).cpu() * num_items + items.to(torch.int64).cpu())
+
+    def is_positive(self, users: torch.Tensor, items: torch.Tensor) -> torch.Tensor:
+        """(users[k], items[k])가 positive 쌍인지 여부 (bool 텐서)."""
+        if self.positive_keys.numel() == 0:
+            return torch.zeros_like(users, dtype=torch.bool)
+        keys = users * self.num_items + items
+        positions = torch.searchsorted(self.positive_keys, keys).clamp_(max=self.positive_keys.numel() - 1)
+        return self.positive_keys[positions] == keys
+
+    def sample(self, users: torch.Tensor) -> torch.Tensor:
+        """users의 각 유저에 대해 negative 아이템 하나씩을 뽑습니다."""
+        negatives = torch.randint(0, self.num_items, users.shape, generator=self.generator, dtype=torch.int64)
+        for _ in range(MAX_NEGATIVE_RESAMPLES):
+            collided = self.is_positive(users, negatives).nonzero().squeeze(1)
+            if collided.numel() == 0:
+                break
+            negatives[collided] = torch.randint(
+                0, self.num_items, (collided.numel(),), generator=self.generator, dtype=torch.int64
+            )
+        return negatives
+
+
+@dataclass
+class BPRTrainingStats:
+    """BPR 학습 결과 (에폭별 평균 손실, 처리량)."""
+
+    num_interactions: int
+    epochs: int
+    seconds: float
+    epoch_losses: List[float] = field(default_factory=list)
+
+    @property
+    def interactions_per_second(self) -> float:
+        return self.num_interactions * self.epochs / self.seconds if self.seconds > 0 else 0.0
+
+
+def bpr_loss(pos_logits: torch.Tensor, neg_logits: torch.Tensor) -> torch.Tensor:
+    """BPR 손실 -mean(log σ(pos - neg)) (로짓 기반, 수치적으로 안정)."""
+    return -F.logsigmoid(pos_logits - neg_logits).mean()
+
+
+def _build_optimizers(model: NeMF, lr: float) -> List[optim.Optimizer]:
+    embeddings = [model.user_embedding, model.item_embedding]
+    if not all(embedding.sparse for embedding in embeddings):
+        return [optim.Adam(model.parameters(), lr=lr)]
+
+    embedding_params = [embedding.weight for embedding in embeddings]
+    embedding_ids = {id(param) for param in embedding_params}
+    dense_params = [param for param in model.parameters() if id(param) not in embedding_ids]
+    return [optim.SparseAdam(embedding_params, lr=lr), optim.Adam(dense_params, lr=lr)]
+
+
+def train_bpr(
+    model: NeMF,
+    users: torch.Tensor,
+    items: torch.Tensor,
+    num_items: int,
+    epochs: int = 5,
+    batch_size: int = 1024,
+    lr: float = 0.001,
+    known_users: Optional[torch.Tensor] = None,
+    known_items: Optional[torch.Tensor] = None,
+    seed: Optional[int] = None,
+    on_epoch_end: Optional[Callable[[int, float], None]] = None,
+) -> BPRTrainingStats:
+    """
+    (users[k], items[k]) positive 쌍으로 모델을 BPR 학습합니다.
+
+    Args:
+        model: 학습할 NeMF 모델 (임베딩이 sparse이면 SparseAdam 사용)
+        users: 유저 인덱스 (int64, N)
+        items: 아이템 인덱스 (int64, N)
+        num_items: 전체 아이템 수 (negative 샘플링 범위)
+        known_users / known_items: negative에서 제외할 positive 쌍 (없으면 users/items만 제외)
+        seed: 셔플/샘플링 시드 (재현용)
+        on_epoch_end: 에폭이 끝날 때마다 (완료한 에폭 수, 평균 손실)로 호출 (진행 상황 보고용)
+
+    Returns:
+        BPRTrainingStats: 에폭별 손실과 처리량 (interactions/sec)
+    """
+    device = next(model.parameters()).device
+    num_interactions = users.numel()
+    if num_interactions == 0 or epochs <= 0:
+        return BPRTrainingStats(num_interactions=num_interactions, epochs=0, seconds=0.0)
+
+    generator = torch.Generator()
+    if seed is not None:
+        generator.manual_seed(seed)
+
+    # 샘플링은 CPU 텐서로, 배치만 학습 디바이스로 옮김
+    users = users.to(torch.int64).cpu()
+    items = items.to(torch.int64).cpu()
+    sampler = NegativeSampler(
+        known_users if known_users is not None else users,
+        known_items if known_items is not None else items,
+        num_items,
+        generator,
+    )
+    optimizers = _build_optimizers(model, lr)
+
+    model.train()
+    stats = BPRTrainingStats(num_interactions=num_interactions, epochs=epochs, seconds=0.0)
+    start = time.perf_counter()
+
+    for epoch in range(epochs):
+        epoch_start = time.perf_counter()
+        order = torch.randperm(num_interactions, generator=generator)
+        epoch_users = users[order]
+        epoch_items = items[order]
+        epoch_negatives = sampler.sample(epoch_users)
+
+        total_loss = torch.zeros((), device=device)
+        num_batches = 0
+        for batch_start in range(0, num_interactions, batch_size):
+            u = epoch_users[batch_start : batch_start + batch_size].to(device, non_blocking=True)
+            i = epoch_items[batch_start : batch_start + batch_size].to(device, non_blocking=True)
+            j = epoch_negatives[batch_start : batch_start + batch_size].to(device, non_blocking=True)
+
+            # positive/negative를 forward 한 번으로 계산
+            logits = model.logits(torch.cat([u, u]), torch.cat([i, j]))
+            pos_logits, neg_logits = logits.split(u.numel())
+            loss = bpr_loss(pos_logits, neg_logits)
+
+            for optimizer in optimizers:
+                optimizer.zero_grad(set_to_none=True)
+            loss.backward()
+            for optimizer in optimizers:
+                optimizer.step()
+
+            total_loss += loss.detach()
+            num_batches += 1
+
+        epoch_loss = total_loss.item() / num_batches
+        epoch_seconds = time.perf_counter() - epoch_start
+        stats.epoch_losses.append(epoch_loss)
+        logger.info(
+            f"[Training] Epoch {epoch + 1}/{epochs} Loss: {epoch_loss:.4f} "
+            f"({num_interactions / epoch_seconds:,.0f} interactions/s)"
+        )
+        if on_epoch_end is not None:
+            on_epoch_end(epoch + 1, epoch_loss)
+
+    stats.seconds = time.perf_counter() - start
+    return stats
@@ -0,0 +1,101 @@
+"""
+유저 벡터 온라인 fold-in (Day 임베딩 갱신용).
+
+학습된 NeMF의 아이템 측 가중치(아이템 임베딩, MLP, 출력 레이어)는 고정하고
+유저 벡터 하나에 대해서만 BPR 손실로 몇 번의 경사하강 스텝을 실행합니다.
+
+    loss = -mean(log σ(s(u, pos) - s(u, neg))) + reg / 2 * ||u - anchor||²
+
+anchor(기본: Night 임베딩)로 당기는 L2 항은 하루 동안의 이벤트가 쌓여도
+유저 벡터가 학습된 분포에서 멀리 벗어나지 않도록 합니다.
+모든 연산은 NumPy로 (pair 수, dim) 크기에서 끝나므로 이벤트 하나당 수 ms 이내입니다.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Optional
+
+import numpy as np
+
+from app.ml.scoring_engine import NeMFScoringEngine
+
+# 이벤트 묶음 하나에 실행할 경사하강 스텝 수
+DAY_FOLD_IN_STEPS = int(os.getenv("DAY_FOLD_IN_STEPS", "5"))
+
+# 학습률
+DAY_FOLD_IN_LR = float(os.getenv("DAY_FOLD_IN_LR", "0.1"))
+
+# anchor(Night 임베딩)로 당기는 L2 계수
+DAY_FOLD_IN_REG = float(os.getenv("DAY_FOLD_IN_REG", "0.01"))
+
+# 좋아요/스킵 코디 하나당 비교할 무작위 아이템 수
+DAY_FOLD_IN_NEGATIVES = int(os.getenv("DAY_FOLD_IN_NEGATIVES", "8"))
+
+
+def build_fold_in_pairs(
+    liked: np.ndarray,
+    skipped: np.ndarray,
+    num_items: int,
+    rng: np.random.Generator,
+    negatives: int = DAY_FOLD_IN_NEGATIVES,
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    BPR (positive, negative) 아이템 인덱스 쌍을 만듭니다.
+
+        - 좋아요: (좋아요 코디, 무작위 아이템) -> 무작위 아이템보다 위로
+        - 스킵: (무작위 아이템, 스킵 코디) -> 무작위 아이템보다 아래로
+        - 좋아요 x 스킵: (좋아요 코디, 스킵 코디)
+    """
+    liked = np.asarray(liked, dtype=np.int64)
+    skipped = np.asarray(skipped, dtype=np.int64)
+    negatives = max(negatives, 1)
+
+    pos = [
+        np.repeat(liked, negatives),
+        rng.integers(0, num_items, len(skipped) * negatives, dtype=np.int64),
+        np.repeat(liked, len(skipped)),
+    ]
+    neg = [
+        rng.integers(0, num_items, len(liked) * negatives, dtype=np.int64),
+        np.repeat(skipped, negatives),
+        np.tile(skipped, len(liked)),
+    ]
+    return np.concatenate(pos), np.concatenate(neg)
+
+
+def fold_in_user_vector(
+    engine: NeMFScoringEngine,
+    user_vector: np.ndarray,
+    pos_indices: np.ndarray,
+    neg_indices: np.ndarray,
+    anchor: Optional[np.ndarray] = None,
+    steps: int = DAY_FOLD_IN_STEPS,
+    lr: float = DAY_FOLD_IN_LR,
+    reg: float = DAY_FOLD_IN_REG,
+) -> np.ndarray:
+    """
+    아이템 측 가중치를 고정한 채 BPR 스텝을 실행하여 갱신된 유저 벡터(새 배열)를 반환합니다.
+
+    Args:
+        engine: 서빙 중인 스코어링 엔진 (읽기 전용)
+        user_vector: 현재 유저 벡터 (dim,)
+        pos_indices / neg_indices: BPR 아이템 인덱스 쌍 (P,)
+        anchor: L2로 당길 기준 벡터 (None이면 시작 벡터)
+    """
+    u = np.array(user_vector, dtype=np.float32)
+    anchor = u.copy() if anchor is None else np.asarray(anchor, dtype=np.float32)
+    pairs = len(pos_indices)
+    if pairs == 0:
+        return u
+
+    items = np.concatenate([pos_indices, neg_indices])
+    for _ in range(max(steps, 0)):
+        logits, gradients = engine.logits_and_user_gradients(u, items)
+        diff = logits[:pairs] - logits[pairs:]
+        # d loss / d diff = -σ(-diff)
+        weights = 1.0 / (1.0 + np.exp(np.clip(diff, -30, 30)))
+        grad = -(weights @ (gradients[:pairs] - gradients[pairs:])) / pairs
+        grad += reg * (u - anchor)
+        u -= np.float32(lr) * grad.astype(np.float32)
+    return u
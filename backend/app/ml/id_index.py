@@ -0,0 +1,144 @@
+"""
+DB ID <-> 모델 인덱스 매핑 (NumPy 배열 기반).
+
+체크포인트는 `{str(id): index}` 딕셔너리로 매핑을 저장하므로 요청마다 `str()` / `.isdigit()` / `int()`
+변환과 파이썬 객체 조회가 반복되었습니다. IdIndex는 같은 매핑을 배열 세 개로 보관합니다.
+
+    ids:         오름차순 DB ID (int64, N)       -> np.searchsorted로 ID -> 인덱스 (O(log N))
+    indices:     ids[k]의 모델 인덱스 (int64, N)
+    index_to_id: 모델 인덱스 -> DB ID (int64, size, 매핑 없는 인덱스는 -1) -> 배열 인덱싱으로 역변환
+
+결과 페이지/이미 본 목록처럼 ID 여러 개를 한 번에 변환할 때는 `lookup` / `to_ids`를 사용합니다.
+배열은 읽기 전용으로 다루므로 memmap(서빙 아티팩트)을 그대로 넘겨도 복사되지 않고,
+매핑을 늘릴 때(`extend`)는 새 IdIndex를 반환합니다.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Iterable, Mapping, Optional
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+_EMPTY = np.empty(0, dtype=np.int64)
+
+
+class IdIndex:
+    """정렬된 int64 ID 배열 + dense 역배열 기반 ID <-> 인덱스 매핑."""
+
+    def __init__(self, ids: np.ndarray, indices: np.ndarray, index_to_id: Optional[np.ndarray] = None, size: int = 0):
+        """
+        Args:
+            ids: 오름차순으로 정렬된 고유 DB ID (int64)
+            indices: ids에 대응하는 모델 인덱스 (int64)
+            index_to_id: 역변환 배열 (없으면 처음 사용할 때 생성)
+            size: 모델 인덱스 공간 크기 (index_to_id가 없을 때만 사용, 기본: max(indices) + 1)
+        """
+        self.ids = ids
+        self.indices = indices
+        self._index_to_id = index_to_id
+        if index_to_id is not None:
+            self._size = len(index_to_id)
+        else:
+            self._size = size or (int(indices.max()) + 1 if len(indices) else 0)
+
+    @classmethod
+    def empty(cls) -> "IdIndex":
+        return cls(_EMPTY, _EMPTY, index_to_id=_EMPTY)
+
+    @classmethod
+    def from_ids(cls, ids: Iterable[int]) -> "IdIndex":
+        """모델 인덱스 순서의 DB ID 목록으로 생성합니다 (ids[k]의 인덱스 = k)."""
+        index_to_id = np.asarray(ids if isinstance(ids, np.ndarray) else list(ids), dtype=np.int64)
+        order = np.argsort(index_to_id, kind="stable")
+        return cls(index_to_id[order], order.astype(np.int64), index_to_id=index_to_id)
+
+    @classmethod
+    def from_mapping(cls, mapping: Mapping, size: Optional[int] = None) -> "IdIndex":
+        """
+        체크포인트 형식의 `{str(id): index}` 딕셔너리로 생성합니다.
+        숫자가 아닌 ID는 제외하며, 해당 인덱스는 역변환 시 -1이 됩니다.
+        """
+        keys = [key for key in mapping if str(key).isdigit()]
+        skipped = len(mapping) - len(keys)
+        if skipped:
+            logger.warning(f"[IdIndex] Skipped {skipped} non-numeric IDs")
+
+        ids = np.fromiter((int(key) for key in keys), dtype=np.int64, count=len(keys))
+        indices = np.fromiter((mapping[key] for key in keys), dtype=np.int64, count=len(keys))
+        ids, first = np.unique(ids, return_index=True)
+        indices = indices[first]
+
+        size = max(size or 0, int(indices.max()) + 1 if len(indices) else 0)
+        index_to_id = np.full(size, -1, dtype=np.int64)
+        index_to_id[indices] = ids
+        return cls(ids, indices, index_to_id=index_to_id)
+
+    @property
+    def size(self) -> int:
+        """모델 인덱스 공간 크기 (임베딩 행 수)."""
+        return self._size
+
+    @property
+    def index_to_id(self) -> np.ndarray:
+        """모델 인덱스 -> DB ID 배열 (매핑 없는 인덱스는 -1)."""
+        if self._index_to_id is None:
+            index_to_id = np.full(self._size, -1, dtype=np.int64)
+            index_to_id[self.indices] = self.ids
+            self._index_to_id = index_to_id
+        return self._index_to_id
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, item_id) -> bool:
+        return self.get(item_id) is not None
+
+    def get(self, item_id, default: Optional[int] = None) -> Optional[int]:
+        """DB ID 하나의 모델 인덱스 (없으면 default)."""
+        ids = self.ids
+        try:
+            value = int(item_id)
+        except (TypeError, ValueError):
+            return default
+        pos = int(np.searchsorted(ids, value))
+        if pos < len(ids) and ids[pos] == value:
+            return int(self.indices[pos])
+        return default
+
+    def lookup(self, item_ids) -> np.ndarray:
+        """DB ID 배열 -> 모델 인덱스 배열 (없는 ID는 -1)."""
+        item_ids = np.asarray(item_ids, dtype=np.int64)
+        if len(self.ids) == 0:
+            return np.full(item_ids.shape, -1, dtype=np.int64)
+
+        pos = np.searchsorted(self.ids, item_ids)
+        np.minimum(pos, len(self.ids) - 1, out=pos)
+        return np.where(self.ids[pos] == item_ids, self.indices[pos], -1)
+
+    def to_ids(self, indices) -> np.ndarray:
+        """모델 인덱스 배열 -> DB ID 배열 (매핑 없는 인덱스는 -1)."""
+        return self.index_to_id[np.asarray(indices, dtype=np.int64)]
+
+    def extend(self, item_ids) -> "IdIndex":
+        """
+        매핑에 없는 ID에 새 인덱스(size, size + 1, ...)를 처음 나온 순서대로 부여한 새 IdIndex를 반환합니다.
+        """
+        item_ids = np.asarray(item_ids, dtype=np.int64)
+        unique, first = np.unique(item_ids, return_index=True)
+        missing = self.lookup(unique) < 0
+        added = unique[missing][np.argsort(first[missing], kind="stable")]
+        if len(added) == 0:
+            return self
+
+        index_to_id = np.concatenate([self.index_to_id, added])
+        ids = np.concatenate([self.ids, added])
+        indices = np.concatenate([self.indices, np.arange(self._size, self._size + len(added), dtype=np.int64)])
+        order = np.argsort(ids, kind="stable")
+        return IdIndex(ids[order], indices[order], index_to_id=index_to_id)
+
+    def to_mapping(self) -> dict:
+        """체크포인트 형식의 `{str(id): index}` 딕셔너리."""
+        return dict(zip(map(str, self.ids.tolist()), self.indices.tolist()))
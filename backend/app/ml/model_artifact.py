@@ -0,0 +1,174 @@
+"""
+메모리 맵(np.memmap)으로 여는 서빙용 모델 아티팩트.
+
+`torch.load`로 체크포인트(.pth)를 읽으면 문자열 키 딕셔너리(user_id_to_index / item_id_to_index)와
+모든 임베딩 테이블이 워커 프로세스마다 각자의 힙에 풀립니다. 서빙 아티팩트는 가중치와 ID 매핑을
+.npy 배열 파일로 저장하고 `np.load(mmap_mode="r")`로 열기 때문에
+
+    - 로드는 파일 헤더만 읽으므로 유저/아이템 수와 무관하게 O(1) (실제 페이지는 처음 접근할 때 읽힘)
+    - 같은 버전을 여는 여러 워커(uvicorn, Top-N 계산 프로세스)가 OS 페이지 캐시의 같은 페이지를 공유
+
+    <version_dir>/serving/
+    ├── meta.json                 # 형식 버전, 차원, hidden_dims, output_bias, 배열 dtype
+    ├── user_ids.npy              # 오름차순 user_id (int64)
+    ├── user_index.npy            # user_ids[k]의 모델 유저 인덱스 (int64)
+    ├── item_ids.npy / item_index.npy
+    ├── index_to_coordi.npy       # 모델 아이템 인덱스 -> coordi_id (-1: 숫자가 아닌 ID)
+    ├── user_embedding.npy        # float32 또는 float16 (행 단위로만 읽으므로 절반 크기로 저장 가능)
+    ├── item_embedding.npy        # 이하 float32 (NeMFScoringEngine 입력 그대로)
+    ├── item_projection.npy       # 첫 MLP 레이어의 아이템 측 projection (변환 시점에 미리 계산)
+    ├── user_projection_weight.npy
+    ├── hidden_{k}_weight.npy / hidden_{k}_bias.npy
+    ├── gmf_weight.npy
+    └── mlp_weight.npy
+
+체크포인트(.pth)는 다음 Night 학습의 시작점으로 계속 함께 발행합니다. 변환기:
+    write_model_artifact(checkpoint, directory)      # 발행 시 (ModelRegistry.publish_checkpoint)
+    convert_checkpoint(checkpoint_path, directory)   # 기존 체크포인트 (scripts/convert_checkpoint.py)
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Union
+
+import numpy as np
+
+from app.ml.id_index import IdIndex
+from app.ml.scoring_engine import NeMFScoringEngine
+
+logger = logging.getLogger(__name__)
+
+MODEL_ARTIFACT_DIRNAME = "serving"
+MODEL_ARTIFACT_FORMAT = 1
+_META_FILENAME = "meta.json"
+
+# 유저 임베딩 저장 dtype ("float32" | "float16")
+MODEL_ARTIFACT_USER_DTYPE = os.getenv("MODEL_ARTIFACT_USER_DTYPE", "float32")
+
+
+@dataclass(frozen=True)
+class ModelArtifact:
+    """memmap으로 연 서빙 아티팩트 (엔진 + ID 매핑)."""
+
+    meta: dict
+    engine: NeMFScoringEngine
+    user_index: IdIndex  # user_id <-> 유저 인덱스 (역배열은 처음 사용할 때 생성)
+    item_index: IdIndex  # coordi_id <-> 아이템 인덱스
+
+    @classmethod
+    def load(cls, directory: Union[str, Path], mmap: bool = True) -> "ModelArtifact":
+        """아티팩트 디렉토리를 엽니다 (mmap=False이면 배열을 메모리로 읽음)."""
+        directory = Path(directory)
+        with open(directory / _META_FILENAME, "r", encoding="utf-8") as f:
+            meta = json.load(f)
+        if meta.get("format") != MODEL_ARTIFACT_FORMAT:
+            raise ValueError(f"Unsupported model artifact format: {meta.get('format')}")
+
+        mmap_mode = "r" if mmap else None
+
+        def _array(name: str) -> np.ndarray:
+            return np.load(directory / f"{name}.npy", mmap_mode=mmap_mode, allow_pickle=False)
+
+        engine = NeMFScoringEngine(
+            user_embedding=_array("user_embedding"),
+            item_embedding=_array("item_embedding"),
+            item_projection=_array("item_projection"),
+            user_projection_weight=_array("user_projection_weight"),
+            hidden_layers=[
+                (_array(f"hidden_{k}_weight"), _array(f"hidden_{k}_bias"))
+                for k in range(meta["num_hidden_layers"])
+            ],
+            gmf_weight=_array("gmf_weight"),
+            mlp_weight=_array("mlp_weight"),
+            output_bias=meta["output_bias"],
+        )
+        return cls(
+            meta=meta,
+            engine=engine,
+            user_index=IdIndex(_array("user_ids"), _array("user_index"), size=meta["num_users"]),
+            item_index=IdIndex(_array("item_ids"), _array("item_index"), index_to_id=_array("index_to_coordi")),
+        )
+
+
+def write_model_artifact(
+    checkpoint: dict,
+    directory: Union[str, Path],
+    user_dtype: str = MODEL_ARTIFACT_USER_DTYPE,
+) -> Path:
+    """
+    Night 학습 체크포인트 딕셔너리를 서빙 아티팩트 디렉토리로 저장합니다.
+
+    Args:
+        checkpoint: model_state_dict, user_id_to_index, item_id_to_index 등을 담은 체크포인트
+        directory: 생성할 디렉토리 (없어야 함)
+        user_dtype: 유저 임베딩 저장 dtype ("float32" | "float16")
+    """
+    if user_dtype not in ("float32", "float16"):
+        raise ValueError(f"user_dtype must be float32 or float16, got {user_dtype}")
+
+    directory = Path(directory)
+    directory.mkdir(parents=True)
+    engine = NeMFScoringEngine.from_checkpoint(checkpoint)
+
+    def _save(name: str, array: np.ndarray) -> None:
+        np.save(directory / f"{name}.npy", np.ascontiguousarray(array), allow_pickle=False)
+
+    user_index = IdIndex.from_mapping(checkpoint["user_id_to_index"], size=engine.num_users)
+    item_index = IdIndex.from_mapping(checkpoint["item_id_to_index"], size=engine.num_items)
+
+    _save("user_ids", user_index.ids)
+    _save("user_index", user_index.indices)
+    _save("item_ids", item_index.ids)
+    _save("item_index", item_index.indices)
+    _save("index_to_coordi", item_index.index_to_id)
+    _save("user_embedding", engine.user_embedding.astype(user_dtype))
+    _save("item_embedding", engine.item_embedding)
+    _save("item_projection", engine.item_projection)
+    _save("user_projection_weight", engine.user_projection_weight)
+    for k, (weight, bias) in enumerate(engine.hidden_layers):
+        _save(f"hidden_{k}_weight", weight)
+        _save(f"hidden_{k}_bias", bias)
+    _save("gmf_weight", engine.gmf_weight)
+    _save("mlp_weight", engine.mlp_weight)
+
+    meta = {
+        "format": MODEL_ARTIFACT_FORMAT,
+        "num_users": engine.num_users,
+        "num_items": engine.num_items,
+        "embedding_dim": engine.embedding_dim,
+        "hidden_dims": checkpoint.get("hidden_dims", [128]),
+        "num_hidden_layers": len(engine.hidden_layers),
+        "output_bias": float(engine.output_bias),
+        "user_dtype": user_dtype,
+    }
+    with open(directory / _META_FILENAME, "w", encoding="utf-8") as f:
+        json.dump(meta, f)
+    return directory
+
+
+def convert_checkpoint(
+    checkpoint_path: Union[str, Path],
+    directory: Union[str, Path],
+    user_dtype: str = MODEL_ARTIFACT_USER_DTYPE,
+) -> Path:
+    """기존 체크포인트 파일(.pth)을 서빙 아티팩트 디렉토리로 변환합니다."""
+    import torch
+
+    checkpoint = torch.load(str(checkpoint_path), map_location="cpu")
+    return write_model_artifact(checkpoint, directory, user_dtype=user_dtype)
+
+
+def load_model_artifact(directory: Optional[Union[str, Path]]) -> Optional[ModelArtifact]:
+    """아티팩트 디렉토리가 있으면 memmap으로 열고, 없거나 열 수 없으면 None을 반환합니다."""
+    if directory is None:
+        return None
+    try:
+        return ModelArtifact.load(directory)
+    except (OSError, ValueError, KeyError) as e:
+        logger.error(f"[ModelArtifact] Failed to open {directory}: {e}")
+        return None
@@ -0,0 +1,244 @@
+"""
+버전 관리되는 모델 아티팩트 레지스트리.
+
+Night 학습 결과를 버전별 디렉토리에 저장하고, 현재 서빙 버전을 manifest 파일로 가리킵니다.
+
+    data/model_artifacts/
+    ├── current.json                  # {"version": "...", "published_at": "..."}
+    └── versions/
+        ├── 20251211T030000Z-1a2b3c/
+        │   ├── neumf_night_model.pth     # 학습용 체크포인트 (다음 Night 학습의 시작점)
+        │   └── serving/                  # 서빙용 memmap 아티팩트 (app/ml/model_artifact.py)
+        └── 20251212T030000Z-4d5e6f/
+            └── neumf_night_model.pth
+
+발행(publish)은 임시 디렉토리에 모든 파일을 쓴 뒤 rename으로 버전 디렉토리를 만들고,
+manifest 역시 임시 파일에 쓴 뒤 rename(os.replace)으로 교체합니다.
+따라서 서빙 워커는 절반만 쓰인 파일을 읽을 수 없습니다.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import shutil
+import uuid
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+# 기본 아티팩트 디렉토리: backend/data/model_artifacts
+_BACKEND_DIR = Path(__file__).resolve().parent.parent.parent
+DEFAULT_ARTIFACTS_DIR = Path(
+    os.getenv("MODEL_ARTIFACTS_DIR", str(_BACKEND_DIR / "data" / "model_artifacts"))
+)
+
+CHECKPOINT_FILENAME = "neumf_night_model.pth"
+MANIFEST_FILENAME = "current.json"
+VERSIONS_DIRNAME = "versions"
+
+# 보관할 이전 버전 수 (현재 버전 포함)
+KEEP_VERSIONS = int(os.getenv("MODEL_KEEP_VERSIONS", "3"))
+
+
+class ModelRegistry:
+    """버전별 모델 아티팩트 발행 및 조회."""
+
+    def __init__(self, base_dir: Optional[Path] = None, keep_versions: int = KEEP_VERSIONS):
+        self.base_dir = Path(base_dir) if base_dir else DEFAULT_ARTIFACTS_DIR
+        self.versions_dir = self.base_dir / VERSIONS_DIRNAME
+        self.manifest_path = self.base_dir / MANIFEST_FILENAME
+        self.keep_versions = max(keep_versions, 1)
+
+    # ------------------------------------------------------------------
+    # 조회
+    # ------------------------------------------------------------------
+    def read_manifest(self) -> Optional[dict]:
+        """현재 manifest를 반환합니다. 없거나 읽을 수 없으면 None."""
+        try:
+            with open(self.manifest_path, "r", encoding="utf-8") as f:
+                return json.load(f)
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.error(f"[ModelRegistry] Failed to read manifest: {e}")
+            return None
+
+    def current_version(self) -> Optional[str]:
+        """
+        현재 서빙 버전을 반환합니다.
+
+        manifest가 없고 이전 방식(덮어쓰기)으로 저장된 체크포인트만 있다면
+        파일 수정 시각 기반의 legacy 버전을 반환합니다.
+        """
+        manifest = self.read_manifest()
+        if manifest and manifest.get("version"):
+            return manifest["version"]
+
+        legacy_path = self.base_dir / CHECKPOINT_FILENAME
+        if legacy_path.exists():
+            return f"legacy-{legacy_path.stat().st_mtime_ns}"
+        return None
+
+    def version_dir(self, version: str) -> Path:
+        return self.versions_dir / version
+
+    def checkpoint_path(self, version: Optional[str] = None) -> Optional[Path]:
+        """지정한 버전(기본: 현재 버전)의 체크포인트 경로를 반환합니다."""
+        version = version or self.current_version()
+        if version is None:
+            return None
+
+        if version.startswith("legacy-"):
+            path = self.base_dir / CHECKPOINT_FILENAME
+        else:
+            path = self.version_dir(version) / CHECKPOINT_FILENAME
+        return path if path.exists() else None
+
+    def artifact_path(self, filename: str, version: Optional[str] = None) -> Optional[Path]:
+        """지정한 버전(기본: 현재 버전)에 부가 아티팩트 파일이 있으면 경로를 반환합니다."""
+        version = version or self.current_version()
+        if version is None or version.startswith("legacy-"):
+            return None
+
+        path = self.version_dir(version) / filename
+        return path if path.exists() else None
+
+    # ------------------------------------------------------------------
+    # 발행
+    # ------------------------------------------------------------------
+    def publish(self, writer: Callable[[Path], None]) -> str:
+        """
+        새 버전을 발행합니다.
+
+        Args:
+            writer: 임시(staging) 디렉토리를 받아 아티팩트 파일을 쓰는 함수
+
+        Returns:
+            str: 발행된 버전 문자열
+        """
+        version = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ") + f"-{uuid.uuid4().hex[:6]}"
+        self.versions_dir.mkdir(parents=True, exist_ok=True)
+
+        staging_dir = self.versions_dir / f".staging-{version}"
+        staging_dir.mkdir()
+        try:
+            writer(staging_dir)
+            for path in staging_dir.rglob("*"):
+                if path.is_file():
+                    _fsync_file(path)
+
+            # 1. 버전 디렉토리 생성 (같은 파일시스템 내 rename은 원자적)
+            os.rename(staging_dir, self.version_dir(version))
+        except Exception:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            raise
+
+        # 2. manifest 교체 (임시 파일 -> os.replace)
+        manifest = {
+            "version": version,
+            "published_at": datetime.now(timezone.utc).isoformat(),
+            "checkpoint": CHECKPOINT_FILENAME,
+        }
+        tmp_manifest = self.base_dir / f".{MANIFEST_FILENAME}.{os.getpid()}.tmp"
+        with open(tmp_manifest, "w", encoding="utf-8") as f:
+            json.dump(manifest, f)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_manifest, self.manifest_path)
+
+        logger.info(f"[ModelRegistry] Published model version {version}")
+        self._prune(current=version)
+        return version
+
+    def publish_checkpoint(self, checkpoint: dict) -> str:
+        """torch 체크포인트 딕셔너리를 서빙용 memmap 아티팩트와 함께 새 버전으로 발행합니다."""
+        import torch
+
+        from app.ml.model_artifact import MODEL_ARTIFACT_DIRNAME, write_model_artifact
+
+        def _write(staging_dir: Path) -> None:
+            torch.save(checkpoint, staging_dir / CHECKPOINT_FILENAME)
+            write_model_artifact(checkpoint, staging_dir / MODEL_ARTIFACT_DIRNAME)
+
+        return self.publish(_write)
+
+    def write_artifact(self, version: str, filename: str, writer: Callable[[Path], None]) -> Path:
+        """
+        이미 발행된 버전 디렉토리에 부가 아티팩트(예: Top-N 사전 계산 결과)를 추가합니다.
+
+        writer는 임시 경로를 받아 파일(또는 디렉토리)을 쓰고, 완료 후 rename으로 최종 이름으로 교체합니다.
+        이미 있는 디렉토리 아티팩트는 새 디렉토리로 교체한 뒤 삭제합니다
+        (이전 파일을 memmap으로 열고 있는 프로세스는 닫을 때까지 기존 내용을 그대로 읽음).
+        """
+        version_dir = self.version_dir(version)
+        if not version_dir.is_dir():
+            raise FileNotFoundError(f"Model version {version} is not published")
+
+        final_path = version_dir / filename
+        tmp_path = version_dir / f".{filename}.{os.getpid()}.tmp"
+        old_path = version_dir / f".{filename}.{os.getpid()}.old"
+        try:
+            writer(tmp_path)
+            if tmp_path.is_dir():
+                for path in tmp_path.rglob("*"):
+                    if path.is_file():
+                        _fsync_file(path)
+                if final_path.is_dir():
+                    os.rename(final_path, old_path)
+            else:
+                _fsync_file(tmp_path)
+            os.replace(tmp_path, final_path)
+        except Exception:
+            if tmp_path.is_dir():
+                shutil.rmtree(tmp_path, ignore_errors=True)
+            else:
+                tmp_path.unlink(missing_ok=True)
+            raise
+        finally:
+            if old_path.exists():
+                if final_path.exists():
+                    shutil.rmtree(old_path, ignore_errors=True)
+                else:
+                    os.rename(old_path, final_path)
+
+        logger.info(f"[ModelRegistry] Wrote artifact {filename} for model version {version}")
+        return final_path
+
+    def _prune(self, current: str) -> None:
+        """오래된 버전 디렉토리를 정리합니다 (최근 keep_versions개 유지)."""
+        try:
+            # 발행 순서(디렉토리 생성 시각) 기준 정렬
+            versions = [
+                p.name for p in sorted(
+                    (p for p in self.versions_dir.iterdir() if p.is_dir() and not p.name.startswith(".")),
+                    key=lambda p: (p.stat().st_mtime_ns, p.name),
+                )
+            ]
+        except OSError:
+            return
+
+        for name in versions[: -self.keep_versions]:
+            if name == current:
+                continue
+            shutil.rmtree(self.version_dir(name), ignore_errors=True)
+            logger.info(f"[ModelRegistry] Pruned old model version {name}")
+
+
+def _fsync_file(path: Path) -> None:
+    with open(path, "rb") as f:
+        os.fsync(f.fileno())
+
+
+_registry: Optional[ModelRegistry] = None
+
+
+def get_model_registry() -> ModelRegistry:
+    """기본 아티팩트 디렉토리를 사용하는 레지스트리 인스턴스를 반환합니다."""
+    global _registry
+    if _registry is None:
+        _registry = ModelRegistry()
+    return _registry
@@ -7,15 +7,17 @@ import torch.nn.functional as F
 
 
 class NeMF(nn.Module):
-    def __init__(self, num_users, num_items, embedding_dim=512, hidden_dims=None, dropout=0.0):
+    def __init__(self, num_users, num_items, embedding_dim=512, hidden_dims=None, dropout=0.0, sparse=False):
         super(NeMF, self).__init__()
         
         if hidden_dims is None:
             hidden_dims = [128]  # 기본값: 1층
             
         # 임베딩 레이어
-        self.user_embedding = nn.Embedding(num_users, embedding_dim)
-        self.item_embedding = nn.Embedding(num_items, embedding_dim)
+        # sparse=True이면 배치에 나온 행의 gradient만 만듭니다 (학습용, SparseAdam과 함께 사용).
+        # state_dict 형태는 동일하므로 체크포인트 호환에는 영향이 없습니다.
+        self.user_embedding = nn.Embedding(num_users, embedding_dim, sparse=sparse)
+        self.item_embedding = nn.Embedding(num_items, embedding_dim, sparse=sparse)
         
         # 1. MLP 부분
         mlp_layers = []
@@ -54,6 +56,10 @@ class NeMF(nn.Module):
         nn.init.constant_(self.output_layer.bias, 0)
     
     def forward(self, user_ids, item_ids):
+            return self.sigmoid(self.logits(user_ids, item_ids))
+    
+    def logits(self, user_ids, item_ids):
+            """sigmoid 이전 점수 (BPR 학습에는 확률 대신 이 값을 사용)"""
             user_emb = self.user_embedding(user_ids)
             item_emb = self.item_embedding(item_ids)
             
@@ -68,7 +74,7 @@ class NeMF(nn.Module):
             vector_concat = torch.cat([gmf_output, mlp_output], dim=1)
             output = self.output_layer(vector_concat)
             
-            return self.sigmoid(output).squeeze(1)
+            return output.squeeze(1)
 
 
 
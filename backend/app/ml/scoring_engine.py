@@ -0,0 +1,299 @@
+"""
+NeMF 서빙용 Factorized 스코어링 엔진.
+
+NeMF의 첫 번째 MLP Linear 레이어는 concat(user_emb, item_emb)를 입력으로 받으므로
+가중치를 W = [W_u | W_i] 로 나눌 수 있습니다.
+
+    W @ concat(u, e_i) + b = W_u @ u + (W_i @ e_i + b)
+
+아이템 쪽 항(W_i @ e_i + b)과 GMF에 쓰이는 아이템 벡터는 체크포인트가 로드된 이후
+변하지 않으므로 로드 시점에 한 번만 계산해 두고, 요청마다 유저 쪽 항(W_u @ u)만
+계산해 더합니다. 결과 점수는 `NeMF.forward`와 동일합니다 (부동소수점 오차 범위 내).
+
+엔진의 모든 배열은 읽기 전용이며, 유저 벡터는 추론 입력으로 직접 전달받습니다.
+요청 간에 공유 상태를 수정하지 않으므로 여러 스레드가 락 없이 동시에 스코어링할 수 있습니다.
+"""
+
+from __future__ import annotations
+
+from typing import List, Tuple
+
+import numpy as np
+import torch
+import torch.nn as nn
+
+from app.ml.neumf_model import NeMF
+
+
+class NeMFScoringEngine:
+    """NeMF 추론 전용 엔진 (NumPy 기반, 가중치는 로드 시점에 고정)."""
+
+    def __init__(
+        self,
+        user_embedding: np.ndarray,
+        item_embedding: np.ndarray,
+        item_projection: np.ndarray,
+        user_projection_weight: np.ndarray,
+        hidden_layers: List[Tuple[np.ndarray, np.ndarray]],
+        gmf_weight: np.ndarray,
+        mlp_weight: np.ndarray,
+        output_bias: float,
+    ):
+        """
+        Args:
+            user_embedding: 체크포인트의 유저 임베딩 (num_users, dim, float32 또는 float16), Day 임베딩이 없을 때 사용
+            item_embedding: 아이템 임베딩 (num_items, dim)
+            item_projection: 첫 MLP 레이어의 아이템 측 projection (num_items, hidden)
+            user_projection_weight: 첫 MLP 레이어의 유저 측 가중치 W_u (hidden, dim)
+            hidden_layers: 두 번째 이후 MLP 레이어의 (weight, bias) 목록
+            gmf_weight: 출력 레이어 중 GMF 파트 가중치 (dim,)
+            mlp_weight: 출력 레이어 중 MLP 파트 가중치 (hidden_last,)
+            output_bias: 출력 레이어 bias
+        """
+        # 유저 임베딩은 행 단위로만 읽으므로 float16 저장본(모델 아티팩트)은 그대로 사용
+        user_dtype = np.float16 if np.asarray(user_embedding).dtype == np.float16 else np.float32
+        self.user_embedding = _read_only(user_embedding, user_dtype)
+        self.item_embedding = _read_only(item_embedding)
+        self.item_projection = _read_only(item_projection)
+        self.user_projection_weight = _read_only(user_projection_weight)
+        self.hidden_layers = [(_read_only(w), _read_only(b)) for w, b in hidden_layers]
+        self.gmf_weight = _read_only(gmf_weight)
+        self.mlp_weight = _read_only(mlp_weight)
+        self.output_bias = np.float32(output_bias)
+
+    @classmethod
+    def from_model(cls, model: NeMF) -> "NeMFScoringEngine":
+        """
+        학습된 NeMF 모델에서 아이템 측 projection을 미리 계산하여 엔진을 생성합니다.
+
+        모든 가중치는 모델 파라미터와 메모리를 공유하지 않는 복사본으로 가져오므로,
+        이후 모델이 수정되거나 해제되어도 엔진에는 영향이 없습니다.
+        """
+        linear_layers = [layer for layer in model.mlp if isinstance(layer, nn.Linear)]
+        if not linear_layers:
+            raise ValueError("NeMF model has no MLP layers")
+
+        with torch.no_grad():
+            user_embedding = model.user_embedding.weight.detach().cpu().float().numpy().copy()
+            item_embedding = model.item_embedding.weight.detach().cpu().float().numpy().copy()
+            embedding_dim = item_embedding.shape[1]
+
+            # 첫 번째 Linear: [W_u | W_i] 분해
+            first = linear_layers[0]
+            first_weight = first.weight.detach().cpu().float().numpy()
+            first_bias = first.bias.detach().cpu().float().numpy()
+            user_projection_weight = np.ascontiguousarray(first_weight[:, :embedding_dim])
+            item_projection_weight = first_weight[:, embedding_dim:]
+
+            # 아이템 측 항은 체크포인트 단위로 고정되므로 한 번만 계산
+            item_projection = item_embedding @ item_projection_weight.T + first_bias
+
+            hidden_layers = [
+                (
+                    layer.weight.detach().cpu().float().numpy().copy(),
+                    layer.bias.detach().cpu().float().numpy().copy(),
+                )
+                for layer in linear_layers[1:]
+            ]
+
+            # 출력 레이어 입력 = concat(gmf_output, mlp_output)
+            output_weight = model.output_layer.weight.detach().cpu().float().numpy()[0].copy()
+            output_bias = float(model.output_layer.bias.detach().cpu().float().numpy()[0])
+
+        return cls(
+            user_embedding=user_embedding,
+            item_embedding=item_embedding,
+            item_projection=item_projection,
+            user_projection_weight=user_projection_weight,
+            hidden_layers=hidden_layers,
+            gmf_weight=output_weight[:embedding_dim],
+            mlp_weight=output_weight[embedding_dim:],
+            output_bias=output_bias,
+        )
+
+    @classmethod
+    def from_checkpoint(cls, checkpoint: dict) -> "NeMFScoringEngine":
+        """Night 학습 체크포인트 딕셔너리로부터 엔진을 생성합니다."""
+        model = NeMF(
+            num_users=checkpoint['num_users'],
+            num_items=checkpoint['num_items'],
+            embedding_dim=checkpoint['embedding_dim'],
+            hidden_dims=checkpoint.get('hidden_dims', [128])
+        )
+        model.load_state_dict(checkpoint['model_state_dict'])
+        model.eval()
+        return cls.from_model(model)
+
+    @property
+    def num_users(self) -> int:
+        return self.user_embedding.shape[0]
+
+    @property
+    def num_items(self) -> int:
+        return self.item_embedding.shape[0]
+
+    @property
+    def embedding_dim(self) -> int:
+        return self.item_embedding.shape[1]
+
+    def user_vector(self, user_idx: int) -> np.ndarray:
+        """체크포인트에 저장된 유저 벡터 (Night 임베딩, float32)를 반환합니다."""
+        return np.asarray(self.user_embedding[user_idx], dtype=np.float32)
+
+    def score_logits(self, user_vector: np.ndarray) -> np.ndarray:
+        """
+        유저 벡터 하나에 대해 전체 아이템의 로짓(sigmoid 이전 점수)을 계산합니다.
+
+        Args:
+            user_vector: 유저 임베딩 벡터 (dim,)
+
+        Returns:
+            np.ndarray: 아이템별 로짓 (num_items,)
+        """
+        u = np.asarray(user_vector, dtype=np.float32)
+        if u.shape != (self.embedding_dim,):
+            raise ValueError(f"user_vector must have shape ({self.embedding_dim},), got {u.shape}")
+
+        # 요청마다 새 배열에만 쓰고, 엔진의 공유 배열은 읽기만 함
+
+        # [A] GMF 파트: (u * e_i) · w_gmf == e_i · (u * w_gmf) -> GEMV 한 번
+        logits = self.item_embedding @ (u * self.gmf_weight)
+
+        # [B] MLP 파트: 아이템 측 projection + 유저 측 projection -> ReLU
+        hidden = self.item_projection + (self.user_projection_weight @ u)
+        np.maximum(hidden, 0, out=hidden)
+        for weight, bias in self.hidden_layers:
+            hidden = hidden @ weight.T + bias
+            np.maximum(hidden, 0, out=hidden)
+
+        logits += hidden @ self.mlp_weight
+        logits += self.output_bias
+        return logits
+
+    def score_logits_batch(self, user_vectors: np.ndarray, item_chunk_size: int = 8192) -> np.ndarray:
+        """
+        여러 유저 벡터에 대해 전체 아이템의 로짓을 한 번에 계산합니다 (배치 스코어링용).
+
+        MLP 중간 결과가 (batch, items, hidden) 크기가 되므로 아이템을 item_chunk_size 단위로
+        나누어 계산합니다. 같은 아이템 청크를 배치 내 모든 유저가 재사용하므로
+        유저별로 score_logits를 호출하는 것보다 캐시 효율이 좋습니다.
+
+        Args:
+            user_vectors: 유저 임베딩 행렬 (batch, dim)
+            item_chunk_size: 한 번에 처리할 아이템 수
+
+        Returns:
+            np.ndarray: 유저별 아이템 로짓 (batch, num_items)
+        """
+        users = np.asarray(user_vectors, dtype=np.float32)
+        if users.ndim != 2 or users.shape[1] != self.embedding_dim:
+            raise ValueError(f"user_vectors must have shape (batch, {self.embedding_dim}), got {users.shape}")
+
+        # [A] GMF 파트: (batch, dim) @ (dim, items)
+        logits = (users * self.gmf_weight) @ self.item_embedding.T
+
+        # [B] MLP 파트: 유저 측 projection은 배치당 한 번만 계산
+        user_projection = users @ self.user_projection_weight.T  # (batch, hidden)
+        for start in range(0, self.num_items, item_chunk_size):
+            end = min(start + item_chunk_size, self.num_items)
+            hidden = self.item_projection[None, start:end, :] + user_projection[:, None, :]
+            np.maximum(hidden, 0, out=hidden)
+            for weight, bias in self.hidden_layers:
+                hidden = hidden @ weight.T + bias
+                np.maximum(hidden, 0, out=hidden)
+            logits[:, start:end] += hidden @ self.mlp_weight
+
+        logits += self.output_bias
+        return logits
+
+    def logits_and_user_gradients(
+        self, user_vector: np.ndarray, item_indices: np.ndarray
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        일부 아이템에 대한 로짓과, 각 로짓의 유저 벡터에 대한 gradient를 계산합니다 (Day 임베딩 fold-in용).
+
+        아이템 측 가중치는 고정된 상수로 보고 유저 벡터에 대해서만 역전파합니다.
+
+        Args:
+            user_vector: 유저 임베딩 벡터 (dim,)
+            item_indices: 모델 아이템 인덱스 (K,)
+
+        Returns:
+            (logits (K,), gradients (K, dim)): gradients[k] = d logits[k] / d user_vector
+        """
+        u = np.asarray(user_vector, dtype=np.float32)
+        items = self.item_embedding[item_indices]
+
+        # 순전파 (ReLU 통과 여부를 역전파용으로 보관)
+        logits = items @ (u * self.gmf_weight)
+        hidden = self.item_projection[item_indices] + (self.user_projection_weight @ u)
+        active = [hidden > 0]
+        np.maximum(hidden, 0, out=hidden)
+        for weight, bias in self.hidden_layers:
+            hidden = hidden @ weight.T + bias
+            active.append(hidden > 0)
+            np.maximum(hidden, 0, out=hidden)
+        logits += hidden @ self.mlp_weight
+        logits += self.output_bias
+
+        # 역전파: MLP 파트 -> 첫 레이어의 유저 측 가중치 W_u
+        delta = np.where(active[-1], self.mlp_weight, np.float32(0))
+        for (weight, _), mask in zip(reversed(self.hidden_layers), reversed(active[:-1])):
+            delta = (delta @ weight) * mask
+        gradients = delta @ self.user_projection_weight
+
+        # GMF 파트: d(e_i · (u * w_gmf)) / du = e_i * w_gmf
+        gradients += items * self.gmf_weight
+        return logits, gradients
+
+    def score(self, user_vector: np.ndarray) -> np.ndarray:
+        """
+        `NeMF.forward`와 동일한 sigmoid 점수를 반환합니다.
+
+        Args:
+            user_vector: 유저 임베딩 벡터 (dim,)
+
+        Returns:
+            np.ndarray: 아이템별 점수 (num_items,)
+        """
+        logits = self.score_logits(user_vector)
+        with np.errstate(over="ignore"):
+            return 1.0 / (1.0 + np.exp(-logits))
+
+
+def _read_only(array: np.ndarray, dtype=np.float32) -> np.ndarray:
+    """
+    연속 배열로 변환한 뒤 쓰기를 금지합니다.
+    이미 같은 dtype의 연속 배열(읽기 전용 memmap 포함)이면 복사하지 않습니다.
+    """
+    array = np.ascontiguousarray(array, dtype=dtype)
+    array.setflags(write=False)
+    return array
+
+
+def top_k_indices(scores: np.ndarray, k: int) -> np.ndarray:
+    """
+    점수 상위 k개 인덱스를 내림차순으로 반환합니다 (-inf로 제외된 아이템은 포함하지 않음).
+
+    전체 정렬(O(N log N)) 대신 `np.argpartition`으로 상위 k개만 골라낸 뒤
+    k개만 정렬하므로 O(N + k log k)입니다.
+
+    Args:
+        scores: 아이템별 점수 (num_items,)
+        k: 반환할 개수
+
+    Returns:
+        np.ndarray: 상위 아이템 인덱스 (최대 k개, 점수 내림차순)
+    """
+    valid_count = int(np.count_nonzero(scores != -np.inf))
+    k = min(k, valid_count)
+    if k <= 0:
+        return np.empty(0, dtype=np.int64)
+
+    if k < scores.shape[0]:
+        candidates = np.argpartition(scores, -k)[-k:]
+    else:
+        candidates = np.arange(scores.shape[0])
+
+    order = np.argsort(scores[candidates])[::-1]
+    return candidates[order]
@@ -1,5 +1,6 @@
 """SQLAlchemy 모델 패키지 초기화."""
 
+from app.models.catalog_version import CatalogVersion
 from app.models.coordi import Coordi
 from app.models.coordi_image import CoordiImage
 from app.models.coordi_item import CoordiItem
@@ -9,6 +10,7 @@ from app.models.fitting_result_image import FittingResultImage
 from app.models.item import Item
 from app.models.item_image import ItemImage
 from app.models.tag import Tag
+from app.models.training_run import TrainingRun
 from app.models.user import User
 from app.models.user_closet_item import UserClosetItem
 from app.models.user_coordi_interaction import UserCoordiInteraction
@@ -36,4 +38,6 @@ __all__ = [
     "UserPreferredTag",
     "UserEmbedding",
     "ItemEmbedding",
+    "TrainingRun",
+    "CatalogVersion",
 ]
@@ -0,0 +1,24 @@
+"""
+카탈로그 버전(CatalogVersion) 엔티티 모델.
+
+배치 스크립트가 코디/아이템 데이터를 바꾸면 해당 이름의 버전을 올리고,
+API 프로세스는 주기적으로 버전을 확인하여 프로세스 캐시(코디 카드 등)를 비운다.
+"""
+
+from sqlalchemy import BigInteger, Column, DateTime, String
+from sqlalchemy.sql import func
+
+from app.db.database import Base
+
+
+class CatalogVersion(Base):
+    """`catalog_versions` 테이블 모델."""
+
+    __tablename__ = "catalog_versions"
+
+    name = Column(String(50), primary_key=True, comment="캐시 대상 이름 (예: coordi_cards)")
+    version = Column(BigInteger, nullable=False, default=0, comment="변경될 때마다 1씩 증가")
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now(), onupdate=func.now())
+
+    def __repr__(self) -> str:
+        return f"CatalogVersion(name={self.name}, version={self.version})"
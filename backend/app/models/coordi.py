@@ -4,13 +4,43 @@
 `Coordis` 테이블은 시즌, 스타일 정보와 자유 텍스트 설명을 보관한다.
 """
 
-from sqlalchemy import BigInteger, Column, DateTime, Enum, Index, String, Text
+from sqlalchemy import BigInteger, Column, DateTime, Enum, Index, String, Text, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from pgvector.sqlalchemy import Vector
 
 from app.db.database import Base
 
+COORDI_GENDERS = ("male", "female")
+COORDI_SEASONS = ("spring", "summer", "fall", "winter")
+
+# HNSW 인덱스 생성 파라미터 (마이그레이션과 동일하게 유지)
+EMBEDDING_HNSW_M = 16
+EMBEDDING_HNSW_EF_CONSTRUCTION = 64
+
+
+def _embedding_partial_indexes() -> list[Index]:
+    """
+    (gender, season) 조합별 description_embedding HNSW 부분 인덱스.
+
+    Cold-Start 검색은 항상 성별/계절로 필터링하므로, 조합별로 인덱스를 나누면
+    필터 조건에 맞지 않는 코디가 ANN 탐색 후보에 섞이지 않아 Recall이 유지됩니다.
+    """
+    return [
+        Index(
+            f"idx_coordis_embedding_hnsw_{gender}_{season}",
+            "description_embedding",
+            postgresql_using="hnsw",
+            postgresql_ops={"description_embedding": "vector_cosine_ops"},
+            postgresql_with={"m": EMBEDDING_HNSW_M, "ef_construction": EMBEDDING_HNSW_EF_CONSTRUCTION},
+            postgresql_where=text(
+                f"gender = '{gender}' AND season = '{season}' AND description_embedding IS NOT NULL"
+            ),
+        )
+        for gender in COORDI_GENDERS
+        for season in COORDI_SEASONS
+    ]
+
 
 class Coordi(Base):
     """`Coordis` 테이블 모델."""
@@ -19,13 +49,13 @@ class Coordi(Base):
 
     coordi_id = Column(BigInteger, primary_key=True, autoincrement=True)
     season = Column(
-        Enum("spring", "summer", "fall", "winter", name="coordi_season_enum")
+        Enum(*COORDI_SEASONS, name="coordi_season_enum")
     )
     style = Column(
         Enum("casual", "street", "sporty", "minimal", name="coordi_style_enum")
     )
     gender = Column(
-        Enum("male", "female", name="coordi_gender_enum"),
+        Enum(*COORDI_GENDERS, name="coordi_gender_enum"),
         comment="코디 대상 성별",
     )
     description = Column(Text, comment="태그 포함 설명 문구")
@@ -39,6 +69,9 @@ class Coordi(Base):
     __table_args__ = (
         Index("idx_coordis_season_style", "season", "style"),
         Index("idx_coordis_style", "style"),
+        # 코디 목록 keyset 페이지네이션 (created_at, coordi_id) 최신순
+        Index("idx_coordis_created_at_id", "created_at", "coordi_id"),
+        *_embedding_partial_indexes(),
     )
 
     images = relationship(
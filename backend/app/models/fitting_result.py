@@ -57,7 +57,8 @@ class FittingResult(Base):
     )
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
-    __table_args__ = (Index("idx_fitting_results_user", "user_id"),)
+    # 사용자별 이력 keyset 페이지네이션 (created_at, fitting_id) 최신순 (user_id 단독 조회도 이 인덱스 사용)
+    __table_args__ = (Index("idx_fitting_results_user_created", "user_id", "created_at", "fitting_id"),)
 
     user = relationship(
         "User",
@@ -0,0 +1,38 @@
+"""
+Night 학습 실행 기록(TrainingRun) 엔티티 모델.
+
+학습 워커 프로세스가 실행 단계와 진행률을 기록하고, API는 이 테이블을 읽어 학습 상태를 보여준다.
+"""
+
+from sqlalchemy import BigInteger, Column, DateTime, Float, Index, Integer, String, Text
+from sqlalchemy.sql import func
+
+from app.db.database import Base
+
+
+class TrainingRun(Base):
+    """`training_runs` 테이블 모델."""
+
+    __tablename__ = "training_runs"
+    __table_args__ = (Index("idx_training_runs_job_started", "job_name", "started_at"),)
+
+    run_id = Column(BigInteger, autoincrement=True, primary_key=True)
+    job_name = Column(String(50), nullable=False, default="night_training", comment="작업 이름")
+    status = Column(
+        String(20),
+        nullable=False,
+        default="running",
+        comment="running / succeeded / failed",
+    )
+    phase = Column(String(50), nullable=True, comment="현재 단계 (training, materialization 등)")
+    progress = Column(Float, nullable=False, default=0.0, comment="진행률 (0.0 ~ 1.0)")
+    message = Column(Text, nullable=True, comment="진행 메시지 또는 오류 내용")
+    model_version = Column(String(100), nullable=True, comment="발행된 모델 버전")
+    hostname = Column(String(255), nullable=True)
+    pid = Column(Integer, nullable=True)
+    started_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    heartbeat_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
+    finished_at = Column(DateTime(timezone=True), nullable=True)
+
+    def __repr__(self) -> str:
+        return f"TrainingRun(run_id={self.run_id}, status={self.status}, phase={self.phase})"
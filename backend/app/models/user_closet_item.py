@@ -25,6 +25,8 @@ class UserClosetItem(Base):
     __table_args__ = (
         PrimaryKeyConstraint("user_id", "item_id"),
         Index("idx_user_closet_items_item", "item_id"),
+        # 옷장 keyset 페이지네이션 (added_at, item_id) 최신순
+        Index("idx_user_closet_items_user_added", "user_id", "added_at", "item_id"),
     )
 
     user_id = Column(
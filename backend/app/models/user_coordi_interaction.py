@@ -27,6 +27,14 @@ class UserCoordiInteraction(Base):
     __table_args__ = (
         PrimaryKeyConstraint("user_id", "coordi_id"),
         Index("idx_user_coordi_interactions_coordi", "coordi_id", "action_type"),
+        # 좋아요 목록 keyset 페이지네이션 (interacted_at, coordi_id) 최신순
+        Index(
+            "idx_user_coordi_interactions_user_action_time",
+            "user_id",
+            "action_type",
+            "interacted_at",
+            "coordi_id",
+        ),
     )
 
     user_id = Column(
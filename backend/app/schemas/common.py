@@ -4,18 +4,24 @@
 
 from __future__ import annotations
 
+from typing import Optional
+
 from pydantic import BaseModel, Field
 
 
 class PaginationPayload(BaseModel):
-    """페이지네이션 정보 페이로드."""
+    """
+    페이지네이션 정보 페이로드.
+
+    cursor로 조회한 경우 currentPage는 없고, totalPages/totalItems는 includeTotal=true일 때만 채워집니다.
+    """
 
-    current_page: int = Field(alias="currentPage")
-    total_pages: int = Field(alias="totalPages")
-    total_items: int = Field(alias="totalItems")
+    current_page: Optional[int] = Field(alias="currentPage")
+    total_pages: Optional[int] = Field(alias="totalPages")
+    total_items: Optional[int] = Field(alias="totalItems")
     has_next: bool = Field(alias="hasNext")
     has_prev: bool = Field(alias="hasPrev")
+    next_cursor: Optional[str] = Field(default=None, alias="nextCursor")
 
     class Config:
         populate_by_name = True
-
@@ -5,6 +5,7 @@
 from __future__ import annotations
 
 from datetime import datetime
+from typing import List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -79,3 +80,73 @@ class RecordViewLogResponse(BaseModel):
     success: bool = True
     data: RecordViewLogResponseData
 
+
+
+# 코디 조회 로그 일괄 기록 요청 항목 스키마
+class ViewLogEntry(BaseModel):
+    outfit_id: int = Field(alias="outfitId")
+    duration_seconds: int = Field(alias="durationSeconds", ge=0, description="조회 시간 (초)")
+    viewed_at: Optional[datetime] = Field(default=None, alias="viewedAt", description="조회 시작 시각 (없으면 서버 수신 시각)")
+
+    class Config:
+        populate_by_name = True
+
+
+# 코디 조회 로그 일괄 기록 요청 스키마
+class RecordViewLogsRequest(BaseModel):
+    views: List[ViewLogEntry] = Field(min_length=1, max_length=100)
+
+
+# 코디 조회 로그 일괄 기록 응답 데이터 스키마 1
+class RecordViewLogsResponseData(BaseModel):
+    accepted_count: int = Field(alias="acceptedCount")
+    ignored_outfit_ids: List[int] = Field(alias="ignoredOutfitIds")
+
+    class Config:
+        populate_by_name = True
+
+
+# 코디 조회 로그 일괄 기록 응답 데이터 스키마 2
+class RecordViewLogsResponse(BaseModel):
+    success: bool = True
+    data: RecordViewLogsResponseData
+
+
+# 스와이프 일괄 기록 요청 항목 스키마
+class SwipeEntry(BaseModel):
+    outfit_id: int = Field(alias="outfitId")
+    action: Literal["like", "skip"] = Field(description="like: 좋아요, skip: 스킵")
+
+    class Config:
+        populate_by_name = True
+
+
+# 스와이프 일괄 기록 요청 스키마
+class RecordSwipesRequest(BaseModel):
+    swipes: List[SwipeEntry] = Field(min_length=1, max_length=100)
+
+
+# 스와이프 일괄 기록 결과 항목 스키마
+class SwipeResult(BaseModel):
+    outfit_id: int = Field(alias="outfitId")
+    action_type: str = Field(alias="actionType", description="기록 후 상호작용 종류 (like, skip, preference)")
+    interacted_at: datetime = Field(alias="interactedAt")
+    changed: bool = Field(description="이번 요청으로 생성/변경되었는지 여부")
+
+    class Config:
+        populate_by_name = True
+
+
+# 스와이프 일괄 기록 응답 데이터 스키마 1
+class RecordSwipesResponseData(BaseModel):
+    results: List[SwipeResult]
+    ignored_outfit_ids: List[int] = Field(alias="ignoredOutfitIds")
+
+    class Config:
+        populate_by_name = True
+
+
+# 스와이프 일괄 기록 응답 데이터 스키마 2
+class RecordSwipesResponse(BaseModel):
+    success: bool = True
+    data: RecordSwipesResponseData
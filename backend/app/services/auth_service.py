@@ -8,12 +8,14 @@ from datetime import timedelta
 
 from sqlalchemy import select
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from app.core.exceptions import DuplicateEmailError, InvalidCredentialsError, UnauthorizedError
 from app.core.security import create_access_token, decode_access_token, hash_password, verify_password
 from app.models.user import User
 from app.schemas.auth import UserCreateRequest, UserLoginRequest
+from app.services.user_cache import CachedUser, load_cached_user, load_cached_user_async
 
 
 def register_user(db: Session, payload: UserCreateRequest) -> User:
@@ -77,8 +79,8 @@ def authenticate_user(db: Session, payload: UserLoginRequest) -> tuple[User, str
     return user, token
 
 
-def get_user_from_token(db: Session, token: str) -> User:
-    """액세스 토큰으로 현재 사용자를 조회한다."""
+def _user_id_from_token(token: str) -> int:
+    """액세스 토큰을 검증하고 사용자 ID를 추출한다."""
 
     # 토큰 페이로드에서 사용자 ID 추출
     payload = decode_access_token(token)
@@ -87,10 +89,16 @@ def get_user_from_token(db: Session, token: str) -> User:
         raise UnauthorizedError()
 
     try:
-        user_id = int(subject)
+        return int(subject)
     except (TypeError, ValueError):
         raise UnauthorizedError() from None # 사용자 ID 추출 실패 시 예외 처리
 
+
+def get_user_from_token(db: Session, token: str) -> User:
+    """액세스 토큰으로 현재 사용자를 조회한다."""
+
+    user_id = _user_id_from_token(token)
+
     # 사용자 조회
     user = db.get(User, user_id)
     if user is None:
@@ -100,3 +108,32 @@ def get_user_from_token(db: Session, token: str) -> User:
     return user
 
 
+def get_authenticated_user(db: Session, token: str) -> CachedUser:
+    """
+    액세스 토큰으로 현재 사용자의 최소 정보(user_id, gender, 온보딩 여부)를 조회한다.
+    캐시에 있으면 users 테이블을 조회하지 않는다.
+    """
+
+    user_id = _user_id_from_token(token)
+
+    # 사용자 조회 (요청/프로세스 캐시 -> DB)
+    user = load_cached_user(db, user_id)
+    if user is None:
+        raise UnauthorizedError() # 사용자 조회 실패 시 예외 처리
+
+    # 사용자 반환
+    return user
+
+
+async def get_authenticated_user_async(db: AsyncSession, token: str) -> CachedUser:
+    """get_authenticated_user의 비동기 세션 버전."""
+
+    user_id = _user_id_from_token(token)
+
+    # 사용자 조회 (요청/프로세스 캐시 -> DB)
+    user = await load_cached_user_async(db, user_id)
+    if user is None:
+        raise UnauthorizedError() # 사용자 조회 실패 시 예외 처리
+
+    # 사용자 반환
+    return user
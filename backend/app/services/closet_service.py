@@ -5,20 +5,22 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Literal
+from typing import Literal, Optional
 
 from sqlalchemy import func, select
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
 
 from app.core.exceptions import AlreadySavedError, ItemNotFoundError, ItemNotInClosetError
+from app.core.pagination import cursor_pagination, decode_cursor, keyset_before, page_pagination, split_page
 from app.models.item import Item
 from app.models.user_closet_item import UserClosetItem
 from app.schemas.closet import CategoryCountsPayload, ClosetItemPayload
 from app.schemas.common import PaginationPayload
 
 
-def save_closet_item(
-    db: Session,
+async def save_closet_item(
+    db: AsyncSession,
     user_id: int,
     item_id: int,
 ) -> datetime:
@@ -47,18 +49,18 @@ def save_closet_item(
         이미 옷장에 저장된 아이템인 경우
     """
     # 1. 아이템 존재 여부 확인
-    item = db.get(Item, item_id)
+    item = await db.get(Item, item_id)
     if item is None:
         raise ItemNotFoundError()
     
     # 2. 이미 저장된 아이템인지 확인
-    existing_closet_item = db.execute(
+    existing_closet_item = (await db.execute(
         select(UserClosetItem)
         .where(
             UserClosetItem.user_id == user_id,
             UserClosetItem.item_id == item_id,
         )
-    ).scalar_one_or_none()
+    )).scalar_one_or_none()
     
     if existing_closet_item is not None:
         raise AlreadySavedError()
@@ -69,14 +71,14 @@ def save_closet_item(
         item_id=item_id,
     )
     db.add(closet_item)
-    db.commit()
-    db.refresh(closet_item)
+    await db.commit()
+    await db.refresh(closet_item)
     
     return closet_item.added_at
 
 
-def delete_closet_item(
-    db: Session,
+async def delete_closet_item(
+    db: AsyncSession,
     user_id: int,
     item_id: int,
 ) -> datetime:
@@ -105,25 +107,25 @@ def delete_closet_item(
         옷장에 저장되지 않은 아이템인 경우
     """
     # 1. 아이템 존재 여부 확인
-    item = db.get(Item, item_id)
+    item = await db.get(Item, item_id)
     if item is None:
         raise ItemNotFoundError()
     
     # 2. 옷장에 저장된 아이템인지 확인
-    closet_item = db.execute(
+    closet_item = (await db.execute(
         select(UserClosetItem)
         .where(
             UserClosetItem.user_id == user_id,
             UserClosetItem.item_id == item_id,
         )
-    ).scalar_one_or_none()
+    )).scalar_one_or_none()
     
     if closet_item is None:
         raise ItemNotInClosetError()
     
     # 3. 옷장에서 아이템 삭제
-    db.delete(closet_item)
-    db.commit()
+    await db.delete(closet_item)
+    await db.commit()
     
     # 4. 삭제 일시 반환 (현재 시간 UTC)
     return datetime.now(timezone.utc)
@@ -132,6 +134,9 @@ def delete_closet_item(
 # 카테고리 필터 타입 정의
 CategoryFilter = Literal["all", "top", "bottom", "outer"]
 
+# 커서가 다른 목록에 재사용되지 않도록 구분하는 scope
+CLOSET_CURSOR_SCOPE = "closet"
+
 
 def _build_closet_item_payload(
     item: Item,
@@ -175,11 +180,13 @@ def _build_closet_item_payload(
 
 
 async def get_closet_items(
-    db: Session,
+    db: AsyncSession,
     user_id: int,
     category: CategoryFilter = "all",
     page: int = 1,
     limit: int = 20,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
 ) -> tuple[list[ClosetItemPayload], PaginationPayload, CategoryCountsPayload]:
     """
     옷장에 저장된 아이템 목록을 조회합니다.
@@ -193,15 +200,21 @@ async def get_closet_items(
     category:
         카테고리 필터 ("all"이면 필터링 안 함)
     page:
-        페이지 번호 (1부터 시작)
+        페이지 번호 (1부터 시작, cursor가 있으면 무시)
     limit:
         페이지당 개수
+    cursor:
+        이전 응답의 nextCursor (있으면 (added_at, item_id) keyset으로 이어서 조회)
+    include_total:
+        cursor 모드에서도 전체 개수를 계산할지 여부
         
     Returns
     -------
     tuple[list[ClosetItemPayload], PaginationPayload, CategoryCountsPayload]:
         (아이템 페이로드 리스트, 페이지네이션 정보, 카테고리별 개수)
     """
+    position = decode_cursor(CLOSET_CURSOR_SCOPE, cursor) if cursor else None
+    
     # 1. categoryCounts 계산 (필터 적용 전 전체 카테고리별 개수)
     category_counts_query = (
         select(Item.category, func.count(UserClosetItem.item_id))
@@ -209,7 +222,7 @@ async def get_closet_items(
         .where(UserClosetItem.user_id == user_id)
         .group_by(Item.category)
     )
-    category_counts_result = db.execute(category_counts_query).all()
+    category_counts_result = (await db.execute(category_counts_query)).all()
     
     # 카테고리별 개수 딕셔너리 생성
     category_counts_dict = {cat: 0 for cat in ["top", "bottom", "outer"]}
@@ -223,7 +236,19 @@ async def get_closet_items(
         outer=category_counts_dict["outer"],
     )
     
-    # 2. category 필터 적용하여 쿼리 구성
+    # 2. 전체 개수 (categoryCounts에서 계산, 별도 COUNT 쿼리 없음)
+    if category == "all":
+        total_items = sum(count for _, count in category_counts_result)
+    else:
+        total_items = category_counts_dict.get(category, 0)
+    
+    # 결과가 없으면 빈 결과 반환
+    if total_items == 0:
+        if position is None:
+            return [], page_pagination(page, limit, 0), category_counts
+        return [], cursor_pagination(False, None, limit, 0 if include_total else None, cursor=cursor), category_counts
+    
+    # 3. category 필터 적용하여 쿼리 구성
     query = (
         select(UserClosetItem)
         .join(Item, UserClosetItem.item_id == Item.item_id)
@@ -233,39 +258,26 @@ async def get_closet_items(
     if category != "all":
         query = query.where(Item.category == category)
     
-    # 3. 전체 개수 조회 (페이지네이션용)
-    count_query = (
-        select(func.count(UserClosetItem.item_id))
-        .join(Item, UserClosetItem.item_id == Item.item_id)
-        .where(UserClosetItem.user_id == user_id)
-    )
-    
-    if category != "all":
-        count_query = count_query.where(Item.category == category)
-    
-    total_items = db.execute(count_query).scalar_one()
-    
-    # 결과가 없으면 빈 결과 반환
-    if total_items == 0:
-        return [], PaginationPayload(
-            currentPage=page,
-            totalPages=0,
-            totalItems=0,
-            hasNext=False,
-            hasPrev=False,
-        ), category_counts
-    
-    # 4. 페이지네이션 적용 및 정렬 (added_at 기준 최신순)
-    offset = (page - 1) * limit
-    closet_items = db.execute(
+    # 4. (added_at, item_id) 최신순으로 limit + 1개 조회
+    query = (
         query
-        .order_by(UserClosetItem.added_at.desc())
-        .offset(offset)
-        .limit(limit)
+        .order_by(UserClosetItem.added_at.desc(), UserClosetItem.item_id.desc())
+        .limit(limit + 1)
         .options(
             selectinload(UserClosetItem.item).selectinload(Item.images),
         )
-    ).scalars().all()
+    )
+    if position is not None:
+        query = query.where(keyset_before(UserClosetItem.added_at, UserClosetItem.item_id, position))
+    else:
+        query = query.offset((page - 1) * limit)
+    
+    closet_items, has_next, next_cursor = split_page(
+        (await db.execute(query)).scalars().all(),
+        limit,
+        CLOSET_CURSOR_SCOPE,
+        lambda closet_item: (closet_item.added_at, closet_item.item_id),
+    )
     
     # 5. 페이로드 생성
     items = [
@@ -274,17 +286,10 @@ async def get_closet_items(
     ]
     
     # 6. 페이지네이션 정보 계산
-    total_pages = (total_items + limit - 1) // limit if total_items > 0 else 0
-    has_next = page < total_pages
-    has_prev = page > 1
-    
-    pagination = PaginationPayload(
-        currentPage=page,
-        totalPages=total_pages,
-        totalItems=total_items,
-        hasNext=has_next,
-        hasPrev=has_prev,
+    if position is None:
+        return items, page_pagination(page, limit, total_items, next_cursor), category_counts
+    return (
+        items,
+        cursor_pagination(has_next, next_cursor, limit, total_items if include_total else None, cursor=cursor),
+        category_counts,
     )
-    
-    return items, pagination, category_counts
-
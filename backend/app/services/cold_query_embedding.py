@@ -0,0 +1,213 @@
+"""
+Cold-Start 쿼리 임베딩 계산 및 저장.
+
+Cold-Start 추천의 쿼리 임베딩은 사용자의 선호 태그(텍스트 임베딩)와 온보딩에서 선택한
+선호 코디(description_embedding 합)로 계산되며, 이 입력은 `set_user_preferences`에서만 바뀝니다.
+따라서 선호도 저장 시점에 한 번 계산하여 `user_embeddings`에 저장하고,
+추천 요청에서는 저장된 벡터를 읽기만 합니다.
+
+저장 시 model_version에는 임베딩 모델 이름, 추론 백엔드(EMBEDDING_BACKEND / ONNX 파일)와
+계산식(text_weight 등)의 해시가 포함됩니다.
+임베딩 모델, 백엔드나 계산식이 바뀌면 버전 문자열이 달라지므로 기존 벡터는 자동으로 무시되고,
+다음 요청에서 다시 계산됩니다.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+from typing import Dict, Optional, Sequence, Tuple
+
+import numpy as np
+from sqlalchemy import delete, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.coordi import Coordi
+from app.models.tag import Tag
+from app.models.user_coordi_interaction import UserCoordiInteraction
+from app.models.user_embedding import UserEmbedding
+from app.models.user_preferred_tag import UserPreferredTag
+from app.services.embedding_batcher import get_embedding_batcher
+from app.services.embedding_service import EMBEDDING_MODEL_NAME, EmbeddingService, embedding_backend_signature
+
+logger = logging.getLogger(__name__)
+
+EMBEDDING_DIM = 512
+
+# 선택한 코디 임베딩 합에 곱하는 가중치 (cold_start.py 로직 참고)
+TEXT_WEIGHT = 10.0
+
+# 계산식이 바뀌면 올려서 저장된 벡터를 무효화
+_FORMULA_REVISION = 1
+
+COLD_QUERY_VERSION_PREFIX = "cold_"
+
+
+def cold_query_model_version() -> str:
+    """현재 임베딩 모델 + 추론 백엔드 + 계산식에 대한 버전 문자열 (예: 'cold_3f2a9c1b7e4d')."""
+    signature = (
+        f"{EMBEDDING_MODEL_NAME}|backend={embedding_backend_signature()}"
+        f"|text_weight={TEXT_WEIGHT}|rev={_FORMULA_REVISION}"
+    )
+    return COLD_QUERY_VERSION_PREFIX + hashlib.sha1(signature.encode("utf-8")).hexdigest()[:12]
+
+
+def _load_query_inputs(db: Session, user_ids: Sequence[int]) -> Dict[int, Tuple[str, np.ndarray]]:
+    """
+    사용자별 (선호 태그 텍스트, 선호 코디 description_embedding 합)을 조회합니다.
+    여러 사용자를 쿼리 두 번으로 처리합니다.
+    """
+    inputs = {user_id: ([], np.zeros(EMBEDDING_DIM)) for user_id in user_ids}
+    if not inputs:
+        return {}
+
+    # 1. 사용자의 선호 태그 조회
+    tag_rows = db.execute(
+        select(UserPreferredTag.user_id, Tag.name)
+        .join(Tag, Tag.tag_id == UserPreferredTag.tag_id)
+        .where(UserPreferredTag.user_id.in_(list(inputs)))
+    ).all()
+    for user_id, name in tag_rows:
+        inputs[user_id][0].append(name)
+
+    # 2. 사용자가 선택한 샘플 코디(action_type='preference')의 description_embedding 합산
+    sample_rows = db.execute(
+        select(UserCoordiInteraction.user_id, Coordi.description_embedding)
+        .join(Coordi, UserCoordiInteraction.coordi_id == Coordi.coordi_id)
+        .where(
+            UserCoordiInteraction.user_id.in_(list(inputs)),
+            UserCoordiInteraction.action_type == "preference",
+            Coordi.description_embedding.isnot(None),
+        )
+    ).all()
+    for user_id, embedding in sample_rows:
+        inputs[user_id][1][:] += np.asarray(embedding, dtype=float)
+
+    # 태그 텍스트 합치기 (예: "#캐주얼 #스트릿 #미니멀")
+    return {user_id: (" ".join(tags), image_sum) for user_id, (tags, image_sum) in inputs.items()}
+
+
+def _combine(hashtags_embedding: Sequence[float], image_embedding_sum: np.ndarray) -> np.ndarray:
+    """쿼리 임베딩 생성 및 정규화 (코사인 유사도 계산 시 필요)"""
+    query_embedding = np.asarray(hashtags_embedding, dtype=float) + image_embedding_sum * TEXT_WEIGHT
+    norm = np.linalg.norm(query_embedding)
+    if norm > 0:
+        query_embedding = query_embedding / norm
+    return query_embedding
+
+
+def compute_cold_query_embeddings(db: Session, user_ids: Sequence[int]) -> Dict[int, np.ndarray]:
+    """
+    여러 사용자의 Cold-Start 쿼리 임베딩을 한 번에 계산합니다.
+    태그 텍스트는 `EmbeddingService.encode_many`로 일괄 인코딩합니다.
+
+    Returns:
+        Dict[int, np.ndarray]: user_id -> 정규화된 쿼리 임베딩 (입력 데이터가 없으면 0 벡터)
+    """
+    inputs = _load_query_inputs(db, user_ids)
+    if not inputs:
+        return {}
+
+    texts = [hashtags_text for hashtags_text, _ in inputs.values()]
+    if any(texts):
+        hashtags_embeddings = EmbeddingService().encode_many(texts)
+    else:
+        hashtags_embeddings = [np.zeros(EMBEDDING_DIM)] * len(texts)
+
+    return {
+        user_id: _combine(hashtags_embedding, image_sum)
+        for (user_id, (_, image_sum)), hashtags_embedding in zip(inputs.items(), hashtags_embeddings)
+    }
+
+
+def compute_cold_query_embedding(db: Session, user_id: int) -> np.ndarray:
+    """
+    사용자의 선호 태그와 선호 코디로 Cold-Start 쿼리 임베딩을 계산합니다.
+
+    Returns:
+        np.ndarray: 정규화된 쿼리 임베딩 (512,). 입력 데이터가 없으면 0 벡터
+    """
+    hashtags_text, image_sum = _load_query_inputs(db, [user_id])[user_id]
+    return _combine(get_embedding_batcher().embed_blocking(hashtags_text), image_sum)
+
+
+async def compute_cold_query_embedding_async(db: AsyncSession, user_id: int) -> np.ndarray:
+    """compute_cold_query_embedding의 비동기 버전 (태그 인코딩을 마이크로 배처로 처리)."""
+    inputs = await db.run_sync(_load_query_inputs, [user_id])
+    hashtags_text, image_sum = inputs[user_id]
+    return _combine(await get_embedding_batcher().embed(hashtags_text), image_sum)
+
+
+def store_cold_query_embedding(db: Session, user_id: int, query_embedding: np.ndarray) -> Optional[np.ndarray]:
+    """
+    쿼리 임베딩을 현재 버전으로 저장합니다 (이전 버전의 벡터는 삭제).
+    0 벡터(입력 데이터 없음)는 저장하지 않고 None을 반환합니다. 호출자가 commit합니다.
+    """
+    version = cold_query_model_version()
+
+    db.execute(
+        delete(UserEmbedding).where(
+            UserEmbedding.user_id == user_id,
+            UserEmbedding.model_version.like(f"{COLD_QUERY_VERSION_PREFIX}%"),
+            UserEmbedding.model_version != version,
+        )
+    )
+
+    if not np.any(query_embedding):
+        db.execute(
+            delete(UserEmbedding).where(
+                UserEmbedding.user_id == user_id,
+                UserEmbedding.model_version == version,
+            )
+        )
+        return None
+
+    embedding = db.get(UserEmbedding, (user_id, version))
+    if embedding is None:
+        db.add(UserEmbedding(user_id=user_id, model_version=version, vector=query_embedding.tolist()))
+    else:
+        embedding.vector = query_embedding.tolist()
+    return query_embedding
+
+
+def refresh_cold_query_embedding(db: Session, user_id: int) -> Optional[np.ndarray]:
+    """쿼리 임베딩을 다시 계산하여 저장합니다. 호출자가 commit합니다."""
+    return store_cold_query_embedding(db, user_id, compute_cold_query_embedding(db, user_id))
+
+
+def load_cold_query_embeddings(db: Session, user_ids: Sequence[int]) -> Dict[int, np.ndarray]:
+    """현재 버전으로 저장된 쿼리 임베딩을 조회합니다 (없는 사용자는 결과에서 빠짐)."""
+    if not user_ids:
+        return {}
+
+    rows = db.execute(
+        select(UserEmbedding.user_id, UserEmbedding.vector).where(
+            UserEmbedding.user_id.in_(list(user_ids)),
+            UserEmbedding.model_version == cold_query_model_version(),
+        )
+    ).all()
+    return {user_id: np.asarray(vector, dtype=float) for user_id, vector in rows}
+
+
+async def get_cold_query_embedding(db: AsyncSession, user_id: int) -> Optional[np.ndarray]:
+    """
+    Cold-Start 추천용 쿼리 임베딩을 반환합니다.
+    현재 버전으로 저장된 벡터가 없으면 계산하여 저장합니다.
+
+    Returns:
+        Optional[np.ndarray]: 정규화된 쿼리 임베딩. 입력 데이터가 없으면 None
+    """
+    stored = (await db.run_sync(load_cold_query_embeddings, [user_id])).get(user_id)
+    if stored is not None:
+        return stored
+
+    query_embedding = await compute_cold_query_embedding_async(db, user_id)
+    try:
+        await db.run_sync(store_cold_query_embedding, user_id, query_embedding)
+        await db.commit()
+    except Exception as e:
+        await db.rollback()
+        logger.error(f"[Cold Start] Failed to store query embedding for user {user_id}: {e}")
+
+    return query_embedding if np.any(query_embedding) else None
@@ -0,0 +1,332 @@
+"""
+사용자와 무관한 코디 카드 캐시.
+
+추천/코디 목록/좋아요 목록 API는 모두 같은 코디 정보(메인 이미지, 아이템 목록, 가격, 브랜드 등)를
+응답에 담습니다. 요청마다 coordi -> coordi_items -> item -> images를 selectinload로 읽어
+페이로드를 다시 만드는 대신, 사용자와 무관한 부분을 미리 만든 카드(CoordiCard)로 프로세스에 보관하고
+isFavorited / isSaved만 요청마다 덧씌웁니다(overlay).
+
+카드는 TTL(COORDI_CARD_CACHE_TTL_SECONDS) 동안 유효하며, 최대 개수(COORDI_CARD_CACHE_SIZE)를 넘으면
+가장 오래 사용되지 않은 카드부터 제거합니다.
+
+무효화: 코디/아이템 데이터를 바꾸는 배치 스크립트(`scripts/load_coordis.py`)는
+`bump_coordi_catalog_version`으로 catalog_versions 테이블의 버전을 올립니다. API 프로세스는
+COORDI_CARD_CACHE_VERSION_CHECK_SECONDS마다 버전을 확인하고, 바뀌었으면 카드를 모두 비웁니다.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from sqlalchemy import func, select
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, selectinload
+
+from app.models.catalog_version import CatalogVersion
+from app.models.coordi import Coordi
+from app.models.coordi_item import CoordiItem
+from app.models.item import Item
+from app.models.user_closet_item import UserClosetItem
+from app.models.user_coordi_interaction import UserCoordiInteraction
+from app.schemas.recommendation_response import OutfitItemPayload, OutfitPayload
+
+# 카드 유지 시간 (초)
+COORDI_CARD_CACHE_TTL_SECONDS = float(os.getenv("COORDI_CARD_CACHE_TTL_SECONDS", "3600"))
+
+# 프로세스당 최대 보관 카드 수 (카드 하나는 아이템 수에 따라 대략 1~3KB)
+COORDI_CARD_CACHE_SIZE = int(os.getenv("COORDI_CARD_CACHE_SIZE", "20000"))
+
+# 다른 프로세스의 코디/아이템 변경(catalog_versions)을 확인하는 주기 (초)
+COORDI_CARD_CACHE_VERSION_CHECK_SECONDS = float(os.getenv("COORDI_CARD_CACHE_VERSION_CHECK_SECONDS", "10"))
+
+# catalog_versions의 코디 카드 버전 이름
+COORDI_CATALOG_VERSION_NAME = "coordi_cards"
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class ItemCard:
+    """코디에 포함된 아이템의 사용자 무관 정보."""
+
+    item_id: int
+    category: str
+    brand: Optional[str]
+    name: str
+    price: Optional[int]
+    image_url: Optional[str]
+    purchase_url: Optional[str]
+
+
+@dataclass(frozen=True)
+class CoordiCard:
+    """코디 응답 페이로드 중 사용자 무관 부분."""
+
+    coordi_id: int
+    image_url: str
+    gender: str
+    season: str
+    style: str
+    description: str
+    created_at: datetime
+    items: Tuple[ItemCard, ...]
+    cached_at: float = field(default_factory=time.monotonic, compare=False)
+
+    @property
+    def item_ids(self) -> List[int]:
+        return [item.item_id for item in self.items]
+
+    def to_payload(
+        self,
+        is_favorited: bool,
+        saved_item_ids: set[int],
+        llm_message: Optional[str] = None,
+    ) -> OutfitPayload:
+        """사용자별 플래그(isFavorited, isSaved)를 덧씌워 응답 페이로드를 만듭니다."""
+        return OutfitPayload(
+            id=self.coordi_id,
+            imageUrl=self.image_url,
+            gender=self.gender,
+            season=self.season,
+            style=self.style,
+            description=self.description,
+            isFavorited=is_favorited,
+            llmMessage=llm_message,
+            items=[
+                OutfitItemPayload(
+                    id=item.item_id,
+                    category=item.category,
+                    brand=item.brand,
+                    name=item.name,
+                    price=item.price,
+                    imageUrl=item.image_url,
+                    purchaseUrl=item.purchase_url,
+                    isSaved=item.item_id in saved_item_ids,
+                )
+                for item in self.items
+            ],
+            createdAt=self.created_at,
+        )
+
+
+def _main_image_url(images) -> Optional[str]:
+    # 메인 이미지 추출 (is_main=True 우선, 없으면 첫 번째 이미지)
+    main_image = next((img for img in images if img.is_main), images[0] if images else None)
+    return main_image.image_url if main_image else None
+
+
+def build_coordi_card(coordi: Coordi) -> CoordiCard:
+    """images, coordi_items.item.images가 로드된 Coordi로 카드를 만듭니다."""
+    image_url = _main_image_url(coordi.images)
+    if image_url is None:
+        raise ValueError(f"Coordi {coordi.coordi_id} has no images")
+
+    items = tuple(
+        ItemCard(
+            item_id=item.item_id,
+            category=item.category,
+            brand=item.brand_name_ko,
+            name=item.item_name,
+            # price 변환 (Numeric → int, 원 단위)
+            price=int(float(item.price)) if item.price is not None else None,
+            image_url=_main_image_url(item.images),
+            purchase_url=item.purchase_url,
+        )
+        for item in (coordi_item.item for coordi_item in coordi.coordi_items)
+    )
+
+    return CoordiCard(
+        coordi_id=coordi.coordi_id,
+        image_url=image_url,
+        gender=coordi.gender,
+        season=coordi.season,
+        style=coordi.style,
+        description=coordi.description or "",
+        created_at=coordi.created_at,
+        items=items,
+    )
+
+
+class CoordiCardCache:
+    """coordi_id -> CoordiCard TTL LRU 캐시 (Thread-safe)."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = COORDI_CARD_CACHE_TTL_SECONDS,
+        max_cards: int = COORDI_CARD_CACHE_SIZE,
+        version_check_seconds: float = COORDI_CARD_CACHE_VERSION_CHECK_SECONDS,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_cards = max_cards
+        self.version_check_seconds = version_check_seconds
+        self._cards: OrderedDict[int, CoordiCard] = OrderedDict()
+        self._lock = threading.Lock()
+        self._catalog_version: Optional[int] = None  # 마지막으로 확인한 catalog_versions 버전
+        self._version_checked_at = float("-inf")
+
+    def get_many(self, coordi_ids: Iterable[int]) -> Tuple[Dict[int, CoordiCard], List[int]]:
+        """(캐시에 있는 카드, 없는 coordi_id 목록)을 반환합니다."""
+        found: Dict[int, CoordiCard] = {}
+        missing: List[int] = []
+        now = time.monotonic()
+        with self._lock:
+            for coordi_id in coordi_ids:
+                card = self._cards.get(coordi_id)
+                if card is not None and now - card.cached_at > self.ttl_seconds:
+                    del self._cards[coordi_id]
+                    card = None
+                if card is None:
+                    missing.append(coordi_id)
+                else:
+                    self._cards.move_to_end(coordi_id)
+                    found[coordi_id] = card
+        return found, missing
+
+    def put_many(self, cards: Iterable[CoordiCard]) -> None:
+        with self._lock:
+            for card in cards:
+                self._cards[card.coordi_id] = card
+                self._cards.move_to_end(card.coordi_id)
+            while len(self._cards) > self.max_cards:
+                self._cards.popitem(last=False)
+
+    def version_check_due(self) -> bool:
+        """버전 확인 주기가 지났으면 True를 반환하고 확인 시각을 갱신합니다 (동시 요청 중 하나만 확인)."""
+        now = time.monotonic()
+        with self._lock:
+            if now - self._version_checked_at < self.version_check_seconds:
+                return False
+            self._version_checked_at = now
+            return True
+
+    def apply_catalog_version(self, version: int) -> bool:
+        """확인한 카탈로그 버전을 기록하고, 이전에 확인한 버전과 다르면 카드를 모두 비웁니다."""
+        with self._lock:
+            changed = self._catalog_version is not None and version != self._catalog_version
+            if changed:
+                self._cards.clear()
+            self._catalog_version = version
+        if changed:
+            logger.info(f"[CoordiCardCache] Catalog version changed to {version}. Cleared cached cards.")
+        return changed
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cards.clear()
+
+    def __len__(self) -> int:
+        return len(self._cards)
+
+
+# 전역 인스턴스
+_coordi_card_cache = CoordiCardCache()
+
+
+def get_coordi_card_cache() -> CoordiCardCache:
+    return _coordi_card_cache
+
+
+def bump_coordi_catalog_version(db: Session) -> None:
+    """
+    코디/아이템 데이터가 바뀌었음을 기록합니다 (배치 스크립트용, 커밋은 호출하는 쪽에서).
+    API 프로세스는 COORDI_CARD_CACHE_VERSION_CHECK_SECONDS 안에 카드 캐시를 비웁니다.
+    """
+    db.execute(
+        insert(CatalogVersion)
+        .values(name=COORDI_CATALOG_VERSION_NAME, version=1)
+        .on_conflict_do_update(
+            index_elements=[CatalogVersion.name],
+            set_={"version": CatalogVersion.version + 1, "updated_at": func.now()},
+        )
+    )
+
+
+async def refresh_coordi_catalog_version(db: AsyncSession) -> None:
+    """확인 주기가 지났으면 카탈로그 버전을 읽고, 바뀌었으면 카드 캐시를 비웁니다."""
+    if not _coordi_card_cache.version_check_due():
+        return
+    version = (await db.execute(
+        select(CatalogVersion.version).where(CatalogVersion.name == COORDI_CATALOG_VERSION_NAME)
+    )).scalar_one_or_none()
+    _coordi_card_cache.apply_catalog_version(version or 0)
+
+
+async def load_coordi_cards(db: AsyncSession, coordi_ids: Sequence[int]) -> List[CoordiCard]:
+    """
+    coordi_ids 순서대로 카드를 반환합니다 (존재하지 않는 코디는 제외).
+    캐시에 없는 카드만 selectinload로 한 번에 조회하여 캐시합니다.
+    """
+    await refresh_coordi_catalog_version(db)
+    found, missing = _coordi_card_cache.get_many(coordi_ids)
+
+    if missing:
+        coordis = (await db.execute(
+            select(Coordi)
+            .where(Coordi.coordi_id.in_(missing))
+            .options(
+                selectinload(Coordi.images),
+                selectinload(Coordi.coordi_items).selectinload(CoordiItem.item).selectinload(Item.images),
+            )
+        )).scalars().all()
+        cards = [build_coordi_card(coordi) for coordi in coordis]
+        _coordi_card_cache.put_many(cards)
+        found.update((card.coordi_id, card) for card in cards)
+
+    return [found[coordi_id] for coordi_id in coordi_ids if coordi_id in found]
+
+
+async def hydrate_outfit_payloads(
+    db: AsyncSession,
+    user_id: int,
+    coordi_ids: Sequence[int],
+    favorited_coordi_ids: Optional[set[int]] = None,
+    llm_messages: Optional[Dict[int, str]] = None,
+) -> List[OutfitPayload]:
+    """
+    coordi_ids 순서대로 응답 페이로드를 만듭니다.
+    카드는 캐시에서 가져오고, isFavorited / isSaved는 사용자별 쿼리 두 번으로 덧씌웁니다.
+
+    favorited_coordi_ids를 넘기면 (예: 좋아요 목록) 좋아요 조회를 생략합니다.
+    """
+    cards = await load_coordi_cards(db, coordi_ids)
+    if not cards:
+        return []
+
+    # 사용자별 isFavorited 체크
+    if favorited_coordi_ids is None:
+        favorited_coordi_ids = set((await db.execute(
+            select(UserCoordiInteraction.coordi_id)
+            .where(
+                UserCoordiInteraction.user_id == user_id,
+                UserCoordiInteraction.coordi_id.in_([card.coordi_id for card in cards]),
+                UserCoordiInteraction.action_type == "like",
+            )
+        )).scalars().all())
+
+    # 사용자별 isSaved 체크 (UserClosetItem 존재 여부)
+    all_item_ids = {item_id for card in cards for item_id in card.item_ids}
+    saved_item_ids = set((await db.execute(
+        select(UserClosetItem.item_id)
+        .where(
+            UserClosetItem.user_id == user_id,
+            UserClosetItem.item_id.in_(all_item_ids),
+        )
+    )).scalars().all()) if all_item_ids else set()
+
+    llm_messages = llm_messages or {}
+    return [
+        card.to_payload(
+            card.coordi_id in favorited_coordi_ids,
+            saved_item_ids,
+            llm_messages.get(card.coordi_id),
+        )
+        for card in cards
+    ]
@@ -0,0 +1,243 @@
+"""
+Day 임베딩 온라인 갱신 (좋아요/스킵 fold-in).
+
+'day_v1' 유저 임베딩은 Night 학습 때만 'night_v1' 값으로 초기화되므로, 낮 동안의 좋아요/스킵이
+다음 날 03:00까지 Warm 추천에 반영되지 않았습니다. 이 모듈은 상호작용이 기록될 때마다
+해당 유저의 벡터만 갱신합니다 (`app/ml/fold_in.py`, 아이템 측 가중치는 고정).
+
+    - 병합(coalesce): 같은 유저의 이벤트는 DAY_FOLD_IN_COALESCE_MS 동안 모아 한 번의 fold-in으로 처리
+    - 처리: 백그라운드 스레드 하나가 준비된 유저들의 Day 벡터를 한 번에 읽고, 유저별로 BPR 스텝을 실행한 뒤
+      `write_embeddings`로 한 번에 저장하고 추천 스냅샷을 무효화합니다.
+    - 대상: 서빙 중인 Warm 모델에 있는 유저/코디만 (Cold 유저와 새 코디의 이벤트는 Night 학습에 맡김)
+
+손실 범위:
+    이벤트는 이미 user_coordi_interactions에 기록된 뒤에 들어오므로, 갱신이 실패하거나
+    대기열(DAY_FOLD_IN_MAX_PENDING_USERS)이 가득 차서 버려져도 다음 Night 학습에는 반영됩니다.
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional
+
+import numpy as np
+from sqlalchemy import select
+
+from app.db.database import SessionLocal
+from app.models.user_embedding import UserEmbedding
+from app.services.embedding_writer import USER_EMBEDDINGS, write_embeddings
+from app.services.ranking_snapshot import get_ranking_snapshot_cache
+
+if TYPE_CHECKING:
+    from app.services.warm_recommendation_service import LoadedModel
+
+logger = logging.getLogger(__name__)
+
+DAY_EMBEDDING_VERSION = "day_v1"
+
+# 온라인 갱신 사용 여부
+DAY_FOLD_IN_ENABLED = os.getenv("DAY_FOLD_IN_ENABLED", "true").lower() == "true"
+
+# 같은 유저의 이벤트를 모으는 시간 (밀리초)
+DAY_FOLD_IN_COALESCE_MS = float(os.getenv("DAY_FOLD_IN_COALESCE_MS", "200"))
+
+# 갱신을 기다리는 최대 유저 수 (초과 시 새 유저의 이벤트는 버림)
+DAY_FOLD_IN_MAX_PENDING_USERS = int(os.getenv("DAY_FOLD_IN_MAX_PENDING_USERS", "10000"))
+
+# 종료 시 남은 갱신을 기다리는 최대 시간 (초)
+DAY_FOLD_IN_SHUTDOWN_TIMEOUT_SECONDS = float(os.getenv("DAY_FOLD_IN_SHUTDOWN_TIMEOUT_SECONDS", "5"))
+
+
+@dataclass
+class PendingFoldIn:
+    """갱신 대기 중인 유저의 이벤트 (병합된 이벤트 포함)."""
+
+    user_id: int
+    liked: set = field(default_factory=set)
+    skipped: set = field(default_factory=set)
+    events: int = 0
+    opened_at: float = field(default_factory=time.monotonic)
+
+
+class DayEmbeddingUpdater:
+    """좋아요/스킵 이벤트로 Day 임베딩을 갱신하는 백그라운드 워커 (submit은 Thread-safe)."""
+
+    def __init__(
+        self,
+        coalesce_ms: float = DAY_FOLD_IN_COALESCE_MS,
+        max_pending_users: int = DAY_FOLD_IN_MAX_PENDING_USERS,
+        seed: Optional[int] = None,
+    ):
+        self.coalesce_seconds = max(coalesce_ms, 0) / 1000
+        self.max_pending_users = max(max_pending_users, 1)
+        self._pending: Dict[int, PendingFoldIn] = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+        self._rng = np.random.default_rng(seed)
+
+        self.received = 0
+        self.coalesced = 0
+        self.updated_users = 0
+        self.dropped = 0
+        self.folded_events = 0
+        self.fold_in_seconds = 0.0  # fold-in 계산에 쓴 시간 누계 (DB 입출력 제외)
+
+    def start(self) -> None:
+        """백그라운드 워커 스레드를 시작합니다 (이미 실행 중이면 무시)."""
+        if self._worker is not None and self._worker.is_alive():
+            return
+
+        self._stop.clear()
+        self._worker = threading.Thread(target=self._run, name="day-embedding-updater", daemon=True)
+        self._worker.start()
+
+    def close(self, timeout: float = DAY_FOLD_IN_SHUTDOWN_TIMEOUT_SECONDS) -> None:
+        """워커를 종료하고 대기 중인 갱신을 모두 처리합니다."""
+        if self._worker is not None:
+            self._stop.set()
+            self._wake.set()
+            self._worker.join(timeout)
+            self._worker = None
+
+        self.flush(force=True)
+        remaining = len(self)
+        if remaining:
+            logger.warning(f"[DayEmbeddingUpdater] {remaining} users were not updated before shutdown")
+
+    def submit(self, user_id: int, liked: Iterable[int] = (), skipped: Iterable[int] = ()) -> None:
+        """유저의 좋아요/스킵 코디 ID를 갱신 대기열에 추가합니다."""
+        liked, skipped = set(liked), set(skipped)
+        if not liked and not skipped:
+            return
+
+        with self._lock:
+            self.received += len(liked) + len(skipped)
+            entry = self._pending.get(user_id)
+            if entry is None:
+                if len(self._pending) >= self.max_pending_users:
+                    self.dropped += len(liked) + len(skipped)
+                    return
+                entry = self._pending[user_id] = PendingFoldIn(user_id)
+            else:
+                self.coalesced += len(liked) + len(skipped)
+            # 좋아요 우선 (스킵 후 좋아요로 바뀐 코디는 좋아요로만 반영)
+            entry.liked |= liked
+            entry.skipped = (entry.skipped | skipped) - entry.liked
+            entry.events += len(liked) + len(skipped)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._pending)
+
+    @property
+    def fold_in_ms_per_event(self) -> float:
+        """이벤트 하나당 평균 fold-in 계산 시간 (밀리초)."""
+        return self.fold_in_seconds * 1000 / self.folded_events if self.folded_events else 0.0
+
+    def flush(self, force: bool = False) -> int:
+        """병합 구간이 끝난 유저(force=True이면 전부)의 Day 임베딩을 갱신하고, 저장한 유저 수를 반환합니다."""
+        batch = self._take(force)
+        if not batch:
+            return 0
+
+        # 서빙 중인 모델 기준으로 갱신 (로드 전이면 Night 학습에 맡김)
+        from app.ml.fold_in import build_fold_in_pairs, fold_in_user_vector
+        from app.services.warm_recommendation_service import current_warm_model
+        loaded = current_warm_model()
+        if loaded is None:
+            return 0
+
+        targets = [entry for entry in batch if entry.user_id in loaded.user_index]
+        if not targets:
+            return 0
+
+        db = SessionLocal()
+        try:
+            day_vectors = dict(db.execute(
+                select(UserEmbedding.user_id, UserEmbedding.vector).where(
+                    UserEmbedding.user_id.in_([entry.user_id for entry in targets]),
+                    UserEmbedding.model_version == DAY_EMBEDDING_VERSION,
+                )
+            ).all())
+
+            start = time.perf_counter()
+            user_ids, vectors = [], []
+            engine = loaded.engine
+            for entry in targets:
+                liked = self._item_indices(loaded, entry.liked)
+                skipped = self._item_indices(loaded, entry.skipped)
+                if len(liked) == 0 and len(skipped) == 0:
+                    continue
+
+                # 시작점은 현재 Day 벡터 (없거나 차원이 다르면 Night 벡터), anchor는 Night 벡터
+                night_vector = engine.user_vector(loaded.user_index.get(entry.user_id))
+                vector = day_vectors.get(entry.user_id)
+                vector = night_vector if vector is None else np.asarray(vector, dtype=np.float32)
+                if vector.shape != (engine.embedding_dim,):
+                    vector = night_vector
+
+                pos, neg = build_fold_in_pairs(liked, skipped, engine.num_items, self._rng)
+                user_ids.append(entry.user_id)
+                vectors.append(fold_in_user_vector(engine, vector, pos, neg, anchor=night_vector))
+                self.folded_events += entry.events
+            self.fold_in_seconds += time.perf_counter() - start
+
+            if not user_ids:
+                return 0
+            write_embeddings(db, USER_EMBEDDINGS, DAY_EMBEDDING_VERSION, np.array(user_ids), np.stack(vectors))
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"[DayEmbeddingUpdater] Failed to update day embeddings for {len(targets)} users: {e}")
+            return 0
+        finally:
+            db.close()
+
+        # 다음 추천 요청은 갱신된 Day 벡터로 다시 스코어링
+        snapshot_cache = get_ranking_snapshot_cache()
+        for user_id in user_ids:
+            snapshot_cache.invalidate(user_id)
+        self.updated_users += len(user_ids)
+        return len(user_ids)
+
+    @staticmethod
+    def _item_indices(loaded: "LoadedModel", coordi_ids: set) -> np.ndarray:
+        """코디 ID를 모델 아이템 인덱스로 변환합니다 (모델에 없는 코디는 제외)."""
+        indices = loaded.item_index.lookup(np.fromiter(coordi_ids, dtype=np.int64, count=len(coordi_ids)))
+        return indices[indices >= 0]
+
+    def _take(self, force: bool) -> List[PendingFoldIn]:
+        now = time.monotonic()
+        with self._lock:
+            ready = [
+                user_id
+                for user_id, entry in self._pending.items()
+                if force or now - entry.opened_at >= self.coalesce_seconds
+            ]
+            return [self._pending.pop(user_id) for user_id in ready]
+
+    def _run(self) -> None:
+        interval = max(self.coalesce_seconds, 0.01)
+        while not self._stop.is_set():
+            self._wake.wait(interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"[DayEmbeddingUpdater] Unexpected error: {e}")
+
+
+_day_embedding_updater: Optional[DayEmbeddingUpdater] = None
+
+
+def get_day_embedding_updater() -> DayEmbeddingUpdater:
+    global _day_embedding_updater
+    if _day_embedding_updater is None:
+        _day_embedding_updater = DayEmbeddingUpdater()
+    return _day_embedding_updater
@@ -0,0 +1,150 @@
+"""
+EmbeddingService 비동기 마이크로 배처.
+
+동시에 들어온 임베딩 요청을 짧은 시간(EMBEDDING_BATCH_WAIT_MS) 동안 모아
+워커 스레드에서 한 번의 `EmbeddingService.encode_many` 호출로 처리합니다.
+요청마다 단건 encode를 실행하는 것보다 모델 호출 횟수와 스레드 점유가 줄어듭니다.
+
+사용법:
+    vector = await get_embedding_batcher().embed("#캐주얼 #스트릿")
+
+    # 동기 함수(FastAPI 스레드풀)에서 호출
+    vector = get_embedding_batcher().embed_blocking("#캐주얼 #스트릿")
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from typing import List, Optional
+
+from app.services.embedding_service import EmbeddingService
+
+logger = logging.getLogger(__name__)
+
+# 한 번에 묶을 최대 요청 수
+EMBEDDING_BATCH_SIZE = int(os.getenv("EMBEDDING_BATCH_SIZE", "32"))
+
+# 첫 요청 이후 추가 요청을 기다리는 최대 시간 (밀리초)
+EMBEDDING_BATCH_WAIT_MS = float(os.getenv("EMBEDDING_BATCH_WAIT_MS", "5"))
+
+
+class EmbeddingBatcher:
+    """asyncio 이벤트 루프 하나에 묶이는 임베딩 요청 마이크로 배처."""
+
+    def __init__(
+        self,
+        service: Optional[EmbeddingService] = None,
+        max_batch_size: int = EMBEDDING_BATCH_SIZE,
+        max_wait_ms: float = EMBEDDING_BATCH_WAIT_MS,
+    ):
+        self._service = service
+        self.max_batch_size = max(max_batch_size, 1)
+        self.max_wait = max(max_wait_ms, 0) / 1000
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    @property
+    def service(self) -> EmbeddingService:
+        if self._service is None:
+            self._service = EmbeddingService()
+        return self._service
+
+    def start(self) -> None:
+        """현재 이벤트 루프에서 배치 워커를 시작합니다 (이미 실행 중이면 무시)."""
+        loop = asyncio.get_running_loop()
+        if self._worker is not None and not self._worker.done() and self._loop is loop:
+            return
+
+        self._loop = loop
+        self._queue = asyncio.Queue()
+        self._worker = loop.create_task(self._run(), name="embedding-batcher")
+
+    async def close(self) -> None:
+        """워커를 종료하고 대기 중인 요청은 취소합니다."""
+        if self._worker is None:
+            return
+
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+
+        while self._queue is not None and not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.cancel()
+
+        self._worker = None
+        self._loop = None
+
+    async def embed(self, text: str) -> List[float]:
+        """텍스트 하나를 임베딩합니다 (동시 요청과 묶여서 처리됨)."""
+        self.start()
+        future = self._loop.create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    def embed_blocking(self, text: str, timeout: Optional[float] = 30.0) -> List[float]:
+        """
+        동기 코드에서 사용할 수 있는 embed.
+
+        배치 워커가 다른 스레드의 이벤트 루프에서 실행 중이면 그 루프에 요청을 넣어 함께 묶고,
+        그렇지 않으면 (스크립트 등) 직접 encode합니다.
+        """
+        loop = self._loop
+        if loop is not None and loop.is_running() and self._worker is not None and not self._worker.done():
+            try:
+                running = asyncio.get_running_loop()
+            except RuntimeError:
+                running = None
+            if running is not loop:
+                return asyncio.run_coroutine_threadsafe(self.embed(text), loop).result(timeout)
+
+        return self.service.generate_embedding(text)
+
+    async def _run(self) -> None:
+        while True:
+            batch = [await self._queue.get()]
+
+            # 대기 시간 동안 추가 요청 수집
+            deadline = self._loop.time() + self.max_wait
+            while len(batch) < self.max_batch_size:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                remaining = deadline - self._loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            texts = [text for text, _ in batch]
+            try:
+                # 모델 추론은 워커 스레드에서 실행 (이벤트 루프 블로킹 방지)
+                vectors = await asyncio.to_thread(self.service.encode_many, texts)
+            except Exception as e:
+                logger.error(f"[EmbeddingBatcher] Batch encode failed: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), vector in zip(batch, vectors):
+                if not future.done():
+                    future.set_result(vector)
+
+
+_batcher: Optional[EmbeddingBatcher] = None
+
+
+def get_embedding_batcher() -> EmbeddingBatcher:
+    global _batcher
+    if _batcher is None:
+        _batcher = EmbeddingBatcher()
+    return _batcher
@@ -3,62 +3,182 @@ Description embedding 생성 서비스
 
 sentence-transformers/distiluse-base-multilingual-cased-v2 모델을 사용하여
 텍스트를 512차원 벡터로 변환합니다.
+
+추론 백엔드는 EMBEDDING_BACKEND 환경 변수로 선택합니다 (CPU 전용 인스턴스용).
+    - torch: 기본 fp32 모델
+    - int8: Linear 레이어 int8 동적 양자화 (torch.ao.quantization.quantize_dynamic)
+    - onnx: ONNX Runtime 그래프 (sentence-transformers>=3.2, optimum[onnxruntime] 필요)
+fp32 모델과의 코사인 유사도/지연 시간/메모리 비교는 scripts/benchmark_embedding_backends.py 참고.
 """
 
-from typing import List
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, List, Optional, Sequence
+
+if TYPE_CHECKING:
+    from sentence_transformers import SentenceTransformer
+
+logger = logging.getLogger(__name__)
+
+# 임베딩 모델 이름 (모델 이름이나 추론 백엔드가 바뀌면 저장된 Cold-Start 쿼리 임베딩도 무효화됨)
+EMBEDDING_MODEL_NAME = "sentence-transformers/distiluse-base-multilingual-cased-v2"
+
+# encode_many에서 SentenceTransformer.encode에 전달하는 배치 크기
+ENCODE_BATCH_SIZE = int(os.getenv("EMBEDDING_ENCODE_BATCH_SIZE", "64"))
+
+# 텍스트 -> 임베딩 결과 캐시 크기
+EMBEDDING_CACHE_SIZE = int(os.getenv("EMBEDDING_CACHE_SIZE", "1000"))
+
+# 추론 백엔드 (torch | int8 | onnx)
+EMBEDDING_BACKENDS = ("torch", "int8", "onnx")
+EMBEDDING_BACKEND = os.getenv("EMBEDDING_BACKEND", "torch").lower()
+
+# onnx 백엔드에서 사용할 ONNX 파일 (예: onnx/model_qint8_avx512_vnni.onnx, 미지정 시 model.onnx)
+EMBEDDING_ONNX_FILE = os.getenv("EMBEDDING_ONNX_FILE")
+
 
-from sentence_transformers import SentenceTransformer
+def embedding_backend_signature(backend: str = EMBEDDING_BACKEND) -> str:
+    """
+    추론 백엔드 설정을 나타내는 문자열 (예: 'torch', 'onnx:onnx/model_qint8_avx512_vnni.onnx').
+    백엔드마다 벡터가 조금씩 다르므로 저장된 임베딩의 버전 문자열에 포함합니다.
+    """
+    if backend == "onnx":
+        return f"onnx:{EMBEDDING_ONNX_FILE or 'model.onnx'}"
+    return backend
+
+
+def load_embedding_model(backend: str = EMBEDDING_BACKEND) -> "SentenceTransformer":
+    """
+    지정한 추론 백엔드로 임베딩 모델을 로드합니다.
+    onnx 백엔드를 사용할 수 없는 환경이면 torch(fp32)로 대체합니다.
+    (sentence-transformers/torch import는 시간이 오래 걸리므로 실제 로드 시점에 수행)
+    """
+    import torch
+    from sentence_transformers import SentenceTransformer
+
+    if backend not in EMBEDDING_BACKENDS:
+        raise ValueError(f"Unknown EMBEDDING_BACKEND: {backend} (expected one of {EMBEDDING_BACKENDS})")
+
+    if backend == "onnx":
+        model_kwargs = {"file_name": EMBEDDING_ONNX_FILE} if EMBEDDING_ONNX_FILE else None
+        try:
+            return SentenceTransformer(EMBEDDING_MODEL_NAME, device="cpu", backend="onnx", model_kwargs=model_kwargs)
+        except (TypeError, ImportError) as e:
+            # sentence-transformers<3.2 (backend 인자 없음) 또는 optimum/onnxruntime 미설치
+            logger.warning(f"ONNX embedding backend unavailable, falling back to torch: {e}")
+            return SentenceTransformer(EMBEDDING_MODEL_NAME)
+
+    model = SentenceTransformer(EMBEDDING_MODEL_NAME, device="cpu" if backend == "int8" else None)
+    if backend == "int8":
+        # 가중치를 int8로 저장하고 활성값은 실행 시 동적으로 양자화 (CPU 전용)
+        model.eval()
+        torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8, inplace=True)
+    return model
 
-# TODO: 데이터주입이 끝나면 모두 주석처리
-from functools import lru_cache
 
 class EmbeddingService:
     """Description embedding을 생성하는 서비스 (Singleton)"""
-    
+
     _instance = None
     _model = None
+    _init_lock = threading.Lock()
 
     def __new__(cls):
         if cls._instance is None:
-            cls._instance = super(EmbeddingService, cls).__new__(cls)
-            # 모델 초기화 (한 번만 실행)
-            model_name = "sentence-transformers/distiluse-base-multilingual-cased-v2"
-            cls._model = SentenceTransformer(model_name)
+            # 백그라운드 로드와 첫 요청이 동시에 생성해도 모델은 한 번만 로드
+            with cls._init_lock:
+                if cls._instance is None:
+                    instance = super(EmbeddingService, cls).__new__(cls)
+                    # 모델 초기화 (한 번만 실행)
+                    cls._model = load_embedding_model()
+                    cls._cache = OrderedDict()
+                    cls._cache_lock = threading.Lock()
+                    cls._instance = instance
         return cls._instance
 
     def __init__(self):
         """
         Embedding 모델 초기화
-        
+
         모델: distiluse-base-multilingual-cased-v2
         차원: 512
         """
         # __init__은 매번 호출되지만 모델은 __new__에서 한 번만 로드됨
         self.dimension = 512
-    
-    @lru_cache(maxsize=1000)
+
     def generate_embedding(self, text: str) -> List[float]:
         """
         텍스트를 embedding 벡터로 변환
-        
+
         Args:
             text: 변환할 텍스트
-            
+
         Returns:
             embedding 벡터 (512차원 리스트)
         """
-        if not text or not text.strip():
-            return [0.0] * self.dimension
-        
-        try:
-            # _model 클래스 변수 사용
-            embedding = self._model.encode(
-                text,
-                normalize_embeddings=True,
-                show_progress_bar=False
-            )
-            return embedding.tolist()
-        except Exception as e:
-            print(f"Embedding 생성 실패: {e}")
-            return [0.0] * self.dimension
+        return self.encode_many([text])[0]
+
+    def encode_many(self, texts: Sequence[str], batch_size: int = ENCODE_BATCH_SIZE) -> List[List[float]]:
+        """
+        여러 텍스트를 한 번의 배치 encode로 변환
+
+        캐시에 있는 텍스트와 중복 텍스트는 제외하고 나머지만 모델에 전달합니다.
+
+        Args:
+            texts: 변환할 텍스트 목록
+            batch_size: 모델 배치 크기
+
+        Returns:
+            texts와 같은 순서의 embedding 벡터 목록 (빈 텍스트는 0 벡터)
+        """
+        results: List[Optional[List[float]]] = [None] * len(texts)
+        pending: dict[str, List[int]] = {}
+
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                results[i] = [0.0] * self.dimension
+                continue
+            cached = self._cache_get(text)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending.setdefault(text, []).append(i)
+
+        if pending:
+            unique_texts = list(pending)
+            try:
+                # _model 클래스 변수 사용
+                embeddings = self._model.encode(
+                    unique_texts,
+                    batch_size=batch_size,
+                    normalize_embeddings=True,
+                    show_progress_bar=False
+                )
+                for text, embedding in zip(unique_texts, embeddings):
+                    vector = embedding.tolist()
+                    self._cache_put(text, vector)
+                    for i in pending[text]:
+                        results[i] = vector
+            except Exception as e:
+                print(f"Embedding 생성 실패: {e}")
+                for positions in pending.values():
+                    for i in positions:
+                        results[i] = [0.0] * self.dimension
+
+        return results
+
+    def _cache_get(self, text: str) -> Optional[List[float]]:
+        with self._cache_lock:
+            vector = self._cache.get(text)
+            if vector is not None:
+                self._cache.move_to_end(text)
+            return vector
 
+    def _cache_put(self, text: str, vector: List[float]) -> None:
+        with self._cache_lock:
+            self._cache[text] = vector
+            self._cache.move_to_end(text)
+            while len(self._cache) > EMBEDDING_CACHE_SIZE:
+                self._cache.popitem(last=False)
@@ -0,0 +1,205 @@
+"""
+Night 학습 임베딩 일괄 저장 (COPY + INSERT ... ON CONFLICT).
+
+유저/아이템마다 `db.get` 후 ORM add/update를 하는 대신, NumPy 가중치 행렬을 그대로
+PostgreSQL 바이너리 COPY 형식으로 스트리밍하여 임시 테이블에 적재한 뒤
+한 번의 set-based `INSERT ... ON CONFLICT DO UPDATE`로 반영합니다.
+
+    1. changed_rows: 이전 체크포인트와 벡터가 같은 행은 COPY 대상에서 제외 (NumPy 비교)
+       (sparse 학습에서는 이번 배치에 나온 유저/아이템 행만 바뀝니다)
+    2. COPY ... FROM STDIN (FORMAT binary): float32 행렬을 텍스트 변환 없이 vector 바이너리 형식으로 전송
+    3. INSERT ... SELECT FROM 임시 테이블 ON CONFLICT DO UPDATE ... WHERE vector IS DISTINCT FROM
+       - DB의 벡터와 같은 행은 갱신하지 않음 (updated_at 유지)
+       - 그 사이 삭제된 유저/코디의 행은 건너뜀
+
+트랜잭션 커밋은 호출하는 쪽에서 합니다 (같은 트랜잭션 안에서 여러 번 호출 가능).
+
+사용법:
+    mask = changed_rows(indices, weights, previous_weights)
+    stats = write_embeddings(db, USER_EMBEDDINGS, "night_v1", user_ids[mask], weights[indices[mask]])
+    db.commit()
+    logger.info(f"{stats.rows_per_second:,.0f} rows/s")
+"""
+
+from __future__ import annotations
+
+import os
+import time
+from dataclasses import dataclass
+from typing import Iterator, Optional
+
+import numpy as np
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+# COPY 스트림 하나를 만들 때 한 번에 직렬화하는 행 수
+EMBEDDING_COPY_CHUNK_ROWS = int(os.getenv("EMBEDDING_COPY_CHUNK_ROWS", "10000"))
+
+_STAGE_TABLE = "embedding_write_stage"
+
+# copy_expert가 한 번에 읽어 서버로 보내는 바이트 수
+_COPY_READ_SIZE = 1 << 20
+
+# PostgreSQL COPY 바이너리 형식 헤더 (signature + flags + header extension length) / 트레일러
+_COPY_HEADER = b"PGCOPY\n\xff\r\n\x00" + np.array([0, 0], dtype=">i4").tobytes()
+_COPY_TRAILER = np.array([-1], dtype=">i2").tobytes()
+
+
+@dataclass(frozen=True)
+class EmbeddingTarget:
+    """임베딩 테이블과 참조 대상 테이블."""
+
+    table: str
+    id_column: str
+    parent_table: str
+
+
+USER_EMBEDDINGS = EmbeddingTarget("user_embeddings", "user_id", "users")
+ITEM_EMBEDDINGS = EmbeddingTarget("item_embeddings", "coordi_id", "coordis")
+
+
+@dataclass
+class EmbeddingWriteStats:
+    """임베딩 저장 결과."""
+
+    table: str
+    model_version: str
+    copied: int  # 임시 테이블에 적재한 행 수
+    written: int  # 실제로 삽입/갱신된 행 수
+    seconds: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.copied / self.seconds if self.seconds > 0 else 0.0
+
+
+def changed_rows(
+    indices: np.ndarray,
+    weights: np.ndarray,
+    previous_weights: Optional[np.ndarray] = None,
+) -> np.ndarray:
+    """
+    weights[indices] 중 이전 가중치와 다른 행의 mask.
+
+    previous_weights가 없거나 그 범위를 넘는 인덱스(새로 추가된 유저/아이템)는 변경된 것으로 봅니다.
+    """
+    indices = np.asarray(indices, dtype=np.int64)
+    if previous_weights is None:
+        return np.ones(len(indices), dtype=bool)
+
+    mask = indices >= previous_weights.shape[0]
+    known = ~mask
+    mask[known] = np.any(weights[indices[known]] != previous_weights[indices[known]], axis=1)
+    return mask
+
+
+def _copy_chunks(ids: np.ndarray, vectors: np.ndarray, chunk_rows: int) -> Iterator[bytes]:
+    """(id BIGINT, vector) 행을 COPY 바이너리 형식으로 직렬화합니다 (chunk_rows 행씩)."""
+    dim = vectors.shape[1]
+    row_dtype = np.dtype([
+        ("num_fields", ">i2"),
+        ("id_length", ">i4"),
+        ("id", ">i8"),
+        ("vector_length", ">i4"),
+        ("dim", ">i2"),
+        ("unused", ">i2"),
+        ("values", ">f4", (dim,)),
+    ])
+
+    yield _COPY_HEADER
+    for start in range(0, len(ids), chunk_rows):
+        end = min(start + chunk_rows, len(ids))
+        rows = np.empty(end - start, dtype=row_dtype)
+        rows["num_fields"] = 2
+        rows["id_length"] = 8
+        rows["id"] = ids[start:end]
+        rows["vector_length"] = 4 + 4 * dim
+        rows["dim"] = dim
+        rows["unused"] = 0
+        rows["values"] = vectors[start:end]
+        yield rows.tobytes()
+    yield _COPY_TRAILER
+
+
+class _ChunkReader:
+    """bytes 청크 iterator를 copy_expert가 읽을 수 있는 파일 객체로 감쌉니다 (청크를 복사하지 않고 잘라 반환)."""
+
+    def __init__(self, chunks: Iterator[bytes]):
+        self._chunks = chunks
+        self._current = memoryview(b"")
+        self._offset = 0
+
+    def read(self, size: int = -1) -> bytes:
+        while self._offset >= len(self._current):
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return b""
+            self._current, self._offset = memoryview(chunk), 0
+        end = len(self._current) if size < 0 else self._offset + size
+        data = self._current[self._offset : end]
+        self._offset += len(data)
+        return data.tobytes()
+
+
+def write_embeddings(
+    db: Session,
+    target: EmbeddingTarget,
+    model_version: str,
+    ids: np.ndarray,
+    vectors: np.ndarray,
+    chunk_rows: int = EMBEDDING_COPY_CHUNK_ROWS,
+) -> EmbeddingWriteStats:
+    """
+    (ids[k], vectors[k]) 임베딩을 target 테이블의 model_version으로 일괄 upsert합니다.
+
+    Args:
+        db: 동기 DB 세션 (psycopg2, 커밋은 호출하는 쪽에서)
+        target: USER_EMBEDDINGS 또는 ITEM_EMBEDDINGS
+        model_version: 저장할 모델 버전 (예: 'night_v1', 'day_v1')
+        ids: DB ID (int64, N)
+        vectors: 임베딩 행렬 (N, dim)
+
+    Returns:
+        EmbeddingWriteStats: 적재/반영 행 수와 처리량 (rows/sec)
+    """
+    start = time.perf_counter()
+    ids = np.asarray(ids, dtype=np.int64)
+    vectors = np.asarray(vectors, dtype=np.float32)
+    if len(ids) == 0:
+        return EmbeddingWriteStats(target.table, model_version, copied=0, written=0, seconds=0.0)
+
+    db.execute(text(f"DROP TABLE IF EXISTS pg_temp.{_STAGE_TABLE}"))
+    db.execute(text(f"CREATE TEMP TABLE {_STAGE_TABLE} (id BIGINT NOT NULL, vector vector NOT NULL) ON COMMIT DROP"))
+
+    # 세션과 같은 트랜잭션의 psycopg2 커넥션으로 COPY
+    dbapi_connection = db.connection().connection
+    with dbapi_connection.cursor() as cursor:
+        cursor.copy_expert(
+            f"COPY {_STAGE_TABLE} (id, vector) FROM STDIN WITH (FORMAT binary)",
+            _ChunkReader(_copy_chunks(ids, vectors, max(chunk_rows, 1))),
+            size=_COPY_READ_SIZE,
+        )
+
+    result = db.execute(
+        text(
+            f"""
+            INSERT INTO {target.table} ({target.id_column}, model_version, vector, updated_at)
+            SELECT s.id, :model_version, s.vector, now()
+            FROM {_STAGE_TABLE} s
+            WHERE EXISTS (SELECT 1 FROM {target.parent_table} p WHERE p.{target.id_column} = s.id)
+            ON CONFLICT ({target.id_column}, model_version) DO UPDATE
+            SET vector = EXCLUDED.vector, updated_at = now()
+            WHERE {target.table}.vector IS DISTINCT FROM EXCLUDED.vector
+            """
+        ),
+        {"model_version": model_version},
+    )
+    db.execute(text(f"DROP TABLE {_STAGE_TABLE}"))
+
+    return EmbeddingWriteStats(
+        target.table,
+        model_version,
+        copied=len(ids),
+        written=result.rowcount,
+        seconds=time.perf_counter() - start,
+    )
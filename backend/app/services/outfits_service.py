@@ -4,139 +4,46 @@
 
 from __future__ import annotations
 
-from datetime import datetime, timezone
-from typing import Literal
+from datetime import datetime, timedelta, timezone
+from typing import Literal, NamedTuple, Optional
 
-from sqlalchemy import func, select
-from sqlalchemy.orm import Session, selectinload
+from sqlalchemy import func, select, text
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.core.exceptions import AlreadyFavoritedError, FavoriteNotFoundError, OutfitNotFoundError
+from app.core.exceptions import AlreadyFavoritedError, FavoriteNotFoundError, OutfitNotFoundError, ValidationError
+from app.core.pagination import cursor_pagination, decode_cursor, keyset_before, page_pagination, split_page
 from app.models.coordi import Coordi
-from app.models.coordi_item import CoordiItem
-from app.models.item import Item
-from app.models.user_closet_item import UserClosetItem
 from app.models.user_coordi_interaction import UserCoordiInteraction
-from app.models.user_coordi_view_log import UserCoordiViewLog
 from app.schemas.common import PaginationPayload
-from app.schemas.recommendation_response import OutfitItemPayload, OutfitPayload
+from app.schemas.recommendation_response import OutfitPayload
+from app.services.coordi_card_cache import get_coordi_card_cache, hydrate_outfit_payloads
+from app.services.day_embedding_updater import DAY_FOLD_IN_ENABLED, get_day_embedding_updater
+from app.services.ranking_snapshot import get_ranking_snapshot_cache
+from app.services.seen_filter import unseen_by
+from app.services.seen_items import get_seen_item_cache
+from app.services.view_log_buffer import VIEW_LOG_MAX_AGE_SECONDS, get_view_log_buffer
 
 # 필터 타입 정의
 SeasonFilter = Literal["all", "spring", "summer", "fall", "winter"]
 StyleFilter = Literal["all", "casual", "street", "sporty", "minimal"]
 GenderFilter = Literal["all", "male", "female"]
+SwipeAction = Literal["like", "skip"]
 
-
-def _build_item_payload_list(
-    item: Item,
-    user_id: int,
-    user_closet_item_ids: set[int],
-) -> OutfitItemPayload:
-    """
-    아이템 페이로드를 생성합니다.
-    
-    Parameters
-    ----------
-    item:
-        아이템 모델
-    user_id:
-        사용자 ID
-    user_closet_item_ids:
-        사용자가 저장한 아이템 ID 집합
-        
-    Returns
-    -------
-    OutfitItemPayload:
-        아이템 페이로드
-    """
-    # 메인 이미지 추출 (is_main=True 우선, 없으면 첫 번째 이미지)
-    main_image = next(
-        (img for img in item.images if img.is_main),
-        item.images[0] if item.images else None
-    )
-    image_url = main_image.image_url if main_image else None
-    
-    # isSaved 체크
-    is_saved = item.item_id in user_closet_item_ids
-    
-    # price 변환 (Numeric → int, 원 단위)
-    price = int(float(item.price)) if item.price is not None else None
-    
-    return OutfitItemPayload(
-        id=item.item_id,
-        category=item.category,
-        brand=item.brand_name_ko,
-        name=item.item_name,
-        price=price,
-        imageUrl=image_url,
-        purchaseUrl=item.purchase_url,
-        isSaved=is_saved,
-    )
-
-
-def _build_outfit_payload_list(
-    coordi: Coordi,
-    user_id: int,
-    user_favorited_coordi_ids: set[int],
-    user_closet_item_ids: set[int],
-) -> OutfitPayload:
-    """
-    코디 페이로드를 생성합니다 (LLM 메시지 없음).
-    
-    Parameters
-    ----------
-    coordi:
-        코디 모델
-    user_id:
-        사용자 ID
-    user_favorited_coordi_ids:
-        사용자가 좋아요한 코디 ID 집합
-    user_closet_item_ids:
-        사용자가 저장한 아이템 ID 집합
-        
-    Returns
-    -------
-    OutfitPayload:
-        코디 페이로드 (llmMessage는 None)
-    """
-    # 메인 이미지 추출 (is_main=True 우선, 없으면 첫 번째 이미지)
-    main_image = next(
-        (img for img in coordi.images if img.is_main),
-        coordi.images[0] if coordi.images else None
-    )
-    if main_image is None:
-        raise ValueError(f"Coordi {coordi.coordi_id} has no images")
-    
-    # isFavorited 체크
-    is_favorited = coordi.coordi_id in user_favorited_coordi_ids
-    
-    # 아이템 페이로드 생성
-    items = [
-        _build_item_payload_list(coordi_item.item, user_id, user_closet_item_ids)
-        for coordi_item in coordi.coordi_items
-    ]
-    
-    return OutfitPayload(
-        id=coordi.coordi_id,
-        imageUrl=main_image.image_url,
-        gender=coordi.gender,
-        season=coordi.season,
-        style=coordi.style,
-        description=coordi.description or "",
-        isFavorited=is_favorited,
-        llmMessage=None,  # 목록 조회에서는 LLM 메시지 없음
-        items=items,
-        createdAt=coordi.created_at,
-    )
+# 커서가 다른 목록에 재사용되지 않도록 구분하는 scope
+OUTFITS_CURSOR_SCOPE = "outfits"
+FAVORITES_CURSOR_SCOPE = "favorites"
 
 
 async def get_outfits_list(
-    db: Session,
+    db: AsyncSession,
     user_id: int,
     season: SeasonFilter = "all",
     style: StyleFilter = "all",
     gender: GenderFilter = "all",
     page: int = 1,
     limit: int = 10,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
 ) -> tuple[list[OutfitPayload], PaginationPayload]:
     """
     필터링된 코디 목록을 조회합니다.
@@ -154,143 +61,165 @@ async def get_outfits_list(
     gender:
         성별 필터 ("all"이면 필터링 안 함)
     page:
-        페이지 번호 (1부터 시작)
+        페이지 번호 (1부터 시작, cursor가 있으면 무시)
     limit:
         페이지당 개수
+    cursor:
+        이전 응답의 nextCursor (있으면 (created_at, coordi_id) keyset으로 이어서 조회)
+    include_total:
+        cursor 모드에서도 전체 개수를 계산할지 여부
         
     Returns
     -------
     tuple[list[OutfitPayload], PaginationPayload]:
         (코디 페이로드 리스트, 페이지네이션 정보)
     """
-    # 1. 사용자가 이미 본 코디 또는 상호작용한 코디 ID 조회 (제외할 코디)
-    viewed_coordi_ids = db.execute(
-        select(UserCoordiViewLog.coordi_id)
-        .where(UserCoordiViewLog.user_id == user_id)
-    ).scalars().all()
-    
-    interacted_coordi_ids = db.execute(
-        select(UserCoordiInteraction.coordi_id)
-        .where(UserCoordiInteraction.user_id == user_id)
-    ).scalars().all()
-    
-    # 두 집합 합치기 (중복 제거)
-    excluded_coordi_ids = set(viewed_coordi_ids) | set(interacted_coordi_ids)
-    
-    # 2. 필터링 쿼리 구성
-    query = select(Coordi)
-    
-    if season != "all":
-        query = query.where(Coordi.season == season)
-    if style != "all":
-        query = query.where(Coordi.style == style)
-    if gender != "all":
-        query = query.where(Coordi.gender == gender)
+    position = decode_cursor(OUTFITS_CURSOR_SCOPE, cursor) if cursor else None
     
-    # 이미 본 코디 또는 상호작용한 코디 제외
-    if excluded_coordi_ids:
-        query = query.where(Coordi.coordi_id.notin_(excluded_coordi_ids))
-    
-    # 3. 전체 개수 조회 (페이지네이션용)
-    count_query = select(func.count(Coordi.coordi_id))
+    # 1. 필터 조건 구성 (목록 쿼리와 개수 쿼리가 공유)
+    conditions = []
     if season != "all":
-        count_query = count_query.where(Coordi.season == season)
+        conditions.append(Coordi.season == season)
     if style != "all":
-        count_query = count_query.where(Coordi.style == style)
+        conditions.append(Coordi.style == style)
     if gender != "all":
-        count_query = count_query.where(Coordi.gender == gender)
+        conditions.append(Coordi.gender == gender)
     
-    # 이미 본 코디 또는 상호작용한 코디 제외
-    if excluded_coordi_ids:
-        count_query = count_query.where(Coordi.coordi_id.notin_(excluded_coordi_ids))
+    # 2. 이미 본 코디 또는 상호작용한 코디 제외 (NOT EXISTS anti-join)
+    conditions.append(unseen_by(user_id))
     
-    total_items = db.execute(count_query).scalar_one()
+    # 3. 전체 개수 조회 (page 모드 또는 includeTotal=true일 때만)
+    total_items = None
+    if position is None or include_total:
+        total_items = (await db.execute(
+            select(func.count(Coordi.coordi_id)).where(*conditions)
+        )).scalar_one()
     
     # 결과가 없으면 빈 결과 반환
-    if total_items == 0:
-        return [], PaginationPayload(
-            currentPage=page,
-            totalPages=0,
-            totalItems=0,
-            hasNext=False,
-            hasPrev=False,
-        )
-    
-    # 4. 페이지네이션 적용 및 정렬
-    offset = (page - 1) * limit
-    coordis = db.execute(
-        query
-        .order_by(Coordi.created_at.desc())
-        .offset(offset)
-        .limit(limit)
-        .options(
-            selectinload(Coordi.images),
-            selectinload(Coordi.coordi_items).selectinload(CoordiItem.item).selectinload(Item.images),
-        )
-    ).scalars().all()
-    
-    # 5. 사용자별 isFavorited 체크
-    coordi_ids = [coordi.coordi_id for coordi in coordis]
-    favorited_interactions = db.execute(
-        select(UserCoordiInteraction)
-        .where(
-            UserCoordiInteraction.user_id == user_id,
-            UserCoordiInteraction.coordi_id.in_(coordi_ids),
-            UserCoordiInteraction.action_type == "like",
-        )
-    ).scalars().all()
-    user_favorited_coordi_ids = {interaction.coordi_id for interaction in favorited_interactions}
-    
-    # 6. 사용자별 isSaved 체크 (UserClosetItem 존재 여부)
-    all_item_ids = set()
-    for coordi in coordis:
-        for coordi_item in coordi.coordi_items:
-            all_item_ids.add(coordi_item.item_id)
-    
-    closet_items = db.execute(
-        select(UserClosetItem)
-        .where(
-            UserClosetItem.user_id == user_id,
-            UserClosetItem.item_id.in_(all_item_ids),
-        )
-    ).scalars().all()
-    user_closet_item_ids = {item.item_id for item in closet_items}
+    if position is None and total_items == 0:
+        return [], page_pagination(page, limit, 0)
+    
+    # 4. (created_at, coordi_id) 최신순으로 limit + 1개 조회 (코디 ID만 조회)
+    query = (
+        select(Coordi.coordi_id, Coordi.created_at)
+        .where(*conditions)
+        .order_by(Coordi.created_at.desc(), Coordi.coordi_id.desc())
+        .limit(limit + 1)
+    )
+    if position is not None:
+        query = query.where(keyset_before(Coordi.created_at, Coordi.coordi_id, position))
+    else:
+        query = query.offset((page - 1) * limit)
+    
+    rows, has_next, next_cursor = split_page(
+        (await db.execute(query)).all(),
+        limit,
+        OUTFITS_CURSOR_SCOPE,
+        lambda row: (row.created_at, row.coordi_id),
+    )
+    coordi_ids = [row.coordi_id for row in rows]
     
-    # 7. 페이로드 생성
-    outfits = [
-        _build_outfit_payload_list(
-            coordi,
-            user_id,
-            user_favorited_coordi_ids,
-            user_closet_item_ids,
-        )
-        for coordi in coordis
-    ]
+    # 5~7. 캐시된 코디 카드에 사용자별 isFavorited / isSaved를 덧씌워 페이로드 생성
+    outfits = await hydrate_outfit_payloads(db, user_id, coordi_ids)
     
     # 8. 페이지네이션 정보 계산
-    total_pages = (total_items + limit - 1) // limit if total_items > 0 else 0
-    has_next = page < total_pages
-    has_prev = page > 1
-    
-    pagination = PaginationPayload(
-        currentPage=page,
-        totalPages=total_pages,
-        totalItems=total_items,
-        hasNext=has_next,
-        hasPrev=has_prev,
+    if position is None:
+        return outfits, page_pagination(page, limit, total_items, next_cursor)
+    return outfits, cursor_pagination(has_next, next_cursor, limit, total_items, cursor=cursor)
+
+
+class InteractionResult(NamedTuple):
+    """좋아요/스킵 upsert 후의 상호작용 상태."""
+
+    coordi_id: int
+    action_type: str
+    interacted_at: datetime
+    changed: bool  # 이번 요청으로 행이 생성/변경되었는지 여부
+
+
+# 좋아요/스킵 일괄 upsert (문장 하나, 배열 파라미터 2개).
+#   - 새 코디: 요청한 action_type으로 INSERT
+#   - like 요청: skip/preference 행을 like로 변경 (좋아요 우선, 다음 학습에 다시 포함되도록 is_trained 초기화)
+#   - skip 요청: 기존 행(like/skip/preference)은 변경하지 않음
+# 존재하지 않는 코디는 events에서 제외되어 결과에 나오지 않으며,
+# 결과의 action_type/interacted_at은 변경되지 않은 행의 경우 기존 값입니다.
+_UPSERT_INTERACTIONS = text(
+    """
+    WITH events AS (
+        SELECT e.coordi_id, CAST(e.action_type AS coordi_action_enum) AS action_type
+        FROM unnest(CAST(:coordi_ids AS BIGINT[]), CAST(:action_types AS TEXT[])) AS e(coordi_id, action_type)
+        WHERE EXISTS (SELECT 1 FROM coordis c WHERE c.coordi_id = e.coordi_id)
+    ),
+    upserted AS (
+        INSERT INTO user_coordi_interactions (user_id, coordi_id, action_type)
+        SELECT :user_id, coordi_id, action_type FROM events
+        ON CONFLICT (user_id, coordi_id) DO UPDATE
+        SET action_type = EXCLUDED.action_type, interacted_at = now(), is_trained = false
+        WHERE EXCLUDED.action_type = 'like' AND user_coordi_interactions.action_type <> 'like'
+        RETURNING coordi_id, action_type, interacted_at
     )
+    SELECT
+        e.coordi_id,
+        CAST(COALESCE(u.action_type, i.action_type) AS TEXT) AS action_type,
+        COALESCE(u.interacted_at, i.interacted_at) AS interacted_at,
+        u.coordi_id IS NOT NULL AS changed
+    FROM events e
+    LEFT JOIN upserted u ON u.coordi_id = e.coordi_id
+    LEFT JOIN user_coordi_interactions i ON i.user_id = :user_id AND i.coordi_id = e.coordi_id
+    """
+)
+
+
+async def _upsert_interactions(
+    db: AsyncSession,
+    user_id: int,
+    actions: dict[int, SwipeAction],
+) -> dict[int, InteractionResult]:
+    """
+    {coordi_id: "like" | "skip"}를 한 번의 INSERT ... ON CONFLICT로 기록하고 커밋합니다.
     
-    return outfits, pagination
+    존재하지 않는 코디는 결과에서 빠집니다. 새로 생성/변경된 코디는 추천 스냅샷과 Warm 제외 비트맵,
+    Day 임베딩(백그라운드 fold-in)에도 반영합니다.
+    """
+    rows = (await db.execute(
+        _UPSERT_INTERACTIONS,
+        {
+            "user_id": user_id,
+            "coordi_ids": list(actions),
+            "action_types": list(actions.values()),
+        },
+    )).all()
+    await db.commit()
+    
+    results = {row.coordi_id: InteractionResult(*row) for row in rows}
+    snapshot_cache = get_ranking_snapshot_cache()
+    seen_cache = get_seen_item_cache()
+    for result in results.values():
+        if result.changed:
+            snapshot_cache.remove_item(user_id, result.coordi_id)
+            seen_cache.mark_seen(user_id, result.coordi_id)
+    
+    # 새로 기록된 좋아요/스킵으로 Day 임베딩 갱신 (백그라운드)
+    if DAY_FOLD_IN_ENABLED:
+        changed = [result for result in results.values() if result.changed]
+        get_day_embedding_updater().submit(
+            user_id,
+            liked=[result.coordi_id for result in changed if result.action_type == "like"],
+            skipped=[result.coordi_id for result in changed if result.action_type == "skip"],
+        )
+    return results
 
 
-def add_favorite(
-    db: Session,
+async def add_favorite(
+    db: AsyncSession,
     user_id: int,
     coordi_id: int,
-) -> UserCoordiInteraction:
+) -> InteractionResult:
     """
     코디에 좋아요를 추가합니다.
     
+    스킵/선호 기록이 있는 코디는 좋아요로 변경됩니다 (좋아요 우선).
+    
     Parameters
     ----------
     db:
@@ -302,8 +231,8 @@ def add_favorite(
         
     Returns
     -------
-    UserCoordiInteraction:
-        생성된 좋아요 상호작용 레코드
+    InteractionResult:
+        좋아요 상호작용 상태
         
     Raises
     ------
@@ -312,61 +241,25 @@ def add_favorite(
     AlreadyFavoritedError:
         이미 좋아요한 코디인 경우
     """
-    # 1. 코디 존재 여부 확인
-    coordi = db.get(Coordi, coordi_id)
-    if coordi is None:
+    result = (await _upsert_interactions(db, user_id, {coordi_id: "like"})).get(coordi_id)
+    if result is None:
         raise OutfitNotFoundError()
-    
-    # 2. 이미 좋아요가 있는지 확인
-    existing_like = db.execute(
-        select(UserCoordiInteraction)
-        .where(
-            UserCoordiInteraction.user_id == user_id,
-            UserCoordiInteraction.coordi_id == coordi_id,
-            UserCoordiInteraction.action_type == "like",
-        )
-    ).scalar_one_or_none()
-    
-    if existing_like is not None:
+    if not result.changed:
         raise AlreadyFavoritedError()
-    
-    # 3. 기존 상호작용 확인 (skip 등 다른 action_type이 있는 경우)
-    existing_interaction = db.execute(
-        select(UserCoordiInteraction)
-        .where(
-            UserCoordiInteraction.user_id == user_id,
-            UserCoordiInteraction.coordi_id == coordi_id,
-        )
-    ).scalar_one_or_none()
-    
-    if existing_interaction is not None:
-        # 기존 상호작용이 있으면 좋아요로 업데이트 (좋아요 우선)
-        existing_interaction.action_type = "like"
-        db.commit()
-        db.refresh(existing_interaction)
-        return existing_interaction
-    
-    # 4. 새로운 좋아요 기록 생성
-    interaction = UserCoordiInteraction(
-        user_id=user_id,
-        coordi_id=coordi_id,
-        action_type="like",
-    )
-    db.add(interaction)
-    db.commit()
-    db.refresh(interaction)
-    
-    return interaction
+    return result
 
 
-def skip_outfit(
-    db: Session,
+async def skip_outfit(
+    db: AsyncSession,
     user_id: int,
     coordi_id: int,
-) -> UserCoordiInteraction:
+) -> InteractionResult:
     """
     코디를 스킵으로 기록합니다.
     
+    이미 좋아요/스킵/선호 기록이 있는 코디는 변경하지 않고 기존 상태를 반환합니다
+    (idempotent, interacted_at 업데이트 안 함).
+    
     Parameters
     ----------
     db:
@@ -378,62 +271,87 @@ def skip_outfit(
         
     Returns
     -------
-    UserCoordiInteraction:
-        스킵 상호작용 레코드 (기존 또는 새로 생성된 레코드)
+    InteractionResult:
+        스킵 상호작용 상태 (기존 또는 새로 생성된 레코드)
         
     Raises
     ------
     OutfitNotFoundError:
         코디가 존재하지 않는 경우
     """
-    # 1. 코디 존재 여부 확인
-    coordi = db.get(Coordi, coordi_id)
-    if coordi is None:
+    result = (await _upsert_interactions(db, user_id, {coordi_id: "skip"})).get(coordi_id)
+    if result is None:
         raise OutfitNotFoundError()
+    return result
+
+
+async def record_swipes(
+    db: AsyncSession,
+    user_id: int,
+    swipes: list[tuple[int, SwipeAction]],
+) -> tuple[list[InteractionResult], list[int]]:
+    """
+    한 스와이프 세션의 좋아요/스킵을 한 번에 기록합니다.
     
-    # 2. 이미 좋아요한 코디인지 확인
-    existing_like = db.execute(
-        select(UserCoordiInteraction)
-        .where(
-            UserCoordiInteraction.user_id == user_id,
-            UserCoordiInteraction.coordi_id == coordi_id,
-            UserCoordiInteraction.action_type == "like",
-        )
-    ).scalar_one_or_none()
-    
-    if existing_like is not None:
-        # 좋아요가 있는 경우: 기존 레코드 반환 (예외 없이 pass, 200 OK)
-        return existing_like
-    
-    # 3. 이미 스킵된 코디인지 확인
-    existing_skip = db.execute(
-        select(UserCoordiInteraction)
-        .where(
-            UserCoordiInteraction.user_id == user_id,
-            UserCoordiInteraction.coordi_id == coordi_id,
-            UserCoordiInteraction.action_type == "skip",
-        )
-    ).scalar_one_or_none()
-    
-    if existing_skip is not None:
-        # 스킵된 경우: 기존 레코드 반환 (idempotent, interacted_at 업데이트 안 함)
-        return existing_skip
+    같은 코디가 여러 번 포함되면 좋아요가 우선합니다. 개별 API와 같은 규칙으로 처리되지만,
+    이미 좋아요한 코디에 대한 좋아요도 오류 없이 기존 상태를 반환합니다.
     
-    # 4. 새로운 스킵 기록 생성
-    interaction = UserCoordiInteraction(
-        user_id=user_id,
-        coordi_id=coordi_id,
-        action_type="skip",
-    )
-    db.add(interaction)
-    db.commit()
-    db.refresh(interaction)
+    Parameters
+    ----------
+    db:
+        데이터베이스 세션
+    user_id:
+        사용자 ID
+    swipes:
+        (coordi_id, "like" | "skip") 리스트
+        
+    Returns
+    -------
+    tuple[list[InteractionResult], list[int]]:
+        (코디별 상호작용 상태 - 요청 순서, 존재하지 않아 무시된 코디 ID 리스트)
+    """
+    # 1. 코디별 최종 액션 결정 (좋아요 우선)
+    actions: dict[int, SwipeAction] = {}
+    for coordi_id, action in swipes:
+        if actions.get(coordi_id) != "like":
+            actions[coordi_id] = action
+    
+    # 2. 문장 하나로 upsert
+    results = await _upsert_interactions(db, user_id, actions)
+    
+    applied = [results[coordi_id] for coordi_id in actions if coordi_id in results]
+    ignored = [coordi_id for coordi_id in actions if coordi_id not in results]
+    return applied, ignored
+
+
+async def _existing_coordi_ids(db: AsyncSession, coordi_ids: set[int]) -> set[int]:
+    """존재하는 코디 ID (카드 캐시에 있는 코디는 조회하지 않음)."""
+    cached, missing = get_coordi_card_cache().get_many(coordi_ids)
+    existing = set(cached)
+    if missing:
+        existing.update((await db.execute(
+            select(Coordi.coordi_id).where(Coordi.coordi_id.in_(missing))
+        )).scalars().all())
+    return existing
+
+
+def _buffer_view_log(
+    user_id: int,
+    coordi_id: int,
+    duration_seconds: int,
+    viewed_at: Optional[datetime] = None,
+) -> datetime:
+    buffer = get_view_log_buffer()
+    buffer.start()
+    recorded_at = buffer.record(user_id, coordi_id, duration_seconds, viewed_at)
     
-    return interaction
+    # Warm 추천 제외 비트맵 갱신 (이미 받은 추천 스냅샷은 페이지 순서 유지를 위해 그대로 둠)
+    get_seen_item_cache().mark_seen(user_id, coordi_id)
+    return recorded_at
 
 
-def record_view_log(
-    db: Session,
+async def record_view_log(
+    db: AsyncSession,
     user_id: int,
     coordi_id: int,
     duration_seconds: int,
@@ -441,6 +359,9 @@ def record_view_log(
     """
     코디 조회 로그를 기록합니다.
     
+    로그는 조회 로그 버퍼에 추가되어 같은 코디의 반복 조회와 병합된 뒤 묶어서 기록됩니다
+    (app/services/view_log_buffer.py).
+    
     Parameters
     ----------
     db:
@@ -455,34 +376,81 @@ def record_view_log(
     Returns
     -------
     datetime:
-        기록 일시 (UTC)
+        기록 일시 (UTC, 병합된 경우 첫 조회 시각)
         
     Raises
     ------
     OutfitNotFoundError:
         코디가 존재하지 않는 경우
     """
-    # 1. 코디 존재 여부 확인
-    coordi = db.get(Coordi, coordi_id)
-    if coordi is None:
+    # 1. 코디 존재 여부 확인 (최근 목록에 나온 코디는 카드 캐시로 확인)
+    if not await _existing_coordi_ids(db, {coordi_id}):
         raise OutfitNotFoundError()
     
-    # 2. 조회 로그 레코드 생성
-    view_log = UserCoordiViewLog(
-        user_id=user_id,
-        coordi_id=coordi_id,
-        duration_seconds=duration_seconds,
-    )
-    db.add(view_log)
-    db.commit()
-    db.refresh(view_log)
+    # 2. 조회 로그 버퍼에 추가
+    return _buffer_view_log(user_id, coordi_id, duration_seconds)
+
+
+async def record_view_logs(
+    db: AsyncSession,
+    user_id: int,
+    views: list[tuple[int, int, Optional[datetime]]],
+) -> tuple[int, list[int]]:
+    """
+    여러 코디 조회 로그를 한 번에 기록합니다.
     
-    # 3. 기록 일시 반환 (view_started_at 사용)
-    return view_log.view_started_at
+    Parameters
+    ----------
+    db:
+        데이터베이스 세션
+    user_id:
+        사용자 ID
+    views:
+        (coordi_id, duration_seconds, viewed_at) 리스트
+        (viewed_at이 None이면 현재 시각, timezone이 없으면 UTC로 간주)
+        
+    Returns
+    -------
+    tuple[int, list[int]]:
+        (버퍼에 추가된 로그 수, 존재하지 않아 무시된 코디 ID 리스트)
+        
+    Raises
+    ------
+    ValidationError:
+        viewed_at이 VIEW_LOG_MAX_AGE_SECONDS보다 오래된 경우 (아무것도 기록하지 않음)
+    """
+    # 1. 조회 시각 보정 (미래 시각은 현재 시각으로, 너무 오래된 시각은 요청 전체를 거부)
+    now = datetime.now(timezone.utc)
+    oldest = now - timedelta(seconds=VIEW_LOG_MAX_AGE_SECONDS)
+    normalized: list[tuple[int, int, datetime]] = []
+    for coordi_id, duration_seconds, viewed_at in views:
+        if viewed_at is None:
+            viewed_at = now
+        elif viewed_at.tzinfo is None:
+            viewed_at = viewed_at.replace(tzinfo=timezone.utc)
+        if viewed_at < oldest:
+            raise ValidationError(message="viewedAt이 허용 범위보다 오래되었습니다.")
+        normalized.append((coordi_id, duration_seconds, min(viewed_at, now)))
+    
+    # 2. 존재하는 코디만 기록 (쿼리 한 번)
+    existing = await _existing_coordi_ids(db, {coordi_id for coordi_id, _, _ in normalized})
+    
+    # 3. 조회 로그 버퍼에 추가
+    accepted = 0
+    ignored: list[int] = []
+    for coordi_id, duration_seconds, viewed_at in normalized:
+        if coordi_id not in existing:
+            if coordi_id not in ignored:
+                ignored.append(coordi_id)
+            continue
+        _buffer_view_log(user_id, coordi_id, duration_seconds, viewed_at)
+        accepted += 1
+    
+    return accepted, ignored
 
 
-def remove_favorite(
-    db: Session,
+async def remove_favorite(
+    db: AsyncSession,
     user_id: int,
     coordi_id: int,
 ) -> tuple[int, datetime]:
@@ -511,36 +479,42 @@ def remove_favorite(
         좋아요하지 않은 코디인 경우
     """
     # 1. 코디 존재 여부 확인
-    coordi = db.get(Coordi, coordi_id)
+    coordi = await db.get(Coordi, coordi_id)
     if coordi is None:
         raise OutfitNotFoundError()
     
     # 2. 좋아요 기록 확인
-    existing_like = db.execute(
+    existing_like = (await db.execute(
         select(UserCoordiInteraction)
         .where(
             UserCoordiInteraction.user_id == user_id,
             UserCoordiInteraction.coordi_id == coordi_id,
             UserCoordiInteraction.action_type == "like",
         )
-    ).scalar_one_or_none()
+    )).scalar_one_or_none()
     
     if existing_like is None:
         raise FavoriteNotFoundError()
     
     # 3. 좋아요 기록 삭제
     unfavorited_at = datetime.now(timezone.utc)
-    db.delete(existing_like)
-    db.commit()
+    await db.delete(existing_like)
+    await db.commit()
+    
+    # 좋아요 취소된 코디는 다시 추천 대상이 될 수 있으므로 스냅샷/비트맵 폐기
+    get_ranking_snapshot_cache().invalidate(user_id)
+    get_seen_item_cache().invalidate(user_id)
     
     return coordi_id, unfavorited_at
 
 
 async def get_favorite_outfits(
-    db: Session,
+    db: AsyncSession,
     user_id: int,
     page: int = 1,
     limit: int = 20,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
 ) -> tuple[list[OutfitPayload], PaginationPayload]:
     """
     사용자가 좋아요한 코디 목록을 조회합니다.
@@ -552,105 +526,63 @@ async def get_favorite_outfits(
     user_id:
         사용자 ID
     page:
-        페이지 번호 (1부터 시작)
+        페이지 번호 (1부터 시작, cursor가 있으면 무시)
     limit:
         페이지당 개수
+    cursor:
+        이전 응답의 nextCursor (있으면 (interacted_at, coordi_id) keyset으로 이어서 조회)
+    include_total:
+        cursor 모드에서도 전체 개수를 계산할지 여부
         
     Returns
     -------
     tuple[list[OutfitPayload], PaginationPayload]:
         (코디 페이로드 리스트, 페이지네이션 정보)
     """
-    # 1. 전체 개수 조회
-    total_items = db.execute(
-        select(func.count(UserCoordiInteraction.coordi_id))
-        .where(
-            UserCoordiInteraction.user_id == user_id,
-            UserCoordiInteraction.action_type == "like",
-        )
-    ).scalar_one()
-    
-    # 결과가 없으면 빈 결과 반환
-    if total_items == 0:
-        return [], PaginationPayload(
-            currentPage=page,
-            totalPages=0,
-            totalItems=0,
-            hasNext=False,
-            hasPrev=False,
-        )
-    
-    # 2. 페이지네이션 적용하여 좋아요한 코디 ID 조회 (interacted_at 기준 최신순)
-    offset = (page - 1) * limit
-    favorite_interactions = db.execute(
-        select(UserCoordiInteraction.coordi_id)
-        .where(
-            UserCoordiInteraction.user_id == user_id,
-            UserCoordiInteraction.action_type == "like",
-        )
-        .order_by(UserCoordiInteraction.interacted_at.desc())
-        .offset(offset)
-        .limit(limit)
-    ).scalars().all()
-    
-    coordi_ids = list(favorite_interactions)
-    
-    # 3. 코디 상세 정보 조회 (selectinload로 N+1 방지)
-    coordis = db.execute(
-        select(Coordi)
-        .where(Coordi.coordi_id.in_(coordi_ids))
-        .options(
-            selectinload(Coordi.images),
-            selectinload(Coordi.coordi_items).selectinload(CoordiItem.item).selectinload(Item.images),
-        )
-    ).scalars().all()
-    
-    # 4. interacted_at 기준으로 정렬 (좋아요 추가 일시 기준 최신순)
-    # coordi_ids 순서대로 정렬하여 페이징된 순서 유지
-    coordi_dict = {coordi.coordi_id: coordi for coordi in coordis}
-    coordis = [coordi_dict[coordi_id] for coordi_id in coordi_ids if coordi_id in coordi_dict]
-    
-    # 5. 사용자별 isFavorited 체크 (모두 좋아요한 코디이므로 True)
-    user_favorited_coordi_ids = set(coordi_ids)
+    position = decode_cursor(FAVORITES_CURSOR_SCOPE, cursor) if cursor else None
+    conditions = (
+        UserCoordiInteraction.user_id == user_id,
+        UserCoordiInteraction.action_type == "like",
+    )
     
-    # 6. 사용자별 isSaved 체크 (UserClosetItem 존재 여부)
-    all_item_ids = set()
-    for coordi in coordis:
-        for coordi_item in coordi.coordi_items:
-            all_item_ids.add(coordi_item.item_id)
+    # 1. 전체 개수 조회 (page 모드 또는 includeTotal=true일 때만)
+    total_items = None
+    if position is None or include_total:
+        total_items = (await db.execute(
+            select(func.count(UserCoordiInteraction.coordi_id)).where(*conditions)
+        )).scalar_one()
     
-    closet_items = db.execute(
-        select(UserClosetItem)
-        .where(
-            UserClosetItem.user_id == user_id,
-            UserClosetItem.item_id.in_(all_item_ids),
+    # 결과가 없으면 빈 결과 반환
+    if position is None and total_items == 0:
+        return [], page_pagination(page, limit, 0)
+    
+    # 2. 좋아요한 코디 ID를 (interacted_at, coordi_id) 최신순으로 limit + 1개 조회
+    query = (
+        select(UserCoordiInteraction.coordi_id, UserCoordiInteraction.interacted_at)
+        .where(*conditions)
+        .order_by(UserCoordiInteraction.interacted_at.desc(), UserCoordiInteraction.coordi_id.desc())
+        .limit(limit + 1)
+    )
+    if position is not None:
+        query = query.where(
+            keyset_before(UserCoordiInteraction.interacted_at, UserCoordiInteraction.coordi_id, position)
         )
-    ).scalars().all()
-    user_closet_item_ids = {item.item_id for item in closet_items}
+    else:
+        query = query.offset((page - 1) * limit)
+    
+    rows, has_next, next_cursor = split_page(
+        (await db.execute(query)).all(),
+        limit,
+        FAVORITES_CURSOR_SCOPE,
+        lambda row: (row.interacted_at, row.coordi_id),
+    )
+    coordi_ids = [row.coordi_id for row in rows]
     
-    # 7. 페이로드 생성
-    outfits = [
-        _build_outfit_payload_list(
-            coordi,
-            user_id,
-            user_favorited_coordi_ids,
-            user_closet_item_ids,
-        )
-        for coordi in coordis
-    ]
+    # 3~7. 캐시된 코디 카드에 isSaved를 덧씌워 페이로드 생성
+    # (coordi_ids 순서 = 좋아요 추가 일시 기준 최신순, 모두 좋아요한 코디이므로 isFavorited=True)
+    outfits = await hydrate_outfit_payloads(db, user_id, coordi_ids, favorited_coordi_ids=set(coordi_ids))
     
     # 8. 페이지네이션 정보 계산
-    total_pages = (total_items + limit - 1) // limit if total_items > 0 else 0
-    has_next = page < total_pages
-    has_prev = page > 1
-    
-    pagination = PaginationPayload(
-        currentPage=page,
-        totalPages=total_pages,
-        totalItems=total_items,
-        hasNext=has_next,
-        hasPrev=has_prev,
-    )
-    
-    return outfits, pagination
-
+    if position is None:
+        return outfits, page_pagination(page, limit, total_items, next_cursor)
+    return outfits, cursor_pagination(has_next, next_cursor, limit, total_items, cursor=cursor)
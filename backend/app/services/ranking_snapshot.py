@@ -0,0 +1,122 @@
+"""
+Warm-Start 추천 결과 스냅샷 캐시.
+
+무한 스크롤에서 같은 사용자가 연속으로 다음 페이지를 요청할 때마다 전체 아이템을
+다시 스코어링하지 않도록, 한 번 계산한 상위 순위 목록(coordi_id 배열)을 사용자별로
+TTL 동안 보관합니다. 스냅샷은 (user_id, model_version) 단위로 유효하며,
+좋아요/스킵이 발생하면 해당 코디만 스냅샷에서 제거합니다.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+# 스냅샷 유지 시간 (초)
+SNAPSHOT_TTL_SECONDS = float(os.getenv("WARM_SNAPSHOT_TTL_SECONDS", "600"))
+
+# 최초 스코어링 시 보관할 최소 순위 깊이 (이보다 깊은 페이지 요청 시 재스코어링)
+SNAPSHOT_DEPTH = int(os.getenv("WARM_SNAPSHOT_DEPTH", "200"))
+
+# 프로세스당 최대 보관 사용자 수 (초과 시 가장 오래 사용되지 않은 스냅샷부터 제거)
+SNAPSHOT_MAX_USERS = int(os.getenv("WARM_SNAPSHOT_MAX_USERS", "10000"))
+
+
+@dataclass
+class RankedListSnapshot:
+    """사용자 한 명의 추천 순위 스냅샷."""
+
+    model_version: str
+    coordi_ids: np.ndarray  # 점수 내림차순 coordi_id (int64)
+    total_items: int  # 제외 처리 후 추천 가능한 전체 아이템 수
+    created_at: float = field(default_factory=time.monotonic)
+
+    @property
+    def is_complete(self) -> bool:
+        """추천 가능한 전체 아이템이 스냅샷에 모두 담겨 있는지 여부."""
+        return len(self.coordi_ids) >= self.total_items
+
+    def covers(self, offset: int, limit: int) -> bool:
+        """요청한 페이지 범위를 스냅샷만으로 응답할 수 있는지 여부."""
+        return self.is_complete or offset + limit <= len(self.coordi_ids)
+
+    def page(self, offset: int, limit: int) -> list[int]:
+        return self.coordi_ids[offset : offset + limit].tolist()
+
+
+class RankingSnapshotCache:
+    """사용자별 추천 순위 스냅샷 LRU 캐시 (Thread-safe)."""
+
+    def __init__(
+        self,
+        ttl_seconds: float = SNAPSHOT_TTL_SECONDS,
+        max_users: int = SNAPSHOT_MAX_USERS,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_users = max_users
+        self._snapshots: OrderedDict[int, RankedListSnapshot] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int, model_version: str) -> Optional[RankedListSnapshot]:
+        """유효한 스냅샷을 반환합니다. 만료되었거나 모델 버전이 다르면 None."""
+        with self._lock:
+            snapshot = self._snapshots.get(user_id)
+            if snapshot is None:
+                return None
+
+            expired = time.monotonic() - snapshot.created_at > self.ttl_seconds
+            if expired or snapshot.model_version != model_version:
+                del self._snapshots[user_id]
+                return None
+
+            self._snapshots.move_to_end(user_id)
+            return snapshot
+
+    def put(self, user_id: int, snapshot: RankedListSnapshot) -> None:
+        with self._lock:
+            self._snapshots[user_id] = snapshot
+            self._snapshots.move_to_end(user_id)
+            while len(self._snapshots) > self.max_users:
+                self._snapshots.popitem(last=False)
+
+    def remove_item(self, user_id: int, coordi_id: int) -> None:
+        """
+        좋아요/스킵된 코디를 스냅샷에서 제거합니다.
+
+        스냅샷에 없는 코디라면 (순위 밖 아이템) 전체 개수를 정확히 보정할 수 없으므로
+        스냅샷을 폐기하고 다음 요청에서 다시 스코어링합니다.
+        """
+        with self._lock:
+            snapshot = self._snapshots.get(user_id)
+            if snapshot is None:
+                return
+
+            positions = np.flatnonzero(snapshot.coordi_ids == coordi_id)
+            if positions.size == 0:
+                del self._snapshots[user_id]
+                return
+
+            snapshot.coordi_ids = np.delete(snapshot.coordi_ids, positions)
+            snapshot.total_items = max(snapshot.total_items - 1, 0)
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            self._snapshots.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snapshots.clear()
+
+
+# 전역 인스턴스
+_snapshot_cache = RankingSnapshotCache()
+
+
+def get_ranking_snapshot_cache() -> RankingSnapshotCache:
+    return _snapshot_cache
@@ -0,0 +1,55 @@
+"""
+"이미 본 코디" 제외 조건 (SQL anti-join).
+
+사용자가 조회(user_coordi_view_logs)했거나 상호작용(user_coordi_interactions)한 코디를
+Python으로 모두 읽어 `NOT IN (...)` 리터럴 목록으로 다시 보내는 대신, 코디 쿼리에
+`NOT EXISTS` 조건을 붙여 DB 안에서 제외합니다. 요청당 바인드 파라미터 수가 기록 수와 무관하게 일정하며,
+두 테이블의 (user_id, coordi_id) 인덱스(idx_user_coordi, 기본 키)로 anti-join 됩니다.
+조회 로그 버퍼(`app/services/view_log_buffer.py`)에서 아직 기록되지 않은 코디는 짧은 NOT IN 목록으로 함께 제외합니다.
+
+사용법:
+    query = select(Coordi.coordi_id).where(Coordi.gender == gender, unseen_by(user_id))
+"""
+
+from __future__ import annotations
+
+from sqlalchemy import and_, exists, select
+
+from app.models.coordi import Coordi
+from app.models.user_coordi_interaction import UserCoordiInteraction
+from app.models.user_coordi_view_log import UserCoordiViewLog
+from app.services.view_log_buffer import get_view_log_buffer
+
+
+def unseen_by(user_id: int, coordi_id_column=Coordi.coordi_id):
+    """coordi_id_column의 코디를 사용자가 조회/상호작용한 적이 없다는 조건 (NOT EXISTS 두 개)."""
+    conditions = [
+        ~exists().where(
+            UserCoordiViewLog.user_id == user_id,
+            UserCoordiViewLog.coordi_id == coordi_id_column,
+        ),
+        ~exists().where(
+            UserCoordiInteraction.user_id == user_id,
+            UserCoordiInteraction.coordi_id == coordi_id_column,
+        ),
+    ]
+    pending = get_view_log_buffer().pending_coordi_ids(user_id)
+    if pending:
+        conditions.append(coordi_id_column.notin_(pending))
+    return and_(*conditions)
+
+
+def seen_coordi_ids_query(user_id: int):
+    """
+    사용자가 조회/상호작용한 coordi_id (중복 제거) 쿼리.
+
+    ID 목록 자체가 필요한 경우(Warm 비트맵, In-process 벡터 인덱스)에만 사용합니다.
+    """
+    return (
+        select(UserCoordiInteraction.coordi_id)
+        .where(UserCoordiInteraction.user_id == user_id)
+        .union(
+            select(UserCoordiViewLog.coordi_id)
+            .where(UserCoordiViewLog.user_id == user_id)
+        )
+    )
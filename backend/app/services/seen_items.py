@@ -0,0 +1,122 @@
+"""
+Warm-Start 추천용 사용자별 "이미 본 코디" 비트맵 캐시.
+
+추천 요청마다 사용자의 상호작용/조회 기록 전체를 DB에서 읽어 모델 아이템 인덱스로
+변환하지 않도록, 모델 아이템 인덱스 기준 비트셋(np.packbits)을 사용자별로 보관합니다.
+비트맵은 (user_id, model_version) 단위로 유효하며, 좋아요/스킵/조회 기록 시
+해당 비트만 켜서 갱신합니다. 다른 워커 프로세스에서 발생한 기록은 TTL 만료 후
+DB에서 다시 읽을 때 반영됩니다.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Optional
+
+import numpy as np
+
+from app.ml.id_index import IdIndex
+
+# 비트맵 유지 시간 (초)
+SEEN_TTL_SECONDS = float(os.getenv("WARM_SEEN_TTL_SECONDS", "300"))
+
+# 프로세스당 최대 보관 사용자 수 (초과 시 가장 오래 사용되지 않은 비트맵부터 제거)
+SEEN_MAX_USERS = int(os.getenv("WARM_SEEN_MAX_USERS", "10000"))
+
+
+@dataclass
+class SeenItemBitmap:
+    """사용자 한 명이 이미 본 모델 아이템 인덱스의 비트셋."""
+
+    model_version: str
+    item_index: IdIndex  # 모델의 coordi_id <-> 아이템 인덱스 매핑 (공유 참조)
+    bits: np.ndarray  # np.packbits 형식 (ceil(num_items / 8),) uint8
+    num_items: int
+    count: int = 0  # 켜진 비트 수 (추천 가능 아이템 수 = num_items - count)
+    created_at: float = field(default_factory=time.monotonic)
+
+    @classmethod
+    def from_indices(cls, model_version: str, item_index: IdIndex, num_items: int, indices) -> "SeenItemBitmap":
+        mask = np.zeros(num_items, dtype=bool)
+        mask[np.asarray(indices, dtype=np.int64)] = True
+        return cls(
+            model_version=model_version,
+            item_index=item_index,
+            bits=np.packbits(mask),
+            num_items=num_items,
+            count=int(np.count_nonzero(mask)),
+        )
+
+    def mask(self) -> np.ndarray:
+        """아이템별 본 여부 (num_items,) bool 배열."""
+        return np.unpackbits(self.bits, count=self.num_items).view(bool)
+
+    def add(self, coordi_id: int) -> None:
+        idx = self.item_index.get(coordi_id)
+        if idx is None:
+            return
+
+        byte, bit = divmod(idx, 8)
+        flag = np.uint8(0x80 >> bit)  # np.packbits는 big-endian 비트 순서
+        if not self.bits[byte] & flag:
+            self.bits[byte] |= flag
+            self.count += 1
+
+
+class SeenItemCache:
+    """사용자별 이미 본 코디 비트맵 LRU 캐시 (Thread-safe)."""
+
+    def __init__(self, ttl_seconds: float = SEEN_TTL_SECONDS, max_users: int = SEEN_MAX_USERS):
+        self.ttl_seconds = ttl_seconds
+        self.max_users = max_users
+        self._bitmaps: OrderedDict[int, SeenItemBitmap] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int, model_version: str) -> Optional[SeenItemBitmap]:
+        """유효한 비트맵을 반환합니다. 만료되었거나 모델 버전이 다르면 None."""
+        with self._lock:
+            bitmap = self._bitmaps.get(user_id)
+            if bitmap is None:
+                return None
+
+            expired = time.monotonic() - bitmap.created_at > self.ttl_seconds
+            if expired or bitmap.model_version != model_version:
+                del self._bitmaps[user_id]
+                return None
+
+            self._bitmaps.move_to_end(user_id)
+            return bitmap
+
+    def put(self, user_id: int, bitmap: SeenItemBitmap) -> None:
+        with self._lock:
+            self._bitmaps[user_id] = bitmap
+            self._bitmaps.move_to_end(user_id)
+            while len(self._bitmaps) > self.max_users:
+                self._bitmaps.popitem(last=False)
+
+    def mark_seen(self, user_id: int, coordi_id: int) -> None:
+        """좋아요/스킵/조회된 코디의 비트를 켭니다 (캐시된 비트맵이 있을 때만)."""
+        with self._lock:
+            bitmap = self._bitmaps.get(user_id)
+            if bitmap is not None:
+                bitmap.add(coordi_id)
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            self._bitmaps.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._bitmaps.clear()
+
+
+# 전역 인스턴스
+_seen_item_cache = SeenItemCache()
+
+
+def get_seen_item_cache() -> SeenItemCache:
+    return _seen_item_cache
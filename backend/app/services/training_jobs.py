@@ -0,0 +1,220 @@
+"""
+Night 학습 작업 실행 (단일 실행 보장 + 진행 상황 기록).
+
+학습은 API 프로세스가 아니라 별도 워커 프로세스(`backend/training_worker.py`)에서 실행합니다.
+    - Postgres advisory lock(NIGHT_TRAINING_LOCK_KEY)을 잡은 인스턴스 하나만 학습합니다.
+      락은 세션 단위이므로 워커가 비정상 종료되면 커넥션과 함께 자동으로 풀립니다.
+    - 실행 단계/진행률/heartbeat를 training_runs 테이블에 기록하고, API는 `/health/training`에서 읽습니다.
+    - 새 모델 버전은 모델 레지스트리(manifest)로 발행되므로 API 워커는 기존처럼 주기적으로 확인하여 교체합니다.
+
+이 모듈은 torch/numpy를 import하지 않습니다 (워커가 스레드 수를 먼저 설정한 뒤 학습 모듈을 불러오도록).
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import socket
+import threading
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from typing import Callable, Iterator, Optional
+
+from sqlalchemy import select, text, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.database import SessionLocal, engine
+from app.models.training_run import TrainingRun
+
+logger = logging.getLogger(__name__)
+
+NIGHT_TRAINING_JOB = "night_training"
+
+# Night 학습 단일 실행용 advisory lock 키
+NIGHT_TRAINING_LOCK_KEY = int(os.getenv("NIGHT_TRAINING_LOCK_KEY", "730300"))
+
+# 실행 중 heartbeat 기록 주기 (초)
+TRAINING_HEARTBEAT_SECONDS = float(os.getenv("TRAINING_HEARTBEAT_SECONDS", "30"))
+
+# heartbeat가 이 시간 이상 끊긴 running 기록은 중단된 것으로 표시 (초)
+TRAINING_HEARTBEAT_STALE_SECONDS = float(os.getenv("TRAINING_HEARTBEAT_STALE_SECONDS", "300"))
+
+# 전체 진행률 중 학습 단계가 차지하는 비율 (나머지는 Top-N 사전 계산)
+_TRAINING_PHASE_WEIGHT = 0.7
+
+
+@contextmanager
+def advisory_lock(key: int) -> Iterator[bool]:
+    """
+    세션 단위 advisory lock을 시도합니다 (대기하지 않음). 잡았는지 여부를 yield 합니다.
+
+    락을 잡은 커넥션은 작업이 끝날 때까지 전용으로 유지합니다.
+    """
+    connection = engine.connect()
+    acquired = False
+    try:
+        acquired = bool(connection.execute(text("SELECT pg_try_advisory_lock(:key)"), {"key": key}).scalar())
+        connection.commit()
+        yield acquired
+    finally:
+        try:
+            if acquired:
+                connection.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": key})
+                connection.commit()
+        except Exception as e:
+            # 커넥션을 풀에 돌려보내지 않고 폐기하여 락을 확실히 해제
+            logger.error(f"[TrainingJob] Failed to release advisory lock {key}: {e}")
+            connection.invalidate()
+        connection.close()
+
+
+class TrainingRunReporter:
+    """training_runs 행 하나에 단계/진행률/heartbeat를 기록합니다 (기록 실패는 학습을 중단시키지 않음)."""
+
+    def __init__(self, job_name: str = NIGHT_TRAINING_JOB, heartbeat_seconds: float = TRAINING_HEARTBEAT_SECONDS):
+        self.job_name = job_name
+        self.heartbeat_seconds = heartbeat_seconds
+        self.run_id: Optional[int] = None
+        self._stop = threading.Event()
+        self._heartbeat: Optional[threading.Thread] = None
+
+    def start(self) -> "TrainingRunReporter":
+        db = SessionLocal()
+        try:
+            run = TrainingRun(
+                job_name=self.job_name,
+                status="running",
+                phase="starting",
+                progress=0.0,
+                hostname=socket.gethostname(),
+                pid=os.getpid(),
+            )
+            db.add(run)
+            db.commit()
+            self.run_id = run.run_id
+        except Exception as e:
+            db.rollback()
+            logger.error(f"[TrainingJob] Failed to create training run record: {e}")
+        finally:
+            db.close()
+
+        self._heartbeat = threading.Thread(target=self._beat, name="training-heartbeat", daemon=True)
+        self._heartbeat.start()
+        return self
+
+    def update(self, phase: Optional[str] = None, progress: Optional[float] = None, message: Optional[str] = None) -> None:
+        values = {}
+        if phase is not None:
+            values["phase"] = phase
+        if progress is not None:
+            values["progress"] = min(max(progress, 0.0), 1.0)
+        if message is not None:
+            values["message"] = message
+        self._write(values)
+
+    def finish(self, status: str, message: Optional[str] = None, model_version: Optional[str] = None) -> None:
+        self._stop.set()
+        values = {"status": status, "finished_at": datetime.now(timezone.utc), "message": message}
+        if status == "succeeded":
+            values.update(phase="done", progress=1.0)
+        if model_version is not None:
+            values["model_version"] = model_version
+        self._write(values)
+
+    def _write(self, values: dict) -> None:
+        if self.run_id is None:
+            return
+        db = SessionLocal()
+        try:
+            db.execute(
+                update(TrainingRun)
+                .where(TrainingRun.run_id == self.run_id)
+                .values(heartbeat_at=datetime.now(timezone.utc), **values)
+            )
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.warning(f"[TrainingJob] Failed to update training run {self.run_id}: {e}")
+        finally:
+            db.close()
+
+    def _beat(self) -> None:
+        while not self._stop.wait(self.heartbeat_seconds):
+            self._write({})
+
+
+def run_training_job(on_published: Optional[Callable[[], None]] = None) -> Optional[str]:
+    """
+    Night 학습 + Top-N 사전 계산을 실행합니다.
+
+    다른 인스턴스가 이미 실행 중이면(advisory lock 실패) 아무것도 하지 않고 None을 반환합니다.
+    그 외에는 최종 상태("succeeded" / "failed")를 반환합니다. 학습한 모델을 발행하지 못하면 "failed"이며,
+    학습할 상호작용이 없어 발행하지 않은 경우는 Top-N 계산 없이 "succeeded"로 기록합니다.
+
+    Args:
+        on_published: 새 모델 발행 후 호출할 콜백 (API 프로세스 안에서 실행할 때 Warm 모델 즉시 교체용)
+    """
+    with advisory_lock(NIGHT_TRAINING_LOCK_KEY) as acquired:
+        if not acquired:
+            logger.info("[TrainingJob] Night training is already running in another instance. Skipping.")
+            return None
+
+        reporter = TrainingRunReporter().start()
+        try:
+            # 학습 모듈(torch)은 락을 잡은 인스턴스에서만 불러옴
+            from app.ml.batch_scoring import run_nightly_materialization
+            from app.services.training_service import run_night_training
+
+            reporter.update(phase="training", progress=0.0)
+            version = run_night_training(
+                progress=lambda fraction, message: reporter.update(
+                    progress=fraction * _TRAINING_PHASE_WEIGHT, message=message
+                )
+            )
+            if version is None:
+                reporter.finish("succeeded", message="No new interactions")
+                return "succeeded"
+
+            reporter.update(phase="materialization", progress=_TRAINING_PHASE_WEIGHT, message="Materializing top-N")
+            run_nightly_materialization()
+
+            if on_published is not None:
+                on_published()
+            reporter.finish("succeeded", model_version=version)
+            return "succeeded"
+        except Exception as e:
+            logger.error(f"[TrainingJob] Night training job failed: {e}")
+            reporter.finish("failed", message=str(e)[:2000])
+            return "failed"
+
+
+async def get_latest_training_run(db: AsyncSession, job_name: str = NIGHT_TRAINING_JOB) -> Optional[dict]:
+    """가장 최근 학습 실행 상태 (heartbeat가 끊긴 running 기록은 stale=True)."""
+    run = (await db.execute(
+        select(TrainingRun)
+        .where(TrainingRun.job_name == job_name)
+        .order_by(TrainingRun.started_at.desc())
+        .limit(1)
+    )).scalar_one_or_none()
+    if run is None:
+        return None
+
+    stale = (
+        run.status == "running"
+        and (datetime.now(timezone.utc) - run.heartbeat_at).total_seconds() > TRAINING_HEARTBEAT_STALE_SECONDS
+    )
+    return {
+        "runId": run.run_id,
+        "jobName": run.job_name,
+        "status": run.status,
+        "phase": run.phase,
+        "progress": run.progress,
+        "message": run.message,
+        "modelVersion": run.model_version,
+        "hostname": run.hostname,
+        "pid": run.pid,
+        "startedAt": run.started_at.isoformat() if run.started_at else None,
+        "heartbeatAt": run.heartbeat_at.isoformat() if run.heartbeat_at else None,
+        "finishedAt": run.finished_at.isoformat() if run.finished_at else None,
+        "stale": stale,
+    }
@@ -1,39 +1,43 @@
+import numpy as np
 import torch
-import torch.nn as nn
-import torch.optim as optim
 from sqlalchemy.orm import Session
 from sqlalchemy import select, text, tuple_
-import numpy as np
 import logging
 import os
 
 from app.db.database import SessionLocal
 from app.models.user_coordi_interaction import UserCoordiInteraction
-from app.models.user_embedding import UserEmbedding
-from app.models.item_embedding import ItemEmbedding
+from app.ml.bpr_trainer import train_bpr
+from app.ml.id_index import IdIndex
+from app.ml.model_registry import get_model_registry
 from app.ml.neumf_model import NeMF
+from app.services.embedding_writer import ITEM_EMBEDDINGS, USER_EMBEDDINGS, changed_rows, write_embeddings
 
 logger = logging.getLogger(__name__)
 
+# Night 학습 배치 크기
+NIGHT_TRAIN_BATCH_SIZE = int(os.getenv("NIGHT_TRAIN_BATCH_SIZE", "64"))
+
 class NightModelTrainer:
     def __init__(self, db: Session):
         self.db = db
         self.device = torch.device("mps" if torch.backends.mps.is_available() else "cpu")
         logger.info(f"Using device: {self.device}")
         
-    def train(self, epochs=5, batch_size=256, embedding_dim=512):
+    def train(self, epochs=5, batch_size=256, embedding_dim=512, progress=None):
+        """
+        progress: (진행률 0.0~1.0, 메시지)로 호출되는 콜백 (학습 워커의 상태 기록용, 선택)
+        반환값: 발행한 모델 버전 (새 상호작용이 없어 학습을 건너뛰면 None)
+        """
+        report = progress or (lambda fraction, message: None)
         logger.info("[Training] Initializing Incremental Training...")
         
         # 1. 체크포인트 로드 (Model + Mappings)
-        # 파일 절대 경로를 기준으로 backend 루트 찾기
-        current_dir = os.path.dirname(os.path.abspath(__file__)) # .../backend/app/services
-        backend_dir = os.path.dirname(os.path.dirname(current_dir)) # .../backend
-        base_dir = os.path.join(backend_dir, "data", "model_artifacts")
-        
-        checkpoint_path = os.path.join(base_dir, "neumf_night_model.pth")
+        # 모델 레지스트리의 현재 서빙 버전을 기준으로 증분 학습
+        checkpoint_path = get_model_registry().checkpoint_path()
         
         existing_checkpoint = None
-        if os.path.exists(checkpoint_path):
+        if checkpoint_path is not None:
             try:
                 existing_checkpoint = torch.load(checkpoint_path, map_location=self.device)
                 logger.info(f"[Training] Found existing checkpoint at {checkpoint_path}")
@@ -41,148 +45,119 @@ class NightModelTrainer:
                 logger.warning(f"[Training] Failed to load checkpoint: {e}. Starting from scratch.")
         
         # 2. 신규 데이터 로드 (is_trained=False)
-        # like, preference 만 Positive로 간주
-        stmt = select(UserCoordiInteraction).where(
-            UserCoordiInteraction.action_type.in_(['like', 'preference']),
+        # like, preference 만 Positive로 간주 (ORM 객체 대신 (user_id, coordi_id) 컬럼만 조회)
+        positive_actions = ['like', 'preference']
+        untrained = (
+            UserCoordiInteraction.action_type.in_(positive_actions),
             UserCoordiInteraction.is_trained == False
         )
-        new_interactions = self.db.execute(stmt).scalars().all()
+        new_interactions = self.db.execute(
+            select(UserCoordiInteraction.user_id, UserCoordiInteraction.coordi_id).where(*untrained)
+        ).all()
         
         if not new_interactions:
             logger.info("[Training] No new interactions found (is_trained=False). Skipping training.")
-            return
+            report(1.0, "No new interactions")
+            return None
+        report(0.05, f"Loaded {len(new_interactions)} new interactions")
 
         # 3. ID 매핑 업데이트 (Dynamic Resize 준비)
-        # 기존 매핑 로드
+        # 기존 매핑 로드 (체크포인트의 str(id) -> idx 딕셔너리 -> 정렬 배열)
         if existing_checkpoint:
-            user_id_to_index = existing_checkpoint['user_id_to_index'] # str(uid) -> idx
-            item_id_to_index = existing_checkpoint['item_id_to_index'] # str(iid) -> idx
             num_users = existing_checkpoint['num_users']
             num_items = existing_checkpoint['num_items']
+            user_index = IdIndex.from_mapping(existing_checkpoint['user_id_to_index'], num_users)
+            item_index = IdIndex.from_mapping(existing_checkpoint['item_id_to_index'], num_items)
         else:
-            user_id_to_index = {}
-            item_id_to_index = {}
             num_users = 0
             num_items = 0
+            user_index = IdIndex.empty()
+            item_index = IdIndex.empty()
             
-        # 신규 ID 식별 및 매핑 추가
-        train_data = [] # (u_idx, i_idx)
-        interaction_ids_to_mark = []
-        
-        # 현재 데이터셋에서의 최대 인덱스 추적
-        current_max_user_idx = num_users - 1
-        current_max_item_idx = num_items - 1
+        # 신규 ID에 기존 인덱스 뒤의 인덱스를 처음 나온 순서대로 부여
+        interaction_user_ids = np.fromiter((row[0] for row in new_interactions), dtype=np.int64, count=len(new_interactions))
+        interaction_item_ids = np.fromiter((row[1] for row in new_interactions), dtype=np.int64, count=len(new_interactions))
+        user_index = user_index.extend(interaction_user_ids)
+        item_index = item_index.extend(interaction_item_ids)
         
-        for interaction in new_interactions:
-            uid_str = str(interaction.user_id)
-            iid_str = str(interaction.coordi_id)
-            
-            # User Mapping
-            if uid_str not in user_id_to_index:
-                current_max_user_idx += 1
-                user_id_to_index[uid_str] = current_max_user_idx
-            
-            # Item Mapping
-            if iid_str not in item_id_to_index:
-                current_max_item_idx += 1
-                item_id_to_index[iid_str] = current_max_item_idx
-                
-            u_idx = user_id_to_index[uid_str]
-            i_idx = item_id_to_index[iid_str]
-            
-            train_data.append((u_idx, i_idx))
-            # 학습에 사용된 Interaction ID 수집 (복합키: user_id, coordi_id)
-            interaction_ids_to_mark.append((interaction.user_id, interaction.coordi_id))
+        # 학습에 사용된 Interaction ID 수집 (복합키: user_id, coordi_id)
+        interaction_ids_to_mark = [(user_id, coordi_id) for user_id, coordi_id in new_interactions]
             
         # 업데이트된 차원 수
-        new_num_users = current_max_user_idx + 1
-        new_num_items = current_max_item_idx + 1
+        new_num_users = user_index.size
+        new_num_items = item_index.size
         
-        logger.info(f"[Training] New Data Split: {len(train_data)} interactions.")
+        logger.info(f"[Training] New Data Split: {len(new_interactions)} interactions.")
         logger.info(f"[Training] Dimensions: Users {num_users} -> {new_num_users}, Items {num_items} -> {new_num_items}")
 
         # 4. 모델 초기화 및 가중치 로드 (Resize 포함)
-        model = NeMF(new_num_users, new_num_items, embedding_dim=embedding_dim).to(self.device)
+        # CPU/CUDA에서는 sparse 임베딩 + SparseAdam으로 배치에 나온 행만 갱신 (MPS는 sparse gradient 미지원)
+        model = NeMF(
+            new_num_users, new_num_items, embedding_dim=embedding_dim,
+            sparse=self.device.type != "mps"
+        ).to(self.device)
         
         if existing_checkpoint:
             self._load_and_resize_model(model, existing_checkpoint, new_num_users, new_num_items)
         else:
             logger.info("[Training] Created new model from scratch.")
-            
-        model.train()
-        optimizer = optim.Adam(model.parameters(), lr=0.001)
         
         # 5. 학습 루프 (BPR) - 신규 데이터에 대해서만 (Fine-tuning)
         # Catastrophic Forgetting 방지를 위해 Old Data를 섞으면 좋지만, 
         # 현재 요청사항은 "is_trained=False만" 학습하는 것임.
+        # Negative 샘플에서는 학습 대상 유저의 기존 positive(학습 완료분 포함)도 제외함.
         logger.info("[Training] Start Incremental BPR Training...")
-        
-        for epoch in range(epochs):
-            total_loss = 0
-            np.random.shuffle(train_data)
-            
-            num_batches = len(train_data) // batch_size
-            
-            # 데이터가 적을 경우 최소 1번은 돌도록
-            if num_batches == 0:
-                num_batches = 1
-            
-            for i in range(num_batches):
-                start = i * batch_size
-                end = min((i + 1) * batch_size, len(train_data))
-                if start >= end: break # Safety check
-                
-                batch = train_data[start:end]
-                u_batch = [x[0] for x in batch]
-                i_batch = [x[1] for x in batch]
-                
-                # Negative Sampling
-                j_batch = []
-                for _ in range(len(batch)):
-                    # 전체 아이템 범위 내에서 랜덤 샘플링
-                    neg_item = np.random.randint(0, new_num_items)
-                    j_batch.append(neg_item)
-                
-                u_tensor = torch.tensor(u_batch, dtype=torch.long).to(self.device)
-                i_tensor = torch.tensor(i_batch, dtype=torch.long).to(self.device)
-                j_tensor = torch.tensor(j_batch, dtype=torch.long).to(self.device)
-                
-                # Forward
-                pos_probs = model.forward(u_tensor, i_tensor)
-                neg_probs = model.forward(u_tensor, j_tensor)
-                
-                # BPR Loss
-                pos_probs = torch.clamp(pos_probs, min=1e-7, max=1.0-1e-7)
-                neg_probs = torch.clamp(neg_probs, min=1e-7, max=1.0-1e-7)
-                
-                pos_scores = torch.log(pos_probs / (1 - pos_probs))
-                neg_scores = torch.log(neg_probs / (1 - neg_probs))
-                
-                loss = -torch.mean(torch.log(torch.sigmoid(pos_scores - neg_scores) + 1e-10))
-                
-                optimizer.zero_grad()
-                loss.backward()
-                optimizer.step()
-                
-                total_loss += loss.item()
-            
-            logger.info(f"[Training] Epoch {epoch+1}/{epochs} Loss: {total_loss:.4f}")
+        users = torch.from_numpy(user_index.lookup(interaction_user_ids))
+        items = torch.from_numpy(item_index.lookup(interaction_item_ids))
+        known_users, known_items = self._load_known_positives(
+            untrained, positive_actions, user_index, item_index
+        )
+        stats = train_bpr(
+            model, users, items, new_num_items,
+            epochs=epochs, batch_size=batch_size, lr=0.001,
+            known_users=known_users, known_items=known_items,
+            on_epoch_end=lambda epoch, loss: report(
+                0.1 + 0.7 * epoch / epochs, f"Epoch {epoch}/{epochs} loss {loss:.4f}"
+            ),
+        )
+        logger.info(
+            f"[Training] Trained {stats.num_interactions} interactions x {stats.epochs} epochs "
+            f"in {stats.seconds:.2f}s ({stats.interactions_per_second:,.0f} interactions/s)"
+        )
+
+        # 6. 저장 (DB & File)
+        report(0.85, "Saving embeddings")
+        self.save_embeddings(
+            model, user_index, item_index,
+            existing_checkpoint['model_state_dict'] if existing_checkpoint else None
+        )
+        report(0.95, "Publishing checkpoint")
+        version = self.save_checkpoint(model, user_index, item_index, embedding_dim)
 
-        # 6. is_trained = True 마킹
+        # 7. is_trained = True 마킹 (발행에 실패하면 다음 실행에서 다시 학습하도록 발행 후에 마킹)
         self._mark_as_trained(interaction_ids_to_mark)
+        report(1.0, "Training finished")
+        return version
 
-        # 7. 저장 (DB & File)
-        # 역매핑 생성 (저장용)
-        # user_map, item_map은 원래 (DB ID -> Index) 였지만, 여기선 str(DB ID) -> Index 로 관리됨
-        # save_embeddings와 save_checkpoint는 이 구조에 맞춰야 함
-        
-        # 호환성을 위해 int 키로 변환한 맵 생성 (save_embeddings용)
-        user_map_int = {int(k): v for k, v in user_id_to_index.items()}
-        item_map_int = {int(k): v for k, v in item_id_to_index.items()}
-        
-        self.save_embeddings(model, user_map_int, item_map_int)
-        self.save_checkpoint(model, user_id_to_index, item_id_to_index, embedding_dim)
+    def _load_known_positives(self, untrained, positive_actions, user_index, item_index):
+        """
+        이번 학습 대상 유저들의 모든 positive (user_idx, item_idx) 쌍.
+        Negative 샘플링에서 제외하는 용도이며, 매핑에 없는 아이템은 샘플링될 수 없으므로 건너뜁니다.
+        """
+        target_users = select(UserCoordiInteraction.user_id).where(*untrained).distinct()
+        rows = self.db.execute(
+            select(UserCoordiInteraction.user_id, UserCoordiInteraction.coordi_id).where(
+                UserCoordiInteraction.action_type.in_(positive_actions),
+                UserCoordiInteraction.user_id.in_(target_users),
+            )
+        ).all()
         
+        user_ids = np.fromiter((row[0] for row in rows), dtype=np.int64, count=len(rows))
+        coordi_ids = np.fromiter((row[1] for row in rows), dtype=np.int64, count=len(rows))
+        item_idx = item_index.lookup(coordi_ids)
+        known = item_idx >= 0
+        return torch.from_numpy(user_index.lookup(user_ids[known])), torch.from_numpy(item_idx[known])
+
     def _load_and_resize_model(self, model, checkpoint, new_num_users, new_num_items):
         """
         기존 모델 가중치를 로드하되, 크기가 늘어난 경우(새 유저/아이템) 
@@ -264,100 +239,109 @@ class NightModelTrainer:
             logger.error(f"[Training] Failed to mark interactions as trained: {e}")
             self.db.rollback()
 
-    def save_embeddings(self, model, user_map, item_map):
+    def save_embeddings(self, model, user_index, item_index, previous_state_dict=None):
+        """
+        학습된 임베딩을 DB에 저장합니다 (night_v1 유저/아이템, day_v1 유저).
+        night_v1은 previous_state_dict(학습 전 체크포인트)와 벡터가 같은 행은 건너뛰고,
+        나머지는 COPY + INSERT ... ON CONFLICT로 일괄 반영합니다 (app/services/embedding_writer.py).
+        day_v1은 낮 동안 fold-in으로 Night 벡터와 달라질 수 있으므로 모든 유저를 Night 벡터로 되돌립니다
+        (DB 벡터와 같은 행은 writer가 갱신하지 않음).
+        저장에 실패하면 롤백 후 예외를 다시 발생시킵니다 (체크포인트 발행/학습 완료 마킹 전).
+        """
         logger.info("[Training] Saving embeddings to DB...")
         model.eval()
         
         with torch.no_grad():
-            u_weights = model.user_embedding.weight.cpu().numpy().tolist()
-            i_weights = model.item_embedding.weight.cpu().numpy().tolist()
-            
+            u_weights = model.user_embedding.weight.detach().cpu().numpy()
+            i_weights = model.item_embedding.weight.detach().cpu().numpy()
+        
+        previous_state_dict = previous_state_dict or {}
+        previous_u = previous_state_dict.get('user_embedding.weight')
+        previous_i = previous_state_dict.get('item_embedding.weight')
+        
         try:
-            # Upsert User Embeddings
-            for uid, idx in user_map.items():
-                 vector = u_weights[idx]
-                 self._upsert_user(uid, 'night_v1', vector)
-                 self._upsert_user(uid, 'day_v1', vector)
-                 
-            # Upsert Item Embeddings
-            for iid, idx in item_map.items():
-                vector = i_weights[idx]
-                self._upsert_item(iid, 'night_v1', vector)
+            stats = []
+            
+            # User Embeddings
+            user_ids, user_idx = user_index.ids, user_index.indices
+            changed = changed_rows(user_idx, u_weights, None if previous_u is None else previous_u.cpu().numpy())
+            stats.append(write_embeddings(
+                self.db, USER_EMBEDDINGS, 'night_v1', user_ids[changed], u_weights[user_idx[changed]]
+            ))
+            
+            # Day 임베딩 초기화: Night 벡터가 그대로인 유저(스킵만 한 유저 등)도 낮 동안 fold-in으로
+            # 옮겨졌을 수 있으므로 체크포인트 비교 없이 전체를 보냄
+            stats.append(write_embeddings(
+                self.db, USER_EMBEDDINGS, 'day_v1', user_ids, u_weights[user_idx]
+            ))
+            
+            # Item Embeddings
+            item_ids, item_idx = item_index.ids, item_index.indices
+            changed = changed_rows(item_idx, i_weights, None if previous_i is None else previous_i.cpu().numpy())
+            stats.append(write_embeddings(
+                self.db, ITEM_EMBEDDINGS, 'night_v1', item_ids[changed], i_weights[item_idx[changed]]
+            ))
             
             self.db.commit()
-            logger.info("[Training] All embeddings saved successfully.")
+            for s in stats:
+                logger.info(
+                    f"[Training] {s.table}({s.model_version}): copied {s.copied}, written {s.written} "
+                    f"in {s.seconds:.2f}s ({s.rows_per_second:,.0f} rows/s)"
+                )
+            logger.info(
+                f"[Training] All embeddings saved successfully "
+                f"(unchanged skipped: users {len(user_index) - stats[0].copied}, items {len(item_index) - stats[-1].copied})."
+            )
             
         except Exception as e:
             self.db.rollback()
             logger.error(f"[Training] Failed to save embeddings: {e}")
+            # changed_rows는 DB가 아니라 이전 체크포인트와 비교하므로, 여기서 실패한 채 발행하면
+            # 다음 학습에서 이 벡터들을 "변경 없음"으로 건너뜀 -> 발행/마킹 없이 실행을 실패로 기록
+            raise
 
-    def save_checkpoint(self, model, user_id_to_index, item_id_to_index, embedding_dim):
+    def save_checkpoint(self, model, user_index, item_index, embedding_dim):
         """
-        모델 체크포인트 저장 (덮어쓰기)
+        모델 체크포인트를 새 버전으로 발행합니다.
+        버전 디렉토리에 모두 쓴 뒤 manifest를 교체하므로, 서빙 중인 워커는
+        기존 버전을 계속 사용하다가 새 버전이 완성된 이후에만 교체합니다.
+        ID 매핑은 기존 체크포인트와 같은 {str(id): index} 딕셔너리로 저장합니다.
+        발행에 실패하면 예외를 다시 발생시킵니다 (학습 실행이 실패로 기록되도록).
         """
-        # 파일 절대 경로를 기준으로 backend 루트 찾기
-        current_dir = os.path.dirname(os.path.abspath(__file__)) # .../backend/app/services
-        backend_dir = os.path.dirname(os.path.dirname(current_dir)) # .../backend
-        base_dir = os.path.join(backend_dir, "data", "model_artifacts")
-        
-        if not os.path.exists(base_dir):
-            os.makedirs(base_dir, exist_ok=True)
-            
-        save_path = os.path.join(base_dir, "neumf_night_model.pth")
-        
         checkpoint = {
             'model_state_dict': model.state_dict(),
-            'user_id_to_index': user_id_to_index,
-            'item_id_to_index': item_id_to_index,
-            'num_users': len(user_id_to_index),
-            'num_items': len(item_id_to_index),
+            'user_id_to_index': user_index.to_mapping(),
+            'item_id_to_index': item_index.to_mapping(),
+            'num_users': user_index.size,
+            'num_items': item_index.size,
             'embedding_dim': embedding_dim,
             'hidden_dims': [128]
         }
         
         try:
-            torch.save(checkpoint, save_path)
-            logger.info(f"[Training] Model checkpoint updated at {save_path}")
+            version = get_model_registry().publish_checkpoint(checkpoint)
         except Exception as e:
             logger.error(f"[Training] Failed to save model checkpoint: {e}")
+            raise
+        logger.info(f"[Training] Model checkpoint published as version {version}")
+        return version
 
-    def _upsert_user(self, user_id, version, vector):
-        embedding = self.db.get(UserEmbedding, (user_id, version))
-        if not embedding:
-            embedding = UserEmbedding(
-                user_id=user_id, 
-                model_version=version, 
-                vector=vector
-            )
-            self.db.add(embedding)
-        else:
-            embedding.vector = vector
-
-    def _upsert_item(self, coordi_id, version, vector):
-        embedding = self.db.get(ItemEmbedding, (coordi_id, version))
-        if not embedding:
-            embedding = ItemEmbedding(
-                coordi_id=coordi_id, 
-                model_version=version, 
-                vector=vector
-            )
-            self.db.add(embedding)
-        else:
-            embedding.vector = vector
-
-def run_night_training():
+def run_night_training(progress=None):
     """
-    스케줄러에서 호출하는 엔트리 포인트
+    스케줄러/학습 워커에서 호출하는 엔트리 포인트
+    발행한 모델 버전을 반환합니다 (학습할 상호작용이 없으면 None).
+    실패하면 예외를 다시 발생시켜 호출한 쪽이 작업 실패로 기록할 수 있게 합니다.
     """
     logger.info("Initializing Night Training Service...")
     db = SessionLocal()
     try:
         trainer = NightModelTrainer(db)
         # 실전: 에폭을 적당히 늘려줍니다 (증분 학습이므로 적은 에폭으로도 충분할 수 있음)
-        trainer.train(epochs=5, batch_size=64)
+        return trainer.train(epochs=5, batch_size=NIGHT_TRAIN_BATCH_SIZE, progress=progress)
     except Exception as e:
         logger.error(f"Night training failed: {e}")
         import traceback
         traceback.print_exc()
+        raise
     finally:
         db.close()
@@ -0,0 +1,143 @@
+"""
+인증된 사용자 캐시.
+
+보호된 API마다 토큰의 사용자 ID로 `users` 테이블을 조회하지 않도록, 추천/목록 API에 필요한
+최소 사용자 정보(user_id, gender, has_completed_onboarding)를 두 단계로 보관합니다.
+
+    - 요청 범위: ContextVar에 현재 요청의 사용자를 저장하여 같은 요청 안의 서비스 함수가 재사용
+    - 프로세스 범위: user_id 기준 TTL LRU 캐시 (Thread-safe)
+
+선호도/프로필 변경 시 `invalidate_cached_user`로 해당 사용자를 제거합니다.
+다른 워커 프로세스에서 발생한 변경은 TTL 만료 후 반영됩니다.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import OrderedDict
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.models.user import User
+
+# 캐시 유지 시간 (초)
+USER_CACHE_TTL_SECONDS = float(os.getenv("AUTH_USER_CACHE_TTL_SECONDS", "60"))
+
+# 프로세스당 최대 보관 사용자 수 (초과 시 가장 오래 사용되지 않은 사용자부터 제거)
+USER_CACHE_MAX_USERS = int(os.getenv("AUTH_USER_CACHE_MAX_USERS", "10000"))
+
+
+@dataclass(frozen=True)
+class CachedUser:
+    """요청 처리에 필요한 최소 사용자 정보."""
+
+    user_id: int
+    gender: Optional[str]
+    has_completed_onboarding: bool
+    cached_at: float = field(default_factory=time.monotonic, compare=False)
+
+
+class UserCache:
+    """user_id -> CachedUser TTL LRU 캐시 (Thread-safe)."""
+
+    def __init__(self, ttl_seconds: float = USER_CACHE_TTL_SECONDS, max_users: int = USER_CACHE_MAX_USERS):
+        self.ttl_seconds = ttl_seconds
+        self.max_users = max_users
+        self._users: OrderedDict[int, CachedUser] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, user_id: int) -> Optional[CachedUser]:
+        with self._lock:
+            user = self._users.get(user_id)
+            if user is None:
+                return None
+
+            if time.monotonic() - user.cached_at > self.ttl_seconds:
+                del self._users[user_id]
+                return None
+
+            self._users.move_to_end(user_id)
+            return user
+
+    def put(self, user: CachedUser) -> None:
+        with self._lock:
+            self._users[user.user_id] = user
+            self._users.move_to_end(user.user_id)
+            while len(self._users) > self.max_users:
+                self._users.popitem(last=False)
+
+    def invalidate(self, user_id: int) -> None:
+        with self._lock:
+            self._users.pop(user_id, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._users.clear()
+
+
+# 전역 인스턴스
+_user_cache = UserCache()
+
+# 현재 요청에서 인증된 사용자 (요청 범위)
+_current_user: ContextVar[Optional[CachedUser]] = ContextVar("current_user", default=None)
+
+
+def get_user_cache() -> UserCache:
+    return _user_cache
+
+
+def _slim_user_query(user_id: int):
+    return select(User.user_id, User.gender, User.has_completed_onboarding).where(User.user_id == user_id)
+
+
+def _lookup(user_id: int) -> Optional[CachedUser]:
+    """요청 범위 -> 프로세스 캐시 순으로 조회합니다."""
+    current = _current_user.get()
+    if current is not None and current.user_id == user_id:
+        return current
+
+    cached = _user_cache.get(user_id)
+    if cached is not None:
+        _current_user.set(cached)
+    return cached
+
+
+def _remember(row) -> Optional[CachedUser]:
+    if row is None:
+        return None
+
+    user = CachedUser(user_id=row.user_id, gender=row.gender, has_completed_onboarding=row.has_completed_onboarding)
+    _user_cache.put(user)
+    _current_user.set(user)
+    return user
+
+
+def load_cached_user(db: Session, user_id: int) -> Optional[CachedUser]:
+    """캐시된 사용자를 반환합니다. 없으면 필요한 컬럼만 조회하여 캐시합니다 (사용자가 없으면 None)."""
+    user = _lookup(user_id)
+    if user is not None:
+        return user
+    return _remember(db.execute(_slim_user_query(user_id)).one_or_none())
+
+
+async def load_cached_user_async(db: AsyncSession, user_id: int) -> Optional[CachedUser]:
+    """load_cached_user의 비동기 세션 버전."""
+    user = _lookup(user_id)
+    if user is not None:
+        return user
+    return _remember((await db.execute(_slim_user_query(user_id))).one_or_none())
+
+
+def invalidate_cached_user(user_id: int) -> None:
+    """선호도/프로필 변경 후 호출하여 캐시된 사용자 정보를 제거합니다."""
+    _user_cache.invalidate(user_id)
+    current = _current_user.get()
+    if current is not None and current.user_id == user_id:
+        _current_user.set(None)
@@ -11,7 +11,7 @@ from pathlib import Path
 
 import aiofiles
 from fastapi import UploadFile
-from sqlalchemy import func, select
+from sqlalchemy import delete, func, select
 from sqlalchemy.orm import Session, selectinload
 
 from app.core.exceptions import (
@@ -35,6 +35,7 @@ from app.models.coordi import Coordi
 from app.models.tag import Tag
 from app.models.user import User
 from app.models.user_coordi_interaction import UserCoordiInteraction
+from app.models.user_embedding import UserEmbedding
 from app.models.user_image import UserImage
 from app.models.user_preferred_tag import UserPreferredTag
 from app.schemas.users import (
@@ -42,6 +43,8 @@ from app.schemas.users import (
     SampleOutfitOptionPayload,
     UserPreferencesRequest,
 )
+from app.services.cold_query_embedding import COLD_QUERY_VERSION_PREFIX, refresh_cold_query_embedding
+from app.services.user_cache import invalidate_cached_user
 
 logger = logging.getLogger(__name__)
 
@@ -255,10 +258,30 @@ def set_user_preferences(
     # has_completed_onboarding을 true로 업데이트
     user.has_completed_onboarding = True
 
+    # 이전 선호도로 계산된 Cold-Start 쿼리 임베딩 무효화 (같은 트랜잭션)
+    db.execute(
+        delete(UserEmbedding).where(
+            UserEmbedding.user_id == user_id,
+            UserEmbedding.model_version.like(f"{COLD_QUERY_VERSION_PREFIX}%"),
+        )
+    )
+
     # 변경사항 커밋
     db.commit()
     db.refresh(user)
 
+    # 캐시된 사용자 정보(온보딩 여부) 무효화
+    invalidate_cached_user(user_id)
+
+    # 새 선호도로 쿼리 임베딩 계산 후 저장
+    # (실패해도 선호도 저장은 유지되며, Cold-Start 요청 시 다시 계산됨)
+    try:
+        refresh_cold_query_embedding(db, user_id)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.error(f"Failed to store cold-start query embedding for user {user_id}: {e}")
+
     return user
 
 
@@ -333,6 +356,9 @@ async def upload_profile_photo(
         db.commit()
         db.refresh(user_image)
 
+        # 프로필 변경 시 캐시된 사용자 정보 무효화
+        invalidate_cached_user(user_id)
+
         return user_image
 
     except InvalidPersonImageError:
@@ -399,6 +425,9 @@ async def delete_profile_photo(
         # 변경사항 커밋
         db.commit()
 
+        # 프로필 변경 시 캐시된 사용자 정보 무효화
+        invalidate_cached_user(user_id)
+
         return deleted_at, had_photo
 
     except Exception as e:
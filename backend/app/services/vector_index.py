@@ -0,0 +1,439 @@
+"""
+코디 임베딩 벡터 인덱스 추상화 및 구현 (pgvector / In-process).
+
+Cold-Start 추천은 쿼리 임베딩과 `Coordi.description_embedding`의 코사인 거리로
+같은 성별/계절의 코디를 찾습니다. 검색 백엔드는 환경 변수 `VECTOR_INDEX_TYPE`으로 선택합니다.
+
+- pgvector (기본): PostgreSQL에서 `<=>` 연산자로 정렬 ((gender, season)별 HNSW 부분 인덱스 사용)
+- memory: 코디 임베딩을 프로세스 메모리에 올려 (gender, season) 파티션별 IVF 인덱스로 검색
+          DB 없이 `from_arrays`로 직접 구성할 수도 있음
+"""
+
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import Dict, Iterable, Optional, Tuple
+
+import numpy as np
+from sqlalchemy import func, select, text
+from sqlalchemy.orm import Session
+
+from app.db.database import SessionLocal
+from app.models.coordi import Coordi
+from app.services.seen_filter import seen_coordi_ids_query, unseen_by
+from app.services.view_log_buffer import get_view_log_buffer
+
+logger = logging.getLogger(__name__)
+
+# 파티션 크기가 이보다 작으면 IVF 대신 전수 비교 (정확한 결과, 충분히 빠름)
+IVF_MIN_PARTITION_SIZE = int(os.getenv("VECTOR_INDEX_IVF_MIN_SIZE", "5000"))
+
+# 검색 시 처음 탐색할 클러스터 수 (후보가 부족하면 자동으로 늘림)
+IVF_NPROBE = int(os.getenv("VECTOR_INDEX_NPROBE", "8"))
+
+# In-process 인덱스 재생성 주기 (초). 코디 데이터는 배치 스크립트로만 추가되므로 길게 유지
+INDEX_REFRESH_SECONDS = float(os.getenv("VECTOR_INDEX_REFRESH_SECONDS", "3600"))
+
+# pgvector HNSW 검색 후보 수 (hnsw.ef_search). 제외할 코디가 많으면 요청별로 늘림 (최대 1000)
+PGVECTOR_EF_SEARCH = int(os.getenv("PGVECTOR_EF_SEARCH", "100"))
+PGVECTOR_MAX_EF_SEARCH = 1000
+
+# ivfflat 인덱스 사용 시 탐색할 리스트 수 (ivfflat.probes)
+PGVECTOR_IVFFLAT_PROBES = int(os.getenv("PGVECTOR_IVFFLAT_PROBES", "10"))
+
+# ef_search만으로 필요한 결과 수를 채울 수 없을 때 사용할 iterative scan 모드
+# (strict_order / relaxed_order / off). pgvector 0.8.0 이상에서만 적용 (설치된 버전을 한 번 확인)
+PGVECTOR_ITERATIVE_SCAN = os.getenv("PGVECTOR_ITERATIVE_SCAN", "strict_order").lower()
+_PGVECTOR_ITERATIVE_SCAN_MIN_VERSION = (0, 8)
+
+_KMEANS_ITERATIONS = 10
+_KMEANS_SAMPLES_PER_CENTROID = 64
+
+
+class VectorIndex(ABC):
+    """코디 임베딩 검색 추상 클래스"""
+
+    @abstractmethod
+    def search(
+        self,
+        db: Session,
+        query: np.ndarray,
+        gender: str,
+        season: str,
+        offset: int,
+        limit: int,
+        exclude_ids: Iterable[int] = (),
+        exclude_seen_by: Optional[int] = None,
+    ) -> Tuple[list[int], int]:
+        """
+        쿼리 임베딩과 코사인 거리가 가까운 순서로 코디를 검색합니다.
+
+        Args:
+            db: DB 세션
+            query: 정규화된 쿼리 임베딩 (512,)
+            gender: 코디 성별 필터
+            season: 코디 계절 필터
+            offset: 건너뛸 개수
+            limit: 반환할 개수
+            exclude_ids: 제외할 coordi_id
+            exclude_seen_by: 이 사용자가 조회/상호작용한 코디를 제외 (user_id)
+
+        Returns:
+            tuple[list[int], int]: (coordi_id 리스트, 제외 후 전체 후보 개수)
+        """
+        pass
+
+
+class PgVectorIndex(VectorIndex):
+    """PostgreSQL pgvector 검색"""
+
+    # 실제로 사용할 iterative scan 모드 (설치된 pgvector 버전 확인 후 결정, 프로세스당 한 번)
+    _iterative_scan: Optional[str] = None
+
+    def search(self, db, query, gender, season, offset, limit, exclude_ids=(), exclude_seen_by=None):
+        excluded = set(exclude_ids)
+
+        # 기본 쿼리: 성별 필터링, 계절 필터링, description_embedding이 있는 코디만
+        # (조건이 부분 인덱스의 WHERE 절과 일치해야 해당 인덱스가 사용됨)
+        base_query = (
+            select(Coordi.coordi_id)
+            .where(Coordi.gender == gender)
+            .where(Coordi.season == season)
+            .where(Coordi.description_embedding.isnot(None))
+        )
+        count_query = (
+            select(func.count(Coordi.coordi_id))
+            .where(Coordi.gender == gender)
+            .where(Coordi.season == season)
+            .where(Coordi.description_embedding.isnot(None))
+        )
+
+        if excluded:
+            base_query = base_query.where(Coordi.coordi_id.notin_(excluded))
+            count_query = count_query.where(Coordi.coordi_id.notin_(excluded))
+
+        # 이미 본 코디는 NOT EXISTS anti-join으로 제외 (제외 개수를 미리 알 수 없음)
+        num_excluded: Optional[int] = len(excluded)
+        if exclude_seen_by is not None:
+            base_query = base_query.where(unseen_by(exclude_seen_by))
+            count_query = count_query.where(unseen_by(exclude_seen_by))
+            num_excluded = None
+
+        total_items = db.execute(count_query).scalar_one()
+
+        self._apply_search_settings(
+            db, need=offset + limit, num_excluded=num_excluded, iterative_scan=self._iterative_scan_mode(db)
+        )
+
+        # 코사인 거리 (<=>) 오름차순 정렬, 쿼리 벡터는 바인드 파라미터로 전달
+        coordi_ids = db.execute(
+            base_query
+            .order_by(Coordi.description_embedding.cosine_distance(np.asarray(query).tolist()))
+            .offset(offset)
+            .limit(limit)
+        ).scalars().all()
+        return list(coordi_ids), total_items
+
+    @classmethod
+    def _iterative_scan_mode(cls, db: Session) -> str:
+        """
+        PGVECTOR_ITERATIVE_SCAN을 설치된 pgvector 버전에 맞춰 반환합니다.
+        0.8.0 미만에서는 hnsw.iterative_scan 설정이 오류(트랜잭션 중단)를 일으키므로 off로 대체합니다.
+        """
+        if cls._iterative_scan is None:
+            mode = PGVECTOR_ITERATIVE_SCAN
+            if mode != "off":
+                extversion = db.execute(
+                    text("SELECT extversion FROM pg_extension WHERE extname = 'vector'")
+                ).scalar_one_or_none()
+                version = tuple(int(part) for part in (extversion or "0").split(".")[:2] if part.isdigit())
+                if version < _PGVECTOR_ITERATIVE_SCAN_MIN_VERSION:
+                    logger.warning(
+                        f"[PgVectorIndex] pgvector {extversion} does not support iterative scan. "
+                        f"Ignoring PGVECTOR_ITERATIVE_SCAN={mode}."
+                    )
+                    mode = "off"
+            cls._iterative_scan = mode
+        return cls._iterative_scan
+
+    @staticmethod
+    def _apply_search_settings(
+        db: Session,
+        need: int,
+        num_excluded: Optional[int],
+        iterative_scan: str = PGVECTOR_ITERATIVE_SCAN,
+    ) -> None:
+        """
+        현재 트랜잭션에 한해 ANN 검색 파라미터를 설정합니다 (set_config(..., is_local=true)).
+
+        HNSW 인덱스 스캔은 ef_search개 후보를 찾은 뒤 WHERE 조건(제외 목록)을 적용하므로,
+        제외되는 코디가 많으면 결과가 LIMIT보다 적게 나올 수 있습니다.
+        ef_search를 (필요 개수 + 제외 개수)까지 늘리고, 그래도 부족하면 iterative scan을 켭니다.
+        제외 개수를 모르면(num_excluded=None, anti-join 제외) iterative scan을 켜고,
+        iterative scan을 쓸 수 없으면 ef_search를 최대로 설정합니다.
+        """
+        iterative_available = iterative_scan != "off"
+        if num_excluded is None:
+            ef_search = min(max(PGVECTOR_EF_SEARCH, need), PGVECTOR_MAX_EF_SEARCH)
+            use_iterative = iterative_available
+            if not iterative_available:
+                ef_search = PGVECTOR_MAX_EF_SEARCH
+        else:
+            wanted = need + num_excluded
+            ef_search = min(max(PGVECTOR_EF_SEARCH, wanted), PGVECTOR_MAX_EF_SEARCH)
+            use_iterative = wanted > ef_search and iterative_available
+        params = {"ef_search": str(ef_search), "probes": str(PGVECTOR_IVFFLAT_PROBES)}
+
+        settings = [
+            "set_config('hnsw.ef_search', :ef_search, true)",
+            "set_config('ivfflat.probes', :probes, true)",
+        ]
+        if use_iterative:
+            settings.append("set_config('hnsw.iterative_scan', :iterative_scan, true)")
+            params["iterative_scan"] = iterative_scan
+
+        db.execute(text("SELECT " + ", ".join(settings)), params)
+
+
+@dataclass
+class _Partition:
+    """(gender, season) 파티션 하나의 IVF 인덱스."""
+
+    ids: np.ndarray  # 리스트 순서로 정렬된 coordi_id (n,)
+    vectors: np.ndarray  # 정규화된 임베딩, ids와 같은 순서 (n, dim)
+    sorted_ids: np.ndarray  # 제외 개수 계산용 오름차순 coordi_id
+    centroids: Optional[np.ndarray]  # (nlist, dim), None이면 전수 비교
+    list_offsets: Optional[np.ndarray]  # 리스트 i의 범위 = [offsets[i], offsets[i+1])
+
+    @classmethod
+    def build(cls, ids: np.ndarray, vectors: np.ndarray, rng: np.random.Generator) -> "_Partition":
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        vectors = (vectors / norms).astype(np.float32)
+
+        if len(ids) < IVF_MIN_PARTITION_SIZE:
+            return cls(ids, vectors, np.sort(ids), None, None)
+
+        # k-means (구면 k-means: 내적 기준 할당, 중심은 정규화)
+        nlist = max(int(np.sqrt(len(ids))), 1)
+        sample_size = min(len(ids), nlist * _KMEANS_SAMPLES_PER_CENTROID)
+        sample = vectors[rng.choice(len(ids), size=sample_size, replace=False)]
+        centroids = sample[rng.choice(sample_size, size=nlist, replace=False)].copy()
+
+        for _ in range(_KMEANS_ITERATIONS):
+            assignment = np.argmax(sample @ centroids.T, axis=1)
+            for c in range(nlist):
+                members = sample[assignment == c]
+                if len(members):
+                    centroid = members.sum(axis=0)
+                    norm = np.linalg.norm(centroid)
+                    centroids[c] = centroid / norm if norm > 0 else centroid
+
+        assignment = _assign(vectors, centroids)
+        order = np.argsort(assignment, kind="stable")
+        counts = np.bincount(assignment, minlength=nlist)
+        list_offsets = np.concatenate([[0], np.cumsum(counts)])
+
+        return cls(
+            ids=ids[order],
+            vectors=np.ascontiguousarray(vectors[order]),
+            sorted_ids=np.sort(ids),
+            centroids=centroids,
+            list_offsets=list_offsets,
+        )
+
+    def count_excluding(self, exclude: np.ndarray) -> int:
+        if exclude.size == 0:
+            return len(self.ids)
+        pos = np.searchsorted(self.sorted_ids, exclude)
+        pos = np.minimum(pos, len(self.sorted_ids) - 1)
+        return len(self.ids) - int(np.count_nonzero(self.sorted_ids[pos] == exclude))
+
+    def search(self, query: np.ndarray, need: int, exclude: np.ndarray) -> np.ndarray:
+        """유사도 내림차순 coordi_id 상위 need개를 반환합니다."""
+        if self.centroids is None:
+            return _rank(self.ids, self.vectors @ query, need, exclude)
+
+        # 쿼리와 가까운 클러스터부터 탐색, 제외 후 후보가 부족하면 탐색 범위를 두 배로 확장
+        probe_order = np.argsort(self.centroids @ query)[::-1]
+        nprobe = min(IVF_NPROBE, len(probe_order))
+        while True:
+            lists = probe_order[:nprobe]
+            ids = np.concatenate([self.ids[self.list_offsets[c] : self.list_offsets[c + 1]] for c in lists])
+            scores = np.concatenate(
+                [self.vectors[self.list_offsets[c] : self.list_offsets[c + 1]] @ query for c in lists]
+            )
+            ranked = _rank(ids, scores, need, exclude)
+            if len(ranked) >= need or nprobe >= len(probe_order):
+                return ranked
+            nprobe = min(nprobe * 2, len(probe_order))
+
+
+def _assign(vectors: np.ndarray, centroids: np.ndarray, chunk_size: int = 65536) -> np.ndarray:
+    assignment = np.empty(len(vectors), dtype=np.int64)
+    for start in range(0, len(vectors), chunk_size):
+        assignment[start : start + chunk_size] = np.argmax(vectors[start : start + chunk_size] @ centroids.T, axis=1)
+    return assignment
+
+
+def _rank(ids: np.ndarray, scores: np.ndarray, need: int, exclude: np.ndarray) -> np.ndarray:
+    if exclude.size:
+        keep = ~np.isin(ids, exclude)
+        ids, scores = ids[keep], scores[keep]
+
+    need = min(need, len(ids))
+    if need <= 0:
+        return np.empty(0, dtype=np.int64)
+    if need < len(ids):
+        top = np.argpartition(scores, -need)[-need:]
+    else:
+        top = np.arange(len(ids))
+    return ids[top[np.argsort(scores[top], kind="stable")[::-1]]]
+
+
+class InMemoryVectorIndex(VectorIndex):
+    """
+    프로세스 메모리 기반 IVF 인덱스.
+
+    (gender, season) 파티션별로 코디 임베딩을 k-means 클러스터로 나누어 두고,
+    쿼리와 가까운 클러스터의 코디만 비교합니다. 인덱스 생성(DB 조회 + k-means)은
+    서버 시작 시 또는 백그라운드 스레드에서 전용 SessionLocal로 수행하며,
+    INDEX_REFRESH_SECONDS가 지나면 다음 검색이 백그라운드 재생성을 시작합니다.
+    검색은 생성 락을 기다리지 않고, 인덱스가 아직 없으면 pgvector 검색으로 대신합니다.
+    """
+
+    def __init__(self, refresh_seconds: float = INDEX_REFRESH_SECONDS, seed: int = 42):
+        self.refresh_seconds = refresh_seconds
+        self.seed = seed
+        self._partitions: Optional[Dict[Tuple[str, str], _Partition]] = None
+        self._built_at = 0.0
+        self._build_lock = threading.Lock()
+
+    @classmethod
+    def from_arrays(
+        cls,
+        ids: np.ndarray,
+        genders: np.ndarray,
+        seasons: np.ndarray,
+        vectors: np.ndarray,
+        seed: int = 42,
+    ) -> "InMemoryVectorIndex":
+        """DB 없이 배열로 인덱스를 구성합니다 (벤치마크/테스트용, 자동 재생성 없음)."""
+        index = cls(refresh_seconds=float("inf"), seed=seed)
+        index._partitions = index._build_partitions(
+            np.asarray(ids, dtype=np.int64), np.asarray(genders), np.asarray(seasons), np.asarray(vectors, dtype=np.float32)
+        )
+        index._built_at = time.monotonic()
+        return index
+
+    def _build_partitions(self, ids, genders, seasons, vectors) -> Dict[Tuple[str, str], _Partition]:
+        rng = np.random.default_rng(self.seed)
+        partitions = {}
+        for key in set(zip(genders.tolist(), seasons.tolist())):
+            mask = (genders == key[0]) & (seasons == key[1])
+            partitions[key] = _Partition.build(ids[mask], vectors[mask], rng)
+        return partitions
+
+    def build(self, db: Session) -> None:
+        """DB의 코디 임베딩으로 인덱스를 (재)생성합니다."""
+        start = time.perf_counter()
+        rows = db.execute(
+            select(Coordi.coordi_id, Coordi.gender, Coordi.season, Coordi.description_embedding)
+            .where(Coordi.description_embedding.isnot(None))
+        ).all()
+
+        if rows:
+            ids = np.array([row[0] for row in rows], dtype=np.int64)
+            genders = np.array([row[1] for row in rows], dtype=object)
+            seasons = np.array([row[2] for row in rows], dtype=object)
+            vectors = np.array([np.asarray(row[3], dtype=np.float32) for row in rows], dtype=np.float32)
+            partitions = self._build_partitions(ids, genders, seasons, vectors)
+        else:
+            partitions = {}
+
+        self._partitions = partitions
+        self._built_at = time.monotonic()
+        logger.info(
+            f"[VectorIndex] Built in-process index for {len(rows)} coordis "
+            f"({len(partitions)} partitions) in {(time.perf_counter() - start) * 1000:.0f} ms"
+        )
+
+    def load(self) -> None:
+        """전용 세션으로 인덱스를 생성합니다 (시작 시 프리로드용, 진행 중인 생성이 있으면 기다림)."""
+        with self._build_lock:
+            if self._partitions is not None:
+                return
+            with SessionLocal() as db:
+                self.build(db)
+
+    def refresh_in_background(self) -> None:
+        """백그라운드 스레드에서 인덱스를 (재)생성합니다. 이미 생성 중이면 아무것도 하지 않습니다."""
+        if not self._build_lock.acquire(blocking=False):
+            return
+
+        def _run() -> None:
+            try:
+                with SessionLocal() as db:
+                    self.build(db)
+            except Exception as e:
+                logger.error(f"[VectorIndex] Failed to build in-process index: {e}")
+            finally:
+                self._build_lock.release()
+
+        threading.Thread(target=_run, name="vector-index-build", daemon=True).start()
+
+    def search(self, db, query, gender, season, offset, limit, exclude_ids=(), exclude_seen_by=None):
+        # 생성/재생성은 백그라운드에서만 수행 (이벤트 루프 스레드에서 호출돼도 블로킹하지 않음)
+        if self._partitions is None or time.monotonic() - self._built_at > self.refresh_seconds:
+            self.refresh_in_background()
+
+        partitions = self._partitions
+        if partitions is None:
+            if db is None:
+                return [], 0
+            # 최초 생성이 끝나기 전에는 같은 결과를 주는 pgvector 검색 사용
+            return PgVectorIndex().search(
+                db, query, gender, season, offset, limit,
+                exclude_ids=exclude_ids, exclude_seen_by=exclude_seen_by,
+            )
+
+        partition = partitions.get((gender, season))
+        if partition is None:
+            return [], 0
+
+        exclude = np.fromiter(exclude_ids, dtype=np.int64)
+        if exclude_seen_by is not None and db is not None:
+            # numpy 마스킹에 ID 배열이 필요하므로 중복 제거된 ID만 한 번 읽음
+            seen = db.execute(seen_coordi_ids_query(exclude_seen_by)).scalars().all()
+            seen = list(seen) + list(get_view_log_buffer().pending_coordi_ids(exclude_seen_by))
+            exclude = np.concatenate([exclude, np.fromiter(seen, dtype=np.int64, count=len(seen))])
+        exclude = np.unique(exclude)
+        total_items = partition.count_excluding(exclude)
+
+        query = np.asarray(query, dtype=np.float32)
+        ranked = partition.search(query, offset + limit, exclude)
+        return ranked[offset : offset + limit].tolist(), total_items
+
+
+_vector_index: Optional[VectorIndex] = None
+_vector_index_lock = threading.Lock()
+
+
+def get_vector_index() -> VectorIndex:
+    """환경 변수에 따라 적절한 VectorIndex 인스턴스를 반환합니다."""
+    global _vector_index
+    if _vector_index is None:
+        # 시작 프리로드 스레드와 요청 처리에서 동시에 호출될 수 있음
+        with _vector_index_lock:
+            if _vector_index is None:
+                index_type = os.getenv("VECTOR_INDEX_TYPE", "pgvector").lower()
+                if index_type == "memory":
+                    _vector_index = InMemoryVectorIndex()
+                else:
+                    _vector_index = PgVectorIndex()
+    return _vector_index
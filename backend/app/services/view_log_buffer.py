@@ -0,0 +1,273 @@
+"""
+코디 조회 로그 버퍼.
+
+클라이언트는 스와이프마다 조회 로그를 보내므로, 요청마다 INSERT + COMMIT을 실행하지 않고
+이벤트를 프로세스 메모리에 모았다가 한 번의 multi-row INSERT로 기록합니다.
+
+    - 병합(collapse): 같은 (user_id, coordi_id)의 조회가 VIEW_LOG_COLLAPSE_SECONDS 안에 다시 들어오면
+      새 행을 만들지 않고 첫 조회의 view_started_at에 duration_seconds만 더합니다.
+    - 시간 트리거: VIEW_LOG_FLUSH_INTERVAL_SECONDS마다 병합 구간이 끝난 로그를 기록
+    - 크기 트리거: 대기 중인 로그가 VIEW_LOG_FLUSH_SIZE개를 넘으면 병합 구간과 관계없이 즉시 전부 기록
+
+INSERT는 unnest 배열 파라미터 4개로 실행되며(로그 수와 무관), 그 사이 삭제된 코디/사용자의 로그는 건너뜁니다.
+
+손실 범위:
+    - 정상 종료(lifespan 종료) 시 대기 중인 로그를 모두 기록합니다 (VIEW_LOG_SHUTDOWN_TIMEOUT_SECONDS 안에서).
+    - 프로세스가 비정상 종료되면 최대 VIEW_LOG_COLLAPSE_SECONDS + VIEW_LOG_FLUSH_INTERVAL_SECONDS 동안의 로그,
+      최대 VIEW_LOG_FLUSH_SIZE개 정도가 유실될 수 있습니다.
+    - DB 장애로 기록이 계속 실패하면 로그를 다시 대기열에 넣되, VIEW_LOG_MAX_PENDING개를 넘는 오래된 로그부터 버립니다.
+
+조회 로그는 추천 제외 조건에도 쓰이므로 `pending_coordi_ids`로 아직 기록되지 않은 코디를 조회할 수 있습니다
+(`app/services/seen_filter.py`에서 사용).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Dict, List, Optional, Set, Tuple
+
+from sqlalchemy import text
+
+from app.db.database import AsyncSessionLocal
+
+logger = logging.getLogger(__name__)
+
+# 같은 코디의 반복 조회를 하나의 로그로 병합하는 구간 (초)
+VIEW_LOG_COLLAPSE_SECONDS = float(os.getenv("VIEW_LOG_COLLAPSE_SECONDS", "10"))
+
+# 병합 구간이 끝난 로그를 기록하는 주기 (초)
+VIEW_LOG_FLUSH_INTERVAL_SECONDS = float(os.getenv("VIEW_LOG_FLUSH_INTERVAL_SECONDS", "1"))
+
+# 대기 중인 로그가 이 개수 이상이면 즉시 전부 기록
+VIEW_LOG_FLUSH_SIZE = int(os.getenv("VIEW_LOG_FLUSH_SIZE", "500"))
+
+# 기록 실패가 계속될 때 메모리에 보관할 최대 로그 수 (초과분은 오래된 것부터 버림)
+VIEW_LOG_MAX_PENDING = int(os.getenv("VIEW_LOG_MAX_PENDING", "50000"))
+
+# 클라이언트가 보낸 조회 시각(viewedAt)으로 허용하는 과거 범위 (초, 기본 7일)
+VIEW_LOG_MAX_AGE_SECONDS = float(os.getenv("VIEW_LOG_MAX_AGE_SECONDS", str(7 * 24 * 3600)))
+
+# 종료 시 남은 로그 기록을 기다리는 최대 시간 (초)
+VIEW_LOG_SHUTDOWN_TIMEOUT_SECONDS = float(os.getenv("VIEW_LOG_SHUTDOWN_TIMEOUT_SECONDS", "10"))
+
+# INSERT 한 번에 기록할 최대 로그 수
+_INSERT_CHUNK_SIZE = 5000
+
+_INSERT_VIEW_LOGS = text(
+    """
+    INSERT INTO user_coordi_view_logs (user_id, coordi_id, duration_seconds, view_started_at)
+    SELECT v.user_id, v.coordi_id, v.duration_seconds, v.view_started_at
+    FROM unnest(
+        CAST(:user_ids AS BIGINT[]),
+        CAST(:coordi_ids AS BIGINT[]),
+        CAST(:durations AS INTEGER[]),
+        CAST(:started_at AS TIMESTAMPTZ[])
+    ) AS v(user_id, coordi_id, duration_seconds, view_started_at)
+    WHERE EXISTS (SELECT 1 FROM coordis c WHERE c.coordi_id = v.coordi_id)
+      AND EXISTS (SELECT 1 FROM users u WHERE u.user_id = v.user_id)
+    """
+)
+
+
+@dataclass
+class PendingViewLog:
+    """기록 대기 중인 조회 로그 (병합된 조회 포함)."""
+
+    user_id: int
+    coordi_id: int
+    view_started_at: datetime
+    duration_seconds: int
+    views: int = 1
+    opened_at: float = field(default_factory=time.monotonic)
+
+
+class ViewLogBuffer:
+    """asyncio 이벤트 루프 하나에서 주기적으로 기록하는 조회 로그 버퍼 (record는 Thread-safe)."""
+
+    def __init__(
+        self,
+        collapse_seconds: float = VIEW_LOG_COLLAPSE_SECONDS,
+        flush_interval: float = VIEW_LOG_FLUSH_INTERVAL_SECONDS,
+        flush_size: int = VIEW_LOG_FLUSH_SIZE,
+        max_pending: int = VIEW_LOG_MAX_PENDING,
+    ):
+        self.collapse_seconds = collapse_seconds
+        self.flush_interval = flush_interval
+        self.flush_size = max(flush_size, 1)
+        self.max_pending = max(max_pending, self.flush_size)
+
+        # 병합 구간이 열려 있는 로그 / 구간이 끝나 기록만 기다리는 로그
+        self._open: Dict[Tuple[int, int], PendingViewLog] = {}
+        self._sealed: List[PendingViewLog] = []
+        self._lock = threading.Lock()
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._worker: Optional[asyncio.Task] = None
+
+        self.received = 0
+        self.collapsed = 0
+        self.flushed = 0
+        self.dropped = 0
+
+    def start(self) -> None:
+        """현재 이벤트 루프에서 기록 워커를 시작합니다 (이미 실행 중이면 무시)."""
+        loop = asyncio.get_running_loop()
+        if self._worker is not None and not self._worker.done() and self._loop is loop:
+            return
+
+        self._loop = loop
+        self._wake = asyncio.Event()
+        self._worker = loop.create_task(self._run(), name="view-log-buffer")
+
+    async def close(self, timeout: float = VIEW_LOG_SHUTDOWN_TIMEOUT_SECONDS) -> None:
+        """워커를 종료하고 대기 중인 로그를 모두 기록합니다."""
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+            self._loop = None
+
+        try:
+            await asyncio.wait_for(self.flush(force=True), timeout)
+        except asyncio.TimeoutError:
+            pass
+        remaining = len(self)
+        if remaining:
+            logger.warning(f"[ViewLogBuffer] {remaining} view logs were not written before shutdown")
+
+    def record(
+        self,
+        user_id: int,
+        coordi_id: int,
+        duration_seconds: int,
+        viewed_at: Optional[datetime] = None,
+    ) -> datetime:
+        """조회 로그를 버퍼에 추가하고 조회 시작 시각을 반환합니다."""
+        now = time.monotonic()
+        viewed_at = viewed_at or datetime.now(timezone.utc)
+        key = (user_id, coordi_id)
+
+        with self._lock:
+            self.received += 1
+            entry = self._open.get(key)
+            if entry is not None and now - entry.opened_at <= self.collapse_seconds:
+                entry.duration_seconds += duration_seconds
+                entry.views += 1
+                self.collapsed += 1
+                return entry.view_started_at
+
+            if entry is not None:
+                self._sealed.append(entry)
+            self._open[key] = PendingViewLog(user_id, coordi_id, viewed_at, duration_seconds, opened_at=now)
+            self._trim()
+            size = len(self._open) + len(self._sealed)
+
+        if size >= self.flush_size:
+            self._notify()
+        return viewed_at
+
+    def pending_coordi_ids(self, user_id: int) -> Set[int]:
+        """아직 DB에 기록되지 않은 사용자의 조회 코디 ID."""
+        with self._lock:
+            pending = {coordi_id for (uid, coordi_id) in self._open if uid == user_id}
+            pending.update(entry.coordi_id for entry in self._sealed if entry.user_id == user_id)
+        return pending
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._open) + len(self._sealed)
+
+    async def flush(self, force: bool = False) -> int:
+        """
+        병합 구간이 끝난 로그를 기록합니다 (force=True이면 전부). 기록한 로그 수를 반환합니다.
+        실패하면 로그를 다시 대기열에 넣습니다.
+        """
+        batch = self._take(force)
+        if not batch:
+            return 0
+
+        try:
+            async with AsyncSessionLocal() as db:
+                for start in range(0, len(batch), _INSERT_CHUNK_SIZE):
+                    chunk = batch[start : start + _INSERT_CHUNK_SIZE]
+                    await db.execute(
+                        _INSERT_VIEW_LOGS,
+                        {
+                            "user_ids": [entry.user_id for entry in chunk],
+                            "coordi_ids": [entry.coordi_id for entry in chunk],
+                            "durations": [entry.duration_seconds for entry in chunk],
+                            "started_at": [entry.view_started_at for entry in chunk],
+                        },
+                    )
+                await db.commit()
+        except (Exception, asyncio.CancelledError) as e:
+            # 기록하지 못한 로그는 다음 flush에서 다시 시도 (종료 중 취소된 경우 포함)
+            with self._lock:
+                self._sealed[:0] = batch
+                self._trim()
+            if isinstance(e, asyncio.CancelledError):
+                raise
+            logger.error(f"[ViewLogBuffer] Failed to write {len(batch)} view logs: {e}")
+            return 0
+
+        self.flushed += len(batch)
+        return len(batch)
+
+    def _take(self, force: bool) -> List[PendingViewLog]:
+        now = time.monotonic()
+        with self._lock:
+            force = force or len(self._open) + len(self._sealed) >= self.flush_size
+            batch, self._sealed = self._sealed, []
+            for key, entry in list(self._open.items()):
+                if force or now - entry.opened_at > self.collapse_seconds:
+                    batch.append(self._open.pop(key))
+        return batch
+
+    def _trim(self) -> None:
+        """대기 중인 로그가 max_pending을 넘으면 오래된 것부터 버립니다 (lock 보유 상태에서 호출)."""
+        overflow = len(self._open) + len(self._sealed) - self.max_pending
+        if overflow <= 0:
+            return
+
+        dropped = min(overflow, len(self._sealed))
+        del self._sealed[:dropped]
+        if overflow > dropped:
+            oldest = sorted(self._open.items(), key=lambda item: item[1].opened_at)[: overflow - dropped]
+            for key, _ in oldest:
+                del self._open[key]
+        self.dropped += overflow
+        logger.warning(f"[ViewLogBuffer] Buffer full, dropped {overflow} oldest view logs")
+
+    def _notify(self) -> None:
+        loop, wake = self._loop, self._wake
+        if loop is not None and wake is not None and not loop.is_closed():
+            loop.call_soon_threadsafe(wake.set)
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            await self.flush()
+
+
+_view_log_buffer: Optional[ViewLogBuffer] = None
+
+
+def get_view_log_buffer() -> ViewLogBuffer:
+    global _view_log_buffer
+    if _view_log_buffer is None:
+        _view_log_buffer = ViewLogBuffer()
+    return _view_log_buffer
@@ -10,7 +10,7 @@ import os
 from datetime import datetime, timezone
 from io import BytesIO
 from pathlib import Path
-from typing import List, Union
+from typing import List, Optional, Union
 
 import aiofiles
 import httpx
@@ -30,12 +30,12 @@ from app.core.exceptions import (
     PhotoRequiredError,
     TooManyItemsError,
 )
+from app.core.pagination import cursor_pagination, decode_cursor, keyset_before, page_pagination, split_page
 from app.models.fitting_result import FittingResult
 from app.models.fitting_result_image import FittingResultImage
 from app.models.fitting_result_item import FittingResultItem
 from app.models.item import Item
 from app.models.user_image import UserImage
-from app.schemas.common import PaginationPayload
 from app.schemas.virtual_fitting import (
     FittingHistoryItemPayload,
     FittingHistoryPayload,
@@ -56,6 +56,9 @@ GEMINI_API_KEY = os.getenv("GOOGLE_API_KEY", "")
 GEMINI_MODEL = os.getenv("GEMINI_MODEL_ID")
 FITTING_TIMEOUT_SECONDS = 300.0  # 5분 타임아웃
 
+# 커서가 다른 목록에 재사용되지 않도록 구분하는 scope
+FITTING_HISTORY_CURSOR_SCOPE = "fitting_history"
+
 
 def start_virtual_fitting(
     db: Session,
@@ -795,6 +798,8 @@ def get_virtual_fitting_history(
     user_id: int,
     page: int = 1,
     limit: int = 20,
+    cursor: Optional[str] = None,
+    include_total: bool = False,
 ) -> FittingHistoryResponseData:
     """
     가상 피팅 이력을 조회합니다.
@@ -806,49 +811,59 @@ def get_virtual_fitting_history(
     user_id:
         사용자 ID
     page:
-        페이지 번호 (기본값: 1)
+        페이지 번호 (기본값: 1, cursor가 있으면 무시)
     limit:
         페이지당 개수 (기본값: 20)
+    cursor:
+        이전 응답의 nextCursor (있으면 (created_at, fitting_id) keyset으로 이어서 조회)
+    include_total:
+        cursor 모드에서도 전체 개수를 계산할지 여부
         
     Returns
     -------
     FittingHistoryResponseData:
         가상 피팅 이력 및 페이지네이션 정보
     """
-    # 1. 전체 개수 조회
-    count_query = select(func.count(FittingResult.fitting_id)).where(
-        FittingResult.user_id == user_id
-    )
-    total_items = db.execute(count_query).scalar_one()
+    position = decode_cursor(FITTING_HISTORY_CURSOR_SCOPE, cursor) if cursor else None
+    
+    # 1. 전체 개수 조회 (page 모드 또는 includeTotal=true일 때만)
+    total_items = None
+    if position is None or include_total:
+        total_items = db.execute(
+            select(func.count(FittingResult.fitting_id)).where(FittingResult.user_id == user_id)
+        ).scalar_one()
     
     # 결과가 없으면 빈 결과 반환
-    if total_items == 0:
+    if position is None and total_items == 0:
         return FittingHistoryResponseData(
             fittings=[],
-            pagination=PaginationPayload(
-                currentPage=page,
-                totalPages=0,
-                totalItems=0,
-                hasNext=False,
-                hasPrev=False,
-            ),
+            pagination=page_pagination(page, limit, 0),
         )
     
-    # 2. 페이지네이션 적용 및 정렬 (created_at 기준 최신순)
-    offset = (page - 1) * limit
-    fitting_results = db.execute(
+    # 2. (created_at, fitting_id) 최신순으로 limit + 1개 조회
+    query = (
         select(FittingResult)
         .where(FittingResult.user_id == user_id)
-        .order_by(FittingResult.created_at.desc())
-        .offset(offset)
-        .limit(limit)
+        .order_by(FittingResult.created_at.desc(), FittingResult.fitting_id.desc())
+        .limit(limit + 1)
         .options(
             selectinload(FittingResult.fitting_result_items).selectinload(
                 FittingResultItem.item
             ),
             selectinload(FittingResult.images),
         )
-    ).scalars().all()
+    )
+    if position is not None:
+        query = query.where(keyset_before(FittingResult.created_at, FittingResult.fitting_id, position))
+    else:
+        query = query.offset((page - 1) * limit)
+    
+    fitting_results, has_next, next_cursor = split_page(
+        db.execute(query).scalars().all(),
+        limit,
+        FITTING_HISTORY_CURSOR_SCOPE,
+        lambda fitting_result: (fitting_result.created_at, fitting_result.fitting_id),
+    )
     
     # 3. 페이로드 생성
     fittings = []
@@ -879,19 +894,14 @@ def get_virtual_fitting_history(
         )
     
     # 4. 페이지네이션 정보 계산
-    total_pages = (total_items + limit - 1) // limit if total_items > 0 else 0
-    has_next = page < total_pages
-    has_prev = page > 1
+    if position is None:
+        pagination = page_pagination(page, limit, total_items, next_cursor)
+    else:
+        pagination = cursor_pagination(has_next, next_cursor, limit, total_items, cursor=cursor)
     
     return FittingHistoryResponseData(
         fittings=fittings,
-        pagination=PaginationPayload(
-            currentPage=page,
-            totalPages=total_pages,
-            totalItems=total_items,
-            hasNext=has_next,
-            hasPrev=has_prev,
-        ),
+        pagination=pagination,
     )
 
 
@@ -4,19 +4,49 @@ NeMF 모델을 로드하고, DB에 저장된 최신 유저 임베딩을 반영
 """
 
 import os
+import threading
+import time
 import torch
 import numpy as np
 import logging
+from dataclasses import dataclass, replace
 from typing import List, Optional
 from sqlalchemy.orm import Session
 from sqlalchemy import select
 
-from app.ml.neumf_model import NeMF
+from app.ml.batch_scoring import TOPN_FILENAME, MaterializedTopN
+from app.ml.id_index import IdIndex
+from app.ml.model_artifact import MODEL_ARTIFACT_DIRNAME, load_model_artifact
+from app.ml.model_registry import ModelRegistry, get_model_registry
+from app.ml.scoring_engine import NeMFScoringEngine, top_k_indices
 from app.models.user_embedding import UserEmbedding
 from app.models.item_embedding import ItemEmbedding
+from app.services.ranking_snapshot import (
+    SNAPSHOT_DEPTH,
+    RankedListSnapshot,
+    get_ranking_snapshot_cache,
+)
+from app.services.seen_filter import seen_coordi_ids_query
+from app.services.seen_items import SeenItemBitmap, get_seen_item_cache
+from app.services.view_log_buffer import get_view_log_buffer
 
 logger = logging.getLogger(__name__)
 
+# 새 모델 버전 확인 주기 (초)
+RELOAD_CHECK_INTERVAL_SECONDS = float(os.getenv("MODEL_RELOAD_INTERVAL_SECONDS", "30"))
+
+
+@dataclass(frozen=True)
+class LoadedModel:
+    """서빙 중인 모델 버전 한 개의 상태 (엔진 + ID 매핑 + Top-N). 교체 시 통째로 바뀜."""
+
+    version: str
+    engine: NeMFScoringEngine
+    user_index: IdIndex  # user_id <-> 모델 유저 인덱스
+    item_index: IdIndex  # coordi_id <-> 모델 아이템 인덱스 (역변환: 숫자가 아닌 ID는 -1)
+    top_n: Optional[MaterializedTopN] = None  # Night 작업에서 사전 계산한 유저별 Top-N
+
+
 class WarmRecommendationService:
     _instance = None
 
@@ -25,59 +55,177 @@ class WarmRecommendationService:
             cls._instance = super(WarmRecommendationService, cls).__new__(cls)
         return cls._instance
 
-    def __init__(self, model_path: Optional[str] = None):
+    def __init__(self, model_path: Optional[str] = None, registry: Optional[ModelRegistry] = None):
+        """
+        Args:
+            model_path: 고정 체크포인트 경로 (지정 시 Hot-reload 없이 해당 파일만 사용)
+            registry: 모델 레지스트리 (지정 시 현재 버전을 로드하고 새 버전을 자동 반영)
+        """
         # Singleton 초기화 방지
-        if hasattr(self, "model"):
+        if hasattr(self, "_loaded"):
             return
 
         self.device = 'cpu'  # 추론은 CPU로 충분함
-        self.model: Optional[NeMF] = None
-        self.user_id_to_index = {}
-        self.item_id_to_index = {}
-        self.index_to_item_id = {}
-        self.is_ready = False
+        self.registry = registry
+        self._loaded: Optional[LoadedModel] = None
+        self._reload_lock = threading.Lock()
+        self._last_reload_check = 0.0
 
-        if model_path:
+        if registry is not None:
+            version = registry.current_version()
+            checkpoint_path = registry.checkpoint_path(version)
+            if checkpoint_path is not None:
+                self.load_model(str(checkpoint_path), version=version)
+            else:
+                logger.warning(f"No published model found in {registry.base_dir}")
+        elif model_path:
             self.load_model(model_path)
 
-    def load_model(self, model_path: str):
-        """모델 체크포인트를 로드합니다."""
+    @property
+    def is_ready(self) -> bool:
+        return self._loaded is not None
+
+    @property
+    def model_version(self) -> Optional[str]:
+        loaded = self._loaded
+        return loaded.version if loaded else None
+
+    def _build(self, model_path: str, version: str) -> LoadedModel:
+        """
+        모델을 읽어 서빙 상태를 생성합니다 (현재 서빙 상태에는 영향 없음).
+
+        버전 디렉토리에 서빙 아티팩트가 있으면 memmap으로 열고 (O(1), 워커 간 페이지 공유),
+        없으면(이전 버전, 고정 경로) 체크포인트를 torch.load로 읽습니다.
+        """
+        artifact = None
+        if self.registry is not None:
+            artifact = load_model_artifact(self.registry.artifact_path(MODEL_ARTIFACT_DIRNAME, version))
+        if artifact is not None:
+            return LoadedModel(
+                version=version,
+                engine=artifact.engine,
+                user_index=artifact.user_index,
+                item_index=artifact.item_index,
+                top_n=self._load_top_n(version),
+            )
+
+        checkpoint = torch.load(model_path, map_location=self.device)
+
+        # ID 매핑 ({str(id): index} 딕셔너리 -> 정렬 배열 + 역배열)
+        user_index = IdIndex.from_mapping(checkpoint['user_id_to_index'], checkpoint['num_users'])
+        item_index = IdIndex.from_mapping(checkpoint['item_id_to_index'], checkpoint['num_items'])
+
+        # 서빙 엔진 생성 (아이템 측 projection 사전 계산, 가중치는 읽기 전용 복사본)
+        engine = NeMFScoringEngine.from_checkpoint(checkpoint)
+
+        return LoadedModel(
+            version=version,
+            engine=engine,
+            user_index=user_index,
+            item_index=item_index,
+            top_n=self._load_top_n(version),
+        )
+
+    def _load_top_n(self, version: str) -> Optional[MaterializedTopN]:
+        """레지스트리에 해당 버전의 사전 계산 Top-N이 있으면 로드합니다."""
+        if self.registry is None:
+            return None
+
+        path = self.registry.artifact_path(TOPN_FILENAME, version)
+        if path is None:
+            return None
+
+        try:
+            top_n = MaterializedTopN.load(path)
+            logger.info(f"Materialized top-N loaded for {len(top_n.user_ids)} users (model {version})")
+            return top_n
+        except Exception as e:
+            logger.error(f"Error loading materialized top-N: {e}")
+            return None
+
+    def load_model(self, model_path: str, version: Optional[str] = None):
+        """모델 체크포인트를 로드하여 서빙 상태를 교체합니다."""
         if not os.path.exists(model_path):
             logger.warning(f"Model file not found at {os.path.abspath(model_path)}")
             return
 
         try:
-            checkpoint = torch.load(model_path, map_location=self.device)
-            
-            # 메타데이터 로드
-            self.user_id_to_index = checkpoint['user_id_to_index']
-            self.item_id_to_index = checkpoint['item_id_to_index']
-            
-            # 역매핑 생성 (Index -> Item ID)
-            self.index_to_item_id = {v: k for k, v in self.item_id_to_index.items()}
-            
-            num_users = checkpoint['num_users']
-            num_items = checkpoint['num_items']
-            embedding_dim = checkpoint['embedding_dim']
-            hidden_dims = checkpoint.get('hidden_dims', [128])
-            
-            # 모델 초기화
-            self.model = NeMF(
-                num_users=num_users,
-                num_items=num_items,
-                embedding_dim=embedding_dim,
-                hidden_dims=hidden_dims
-            ).to(self.device)
-            
-            # 가중치 로드
-            self.model.load_state_dict(checkpoint['model_state_dict'])
-            self.model.eval()
-            self.is_ready = True
-            logger.info(f"Warm model loaded successfully from {model_path}")
-            
+            # 버전 미지정 시 체크포인트 수정 시각을 버전으로 사용 (스냅샷 캐시 키)
+            version = version or str(os.stat(model_path).st_mtime_ns)
+            loaded = self._build(model_path, version)
+
+            # 원자적 교체: 진행 중인 요청은 이전 LoadedModel 참조를 끝까지 사용함
+            self._loaded = loaded
+            logger.info(f"Warm model {version} loaded successfully from {model_path}")
+
         except Exception as e:
             logger.error(f"Error loading warm model: {e}")
-            self.is_ready = False
+
+    def maybe_reload(self) -> None:
+        """
+        레지스트리에 새 버전이 발행되었는지 주기적으로 확인하고,
+        새 버전이 있으면 백그라운드 스레드에서 엔진을 생성한 뒤 교체합니다.
+        요청 처리 경로에서는 manifest 확인 외에 블로킹 작업을 하지 않습니다.
+        """
+        if self.registry is None:
+            return
+
+        now = time.monotonic()
+        if now - self._last_reload_check < RELOAD_CHECK_INTERVAL_SECONDS:
+            return
+        self._last_reload_check = now
+
+        self.refresh_async()
+
+    def refresh_async(self) -> None:
+        """
+        현재 버전과 레지스트리 버전이 다르면 백그라운드 로드를 시작합니다.
+        버전이 같더라도 모델 발행 이후 Top-N 계산이 끝났다면 Top-N만 추가로 로드합니다.
+        """
+        if self.registry is None:
+            return
+
+        version = self.registry.current_version()
+        if version is None:
+            return
+
+        loaded = self._loaded
+        if loaded is not None and loaded.version == version:
+            if loaded.top_n is None and self.registry.artifact_path(TOPN_FILENAME, version) is not None:
+                self._attach_top_n_async(version)
+            return
+
+        # 이미 다른 스레드에서 로드 중이면 건너뜀
+        if not self._reload_lock.acquire(blocking=False):
+            return
+
+        def _reload():
+            try:
+                checkpoint_path = self.registry.checkpoint_path(version)
+                if checkpoint_path is None:
+                    logger.warning(f"Checkpoint for model version {version} not found")
+                    return
+                logger.info(f"New warm model version detected: {version}. Loading in background...")
+                self.load_model(str(checkpoint_path), version=version)
+            finally:
+                self._reload_lock.release()
+
+        threading.Thread(target=_reload, name="warm-model-reload", daemon=True).start()
+
+    def _attach_top_n_async(self, version: str) -> None:
+        if not self._reload_lock.acquire(blocking=False):
+            return
+
+        def _attach():
+            try:
+                top_n = self._load_top_n(version)
+                loaded = self._loaded
+                if top_n is not None and loaded is not None and loaded.version == version:
+                    self._loaded = replace(loaded, top_n=top_n)
+            finally:
+                self._reload_lock.release()
+
+        threading.Thread(target=_attach, name="warm-topn-load", daemon=True).start()
 
     def recommend(
         self, 
@@ -98,19 +246,29 @@ class WarmRecommendationService:
         Returns:
             tuple[List[int], int]: (추천된 coordi_id 리스트, 전체 아이템 수)
         """
-        if not self.is_ready or not self.model:
+        # 새 모델 버전이 발행되었으면 백그라운드에서 교체 (현재 요청은 기존 버전으로 처리)
+        self.maybe_reload()
+
+        # 요청 처리 동안 동일한 모델 버전을 사용하도록 참조를 한 번만 읽음
+        loaded = self._loaded
+        if loaded is None:
             return [], 0
+        engine = loaded.engine
 
-        user_id_str = str(user_id)
-        
         # 1. 모델 인덱스 확인
-        if user_id_str not in self.user_id_to_index:
+        user_idx = loaded.user_index.get(user_id)
+        if user_idx is None:
             return [], 0
             
-        user_idx = self.user_id_to_index[user_id_str]
+        offset = (page - 1) * limit
+
+        # 1-1. 스냅샷 확인: 같은 모델 버전으로 계산해 둔 순위 목록이 있으면 재스코어링 없이 슬라이싱
+        snapshot_cache = get_ranking_snapshot_cache()
+        snapshot = snapshot_cache.get(user_id, loaded.version)
+        if snapshot is not None and snapshot.covers(offset, limit):
+            return snapshot.page(offset, limit), snapshot.total_items
 
-        # 2. 동적 임베딩 주입 (Day Embedding ONLY)
-        # 무조건 'day_v1' 임베딩만 사용
+        # 2. Day Embedding 조회
         user_embedding_record = db.execute(
             select(UserEmbedding).where(
                 UserEmbedding.user_id == user_id,
@@ -118,97 +276,162 @@ class WarmRecommendationService:
             )
         ).scalar_one_or_none()
 
-        # Day 임베딩이 없으면 Warm Start 대상이 아님 -> 빈 리스트 반환 (Cold Start 로직으로 넘어감)
-        # 수정: 모델에 유저가 존재한다면(위에서 체크함), Day 임베딩이 없어도 모델 원래 가중치(Night v1)로 추천 가능함.
+        # [Filter] 이미 상호작용/조회한 아이템 (Seen Items filtering)
+        # 사용자별 비트맵으로 보관하여 요청마다 DB 조회 및 ID 변환을 반복하지 않음
+        seen = self._seen_bitmap(db, user_id, loaded)
+        seen_mask = seen.mask()
+
+        # 2-1. 사전 계산된 Top-N 사용 (Day 임베딩이 계산 시점 이후 바뀌지 않은 경우)
+        materialized = self._materialized_ranking(loaded, user_id, user_embedding_record)
+        if materialized is not None:
+            ranked = loaded.item_index.to_ids(materialized[~seen_mask[materialized]])
+            total_items = engine.num_items - seen.count
+
+            materialized_snapshot = RankedListSnapshot(
+                model_version=loaded.version,
+                coordi_ids=ranked[ranked >= 0],
+                total_items=total_items,
+            )
+            # 제외 후 남은 개수로 요청 페이지를 채울 수 있을 때만 사용, 아니면 온라인 스코어링
+            if materialized_snapshot.covers(offset, limit):
+                snapshot_cache.put(user_id, materialized_snapshot)
+                if offset >= total_items:
+                    return [], total_items
+                return materialized_snapshot.page(offset, limit), total_items
+
+        # 2-2. 유저 벡터 결정 (Day Embedding 우선)
+        # 공유 모델 가중치에 주입하지 않고 유저 벡터를 추론 입력으로 직접 전달함
+        # -> 동시 요청 간 경쟁 상태가 없으므로 락 없이 병렬 추론 가능
+        user_vector = None
+        # 모델에 유저가 존재한다면(위에서 체크함), Day 임베딩이 없어도 모델 원래 가중치(Night v1)로 추천 가능함.
         if not user_embedding_record or user_embedding_record.vector is None:
             logger.info(f"Day embedding not found for user {user_id}. Using internal model weights (Night v1).")
         else:
-            try:
-                vector_data = np.array(user_embedding_record.vector, dtype=np.float32)
-                with torch.no_grad():
-                        self.model.user_embedding.weight.data[user_idx] = torch.from_numpy(vector_data)
-            except Exception as e:
-                logger.error(f"Error injecting user embedding: {e}")
-                # 주입 실패 시에도 모델 원래 가중치 사용
-                pass
-
-        # 3. 추론
-        num_items = self.model.item_embedding.num_embeddings
-        
-        user_tensor = torch.tensor([user_idx] * num_items, dtype=torch.long).to(self.device)
-        item_tensor = torch.tensor(list(range(num_items)), dtype=torch.long).to(self.device)
-        
-        with torch.no_grad():
-            scores = self.model(user_tensor, item_tensor).numpy()
-            
-        # [Filter] 이미 상호작용한 아이템 제외 (Seen Items filtering)
-        # DB에서 사용자가 인터랙션한 coordi_id 조회
-        from app.models.user_coordi_interaction import UserCoordiInteraction
-        
-        seen_interactions = db.execute(
-            select(UserCoordiInteraction.coordi_id).where(
-                UserCoordiInteraction.user_id == user_id
-            )
-        ).scalars().all()
-        
-        seen_indices = []
-        for coordi_id in seen_interactions:
-            cid_str = str(coordi_id)
-            if cid_str in self.item_id_to_index:
-                seen_indices.append(self.item_id_to_index[cid_str])
-        
-        # 이미 본 아이템의 점수를 -무한대로 설정하여 추천에서 제외
-        if seen_indices:
-            scores[seen_indices] = -np.inf
+            vector_data = np.asarray(user_embedding_record.vector, dtype=np.float32)
+            if vector_data.shape == (engine.embedding_dim,):
+                user_vector = vector_data
+            else:
+                # 차원이 맞지 않으면 모델 원래 가중치 사용
+                logger.error(f"Invalid day embedding shape for user {user_id}: {vector_data.shape}")
+
+        if user_vector is None:
+            user_vector = engine.user_vector(user_idx)
+
+        # 3. 추론 (Factorized 엔진: 아이템 측 projection은 load_model 시점에 계산됨)
+        scores = engine.score(user_vector)
+
+        # 이미 본 아이템의 점수를 -무한대로 설정하여 추천에서 제외 (마스크 연산 한 번)
+        scores[seen_mask] = -np.inf
 
         # 4. Top-K 추출 (페이지네이션)
-        offset = (page - 1) * limit
-        sorted_indices = np.argsort(scores)[::-1]
-        
-        # 전체 유효 아이템 수 (이미 본 것 제외한 유효 아이템 수로 조정 가능하나, 
-        # 여기서는 min(-inf) 체크 등으로 필터링된 개수를 뺄 수도 있음. 
-        # 일단 전체 풀 사이즈 유지하거나, seen을 뺀 갯수로 할 수 있음)
-        # -inf인 것들은 맨 뒤로 갔을 것임.
-        
-        # 유효한 추천(점수가 -inf가 아닌) 개수 카운트
-        valid_count = np.count_nonzero(scores != -np.inf)
-        total_items = valid_count
-        
-        # 슬라이싱 (유효 범위 내에서)
+        # 전체 정렬 대신 필요한 깊이만큼만 부분 선택 (np.argpartition)
+        # -inf로 제외된 아이템은 top_k_indices에서 자동으로 빠짐
+        total_items = engine.num_items - seen.count
+
+        depth = max(offset + limit, SNAPSHOT_DEPTH)
+        if snapshot is not None:
+            # 기존 스냅샷보다 깊은 페이지 요청 -> 깊이를 늘려 다시 계산
+            depth = max(depth, len(snapshot.coordi_ids) * 2)
+        top_indices = top_k_indices(scores, depth)
+
+        # 5. DB ID로 변환 (숫자가 아닌 아이템 ID는 -1로 매핑되어 제외)
+        ranked_ids = loaded.item_index.to_ids(top_indices)
+        ranked_ids = ranked_ids[ranked_ids >= 0]
+
+        # 6. 스냅샷 저장 (다음 페이지 요청은 스냅샷 슬라이싱으로 처리)
+        snapshot = RankedListSnapshot(
+            model_version=loaded.version,
+            coordi_ids=ranked_ids,
+            total_items=total_items,
+        )
+        snapshot_cache.put(user_id, snapshot)
+
         if offset >= total_items:
             return [], total_items
-            
-        top_indices = sorted_indices[offset : offset + limit]
-        
-        # 5. DB ID로 변환
-        recommended_ids = []
-        for idx in top_indices:
-            # 점수가 -inf면 추천 안 함 (혹시 모를 경계값 처리)
-            if scores[idx] == -np.inf:
-                continue
-                
-            item_id_str = self.index_to_item_id.get(idx)
-            if item_id_str and item_id_str.isdigit():
-                recommended_ids.append(int(item_id_str))
-                
-        return recommended_ids, total_items
+
+        return snapshot.page(offset, limit), total_items
+
+    @staticmethod
+    def _seen_bitmap(db: Session, user_id: int, loaded: LoadedModel) -> SeenItemBitmap:
+        """
+        사용자가 이미 상호작용(좋아요/스킵/선호)하거나 조회한 아이템의 비트맵을 반환합니다.
+        캐시에 없으면 DB에서 한 번 읽어 생성하고, 이후에는 outfits_service에서 증분 갱신됩니다.
+        """
+        seen_cache = get_seen_item_cache()
+        bitmap = seen_cache.get(user_id, loaded.version)
+        if bitmap is not None:
+            return bitmap
+
+        seen_coordi_ids = db.execute(seen_coordi_ids_query(user_id)).scalars().all()
+        seen_coordi_ids = list(seen_coordi_ids) + list(get_view_log_buffer().pending_coordi_ids(user_id))
+
+        # 한 번의 searchsorted로 일괄 변환 (모델에 없는 코디는 -1)
+        indices = loaded.item_index.lookup(np.array(seen_coordi_ids, dtype=np.int64))
+        bitmap = SeenItemBitmap.from_indices(
+            loaded.version, loaded.item_index, loaded.engine.num_items, indices[indices >= 0]
+        )
+        seen_cache.put(user_id, bitmap)
+        return bitmap
+
+    @staticmethod
+    def _materialized_ranking(
+        loaded: LoadedModel, user_id: int, user_embedding_record: Optional[UserEmbedding]
+    ) -> Optional[np.ndarray]:
+        """
+        사전 계산된 Top-N을 사용할 수 있으면 모델 아이템 인덱스 배열(점수 내림차순)을 반환합니다.
+
+        Top-N은 체크포인트의 유저 벡터(Night 임베딩)로 계산되므로,
+        Day 임베딩이 계산 시작 이후 갱신되었다면 사용할 수 없습니다.
+        """
+        if loaded.top_n is None:
+            return None
+
+        ranking = loaded.top_n.lookup(user_id)
+        if ranking is None:
+            return None
+
+        if user_embedding_record is not None and user_embedding_record.updated_at is not None:
+            if user_embedding_record.updated_at.timestamp() > loaded.top_n.materialized_at:
+                return None
+
+        return ranking
 
 # 전역 인스턴스 (lazy loading을 위해 None으로 시작)
 _warm_service_instance = None
+_warm_service_lock = threading.Lock()
 
 def get_warm_recommendation_service(model_path: str = None) -> WarmRecommendationService:
+    """
+    Warm 추천 서비스 인스턴스를 반환합니다.
+
+    model_path를 지정하지 않으면 모델 레지스트리(backend/data/model_artifacts)의
+    현재 버전을 로드하고, 이후 새 버전이 발행되면 자동으로 교체합니다.
+    """
     global _warm_service_instance
     if _warm_service_instance is None:
-        if model_path is None:
-            # 현재 파일 위치: backend/app/services/warm_recommendation_service.py
-            # 목표 파일 위치: backend/data/model_artifacts/neumf_night_model.pth
-            
-            current_dir = os.path.dirname(os.path.abspath(__file__)) # .../backend/app/services
-            app_dir = os.path.dirname(current_dir) # .../backend/app
-            backend_dir = os.path.dirname(app_dir) # .../backend
-            
-            # 절대 경로 생성
-            model_path = os.path.join(backend_dir, "data", "model_artifacts", "neumf_night_model.pth")
-            
-        _warm_service_instance = WarmRecommendationService(model_path)
+        # 백그라운드 로드와 첫 요청이 동시에 생성해도 모델은 한 번만 로드
+        with _warm_service_lock:
+            if _warm_service_instance is None:
+                if model_path is None:
+                    _warm_service_instance = WarmRecommendationService(registry=get_model_registry())
+                else:
+                    _warm_service_instance = WarmRecommendationService(model_path)
     return _warm_service_instance
+
+
+def request_warm_model_reload() -> None:
+    """
+    이미 생성된 Warm 서비스가 있으면 새 모델 버전을 즉시 확인하도록 요청합니다.
+    (서비스가 아직 로드되지 않았다면 다음 생성 시 최신 버전을 읽으므로 아무것도 하지 않음)
+    """
+    if _warm_service_instance is not None:
+        _warm_service_instance.refresh_async()
+
+
+def current_warm_model() -> Optional[LoadedModel]:
+    """
+    이미 로드된 Warm 모델 상태를 반환합니다 (서비스가 없거나 로드 전이면 None, 모델을 새로 로드하지 않음).
+    """
+    if _warm_service_instance is None:
+        return None
+    return _warm_service_instance._loaded
@@ -60,6 +60,7 @@ COMMENT ON COLUMN coordis.description IS '태그 포함 설명 문구';
 COMMENT ON COLUMN coordis.description_embedding IS '의미 검색을 위한 Description 임베딩 벡터(512차원)';
 CREATE INDEX idx_coordis_season_style ON coordis(season, style);
 CREATE INDEX idx_coordis_style ON coordis(style);
+CREATE INDEX idx_coordis_created_at_id ON coordis(created_at, coordi_id);
 -- 벡터 검색을 위한 인덱스 (코사인 유사도 검색용)
 -- ivfflat 인덱스는 데이터가 많을 때 성능 향상
 -- lists 파라미터는 데이터 양에 따라 조정 (일반적으로 sqrt(총_레코드_수))
@@ -101,7 +102,7 @@ COMMENT ON COLUMN fitting_results.current_step IS '현재 처리 단계 (process
 COMMENT ON COLUMN fitting_results.failed_step IS '실패한 단계 (failed 상태일 때)';
 COMMENT ON COLUMN fitting_results.llm_message IS 'LLM 평가 메시지';
 COMMENT ON COLUMN fitting_results.finished_at IS '작업 완료/실패/타임아웃 시점 (status가 completed/failed/timeout일 때)';
-CREATE INDEX idx_fitting_results_user ON fitting_results(user_id);
+CREATE INDEX idx_fitting_results_user_created ON fitting_results(user_id, created_at, fitting_id);
 
 
 /* =======================
@@ -234,6 +235,7 @@ CREATE TABLE user_coordi_interactions (
 
 COMMENT ON TABLE user_coordi_interactions IS '사용자와 코디의 N:M 관계 테이블 (스와이프 이력)';
 CREATE INDEX idx_user_coordi_interactions_coordi ON user_coordi_interactions(coordi_id, action_type);
+CREATE INDEX idx_user_coordi_interactions_user_action_time ON user_coordi_interactions(user_id, action_type, interacted_at, coordi_id);
 
 
 /* =======================
@@ -271,3 +273,41 @@ CREATE TABLE user_closet_items (
 
 COMMENT ON TABLE user_closet_items IS '사용자와 아이템의 N:M 관계 테이블 (옷장)';
 CREATE INDEX idx_user_closet_items_item ON user_closet_items(item_id);
+CREATE INDEX idx_user_closet_items_user_added ON user_closet_items(user_id, added_at, item_id);
+
+
+/* =======================
+   12. Night 학습 실행 기록
+   ======================= */
+CREATE TABLE training_runs (
+    run_id BIGSERIAL PRIMARY KEY,
+    job_name VARCHAR(50) NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    phase VARCHAR(50),
+    progress DOUBLE PRECISION NOT NULL DEFAULT 0,
+    message TEXT,
+    model_version VARCHAR(100),
+    hostname VARCHAR(255),
+    pid INT,
+    started_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    heartbeat_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    finished_at TIMESTAMP
+);
+
+COMMENT ON TABLE training_runs IS 'Night 학습 워커 실행 상태 (단계, 진행률, heartbeat)';
+COMMENT ON COLUMN training_runs.status IS 'running / succeeded / failed';
+COMMENT ON COLUMN training_runs.progress IS '진행률 (0.0 ~ 1.0)';
+CREATE INDEX idx_training_runs_job_started ON training_runs(job_name, started_at);
+
+
+/* =======================
+   13. 카탈로그 버전 (프로세스 캐시 무효화)
+   ======================= */
+CREATE TABLE catalog_versions (
+    name VARCHAR(50) PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+COMMENT ON TABLE catalog_versions IS '배치 스크립트의 코디/아이템 변경 버전 (API 프로세스가 주기적으로 확인하여 캐시를 비움)';
+COMMENT ON COLUMN catalog_versions.name IS '캐시 대상 이름 (예: coordi_cards)';
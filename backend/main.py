@@ -1,18 +1,32 @@
+import asyncio
 import logging
 import os
 import sys
 from contextlib import asynccontextmanager
 
 from dotenv import load_dotenv
-from fastapi import FastAPI
+from fastapi import FastAPI, Query
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 
-from app.core.scheduler import start_scheduler, shutdown_scheduler
+from app.core.startup import (
+    load_in_background,
+    readiness,
+    register_resource,
+    startup_phase,
+)
+
+with startup_phase("import:app.core.scheduler"):
+    from app.core.scheduler import start_scheduler, shutdown_scheduler
 
 from app.core import register_exception_handlers
-from app.db.database import Base, engine
-from app.api import api_router
-from app import models
+
+with startup_phase("import:app.db"):
+    from app.db.database import Base, engine
+    from app import models
+
+with startup_phase("import:app.api"):
+    from app.api import api_router
 
 # 환경 변수 로드
 load_dotenv()
@@ -29,21 +43,71 @@ logging.basicConfig(
 # SQLAlchemy 로그 레벨 조정 (쿼리 로그 숨기기)
 logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
 
+# 부팅 시 create_all 실행 여부 (마이그레이션으로 스키마를 관리하는 배포 환경에서는 false 권장)
+DB_CREATE_ALL = os.getenv("DB_CREATE_ALL", "true").lower() in ("1", "true", "yes")
+
+# 서버 시작 직후 백그라운드에서 미리 로드할 리소스 (나머지는 첫 사용 시 로드)
+STARTUP_PRELOAD_RESOURCES = [
+    name.strip()
+    for name in os.getenv("STARTUP_PRELOAD_RESOURCES", "database_schema,embedding_model,warm_model,vector_index").split(",")
+    if name.strip()
+]
+
 # 데이터베이스 테이블 생성
 # 모든 모델 클래스 검사 + 존재하지 않는 테이블 생성
 def init_db():
     """데이터베이스 테이블 초기화"""
-    Base.metadata.create_all(bind=engine)
+    if DB_CREATE_ALL:
+        Base.metadata.create_all(bind=engine)
 
-@asynccontextmanager
-async def lifespan(app: FastAPI):
-    # 데이터베이스 테이블 생성
-    init_db()
-    
-    # 모델 프리로딩 (Singleton 초기화)
+
+def _load_embedding_model():
     from app.services.embedding_service import EmbeddingService
     EmbeddingService()
-    logging.info("Embedding model loaded successfully")
+
+
+def _load_warm_model():
+    from app.services.warm_recommendation_service import get_warm_recommendation_service
+    get_warm_recommendation_service()
+
+
+def _load_vector_index():
+    # VECTOR_INDEX_TYPE=memory일 때만 인덱스를 미리 생성 (pgvector는 준비할 것이 없음)
+    from app.services.vector_index import InMemoryVectorIndex, get_vector_index
+    index = get_vector_index()
+    if isinstance(index, InMemoryVectorIndex):
+        index.load()
+
+
+def _load_pose_model():
+    from app.core.image_validation import get_pose
+    get_pose()
+
+
+register_resource("database_schema", init_db)
+register_resource("embedding_model", _load_embedding_model)
+register_resource("warm_model", _load_warm_model)
+register_resource("vector_index", _load_vector_index)
+register_resource("pose_model", _load_pose_model)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # 테이블 생성 및 모델 프리로딩은 백그라운드에서 진행 (준비 상태는 /health/ready)
+    load_in_background(STARTUP_PRELOAD_RESOURCES)
+
+    # 임베딩 요청 마이크로 배처 시작
+    from app.services.embedding_batcher import get_embedding_batcher
+    get_embedding_batcher().start()
+
+    # 조회 로그 버퍼 기록 워커 시작
+    from app.services.view_log_buffer import get_view_log_buffer
+    get_view_log_buffer().start()
+
+    # 좋아요/스킵 Day 임베딩 갱신 워커 시작
+    from app.services.day_embedding_updater import DAY_FOLD_IN_ENABLED, get_day_embedding_updater
+    if DAY_FOLD_IN_ENABLED:
+        get_day_embedding_updater().start()
 
     # 스케줄러 시작
     start_scheduler()
@@ -55,6 +119,19 @@ async def lifespan(app: FastAPI):
     shutdown_scheduler()
     logging.info("Scheduler shut down successfully")
 
+    await get_embedding_batcher().close()
+
+    # 대기 중인 조회 로그 기록 (VIEW_LOG_SHUTDOWN_TIMEOUT_SECONDS 안에서)
+    await get_view_log_buffer().close()
+
+    # 대기 중인 Day 임베딩 갱신 처리 (DAY_FOLD_IN_SHUTDOWN_TIMEOUT_SECONDS 안에서)
+    if DAY_FOLD_IN_ENABLED:
+        await asyncio.to_thread(get_day_embedding_updater().close)
+
+    # 비동기 DB 커넥션 풀 정리
+    from app.db.database import async_engine
+    await async_engine.dispose()
+
 # 애플리케이션 생성
 app = FastAPI(
     title="HCI Fashion Recommendation API",
@@ -89,3 +166,25 @@ async def root():
 @app.get("/health")
 async def health_check():
     return {"status": "healthy"}
+
+
+@app.get("/health/ready")
+async def readiness_check(resources: str = Query(None, description="확인할 리소스 (쉼표 구분, 미지정 시 READINESS_REQUIRED_RESOURCES)")):
+    required = [name.strip() for name in resources.split(",") if name.strip()] if resources else None
+    status = readiness(required)
+    # 프리로드 대상이 아닌 리소스를 요청한 경우 여기서 로드를 시작
+    pending = [name for name in status["missing"] if status["resources"][name]["state"] == "pending"]
+    if pending:
+        load_in_background(pending)
+    return JSONResponse(status_code=200 if status["ready"] else 503, content=status)
+
+
+@app.get("/health/training")
+async def training_status():
+    """가장 최근 Night 학습 실행 상태 (학습 워커가 training_runs 테이블에 기록)."""
+    from app.db.database import AsyncSessionLocal
+    from app.services.training_jobs import get_latest_training_run
+
+    async with AsyncSessionLocal() as db:
+        run = await get_latest_training_run(db)
+    return {"lastRun": run}
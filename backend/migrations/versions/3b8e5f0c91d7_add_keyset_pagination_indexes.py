@@ -0,0 +1,53 @@
+"""add_keyset_pagination_indexes
+
+Revision ID: 3b8e5f0c91d7
+Revises: 7c2d9a41b8e3
+Create Date: 2026-01-08 14:21:37.518204
+
+목록 API의 cursor(keyset) 페이지네이션용 복합 인덱스를 생성합니다.
+    - coordis (created_at, coordi_id)
+    - user_coordi_interactions (user_id, action_type, interacted_at, coordi_id)
+    - user_closet_items (user_id, added_at, item_id)
+    - fitting_results (user_id, created_at, fitting_id): idx_fitting_results_user(user_id)를 대체
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '3b8e5f0c91d7'
+down_revision: Union[str, None] = '7c2d9a41b8e3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('idx_coordis_created_at_id', 'coordis', ['created_at', 'coordi_id'], unique=False)
+    op.create_index(
+        'idx_user_coordi_interactions_user_action_time',
+        'user_coordi_interactions',
+        ['user_id', 'action_type', 'interacted_at', 'coordi_id'],
+        unique=False,
+    )
+    op.create_index(
+        'idx_user_closet_items_user_added',
+        'user_closet_items',
+        ['user_id', 'added_at', 'item_id'],
+        unique=False,
+    )
+    op.create_index(
+        'idx_fitting_results_user_created',
+        'fitting_results',
+        ['user_id', 'created_at', 'fitting_id'],
+        unique=False,
+    )
+    op.drop_index('idx_fitting_results_user', table_name='fitting_results')
+
+
+def downgrade() -> None:
+    op.create_index('idx_fitting_results_user', 'fitting_results', ['user_id'], unique=False)
+    op.drop_index('idx_fitting_results_user_created', table_name='fitting_results')
+    op.drop_index('idx_user_closet_items_user_added', table_name='user_closet_items')
+    op.drop_index('idx_user_coordi_interactions_user_action_time', table_name='user_coordi_interactions')
+    op.drop_index('idx_coordis_created_at_id', table_name='coordis')
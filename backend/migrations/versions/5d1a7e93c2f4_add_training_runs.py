@@ -0,0 +1,43 @@
+"""add_training_runs
+
+Revision ID: 5d1a7e93c2f4
+Revises: 3b8e5f0c91d7
+Create Date: 2026-01-12 10:04:52.813327
+
+Night 학습 워커의 실행 상태(단계, 진행률, heartbeat)를 기록하는 training_runs 테이블을 생성합니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '5d1a7e93c2f4'
+down_revision: Union[str, None] = '3b8e5f0c91d7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'training_runs',
+        sa.Column('run_id', sa.BigInteger(), autoincrement=True, nullable=False),
+        sa.Column('job_name', sa.String(length=50), nullable=False, comment='작업 이름'),
+        sa.Column('status', sa.String(length=20), nullable=False, comment='running / succeeded / failed'),
+        sa.Column('phase', sa.String(length=50), nullable=True, comment='현재 단계 (training, materialization 등)'),
+        sa.Column('progress', sa.Float(), nullable=False, comment='진행률 (0.0 ~ 1.0)'),
+        sa.Column('message', sa.Text(), nullable=True, comment='진행 메시지 또는 오류 내용'),
+        sa.Column('model_version', sa.String(length=100), nullable=True, comment='발행된 모델 버전'),
+        sa.Column('hostname', sa.String(length=255), nullable=True),
+        sa.Column('pid', sa.Integer(), nullable=True),
+        sa.Column('started_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('heartbeat_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.Column('finished_at', sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint('run_id'),
+    )
+    op.create_index('idx_training_runs_job_started', 'training_runs', ['job_name', 'started_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('idx_training_runs_job_started', table_name='training_runs')
+    op.drop_table('training_runs')
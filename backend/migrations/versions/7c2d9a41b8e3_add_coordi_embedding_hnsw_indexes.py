@@ -0,0 +1,46 @@
+"""add_coordi_embedding_hnsw_indexes
+
+Revision ID: 7c2d9a41b8e3
+Revises: e4f17b18e062
+Create Date: 2025-12-18 10:12:44.183022
+
+e4f17b18e062에서 삭제된 idx_coordis_embedding(ivfflat) 대신
+(gender, season) 조합별 HNSW 부분 인덱스를 생성합니다.
+HNSW 인덱스는 pgvector 0.5.0 이상이 필요합니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '7c2d9a41b8e3'
+down_revision: Union[str, None] = 'e4f17b18e062'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+GENDERS = ('male', 'female')
+SEASONS = ('spring', 'summer', 'fall', 'winter')
+
+
+def upgrade() -> None:
+    for gender in GENDERS:
+        for season in SEASONS:
+            op.create_index(
+                f'idx_coordis_embedding_hnsw_{gender}_{season}',
+                'coordis',
+                ['description_embedding'],
+                unique=False,
+                postgresql_using='hnsw',
+                postgresql_ops={'description_embedding': 'vector_cosine_ops'},
+                postgresql_with={'m': 16, 'ef_construction': 64},
+                postgresql_where=sa.text(
+                    f"gender = '{gender}' AND season = '{season}' AND description_embedding IS NOT NULL"
+                ),
+            )
+
+
+def downgrade() -> None:
+    for gender in GENDERS:
+        for season in SEASONS:
+            op.drop_index(f'idx_coordis_embedding_hnsw_{gender}_{season}', table_name='coordis')
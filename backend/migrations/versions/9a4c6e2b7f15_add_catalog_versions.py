@@ -0,0 +1,32 @@
+"""add_catalog_versions
+
+Revision ID: 9a4c6e2b7f15
+Revises: 5d1a7e93c2f4
+Create Date: 2026-01-14 09:12:31.402118
+
+배치 스크립트의 코디/아이템 변경을 API 프로세스의 코디 카드 캐시에 알리는 catalog_versions 테이블을 생성합니다.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = '9a4c6e2b7f15'
+down_revision: Union[str, None] = '5d1a7e93c2f4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'catalog_versions',
+        sa.Column('name', sa.String(length=50), nullable=False, comment='캐시 대상 이름 (예: coordi_cards)'),
+        sa.Column('version', sa.BigInteger(), nullable=False, comment='변경될 때마다 1씩 증가'),
+        sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+        sa.PrimaryKeyConstraint('name'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table('catalog_versions')
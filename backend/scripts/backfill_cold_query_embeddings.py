@@ -0,0 +1,84 @@
+"""
+Cold-Start 쿼리 임베딩 일괄 계산 (backfill_cold_query_embeddings.py)
+
+온보딩을 완료했지만 현재 버전(`cold_query_model_version()`)의 쿼리 임베딩이 저장되지 않은
+사용자들의 쿼리 임베딩을 청크 단위로 계산하여 `user_embeddings`에 저장합니다.
+임베딩 모델이나 계산식이 바뀐 뒤 실행하면 첫 추천 요청에서 계산하는 지연을 없앨 수 있습니다.
+태그 텍스트는 청크마다 `EmbeddingService.encode_many` 한 번으로 인코딩합니다.
+
+사용법:
+    # backend 디렉토리에서 실행
+    python scripts/backfill_cold_query_embeddings.py
+    python scripts/backfill_cold_query_embeddings.py --chunk-size 500 --dry-run
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+
+# Add backend directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from sqlalchemy import select
+
+from app.db.database import SessionLocal
+from app.models.user import User
+from app.models.user_embedding import UserEmbedding
+from app.services.cold_query_embedding import (
+    cold_query_model_version,
+    compute_cold_query_embeddings,
+    store_cold_query_embedding,
+)
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _missing_user_ids(db, version):
+    stored = select(UserEmbedding.user_id).where(UserEmbedding.model_version == version)
+    return db.execute(
+        select(User.user_id)
+        .where(User.has_completed_onboarding.is_(True), User.user_id.not_in(stored))
+        .order_by(User.user_id)
+    ).scalars().all()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill cold-start query embeddings")
+    parser.add_argument("--chunk-size", type=int, default=256, help="한 번에 계산할 사용자 수")
+    parser.add_argument("--dry-run", action="store_true", help="계산만 하고 저장하지 않음")
+    args = parser.parse_args()
+
+    version = cold_query_model_version()
+    db = SessionLocal()
+    try:
+        user_ids = _missing_user_ids(db, version)
+        logger.info(f"{len(user_ids)} users without query embedding version {version}")
+
+        start = time.perf_counter()
+        stored = 0
+        for offset in range(0, len(user_ids), args.chunk_size):
+            chunk = user_ids[offset : offset + args.chunk_size]
+            embeddings = compute_cold_query_embeddings(db, chunk)
+
+            if not args.dry_run:
+                for user_id, embedding in embeddings.items():
+                    if store_cold_query_embedding(db, user_id, embedding) is not None:
+                        stored += 1
+                db.commit()
+
+            logger.info(f"Processed {offset + len(chunk)}/{len(user_ids)} users")
+
+        elapsed = time.perf_counter() - start
+        rate = len(user_ids) / elapsed if elapsed > 0 else float("inf")
+        logger.info(f"Done: {stored} embeddings stored in {elapsed:.1f}s ({rate:.0f} users/sec)")
+    except Exception:
+        db.rollback()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
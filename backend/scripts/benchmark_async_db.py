@@ -0,0 +1,139 @@
+"""
+비동기 DB 계층 동시 처리량 벤치마크 (benchmark_async_db.py)
+
+하나의 이벤트 루프에서 여러 요청을 동시에 실행하여 다음 세 가지 경로의 처리량(req/s)과 지연 시간을 비교합니다.
+    - blocking: 기존 핸들러처럼 async 함수 안에서 동기 Session으로 쿼리 (이벤트 루프가 막힘)
+    - async:    같은 쿼리를 AsyncSession(asyncpg)으로 실행
+    - service:  실제 비동기 서비스 함수 (get_outfits_list, get_closet_items) 호출
+
+blocking/async 경로는 코디 목록 조회와 같은 쿼리(제외 목록, 개수, 페이지)를 사용합니다.
+--rtt-ms를 지정하면 요청마다 pg_sleep으로 네트워크 왕복 지연(Cloud SQL 등)을 흉내냅니다.
+
+사용법:
+    # backend 디렉토리에서 실행 (DATABASE_URL의 로컬 Postgres, 사용자/코디 데이터가 있어야 함)
+    python scripts/benchmark_async_db.py
+    python scripts/benchmark_async_db.py --requests 500 --concurrency 1 10 50 --rtt-ms 2
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+import numpy as np
+from sqlalchemy import func, select, text
+
+# Add backend directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.database import AsyncSessionLocal, SessionLocal, async_engine, engine
+from app.models.coordi import Coordi
+from app.models.user import User
+from app.models.user_coordi_interaction import UserCoordiInteraction
+from app.models.user_coordi_view_log import UserCoordiViewLog
+from app.services.closet_service import get_closet_items
+from app.services.outfits_service import get_outfits_list
+
+
+def _statements(excluded_ids, limit: int = 20):
+    """코디 목록 조회 경로가 실행하는 쿼리들."""
+    query = select(Coordi.coordi_id)
+    count_query = select(func.count(Coordi.coordi_id))
+    if excluded_ids:
+        query = query.where(Coordi.coordi_id.notin_(excluded_ids))
+        count_query = count_query.where(Coordi.coordi_id.notin_(excluded_ids))
+    return count_query, query.order_by(Coordi.created_at.desc()).limit(limit)
+
+
+def _exclusion_queries(user_id: int):
+    return (
+        select(UserCoordiViewLog.coordi_id).where(UserCoordiViewLog.user_id == user_id),
+        select(UserCoordiInteraction.coordi_id).where(UserCoordiInteraction.user_id == user_id),
+    )
+
+
+async def _blocking_request(user_id: int, rtt: float) -> None:
+    with SessionLocal() as db:
+        if rtt:
+            db.execute(text("SELECT pg_sleep(:s)"), {"s": rtt})
+        viewed_query, interacted_query = _exclusion_queries(user_id)
+        excluded = set(db.execute(viewed_query).scalars().all()) | set(db.execute(interacted_query).scalars().all())
+        count_query, page_query = _statements(excluded)
+        db.execute(count_query).scalar_one()
+        db.execute(page_query).scalars().all()
+
+
+async def _async_request(user_id: int, rtt: float) -> None:
+    async with AsyncSessionLocal() as db:
+        if rtt:
+            await db.execute(text("SELECT pg_sleep(:s)"), {"s": rtt})
+        viewed_query, interacted_query = _exclusion_queries(user_id)
+        excluded = set((await db.execute(viewed_query)).scalars().all())
+        excluded |= set((await db.execute(interacted_query)).scalars().all())
+        count_query, page_query = _statements(excluded)
+        (await db.execute(count_query)).scalar_one()
+        (await db.execute(page_query)).scalars().all()
+
+
+async def _service_request(user_id: int, rtt: float) -> None:
+    async with AsyncSessionLocal() as db:
+        if rtt:
+            await db.execute(text("SELECT pg_sleep(:s)"), {"s": rtt})
+        await get_outfits_list(db, user_id, page=1, limit=20)
+        await get_closet_items(db, user_id, page=1, limit=20)
+
+
+MODES = {
+    "blocking": _blocking_request,
+    "async": _async_request,
+    "service": _service_request,
+}
+
+
+async def _run(mode: str, user_ids, num_requests: int, concurrency: int, rtt: float):
+    request = MODES[mode]
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+
+    async def _one(i: int) -> None:
+        async with semaphore:
+            start = time.perf_counter()
+            await request(user_ids[i % len(user_ids)], rtt)
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(_one(i) for i in range(num_requests)))
+    elapsed = time.perf_counter() - start
+    return num_requests / elapsed, np.percentile(latencies, 50), np.percentile(latencies, 95)
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Async DB layer throughput benchmark")
+    parser.add_argument("--requests", type=int, default=300)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 10, 50])
+    parser.add_argument("--users", type=int, default=50, help="요청에 사용할 사용자 수")
+    parser.add_argument("--rtt-ms", type=float, default=0.0, help="요청당 추가 DB 왕복 지연 (pg_sleep)")
+    parser.add_argument("--modes", nargs="+", default=list(MODES), choices=list(MODES))
+    args = parser.parse_args()
+
+    async with AsyncSessionLocal() as db:
+        user_ids = (await db.execute(select(User.user_id).order_by(User.user_id).limit(args.users))).scalars().all()
+    if not user_ids:
+        print("사용자 데이터가 없습니다. scripts/seed_data.py로 먼저 데이터를 생성하세요.")
+        return
+
+    rtt = args.rtt_ms / 1000
+    print(f"users={len(user_ids)}, requests={args.requests}, rtt={args.rtt_ms} ms")
+    print(f"{'mode':9s} {'conc':>5s} {'req/s':>9s} {'p50 ms':>9s} {'p95 ms':>9s}")
+    for concurrency in args.concurrency:
+        for mode in args.modes:
+            await _run(mode, user_ids, min(args.requests, 20), concurrency, rtt)  # warm-up (커넥션 풀)
+            throughput, p50, p95 = await _run(mode, user_ids, args.requests, concurrency, rtt)
+            print(f"{mode:9s} {concurrency:5d} {throughput:9.1f} {p50:9.2f} {p95:9.2f}")
+
+    await async_engine.dispose()
+    engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,137 @@
+"""
+Night BPR 학습 처리량 벤치마크 (benchmark_bpr_training.py)
+
+합성 상호작용 데이터(기본 2,000,000건)로 기존 학습 루프와 텐서 기반 학습 루프(`app/ml/bpr_trainer.py`)의
+처리량(interactions/sec)을 비교합니다.
+
+    - legacy:   기존 NightModelTrainer.train 루프 (튜플 리스트 셔플, 리스트 컴프리헨션 배치,
+                negative를 하나씩 np.random.randint, sigmoid 확률을 로짓으로 역변환, dense Adam)
+    - vectorized: train_bpr (int64 텐서, 에폭 단위 negative 샘플링 + positive 제외, 로짓 BPR, SparseAdam)
+
+기존 루프는 전체 에폭을 돌리면 너무 오래 걸리므로 --legacy-batches 개 배치만 실행해 처리량을 측정합니다.
+vectorized 모드에서는 negative 샘플 중 positive와 겹친 비율도 함께 출력합니다.
+
+사용법:
+    # backend 디렉토리에서 실행
+    python scripts/benchmark_bpr_training.py
+    python scripts/benchmark_bpr_training.py --interactions 5000000 --users 500000 --items 100000 --batch-sizes 64 1024
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import torch
+
+# Add backend directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.ml.bpr_trainer import NegativeSampler, train_bpr
+from app.ml.neumf_model import NeMF
+
+
+def _synthetic_interactions(num_interactions: int, num_users: int, num_items: int, seed: int):
+    """인기도가 치우친(Zipf 유사) 아이템 분포의 (user_idx, item_idx) positive 쌍."""
+    rng = np.random.default_rng(seed)
+    users = rng.integers(0, num_users, num_interactions, dtype=np.int64)
+    items = np.minimum(rng.zipf(1.2, num_interactions) - 1, num_items - 1).astype(np.int64)
+    items = rng.permutation(num_items)[items]  # 인기 아이템을 인덱스 전체에 흩어 놓음
+    return torch.from_numpy(users), torch.from_numpy(items)
+
+
+def _legacy_loop(model: NeMF, train_data: list, num_items: int, batch_size: int, num_batches: int) -> float:
+    """
+    기존 NightModelTrainer.train 학습 루프 (num_batches개 배치만). 걸린 시간(초)을 반환합니다.
+    에폭마다 하는 전체 셔플 시간은 실행한 배치 비율만큼만 포함합니다.
+    """
+    optimizer = torch.optim.Adam(model.parameters(), lr=0.001)
+    model.train()
+
+    start = time.perf_counter()
+    np.random.shuffle(train_data)
+    shuffle_seconds = (time.perf_counter() - start) * min(num_batches * batch_size / len(train_data), 1.0)
+
+    start = time.perf_counter()
+    for i in range(num_batches):
+        batch = train_data[i * batch_size : (i + 1) * batch_size]
+        u_batch = [x[0] for x in batch]
+        i_batch = [x[1] for x in batch]
+
+        j_batch = []
+        for _ in range(len(batch)):
+            j_batch.append(np.random.randint(0, num_items))
+
+        u_tensor = torch.tensor(u_batch, dtype=torch.long)
+        i_tensor = torch.tensor(i_batch, dtype=torch.long)
+        j_tensor = torch.tensor(j_batch, dtype=torch.long)
+
+        pos_probs = torch.clamp(model.forward(u_tensor, i_tensor), min=1e-7, max=1.0 - 1e-7)
+        neg_probs = torch.clamp(model.forward(u_tensor, j_tensor), min=1e-7, max=1.0 - 1e-7)
+        pos_scores = torch.log(pos_probs / (1 - pos_probs))
+        neg_scores = torch.log(neg_probs / (1 - neg_probs))
+        loss = -torch.mean(torch.log(torch.sigmoid(pos_scores - neg_scores) + 1e-10))
+
+        optimizer.zero_grad()
+        loss.backward()
+        optimizer.step()
+        loss.item()
+
+    return time.perf_counter() - start + shuffle_seconds
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Night BPR training throughput benchmark")
+    parser.add_argument("--interactions", type=int, default=2_000_000)
+    parser.add_argument("--users", type=int, default=200_000)
+    parser.add_argument("--items", type=int, default=50_000)
+    parser.add_argument("--embedding-dim", type=int, default=64)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[64, 1024])
+    parser.add_argument("--epochs", type=int, default=1, help="vectorized 모드 에폭 수")
+    parser.add_argument("--legacy-batches", type=int, default=200, help="legacy 모드에서 실행할 배치 수")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    torch.manual_seed(args.seed)
+    np.random.seed(args.seed)
+    users, items = _synthetic_interactions(args.interactions, args.users, args.items, args.seed)
+    print(
+        f"interactions={args.interactions:,}, users={args.users:,}, items={args.items:,}, "
+        f"dim={args.embedding_dim}, torch_threads={torch.get_num_threads()}"
+    )
+
+    # 기존 루프 입력 형식 (튜플 리스트)
+    train_data = list(zip(users.tolist(), items.tolist()))
+
+    print(f"{'batch':>6} | {'mode':10s} | {'interactions':>12} | {'seconds':>8} | {'inter/s':>12} | {'speedup':>7}")
+    print("-" * 70)
+    for batch_size in args.batch_sizes:
+        model = NeMF(args.users, args.items, embedding_dim=args.embedding_dim)
+        num_batches = min(args.legacy_batches, len(train_data) // batch_size)
+        legacy_seconds = _legacy_loop(model, train_data, args.items, batch_size, num_batches)
+        legacy_rate = num_batches * batch_size / legacy_seconds
+        print(
+            f"{batch_size:6d} | {'legacy':10s} | {num_batches * batch_size:12,d} | "
+            f"{legacy_seconds:8.2f} | {legacy_rate:12,.0f} | {'1.0x':>7}"
+        )
+
+        model = NeMF(args.users, args.items, embedding_dim=args.embedding_dim, sparse=True)
+        stats = train_bpr(model, users, items, args.items, epochs=args.epochs, batch_size=batch_size, seed=args.seed)
+        print(
+            f"{batch_size:6d} | {'vectorized':10s} | {stats.num_interactions * stats.epochs:12,d} | "
+            f"{stats.seconds:8.2f} | {stats.interactions_per_second:12,.0f} | "
+            f"{stats.interactions_per_second / legacy_rate:6.1f}x"
+        )
+
+    # negative 샘플 품질: positive와 겹친 비율 (기존 방식은 제외하지 않음)
+    sampler = NegativeSampler(users, items, args.items, torch.Generator().manual_seed(args.seed))
+    uniform = torch.randint(0, args.items, users.shape, dtype=torch.int64)
+    sampled = sampler.sample(users)
+    print(
+        f"positive collisions: uniform={sampler.is_positive(users, uniform).float().mean().item():.4%}, "
+        f"sampler={sampler.is_positive(users, sampled).float().mean().item():.4%}"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""
+임베딩 추론 백엔드 비교 (benchmark_embedding_backends.py)
+
+`data/final_data_*.json`의 코디 description을 각 추론 백엔드(torch / int8 / onnx)로 인코딩하여
+fp32(torch) 모델 대비 코사인 유사도(parity), 배치/단건 인코딩 지연 시간, 프로세스 RSS를 비교합니다.
+RSS가 서로 섞이지 않도록 백엔드마다 별도 프로세스에서 모델을 로드합니다.
+
+사용법:
+    # backend 디렉토리에서 실행
+    python scripts/benchmark_embedding_backends.py
+    python scripts/benchmark_embedding_backends.py --backends torch int8 --limit 500 --min-cosine 0.99
+
+최소 코사인 유사도가 --min-cosine 보다 낮은 백엔드가 있으면 종료 코드 1을 반환합니다.
+"""
+import argparse
+import glob
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+# Add backend directory to path to import app modules
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(BACKEND_DIR)
+
+
+def _rss_mb() -> float:
+    """현재 프로세스의 RSS (MB, Linux /proc 기준)"""
+    with open("/proc/self/statm") as f:
+        resident_pages = int(f.read().split()[1])
+    return resident_pages * os.sysconf("SC_PAGE_SIZE") / (1024 * 1024)
+
+
+def _load_descriptions(limit: int) -> list:
+    descriptions = []
+    for path in sorted(glob.glob(os.path.join(BACKEND_DIR, "data", "final_data_*.json"))):
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, list):
+            continue
+        descriptions.extend(c["description"] for c in data if isinstance(c, dict) and c.get("description"))
+    return descriptions[:limit] if limit else descriptions
+
+
+def _run_worker(args) -> None:
+    """하나의 백엔드로 모델을 로드/인코딩하고 결과를 --output(.npy)과 stdout(JSON)으로 남깁니다."""
+    import torch
+
+    torch.set_num_threads(args.threads)
+    rss_before = _rss_mb()
+
+    from app.services.embedding_service import load_embedding_model
+
+    start = time.perf_counter()
+    model = load_embedding_model(args.worker)
+    load_s = time.perf_counter() - start
+    rss_model = _rss_mb()
+
+    descriptions = _load_descriptions(args.limit)
+    model.encode(descriptions[:8], normalize_embeddings=True, show_progress_bar=False)  # warm-up
+
+    start = time.perf_counter()
+    embeddings = model.encode(
+        descriptions, batch_size=args.batch_size, normalize_embeddings=True, show_progress_bar=False
+    )
+    batch_s = time.perf_counter() - start
+
+    single_ms = []
+    for text in descriptions[: args.single]:
+        start = time.perf_counter()
+        model.encode([text], normalize_embeddings=True, show_progress_bar=False)
+        single_ms.append((time.perf_counter() - start) * 1000)
+
+    np.save(args.output, np.asarray(embeddings, dtype=np.float32))
+    print(json.dumps({
+        "load_s": load_s,
+        "model_rss_mb": rss_model - rss_before,
+        "peak_rss_mb": _rss_mb(),
+        "texts_per_s": len(descriptions) / batch_s,
+        "single_p50_ms": float(np.percentile(single_ms, 50)) if single_ms else 0.0,
+        "single_p95_ms": float(np.percentile(single_ms, 95)) if single_ms else 0.0,
+    }))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Embedding inference backend parity & benchmark")
+    parser.add_argument("--backends", nargs="+", default=["torch", "int8", "onnx"])
+    parser.add_argument("--limit", type=int, default=0, help="사용할 description 수 (0: 전체)")
+    parser.add_argument("--batch-size", type=int, default=64)
+    parser.add_argument("--single", type=int, default=100, help="단건 인코딩 지연 시간 측정 횟수")
+    parser.add_argument("--threads", type=int, default=1, help="torch 스레드 수 (Cloud Run vCPU 수에 맞춤)")
+    parser.add_argument("--min-cosine", type=float, default=0.98, help="fp32 대비 허용 최소 코사인 유사도")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    parser.add_argument("--output", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        _run_worker(args)
+        return
+
+    backends = ["torch"] + [b for b in args.backends if b != "torch"]
+    print(f"descriptions={len(_load_descriptions(args.limit))}, threads={args.threads}, batch_size={args.batch_size}")
+
+    stats, embeddings = {}, {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for backend in backends:
+            output = os.path.join(tmp, f"{backend}.npy")
+            cmd = [
+                sys.executable, os.path.abspath(__file__),
+                "--worker", backend, "--output", output,
+                "--limit", str(args.limit), "--batch-size", str(args.batch_size),
+                "--single", str(args.single), "--threads", str(args.threads),
+            ]
+            proc = subprocess.run(cmd, capture_output=True, text=True)
+            if proc.returncode != 0:
+                print(f"[{backend}] failed:\n{proc.stderr}")
+                continue
+            stats[backend] = json.loads(proc.stdout.strip().splitlines()[-1])
+            embeddings[backend] = np.load(output)
+
+    if "torch" not in embeddings:
+        print("fp32(torch) 기준 모델 로드 실패")
+        sys.exit(1)
+
+    reference = embeddings["torch"]
+    failed = False
+    print(f"{'backend':8s} {'model RSS':>10s} {'peak RSS':>10s} {'texts/s':>9s} {'p50 ms':>8s} {'p95 ms':>8s} {'cos min':>8s} {'cos mean':>9s}")
+    for backend, s in stats.items():
+        # 정규화된 벡터이므로 행별 내적이 곧 코사인 유사도
+        cosine = np.sum(embeddings[backend] * reference, axis=1)
+        failed |= bool(cosine.min() < args.min_cosine)
+        print(
+            f"{backend:8s} {s['model_rss_mb']:8.0f}MB {s['peak_rss_mb']:8.0f}MB {s['texts_per_s']:9.1f} "
+            f"{s['single_p50_ms']:8.2f} {s['single_p95_ms']:8.2f} {cosine.min():8.4f} {cosine.mean():9.4f}"
+        )
+
+    if failed:
+        print(f"FAIL: cosine similarity below {args.min_cosine}")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Night 임베딩 저장 방식 벤치마크 (benchmark_embedding_writes.py)
+
+기존 코디(coordis)에 대해 임시 모델 버전(기본 'bench_v1')의 아이템 임베딩을 저장하며 처리량(rows/sec)을 비교합니다.
+    - orm:  기존 NightModelTrainer._upsert_item 방식 (행마다 db.get 후 ORM add/update, .tolist() 변환)
+    - bulk: app/services/embedding_writer.write_embeddings (바이너리 COPY + INSERT ... ON CONFLICT)
+
+bulk 모드는 같은 벡터를 한 번 더 저장하여 변경되지 않은 행이 갱신되지 않는지(written=0)도 확인합니다.
+모든 쓰기는 하나의 트랜잭션 안에서 실행하고 마지막에 롤백하므로 DB에 남지 않습니다.
+
+사용법:
+    # backend 디렉토리에서 실행 (DATABASE_URL의 DB에 코디 데이터가 있어야 함)
+    python scripts/benchmark_embedding_writes.py
+    python scripts/benchmark_embedding_writes.py --rows 20000 --orm-rows 2000
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+from sqlalchemy import select
+
+# Add backend directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.database import SessionLocal
+from app.models.coordi import Coordi
+from app.models.item_embedding import ItemEmbedding
+from app.services.embedding_writer import ITEM_EMBEDDINGS, write_embeddings
+
+EMBEDDING_DIM = 512
+
+
+def _orm_upsert(db, coordi_ids, vectors, model_version: str) -> float:
+    """기존 방식: 행마다 db.get + ORM add/update. 걸린 시간(초)을 반환합니다."""
+    start = time.perf_counter()
+    vectors = vectors.tolist()
+    for coordi_id, vector in zip(coordi_ids.tolist(), vectors):
+        embedding = db.get(ItemEmbedding, (coordi_id, model_version))
+        if not embedding:
+            db.add(ItemEmbedding(coordi_id=coordi_id, model_version=model_version, vector=vector))
+        else:
+            embedding.vector = vector
+    db.flush()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Night embedding write benchmark (ORM vs COPY)")
+    parser.add_argument("--rows", type=int, default=50_000, help="bulk 모드로 저장할 최대 행 수 (코디 수 이내)")
+    parser.add_argument("--orm-rows", type=int, default=5_000, help="orm 모드로 저장할 행 수")
+    parser.add_argument("--model-version", default="bench_v1")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        coordi_ids = np.array(
+            db.execute(select(Coordi.coordi_id).order_by(Coordi.coordi_id).limit(args.rows)).scalars().all(),
+            dtype=np.int64,
+        )
+        if len(coordi_ids) == 0:
+            print("코디 데이터가 없습니다. scripts/load_coordis.py로 먼저 데이터를 생성하세요.")
+            return
+
+        rng = np.random.default_rng(0)
+        vectors = rng.normal(scale=0.01, size=(len(coordi_ids), EMBEDDING_DIM)).astype(np.float32)
+        print(f"rows={len(coordi_ids)}, dim={EMBEDDING_DIM}, model_version={args.model_version}")
+        print(f"{'mode':16s} {'rows':>8s} {'written':>8s} {'seconds':>8s} {'rows/s':>10s}")
+
+        orm_rows = min(args.orm_rows, len(coordi_ids))
+        seconds = _orm_upsert(db, coordi_ids[:orm_rows], vectors[:orm_rows], f"{args.model_version}_orm")
+        print(f"{'orm':16s} {orm_rows:8d} {orm_rows:8d} {seconds:8.2f} {orm_rows / seconds:10,.0f}")
+
+        for label, batch in (("bulk (insert)", vectors), ("bulk (unchanged)", vectors)):
+            stats = write_embeddings(db, ITEM_EMBEDDINGS, args.model_version, coordi_ids, batch)
+            print(
+                f"{label:16s} {stats.copied:8d} {stats.written:8d} {stats.seconds:8.2f} "
+                f"{stats.rows_per_second:10,.0f}"
+            )
+
+        vectors[::2] += 0.01
+        stats = write_embeddings(db, ITEM_EMBEDDINGS, args.model_version, coordi_ids, vectors)
+        print(
+            f"{'bulk (50% diff)':16s} {stats.copied:8d} {stats.written:8d} {stats.seconds:8.2f} "
+            f"{stats.rows_per_second:10,.0f}"
+        )
+    finally:
+        # 저장한 벤치마크 임베딩 폐기
+        db.rollback()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,112 @@
+"""
+ID 매핑 벤치마크 (benchmark_id_index.py)
+
+체크포인트 형식의 문자열 키 딕셔너리({str(id): index})와 배열 기반 IdIndex(app/ml/id_index.py)를
+Warm 서빙 경로의 사용 패턴으로 비교합니다. DB ID는 실제처럼 듬성듬성한(sparse) 값으로 생성합니다.
+
+    - memory: 매핑 + 역변환 배열이 차지하는 메모리 (dict: tracemalloc, IdIndex: 배열 nbytes)
+    - build: 체크포인트 딕셔너리에서 매핑을 만드는 시간 (dict는 그대로 사용하므로 생략)
+    - get: ID 하나 조회 (추천 요청마다 유저 인덱스 조회)
+    - seen: 이미 본 코디 목록 일괄 변환 (--seen개)
+    - page: 결과 페이지의 인덱스 -> ID 역변환 (--page개, 두 방식 모두 배열 인덱싱)
+
+사용법:
+    # backend 디렉토리에서 실행
+    python scripts/benchmark_id_index.py
+    python scripts/benchmark_id_index.py --sizes 1000000 5000000 --seen 1000 --page 500
+"""
+import argparse
+import os
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+# Add backend directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.ml.id_index import IdIndex
+
+
+def _per_call_us(fn, repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="dict vs IdIndex ID mapping benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000_000, 5_000_000])
+    parser.add_argument("--seen", type=int, default=1000, help="이미 본 코디 ID 수")
+    parser.add_argument("--page", type=int, default=500, help="역변환할 인덱스 수")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    print(f"seen={args.seen}, page={args.page}")
+    print(f"{'ids':>9} | {'mapping':7} | {'memory MB':>9} | {'build s':>7} | {'get us':>6} | {'seen us':>8} | {'page us':>8}")
+    print("-" * 75)
+    for size in args.sizes:
+        # 인덱스 순서의 sparse DB ID (평균 간격 8)
+        ids = np.cumsum(rng.integers(1, 16, size=size, dtype=np.int64))
+        rng.shuffle(ids)
+        id_list = ids.tolist()
+
+        # 기존 방식: 딕셔너리 + 역변환 배열 (build_index_to_coordi와 같은 방식으로 생성)
+        tracemalloc.start()
+        mapping = {str(db_id): idx for idx, db_id in enumerate(id_list)}
+        legacy_reverse = np.full(size, -1, dtype=np.int64)
+        for key, idx in mapping.items():
+            if key.isdigit():
+                legacy_reverse[idx] = int(key)
+        dict_mb = tracemalloc.get_traced_memory()[0] / 1e6
+        tracemalloc.stop()
+
+        start = time.perf_counter()
+        index = IdIndex.from_mapping(mapping, size)
+        build_seconds = time.perf_counter() - start
+        index_mb = (index.ids.nbytes + index.indices.nbytes + index.index_to_id.nbytes) / 1e6
+
+        # 절반은 없는 ID
+        query = rng.choice(ids, size=args.seen)
+        query[::2] += 10**12
+        query_list = query.tolist()
+        page = rng.integers(0, size, size=args.page)
+        page_list = page.tolist()
+        one = id_list[size // 2]
+
+        def dict_get():
+            key = str(one)
+            return mapping[key] if key in mapping else None
+
+        def dict_seen():
+            return [mapping[key] for key in map(str, query_list) if key in mapping]
+
+        def dict_page():
+            return legacy_reverse[np.array(page_list, dtype=np.int64)]
+
+        assert sorted(dict_seen()) == sorted(index.lookup(query)[index.lookup(query) >= 0].tolist())
+        assert dict_get() == index.get(one)
+
+        rows = (
+            ("dict", dict_mb, float("nan"), dict_get, dict_seen, dict_page),
+            (
+                "IdIndex", index_mb, build_seconds,
+                lambda: index.get(one),
+                lambda: index.lookup(np.array(query_list, dtype=np.int64)),
+                lambda: index.to_ids(np.array(page_list, dtype=np.int64)),
+            ),
+        )
+        for name, memory_mb, build, get, seen, to_page in rows:
+            print(
+                f"{size:9,d} | {name:7} | {memory_mb:9.1f} | {build:7.2f} | "
+                f"{_per_call_us(get, args.repeat * 10):6.2f} | {_per_call_us(seen, args.repeat):8.1f} | "
+                f"{_per_call_us(to_page, args.repeat):8.1f}"
+            )
+        del mapping, index, legacy_reverse
+
+
+if __name__ == "__main__":
+    main()
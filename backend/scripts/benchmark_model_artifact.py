@@ -0,0 +1,132 @@
+"""
+모델 로드 방식 벤치마크 (benchmark_model_artifact.py)
+
+합성 NeMF 체크포인트를 만들어 Warm 서비스의 두 가지 로드 방식을 비교합니다.
+    - torch: torch.load(.pth) + NeMFScoringEngine.from_checkpoint (문자열 키 딕셔너리, 힙에 복사)
+    - mmap:  ModelArtifact.load(serving/) (np.load(mmap_mode="r"), 파일 페이지를 그대로 사용)
+
+각 방식은 새 프로세스에서 측정합니다.
+    - load: 로드 시간 (mmap은 유저 수와 무관해야 함)
+    - first: 로드 직후 첫 스코어링(유저 한 명) 시간
+    - anon MB: 프로세스 전용 메모리 (RssAnon, 워커마다 따로 차지)
+    - file MB: 파일 페이지 (RssFile, 같은 파일을 연 워커끼리 OS 페이지 캐시를 공유)
+
+사용법:
+    # backend 디렉토리에서 실행
+    python scripts/benchmark_model_artifact.py
+    python scripts/benchmark_model_artifact.py --users 100000 1000000 --items 50000 --embedding-dim 128
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+import torch
+
+# Add backend directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.ml.model_artifact import ModelArtifact, convert_checkpoint
+from app.ml.neumf_model import NeMF
+from app.ml.scoring_engine import NeMFScoringEngine
+
+
+def _memory_mb() -> dict:
+    """현재 프로세스의 RssAnon / RssFile (MB, Linux)."""
+    usage = {"anon": float("nan"), "file": float("nan")}
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith("RssAnon:"):
+                    usage["anon"] = int(line.split()[1]) / 1024
+                elif line.startswith("RssFile:"):
+                    usage["file"] = int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return usage
+
+
+def _child(mode: str, path: str) -> None:
+    """새 프로세스에서 한 가지 방식으로 로드하고 결과를 JSON 한 줄로 출력합니다."""
+    before = _memory_mb()
+    start = time.perf_counter()
+    if mode == "torch":
+        checkpoint = torch.load(path, map_location="cpu")
+        user_idx = checkpoint["user_id_to_index"]["1"]
+        engine = NeMFScoringEngine.from_checkpoint(checkpoint)
+        del checkpoint
+    else:
+        artifact = ModelArtifact.load(path)
+        user_idx = artifact.user_index.get(1)
+        engine = artifact.engine
+    load_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    engine.score(engine.user_vector(user_idx))
+    first_seconds = time.perf_counter() - start
+
+    after = _memory_mb()
+    print(json.dumps({
+        "load": load_seconds,
+        "first": first_seconds,
+        "anon": after["anon"] - before["anon"],
+        "file": after["file"] - before["file"],
+    }))
+
+
+def _run_child(mode: str, path: Path) -> dict:
+    output = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", mode, str(path)],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Warm model load benchmark (torch.load vs memmap artifact)")
+    parser.add_argument("--users", type=int, nargs="+", default=[10_000, 100_000, 500_000])
+    parser.add_argument("--items", type=int, default=20_000)
+    parser.add_argument("--embedding-dim", type=int, default=128)
+    parser.add_argument("--user-dtype", choices=["float32", "float16"], default="float32")
+    parser.add_argument("--child", nargs=2, metavar=("MODE", "PATH"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        _child(*args.child)
+        return
+
+    print(f"items={args.items:,}, dim={args.embedding_dim}, user_dtype={args.user_dtype}")
+    print(f"{'users':>9} | {'mode':5} | {'load s':>7} | {'first ms':>8} | {'anon MB':>8} | {'file MB':>8}")
+    print("-" * 62)
+    with tempfile.TemporaryDirectory() as tmp:
+        for num_users in args.users:
+            model = NeMF(num_users, args.items, embedding_dim=args.embedding_dim)
+            checkpoint_path = Path(tmp) / f"model_{num_users}.pth"
+            torch.save({
+                "model_state_dict": model.state_dict(),
+                "user_id_to_index": {str(uid): uid - 1 for uid in range(1, num_users + 1)},
+                "item_id_to_index": {str(iid): iid - 1 for iid in range(1, args.items + 1)},
+                "num_users": num_users,
+                "num_items": args.items,
+                "embedding_dim": args.embedding_dim,
+            }, checkpoint_path)
+            del model
+            artifact_dir = convert_checkpoint(checkpoint_path, Path(tmp) / f"serving_{num_users}", user_dtype=args.user_dtype)
+
+            for mode, path in (("torch", checkpoint_path), ("mmap", artifact_dir)):
+                r = _run_child(mode, path)
+                print(
+                    f"{num_users:9,d} | {mode:5} | {r['load']:7.3f} | {r['first'] * 1000:8.1f} | "
+                    f"{r['anon']:8.1f} | {r['file']:8.1f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
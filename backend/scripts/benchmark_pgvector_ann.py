@@ -0,0 +1,201 @@
+"""
+pgvector ANN 인덱스 벤치마크 (benchmark_pgvector_ann.py)
+
+합성 코디 카탈로그(기본 1M개, 512차원)를 별도 벤치마크 테이블에 적재하고,
+마이그레이션과 동일한 (gender, season)별 HNSW 부분 인덱스를 생성한 뒤
+Cold-Start 쿼리 형태(성별/계절 필터 + 제외 목록 + 코사인 거리 정렬)로
+정확한 전수 스캔 대비 Recall@K와 지연 시간을 비교합니다.
+
+ANN 경로는 `PgVectorIndex._apply_search_settings`와 같은 방식으로
+hnsw.ef_search / hnsw.iterative_scan을 설정합니다.
+
+사용법:
+    # backend 디렉토리에서 실행 (DATABASE_URL의 DB에 bench_coordis 테이블을 생성)
+    python scripts/benchmark_pgvector_ann.py
+    python scripts/benchmark_pgvector_ann.py --rows 200000 --queries 50 --ef-search 40 100 200
+    python scripts/benchmark_pgvector_ann.py --reuse --exclude 500   # 이미 적재된 테이블 재사용
+
+주의: 1M x 512차원 적재와 HNSW 인덱스 생성에는 수 GB의 디스크와 수십 분이 걸릴 수 있습니다.
+      maintenance_work_mem을 충분히 크게 (예: 2GB) 설정하는 것을 권장합니다.
+"""
+import argparse
+import io
+import os
+import sys
+import time
+
+import numpy as np
+
+# Add backend directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.database import engine
+from app.models.coordi import (
+    COORDI_GENDERS,
+    COORDI_SEASONS,
+    EMBEDDING_HNSW_EF_CONSTRUCTION,
+    EMBEDDING_HNSW_M,
+)
+
+TABLE = "bench_coordis"
+
+
+def _vector_literal(vector: np.ndarray) -> str:
+    return "[" + ",".join(f"{x:.6f}" for x in vector) + "]"
+
+
+def _load_catalog(conn, rows: int, dim: int, rng: np.random.Generator, topics: np.ndarray, chunk: int = 20_000) -> None:
+    with conn.cursor() as cur:
+        cur.execute("CREATE EXTENSION IF NOT EXISTS vector")
+        cur.execute(f"DROP TABLE IF EXISTS {TABLE}")
+        cur.execute(
+            f"CREATE TABLE {TABLE} ("
+            "coordi_id BIGINT PRIMARY KEY, gender TEXT NOT NULL, season TEXT NOT NULL, "
+            f"description_embedding vector({dim}))"
+        )
+    conn.commit()
+
+    start = time.perf_counter()
+    for offset in range(0, rows, chunk):
+        n = min(chunk, rows - offset)
+        vectors = topics[rng.integers(0, len(topics), n)] + 0.6 * rng.normal(size=(n, dim)).astype(np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        genders = rng.integers(0, len(COORDI_GENDERS), n)
+        seasons = rng.integers(0, len(COORDI_SEASONS), n)
+
+        buffer = io.StringIO()
+        for i in range(n):
+            buffer.write(
+                f"{offset + i + 1}\t{COORDI_GENDERS[genders[i]]}\t{COORDI_SEASONS[seasons[i]]}\t"
+                f"{_vector_literal(vectors[i])}\n"
+            )
+        buffer.seek(0)
+        with conn.cursor() as cur:
+            cur.copy_expert(f"COPY {TABLE} (coordi_id, gender, season, description_embedding) FROM STDIN", buffer)
+        conn.commit()
+        print(f"  loaded {offset + n}/{rows} rows ({time.perf_counter() - start:.0f}s)", end="\r")
+    print()
+
+    start = time.perf_counter()
+    with conn.cursor() as cur:
+        for gender in COORDI_GENDERS:
+            for season in COORDI_SEASONS:
+                cur.execute(
+                    f"CREATE INDEX {TABLE}_hnsw_{gender}_{season} ON {TABLE} "
+                    "USING hnsw (description_embedding vector_cosine_ops) "
+                    f"WITH (m = {EMBEDDING_HNSW_M}, ef_construction = {EMBEDDING_HNSW_EF_CONSTRUCTION}) "
+                    f"WHERE gender = '{gender}' AND season = '{season}' AND description_embedding IS NOT NULL"
+                )
+                conn.commit()
+        cur.execute(f"ANALYZE {TABLE}")
+    conn.commit()
+    print(f"  built {len(COORDI_GENDERS) * len(COORDI_SEASONS)} HNSW partial indexes in {time.perf_counter() - start:.0f}s")
+
+
+def _search(conn, query: str, gender: str, season: str, exclude: list, limit: int, settings: dict) -> tuple[list, float]:
+    """Cold-Start 쿼리 형태로 검색하고 (coordi_id 리스트, 지연 시간 ms)를 반환합니다."""
+    with conn.cursor() as cur:
+        for name, value in settings.items():
+            cur.execute("SELECT set_config(%s, %s, true)", (name, str(value)))
+
+        sql = (
+            f"SELECT coordi_id FROM {TABLE} "
+            "WHERE gender = %s AND season = %s AND description_embedding IS NOT NULL "
+        )
+        params = [gender, season]
+        if exclude:
+            sql += "AND coordi_id NOT IN %s "
+            params.append(tuple(exclude))
+        sql += "ORDER BY description_embedding <=> %s::vector LIMIT %s"
+        params.extend([query, limit])
+
+        start = time.perf_counter()
+        cur.execute(sql, params)
+        result = [row[0] for row in cur.fetchall()]
+        elapsed = (time.perf_counter() - start) * 1000
+    conn.rollback()  # set_config(..., true)는 트랜잭션 종료 시 초기화
+    return result, elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="pgvector HNSW partial index benchmark")
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--dim", type=int, default=512)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--limit", type=int, default=20, help="페이지 크기 (Recall@K의 K)")
+    parser.add_argument("--exclude", type=int, default=200, help="쿼리당 제외할 코디 수")
+    parser.add_argument("--ef-search", type=int, nargs="+", default=[40, 100, 200, 400])
+    parser.add_argument("--iterative-scan", type=str, default="strict_order", help="off이면 iterative scan 미사용")
+    parser.add_argument("--reuse", action="store_true", help="기존 bench_coordis 테이블 재사용")
+    parser.add_argument("--keep", action="store_true", help="종료 후 테이블 유지")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    topics = rng.normal(size=(256, args.dim)).astype(np.float32)
+
+    conn = engine.raw_connection()
+    try:
+        if not args.reuse:
+            print(f"Loading synthetic catalog: rows={args.rows}, dim={args.dim}")
+            _load_catalog(conn, args.rows, args.dim, rng, topics)
+
+        # 쿼리 및 제외 목록 준비 (제외 목록은 해당 파티션의 임의 코디)
+        workload = []
+        with conn.cursor() as cur:
+            for _ in range(args.queries):
+                gender = COORDI_GENDERS[rng.integers(0, len(COORDI_GENDERS))]
+                season = COORDI_SEASONS[rng.integers(0, len(COORDI_SEASONS))]
+                query = topics[rng.integers(0, len(topics))] + 0.6 * rng.normal(size=args.dim).astype(np.float32)
+                query /= np.linalg.norm(query)
+                cur.execute(
+                    f"SELECT coordi_id FROM {TABLE} WHERE gender = %s AND season = %s "
+                    "ORDER BY random() LIMIT %s",
+                    (gender, season, args.exclude),
+                )
+                exclude = [row[0] for row in cur.fetchall()]
+                workload.append((_vector_literal(query), gender, season, exclude))
+        conn.rollback()
+
+        # 1. 정확한 전수 스캔 (인덱스 스캔 비활성화)
+        exact_settings = {"enable_indexscan": "off"}
+        expected, exact_ms = [], []
+        for query, gender, season, exclude in workload:
+            result, elapsed = _search(conn, query, gender, season, exclude, args.limit, exact_settings)
+            expected.append(set(result))
+            exact_ms.append(elapsed)
+
+        print(f"rows={args.rows}, queries={args.queries}, limit={args.limit}, exclude={args.exclude}")
+        print(f"{'mode':>24} | {'p50(ms)':>8} | {'p95(ms)':>8} | {'recall@' + str(args.limit):>10} | {'short':>5}")
+        print("-" * 68)
+        print(f"{'exact scan':>24} | {np.percentile(exact_ms, 50):>8.2f} | {np.percentile(exact_ms, 95):>8.2f} | {1.0:>10.3f} | {0:>5}")
+
+        # 2. HNSW 부분 인덱스 (ef_search별)
+        for ef_search in args.ef_search:
+            for iterative in ("off", args.iterative_scan) if args.iterative_scan != "off" else ("off",):
+                settings = {"hnsw.ef_search": ef_search}
+                if iterative != "off":
+                    settings["hnsw.iterative_scan"] = iterative
+
+                latencies, recalls, short = [], [], 0
+                for (query, gender, season, exclude), truth in zip(workload, expected):
+                    result, elapsed = _search(conn, query, gender, season, exclude, args.limit, settings)
+                    latencies.append(elapsed)
+                    recalls.append(len(truth & set(result)) / max(len(truth), 1))
+                    short += len(result) < len(truth)
+
+                label = f"hnsw ef={ef_search}" + (f" +{iterative}" if iterative != "off" else "")
+                print(
+                    f"{label:>24} | {np.percentile(latencies, 50):>8.2f} | {np.percentile(latencies, 95):>8.2f} | "
+                    f"{np.mean(recalls):>10.3f} | {short:>5}"
+                )
+        print("(short: LIMIT보다 적은 결과를 반환한 쿼리 수)")
+    finally:
+        if not args.keep:
+            with conn.cursor() as cur:
+                cur.execute(f"DROP TABLE IF EXISTS {TABLE}")
+            conn.commit()
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
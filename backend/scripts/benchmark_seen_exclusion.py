@@ -0,0 +1,152 @@
+"""
+"이미 본 코디" 제외 방식 벤치마크 (benchmark_seen_exclusion.py)
+
+조회 로그가 많은 사용자(기본 50,000건)를 만들어 코디 목록/임시 추천 쿼리의 제외 방식을 비교합니다.
+    - not_in:    조회/상호작용 coordi_id를 모두 Python으로 읽어 `NOT IN (...)` 리터럴로 개수/페이지 쿼리에 전달 (기존 방식)
+    - anti_join: `unseen_by(user_id)` (NOT EXISTS) 조건으로 DB 안에서 제외
+
+두 방식의 결과(전체 개수, 페이지 coordi_id)가 같은지 확인한 뒤 요청당 지연 시간(p50/p95)을 출력합니다.
+조회 로그는 하나의 트랜잭션 안에서 삽입하고 마지막에 롤백하므로 DB에 남지 않습니다.
+
+사용법:
+    # backend 디렉토리에서 실행 (DATABASE_URL의 DB에 사용자/코디 데이터가 있어야 함)
+    python scripts/benchmark_seen_exclusion.py
+    python scripts/benchmark_seen_exclusion.py --view-logs 50000 100000 --repeat 30 --explain
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+from sqlalchemy import func, select, text
+
+# Add backend directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.db.database import SessionLocal
+from app.models.coordi import Coordi
+from app.models.user import User
+from app.models.user_coordi_interaction import UserCoordiInteraction
+from app.models.user_coordi_view_log import UserCoordiViewLog
+from app.services.seen_filter import unseen_by
+
+
+def _insert_view_logs(db, user_id: int, num_logs: int) -> None:
+    """기존 코디를 무작위 순서로 반복하여 사용자 조회 로그 num_logs건을 삽입합니다."""
+    db.execute(
+        text(
+            "INSERT INTO user_coordi_view_logs (user_id, coordi_id, duration_seconds) "
+            "SELECT :user_id, a.ids[1 + (g % array_length(a.ids, 1))], 5 "
+            "FROM generate_series(1, :num_logs) AS g, "
+            "(SELECT array_agg(coordi_id ORDER BY random()) AS ids FROM coordis) AS a"
+        ),
+        {"user_id": user_id, "num_logs": num_logs},
+    )
+    db.execute(text("ANALYZE user_coordi_view_logs"))
+
+
+def _not_in(db, user_id: int, gender, limit: int):
+    viewed = db.execute(
+        select(UserCoordiViewLog.coordi_id).where(UserCoordiViewLog.user_id == user_id)
+    ).scalars().all()
+    interacted = db.execute(
+        select(UserCoordiInteraction.coordi_id).where(UserCoordiInteraction.user_id == user_id)
+    ).scalars().all()
+    excluded = set(viewed) | set(interacted)
+
+    conditions = [Coordi.gender == gender] if gender else []
+    if excluded:
+        conditions.append(Coordi.coordi_id.notin_(excluded))
+    total = db.execute(select(func.count(Coordi.coordi_id)).where(*conditions)).scalar_one()
+    page = db.execute(
+        select(Coordi.coordi_id).where(*conditions)
+        .order_by(Coordi.created_at.desc(), Coordi.coordi_id.desc()).limit(limit)
+    ).scalars().all()
+    return total, list(page), len(excluded)
+
+
+def _anti_join(db, user_id: int, gender, limit: int):
+    conditions = [Coordi.gender == gender] if gender else []
+    conditions.append(unseen_by(user_id))
+    total = db.execute(select(func.count(Coordi.coordi_id)).where(*conditions)).scalar_one()
+    page = db.execute(
+        select(Coordi.coordi_id).where(*conditions)
+        .order_by(Coordi.created_at.desc(), Coordi.coordi_id.desc()).limit(limit)
+    ).scalars().all()
+    return total, list(page), 0
+
+
+MODES = {
+    "not_in": _not_in,
+    "anti_join": _anti_join,
+}
+
+
+def _explain(db, user_id: int, gender, limit: int) -> None:
+    conditions = [Coordi.gender == gender] if gender else []
+    conditions.append(unseen_by(user_id))
+    query = (
+        select(Coordi.coordi_id).where(*conditions)
+        .order_by(Coordi.created_at.desc(), Coordi.coordi_id.desc()).limit(limit)
+    )
+    compiled = query.compile(db.get_bind(), compile_kwargs={"literal_binds": True})
+    for (line,) in db.execute(text(f"EXPLAIN (ANALYZE, BUFFERS) {compiled}")):
+        print(f"    {line}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Seen-coordi exclusion benchmark (NOT IN vs NOT EXISTS)")
+    parser.add_argument("--user-id", type=int, help="벤치마크에 사용할 사용자 (기본: 첫 번째 사용자)")
+    parser.add_argument("--view-logs", type=int, nargs="+", default=[50_000], help="사용자에게 추가할 조회 로그 수")
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--explain", action="store_true", help="anti_join 쿼리의 EXPLAIN ANALYZE 출력")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        user = db.get(User, args.user_id) if args.user_id else db.execute(
+            select(User).order_by(User.user_id).limit(1)
+        ).scalar_one_or_none()
+        if user is None:
+            print("사용자 데이터가 없습니다. scripts/seed_data.py로 먼저 데이터를 생성하세요.")
+            return
+        num_coordis = db.execute(select(func.count(Coordi.coordi_id))).scalar_one()
+        print(f"user_id={user.user_id}, gender={user.gender}, coordis={num_coordis}, repeat={args.repeat}")
+        print(f"{'view logs':>10s} {'mode':10s} {'excluded':>9s} {'p50 ms':>9s} {'p95 ms':>9s}")
+
+        added = 0
+        for num_logs in sorted(args.view_logs):
+            _insert_view_logs(db, user.user_id, num_logs - added)
+            added = num_logs
+
+            expected = None
+            for mode, run in MODES.items():
+                run(db, user.user_id, user.gender, args.limit)  # warm-up
+                latencies = []
+                for _ in range(args.repeat):
+                    start = time.perf_counter()
+                    total, page, excluded = run(db, user.user_id, user.gender, args.limit)
+                    latencies.append((time.perf_counter() - start) * 1000)
+
+                if expected is None:
+                    expected = (total, page)
+                elif (total, page) != expected:
+                    print(f"MISMATCH: {mode} returned total={total} (expected {expected[0]})")
+
+                print(
+                    f"{num_logs:10d} {mode:10s} {excluded or '-':>9} "
+                    f"{np.percentile(latencies, 50):9.2f} {np.percentile(latencies, 95):9.2f}"
+                )
+
+            if args.explain:
+                _explain(db, user.user_id, user.gender, args.limit)
+    finally:
+        # 삽입한 조회 로그 폐기
+        db.rollback()
+        db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+In-process 벡터 인덱스 벤치마크 (benchmark_vector_index.py)
+
+합성 코디 임베딩으로 `InMemoryVectorIndex`(파티션별 IVF)를 구성하고,
+전수 비교(정확한 코사인 유사도 정렬) 대비 검색 지연 시간과 Recall@K를 측정합니다.
+DB 없이 실행됩니다.
+
+사용법:
+    # backend 디렉토리에서 실행
+    python scripts/benchmark_vector_index.py
+    python scripts/benchmark_vector_index.py --coordis 200000 --queries 200 --exclude 300
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+# Add backend directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.services.vector_index import InMemoryVectorIndex
+
+GENDERS = ["male", "female"]
+SEASONS = ["spring", "summer", "fall", "winter"]
+
+
+def _synthetic_catalog(num_coordis: int, dim: int, rng: np.random.Generator):
+    # 실제 문장 임베딩처럼 군집 구조를 갖도록 토픽 중심 주변에 샘플링
+    topics = rng.normal(size=(256, dim)).astype(np.float32)
+    vectors = topics[rng.integers(0, len(topics), num_coordis)] + 0.6 * rng.normal(size=(num_coordis, dim)).astype(np.float32)
+    ids = np.arange(1, num_coordis + 1, dtype=np.int64)
+    genders = np.array(GENDERS, dtype=object)[rng.integers(0, len(GENDERS), num_coordis)]
+    seasons = np.array(SEASONS, dtype=object)[rng.integers(0, len(SEASONS), num_coordis)]
+    return ids, genders, seasons, vectors, topics
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="In-process vector index benchmark")
+    parser.add_argument("--coordis", type=int, default=100_000)
+    parser.add_argument("--dim", type=int, default=512)
+    parser.add_argument("--queries", type=int, default=100)
+    parser.add_argument("--limit", type=int, default=20, help="페이지 크기 (Recall@K의 K)")
+    parser.add_argument("--exclude", type=int, default=100, help="쿼리당 제외할 코디 수")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(0)
+    ids, genders, seasons, vectors, topics = _synthetic_catalog(args.coordis, args.dim, rng)
+
+    start = time.perf_counter()
+    index = InMemoryVectorIndex.from_arrays(ids, genders, seasons, vectors)
+    print(f"coordis={args.coordis}, dim={args.dim}, build={(time.perf_counter() - start) * 1000:.0f} ms")
+
+    normalized = vectors / np.linalg.norm(vectors, axis=1, keepdims=True)
+
+    ivf_ms, exact_ms, recalls = [], [], []
+    for _ in range(args.queries):
+        gender, season = rng.choice(GENDERS), rng.choice(SEASONS)
+        query = topics[rng.integers(0, len(topics))] + 0.6 * rng.normal(size=args.dim).astype(np.float32)
+        query /= np.linalg.norm(query)
+
+        mask = (genders == gender) & (seasons == season)
+        exclude = rng.choice(ids[mask], size=min(args.exclude, int(mask.sum())), replace=False)
+
+        start = time.perf_counter()
+        result, _ = index.search(None, query, gender, season, 0, args.limit, exclude)
+        ivf_ms.append((time.perf_counter() - start) * 1000)
+
+        # 정확한 결과 (전수 비교)
+        start = time.perf_counter()
+        candidates = mask & ~np.isin(ids, exclude)
+        scores = normalized[candidates] @ query
+        expected = ids[candidates][np.argsort(scores)[::-1][: args.limit]]
+        exact_ms.append((time.perf_counter() - start) * 1000)
+
+        recalls.append(len(set(result) & set(expected.tolist())) / max(len(expected), 1))
+
+    print(f"in-process index : p50={np.percentile(ivf_ms, 50):.3f} ms, p95={np.percentile(ivf_ms, 95):.3f} ms")
+    print(f"exact (numpy)    : p50={np.percentile(exact_ms, 50):.3f} ms, p95={np.percentile(exact_ms, 95):.3f} ms")
+    print(f"recall@{args.limit}        : {np.mean(recalls):.3f}")
+
+
+if __name__ == "__main__":
+    main()
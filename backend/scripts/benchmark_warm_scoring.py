@@ -0,0 +1,103 @@
+"""
+Warm-Start 스코어링 벤치마크 (benchmark_warm_scoring.py)
+
+기존 추론 경로(유저 인덱스를 아이템 수만큼 복제하여 `NeMF.forward` 전체 실행)와
+Factorized 엔진(`NeMFScoringEngine.score`)의 요청당 CPU 시간을 비교합니다.
+두 경로의 점수가 동일한지도 함께 확인합니다.
+
+사용법:
+    # backend 디렉토리에서 실행
+    python scripts/benchmark_warm_scoring.py
+    python scripts/benchmark_warm_scoring.py --sizes 10000 100000 --repeat 5
+
+주의: 1M 아이템 / 512차원 기준 기존 경로는 요청당 수 GB의 임시 텐서를 만듭니다.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+import torch
+
+# Add backend directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.ml.neumf_model import NeMF
+from app.ml.scoring_engine import NeMFScoringEngine
+
+
+def _forward_path(model: NeMF, user_idx: int) -> np.ndarray:
+    """기존 WarmRecommendationService.recommend의 추론 경로."""
+    num_items = model.item_embedding.num_embeddings
+    user_tensor = torch.tensor([user_idx] * num_items, dtype=torch.long)
+    item_tensor = torch.tensor(list(range(num_items)), dtype=torch.long)
+    with torch.no_grad():
+        return model(user_tensor, item_tensor).numpy()
+
+
+def _engine_path(engine: NeMFScoringEngine, user_vector: np.ndarray) -> np.ndarray:
+    return engine.score(user_vector)
+
+
+def _time(fn, repeat: int) -> float:
+    """repeat 회 실행한 뒤 중앙값(ms)을 반환합니다."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) * 1000)
+    return float(np.median(timings))
+
+
+def run_benchmark(sizes, embedding_dim: int, repeat: int, skip_forward_above: int) -> None:
+    torch.manual_seed(0)
+    print(f"embedding_dim={embedding_dim}, repeat={repeat}, torch_threads={torch.get_num_threads()}")
+    print(f"{'items':>10} | {'forward(ms)':>12} | {'engine(ms)':>11} | {'speedup':>8} | {'max|diff|':>10}")
+    print("-" * 64)
+
+    for num_items in sizes:
+        model = NeMF(num_users=4, num_items=num_items, embedding_dim=embedding_dim).eval()
+
+        build_start = time.perf_counter()
+        engine = NeMFScoringEngine.from_model(model)
+        build_ms = (time.perf_counter() - build_start) * 1000
+
+        user_idx = 1
+        user_vector = model.user_embedding.weight[user_idx].detach().numpy()
+
+        engine_ms = _time(lambda: _engine_path(engine, user_vector), repeat)
+
+        if num_items > skip_forward_above:
+            print(f"{num_items:>10} | {'skipped':>12} | {engine_ms:>11.2f} | {'-':>8} | {'-':>10}")
+        else:
+            forward_ms = _time(lambda: _forward_path(model, user_idx), repeat)
+            diff = np.abs(_forward_path(model, user_idx) - _engine_path(engine, user_vector)).max()
+            speedup = forward_ms / engine_ms if engine_ms > 0 else float("inf")
+            print(
+                f"{num_items:>10} | {forward_ms:>12.2f} | {engine_ms:>11.2f} | "
+                f"{speedup:>7.1f}x | {diff:>10.2e}"
+            )
+        print(f"{'':>10}   (engine build at load_model: {build_ms:.1f} ms)")
+
+        del model, engine
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="NeMF forward vs factorized engine benchmark")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--dim", type=int, default=512, help="임베딩 차원")
+    parser.add_argument("--repeat", type=int, default=5, help="사이즈별 반복 횟수")
+    parser.add_argument(
+        "--skip-forward-above",
+        type=int,
+        default=10_000_000,
+        help="이 값보다 큰 아이템 수에서는 기존 forward 경로를 생략 (메모리 부족 방지)",
+    )
+    args = parser.parse_args()
+
+    run_benchmark(args.sizes, args.dim, args.repeat, args.skip_forward_above)
+
+
+if __name__ == "__main__":
+    main()
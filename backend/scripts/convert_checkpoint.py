@@ -0,0 +1,79 @@
+"""
+Night 모델 체크포인트 -> 서빙 아티팩트 변환 (convert_checkpoint.py)
+
+torch 체크포인트(.pth)를 memmap으로 여는 서빙 아티팩트 디렉토리(`app/ml/model_artifact.py`)로 변환합니다.
+서빙 아티팩트 도입 전에 발행된 버전도 변환해 두면 Warm 서비스가 torch.load 대신 memmap으로 엽니다.
+
+사용법:
+    # backend 디렉토리에서 실행
+    # 현재 서빙 버전 디렉토리에 serving/ 추가 (이미 있으면 --force로 다시 생성)
+    python scripts/convert_checkpoint.py
+    python scripts/convert_checkpoint.py --user-dtype float16 --force
+
+    # 특정 체크포인트를 지정한 디렉토리로 변환
+    python scripts/convert_checkpoint.py --checkpoint path/to/neumf_night_model.pth --output data/serving
+"""
+import argparse
+import logging
+import os
+import sys
+import time
+
+# Add backend directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.ml.model_artifact import (
+    MODEL_ARTIFACT_DIRNAME,
+    MODEL_ARTIFACT_USER_DTYPE,
+    ModelArtifact,
+    convert_checkpoint,
+)
+from app.ml.model_registry import get_model_registry
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Convert a NeMF checkpoint into a memory-mappable serving artifact")
+    parser.add_argument("--checkpoint", type=str, default=None, help="체크포인트 경로 (기본: 현재 서빙 버전)")
+    parser.add_argument("--output", type=str, default=None, help="출력 디렉토리 (--checkpoint와 함께 사용)")
+    parser.add_argument("--user-dtype", choices=["float32", "float16"], default=MODEL_ARTIFACT_USER_DTYPE)
+    parser.add_argument("--force", action="store_true", help="이미 변환된 버전도 다시 생성")
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    if args.checkpoint:
+        if not args.output:
+            parser.error("--checkpoint를 지정하면 --output도 지정해야 합니다.")
+        path = convert_checkpoint(args.checkpoint, args.output, user_dtype=args.user_dtype)
+    else:
+        registry = get_model_registry()
+        version = registry.current_version()
+        checkpoint_path = registry.checkpoint_path(version)
+        if checkpoint_path is None:
+            logger.error("No published model found.")
+            sys.exit(1)
+        if version.startswith("legacy-"):
+            logger.error("Legacy (unversioned) checkpoint cannot store artifacts. Use --checkpoint/--output.")
+            sys.exit(1)
+        if not args.force and registry.artifact_path(MODEL_ARTIFACT_DIRNAME, version) is not None:
+            logger.info(f"Model version {version} already has a serving artifact. Use --force to rebuild.")
+            return
+
+        path = registry.write_artifact(
+            version,
+            MODEL_ARTIFACT_DIRNAME,
+            lambda tmp_path: convert_checkpoint(checkpoint_path, tmp_path, user_dtype=args.user_dtype),
+        )
+
+    artifact = ModelArtifact.load(path)
+    logger.info(
+        f"Converted in {time.perf_counter() - start:.1f}s -> {path} "
+        f"(users={artifact.meta['num_users']}, items={artifact.meta['num_items']}, "
+        f"user_dtype={artifact.meta['user_dtype']})"
+    )
+
+
+if __name__ == "__main__":
+    main()
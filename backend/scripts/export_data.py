@@ -17,7 +17,6 @@
 import sys
 import os
 import csv
-import numpy as np
 import traceback
 
 # Add backend directory to path to import app modules
@@ -28,76 +27,20 @@ from app.db.database import SessionLocal
 from app.models.user_coordi_interaction import UserCoordiInteraction
 from app.models.user_coordi_view_log import UserCoordiViewLog
 from app.models.coordi import Coordi
-from app.models.user_preferred_tag import UserPreferredTag
-from app.models.tag import Tag
-from app.services.embedding_service import EmbeddingService
+from app.services.cold_query_embedding import compute_cold_query_embeddings, load_cold_query_embeddings
 
-def calculate_user_embedding(db, user_id, embedding_service):
+def calculate_user_embeddings(db, user_ids):
     """
-    recommendations_service.py의 _get_cold_recommended_coordi_ids 로직을 참고하여
-    query_embedding(user_embedding)을 계산합니다.
+    Cold-Start 추천과 동일한 query_embedding(user_embedding)을 사용자별로 반환합니다.
+    선호도 저장 시 계산된 벡터가 있으면 그대로 사용하고, 없는 사용자만 모아서
+    태그 텍스트를 일괄 인코딩합니다 (DB에는 저장하지 않음).
     """
-    # 1. 사용자의 선호 태그 조회
-    preferred_tags = db.execute(
-        select(Tag)
-        .join(UserPreferredTag, Tag.tag_id == UserPreferredTag.tag_id)
-        .where(UserPreferredTag.user_id == user_id)
-    ).scalars().all()
-    
-    # 태그 텍스트 합치기
-    hashtags_text = " ".join([tag.name for tag in preferred_tags])
-    
-    # 2. 사용자가 선택한 샘플 코디 조회 (action_type='preference')
-    preference_interactions = db.execute(
-        select(UserCoordiInteraction)
-        .where(
-            UserCoordiInteraction.user_id == user_id,
-            UserCoordiInteraction.action_type == "preference",
-        )
-    ).scalars().all()
-    
-    sample_coordi_ids = [interaction.coordi_id for interaction in preference_interactions]
-    
-    # 3. 선택한 코디들의 description_embedding 합산
-    if sample_coordi_ids:
-        sample_embeddings = db.execute(
-            select(Coordi.description_embedding)
-            .where(Coordi.coordi_id.in_(sample_coordi_ids))
-            .where(Coordi.description_embedding.isnot(None))
-        ).scalars().all()
-        
-        embeddings = []
-        for embedding in sample_embeddings:
-            if embedding is not None:
-                # Vector 타입을 리스트로 변환
-                embedding_list = list(embedding)
-                embeddings.append(np.array(embedding_list, dtype=float))
-        
-        if embeddings:
-            image_embedding_sum = np.sum(embeddings, axis=0)
-        else:
-            image_embedding_sum = np.zeros(512)
-    else:
-        image_embedding_sum = np.zeros(512)
-    
-    # 4. 태그 임베딩 생성
-    if hashtags_text:
-        # EmbeddingService의 generate_embedding 메소드 사용
-        # recommendations_service.py: np.array(embedding_service.generate_embedding(hashtags_text), dtype=float)
-        hashtags_embedding = np.array(embedding_service.generate_embedding(hashtags_text), dtype=float)
-    else:
-        hashtags_embedding = np.zeros(512)
-    
-    # 5. 쿼리 임베딩 생성 (text_weight=10.0)
-    text_weight = 10.0
-    query_embedding = hashtags_embedding + image_embedding_sum * text_weight
-    
-    # 정규화
-    norm = np.linalg.norm(query_embedding)
-    if norm > 0:
-        query_embedding = query_embedding / norm
-        
-    return query_embedding.tolist()
+    embeddings = load_cold_query_embeddings(db, user_ids)
+    missing = [user_id for user_id in user_ids if user_id not in embeddings]
+    if missing:
+        print(f"Calculating embeddings for {len(missing)} users...")
+        embeddings.update(compute_cold_query_embeddings(db, missing))
+    return {user_id: embedding.tolist() for user_id, embedding in embeddings.items()}
 
 def format_embedding(embedding_list):
     """임베딩 리스트를 문자열로 변환"""
@@ -107,19 +50,14 @@ def format_embedding(embedding_list):
 
 def export_data():
     db = SessionLocal()
-    embedding_service = None
     
     try:
-        print("Initializing EmbeddingService (this may take a while)...")
-        embedding_service = EmbeddingService()
-        
         print("Exporting data to CSV...")
 
         # 1. Export user_outfit_interaction.csv
         # 임베딩 값은 별도의 CSV 파일(table)로 분리
         
         # Caches
-        user_embedding_cache = {}
         outfit_embedding_cache = {}
 
         # Coordi 테이블과 조인하여 바로 outfit_embedding 가져오기
@@ -132,6 +70,10 @@ def export_data():
         total_count = len(results)
         print(f"Found {total_count} interactions. Processing...")
 
+        # User Embedding은 상호작용이 있는 유저 전체를 한 번에 계산
+        user_ids = sorted({interaction.user_id for interaction, _ in results})
+        user_embedding_cache = calculate_user_embeddings(db, user_ids)
+
         with open('user_outfit_interaction.csv', 'w', newline='') as csvfile:
             # 임베딩 컬럼 제거
             fieldnames = ['user_id', 'outfit_id', 'interaction']
@@ -142,12 +84,6 @@ def export_data():
                 user_id = interaction.user_id
                 outfit_id = interaction.coordi_id
                 
-                # Retrieve or calculate User Embedding
-                if user_id not in user_embedding_cache:
-                    if len(user_embedding_cache) % 10 == 0:
-                        print(f"Calculating embedding for User {user_id}...")
-                    user_embedding_cache[user_id] = calculate_user_embedding(db, user_id, embedding_service)
-                
                 # Cache Outfit Embedding
                 if outfit_id not in outfit_embedding_cache:
                     outfit_emb_list = list(outfit_emb_vec) if outfit_emb_vec is not None else [0.0]*512
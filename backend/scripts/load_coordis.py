@@ -25,6 +25,7 @@ from app.models.coordi_item import CoordiItem
 from app.models.item import Item
 from app.models.item_image import ItemImage
 from app.models.item_image import ItemImage
+from app.services.coordi_card_cache import bump_coordi_catalog_version
 
 
 # 카테고리 변환: 한국어 -> 영어
@@ -358,6 +359,11 @@ def load_coordis_from_json(json_file_path: str) -> None:
                 traceback.print_exc()
                 print("-" * 50)
         
+        # 실행 중인 API 서버의 코디 카드 캐시 무효화 (catalog_versions 버전 증가)
+        if success_count:
+            bump_coordi_catalog_version(db)
+            db.commit()
+        
         # 결과 요약
         print(f"\n{'='*50}")
         print(f"완료: {success_count}개 성공, {error_count}개 실패, {skipped_count}개 스킵됨")
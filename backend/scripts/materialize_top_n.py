@@ -0,0 +1,118 @@
+"""
+유저별 Top-N 추천 일괄 계산 (materialize_top_n.py)
+
+Night 모델 체크포인트로 지정한 유저들의 Top-N 추천을 배치/멀티 프로세스로 계산합니다.
+결과는 .npz(`MaterializedTopN` 형식) 또는 .csv(user_id, rank, coordi_id, score)로 저장하거나,
+`--publish` 옵션으로 현재 모델 버전 디렉토리에 저장하여 서빙에 바로 사용할 수 있습니다.
+
+사용법:
+    # backend 디렉토리에서 실행
+    # 현재 서빙 모델 버전의 모든 유저를 계산하여 버전 디렉토리에 저장 (Night 작업과 동일)
+    python scripts/materialize_top_n.py --publish
+
+    # 특정 유저 목록만 계산하여 CSV로 저장
+    python scripts/materialize_top_n.py --users 1 2 3 --top-n 100 --output data/topn.csv
+    python scripts/materialize_top_n.py --users-file data/user_ids.txt --workers 8 --output data/topn.npz
+
+    # 특정 체크포인트 사용
+    python scripts/materialize_top_n.py --checkpoint path/to/neumf_night_model.pth --output data/topn.npz
+"""
+import argparse
+import csv
+import logging
+import os
+import sys
+
+# Add backend directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.ml.batch_scoring import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_TOP_N,
+    DEFAULT_WORKERS,
+    TOPN_FILENAME,
+    MaterializedTopN,
+    materialize_top_n,
+)
+from app.ml.model_artifact import MODEL_ARTIFACT_DIRNAME
+from app.ml.model_registry import get_model_registry
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+def _read_user_ids(args):
+    if args.users:
+        return args.users
+    if args.users_file:
+        with open(args.users_file, "r", encoding="utf-8") as f:
+            return [line.strip() for line in f if line.strip()]
+    return None
+
+
+def _write_csv(result: MaterializedTopN, path: str) -> None:
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["user_id", "rank", "coordi_id", "score"])
+        for user_id, coordi_ids, scores in zip(result.user_ids, result.coordi_ids, result.scores):
+            rank = 0
+            for coordi_id, score in zip(coordi_ids, scores):
+                if coordi_id < 0:
+                    continue
+                rank += 1
+                writer.writerow([int(user_id), rank, int(coordi_id), f"{float(score):.6f}"])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Batch top-N scoring for NeMF night model")
+    parser.add_argument("--checkpoint", type=str, default=None, help="체크포인트 경로 (기본: 현재 서빙 버전)")
+    parser.add_argument("--users", type=str, nargs="+", default=None, help="계산할 user_id 목록")
+    parser.add_argument("--users-file", type=str, default=None, help="한 줄에 user_id 하나씩 적힌 파일")
+    parser.add_argument("--top-n", type=int, default=DEFAULT_TOP_N)
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="병렬 프로세스 수")
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE, help="한 번에 스코어링할 유저 수")
+    parser.add_argument("--output", type=str, default=None, help="결과 파일 (.npz 또는 .csv)")
+    parser.add_argument("--publish", action="store_true", help="현재 모델 버전 디렉토리에 topn.npz로 저장")
+    args = parser.parse_args()
+
+    if not args.output and not args.publish:
+        parser.error("--output 또는 --publish 중 하나는 지정해야 합니다.")
+
+    registry = get_model_registry()
+    if args.checkpoint:
+        if args.publish:
+            parser.error("--publish는 현재 서빙 버전에만 사용할 수 있습니다 (--checkpoint와 함께 사용 불가).")
+        checkpoint_path = args.checkpoint
+        version = os.path.basename(args.checkpoint)
+    else:
+        version = registry.current_version()
+        checkpoint_path = registry.artifact_path(MODEL_ARTIFACT_DIRNAME, version) or registry.checkpoint_path(version)
+        if checkpoint_path is None:
+            logger.error("No published model found.")
+            sys.exit(1)
+
+    result = materialize_top_n(
+        checkpoint_path,
+        model_version=version,
+        user_ids=_read_user_ids(args),
+        top_n=args.top_n,
+        workers=args.workers,
+        batch_size=args.batch_size,
+    )
+
+    if args.publish:
+        if args.users or args.users_file:
+            logger.warning("Publishing top-N for a subset of users. Other users will be scored online.")
+        path = registry.write_artifact(version, TOPN_FILENAME, result.save)
+        logger.info(f"Published top-N to {path}")
+
+    if args.output:
+        if args.output.endswith(".csv"):
+            _write_csv(result, args.output)
+        else:
+            result.save(args.output)
+        logger.info(f"Saved top-N for {len(result.user_ids)} users to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,149 @@
+"""
+Warm-Start 동시 추론 스트레스 테스트 (stress_warm_inference.py)
+
+수백 명의 사용자 벡터를 여러 스레드에서 동시에 스코어링하고,
+단일 스레드에서 계산한 결과와 점수/순위가 완전히 일치하는지 확인합니다.
+또한 스트레스 테스트 전후로 엔진의 공유 가중치가 변경되지 않았는지 검사합니다.
+
+사용법:
+    # backend 디렉토리에서 실행 (랜덤 초기화 모델 사용)
+    python scripts/stress_warm_inference.py
+    python scripts/stress_warm_inference.py --users 500 --threads 64 --rounds 5
+
+    # 실제 체크포인트 사용
+    python scripts/stress_warm_inference.py --checkpoint data/model_artifacts/neumf_night_model.pth
+
+실패 시 종료 코드 1을 반환합니다.
+"""
+import argparse
+import hashlib
+import os
+import random
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import torch
+
+# Add backend directory to path to import app modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from app.ml.neumf_model import NeMF
+from app.ml.scoring_engine import NeMFScoringEngine, top_k_indices
+
+
+def _build_engine(args) -> NeMFScoringEngine:
+    if args.checkpoint:
+        checkpoint = torch.load(args.checkpoint, map_location="cpu")
+        model = NeMF(
+            num_users=checkpoint["num_users"],
+            num_items=checkpoint["num_items"],
+            embedding_dim=checkpoint["embedding_dim"],
+            hidden_dims=checkpoint.get("hidden_dims", [128]),
+        )
+        model.load_state_dict(checkpoint["model_state_dict"])
+    else:
+        torch.manual_seed(0)
+        model = NeMF(num_users=args.users, num_items=args.items, embedding_dim=args.dim)
+    model.eval()
+    return NeMFScoringEngine.from_model(model)
+
+
+def _fingerprint(engine: NeMFScoringEngine) -> str:
+    """엔진의 공유 가중치 전체에 대한 해시."""
+    digest = hashlib.sha256()
+    arrays = [
+        engine.user_embedding,
+        engine.item_embedding,
+        engine.item_projection,
+        engine.user_projection_weight,
+        engine.gmf_weight,
+        engine.mlp_weight,
+    ]
+    for weight, bias in engine.hidden_layers:
+        arrays.extend([weight, bias])
+    for array in arrays:
+        digest.update(array.tobytes())
+    return digest.hexdigest()
+
+
+def _recommend(engine: NeMFScoringEngine, user_vector: np.ndarray, seen: np.ndarray, k: int):
+    """WarmRecommendationService.recommend의 추론 + 제외 + Top-K 부분."""
+    scores = engine.score(user_vector)
+    scores[seen] = -np.inf
+    return scores, top_k_indices(scores, k)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Concurrent warm inference stress test")
+    parser.add_argument("--checkpoint", type=str, default=None, help="NeMF 체크포인트 경로 (미지정 시 랜덤 모델)")
+    parser.add_argument("--users", type=int, default=300, help="동시 요청할 사용자 수")
+    parser.add_argument("--items", type=int, default=20_000, help="랜덤 모델의 아이템 수")
+    parser.add_argument("--dim", type=int, default=512, help="랜덤 모델의 임베딩 차원")
+    parser.add_argument("--threads", type=int, default=32)
+    parser.add_argument("--rounds", type=int, default=3, help="사용자 전체를 몇 번 반복 요청할지")
+    parser.add_argument("--top-k", type=int, default=200)
+    args = parser.parse_args()
+
+    engine = _build_engine(args)
+    fingerprint_before = _fingerprint(engine)
+
+    rng = np.random.default_rng(42)
+    num_users = min(args.users, engine.num_users) if args.checkpoint else args.users
+
+    # 절반은 Day 임베딩(외부 벡터), 절반은 체크포인트 벡터를 사용하는 요청으로 구성
+    requests = []
+    for user_idx in range(num_users):
+        if user_idx % 2 == 0:
+            user_vector = rng.normal(0, 0.05, engine.embedding_dim).astype(np.float32)
+        else:
+            user_vector = engine.user_vector(user_idx)
+        seen = rng.choice(engine.num_items, size=min(50, engine.num_items), replace=False)
+        requests.append((user_vector, seen))
+
+    # 1. 단일 스레드 기준값
+    start = time.perf_counter()
+    expected = [_recommend(engine, vector, seen, args.top_k) for vector, seen in requests]
+    single_ms = (time.perf_counter() - start) * 1000
+
+    # 2. 멀티 스레드 동시 요청 (순서를 섞어 서로 다른 사용자가 겹치도록)
+    jobs = [i for _ in range(args.rounds) for i in range(num_users)]
+    random.Random(7).shuffle(jobs)
+
+    def _run(i):
+        vector, seen = requests[i]
+        return i, _recommend(engine, vector, seen, args.top_k)
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads) as executor:
+        results = list(executor.map(_run, jobs))
+    concurrent_ms = (time.perf_counter() - start) * 1000
+
+    # 3. 검증
+    mismatches = 0
+    max_diff = 0.0
+    for i, (scores, ranking) in results:
+        expected_scores, expected_ranking = expected[i]
+        finite = np.isfinite(expected_scores)
+        diff = float(np.abs(scores[finite] - expected_scores[finite]).max())
+        max_diff = max(max_diff, diff)
+        if not np.array_equal(np.isfinite(scores), finite) or not np.array_equal(ranking, expected_ranking) or diff > 1e-6:
+            mismatches += 1
+
+    fingerprint_after = _fingerprint(engine)
+
+    print(f"users={num_users}, items={engine.num_items}, threads={args.threads}, requests={len(jobs)}")
+    print(f"single-thread: {single_ms:.1f} ms for {num_users} requests")
+    print(f"concurrent   : {concurrent_ms:.1f} ms for {len(jobs)} requests")
+    print(f"mismatched requests: {mismatches}, max |score diff|: {max_diff:.2e}")
+    print(f"engine weights unchanged: {fingerprint_before == fingerprint_after}")
+
+    if mismatches or fingerprint_before != fingerprint_after:
+        print("FAILED")
+        sys.exit(1)
+    print("OK")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Night 학습 워커 프로세스 진입점.
+
+API 서버(uvicorn)와 별도 프로세스로 실행되어 매일 NIGHT_TRAINING_HOUR:NIGHT_TRAINING_MINUTE(기본 03:00)에
+Night 학습과 Top-N 사전 계산을 실행합니다. torch 학습이 API 요청 처리와 같은 CPU 코어/GIL을 쓰지 않도록
+    - TRAINING_WORKER_CPUS: 사용할 CPU 코어 (예: "2-3", "4,5,6"; 기본: 제한 없음, Linux만 지원)
+    - TRAINING_WORKER_THREADS: torch/BLAS 스레드 수 (기본: 사용할 코어 수)
+    - TRAINING_WORKER_NICE: 프로세스 우선순위 낮춤 정도 (기본 10)
+를 torch/numpy를 불러오기 전에 적용합니다.
+
+여러 워커(또는 NIGHT_TRAINING_IN_PROCESS=true인 API 워커)가 떠 있어도 Postgres advisory lock으로 하나만 학습하며,
+진행 상황은 training_runs 테이블에 기록됩니다 (API: GET /health/training).
+
+사용법:
+    # backend 디렉토리에서 실행
+    python training_worker.py              # 스케줄러 상주
+    python training_worker.py --run-now    # 즉시 한 번 실행 후 종료 (종료 코드: 성공/건너뜀 0, 실패 1)
+"""
+import argparse
+import logging
+import os
+import sys
+from typing import Optional, Set
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+logging.basicConfig(
+    level=logging.INFO,
+    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+    handlers=[
+        logging.StreamHandler(sys.stdout)
+    ]
+)
+logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
+logger = logging.getLogger("training_worker")
+
+# torch/numpy 스레드 풀 크기를 정하는 환경 변수 (라이브러리 import 전에 설정해야 적용됨)
+_THREAD_ENV_VARS = ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS", "NUMEXPR_NUM_THREADS")
+
+
+def parse_cpu_list(spec: str) -> Set[int]:
+    """ "0-3,6" 형식의 CPU 목록을 {0, 1, 2, 3, 6}으로 변환합니다."""
+    cpus: Set[int] = set()
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        if "-" in part:
+            start, end = part.split("-", 1)
+            cpus.update(range(int(start), int(end) + 1))
+        else:
+            cpus.add(int(part))
+    return cpus
+
+
+def configure_process(cpus_spec: str, threads: int, nice: int) -> int:
+    """
+    CPU affinity, 우선순위, 스레드 수 환경 변수를 설정하고 사용할 스레드 수를 반환합니다.
+    torch/numpy를 import하기 전에 호출해야 합니다.
+    """
+    cpus: Optional[Set[int]] = parse_cpu_list(cpus_spec) if cpus_spec else None
+    if cpus:
+        if hasattr(os, "sched_setaffinity"):
+            os.sched_setaffinity(0, cpus)
+            logger.info(f"CPU affinity set to {sorted(cpus)}")
+        else:
+            logger.warning("CPU affinity is not supported on this platform. Ignoring TRAINING_WORKER_CPUS.")
+            cpus = None
+
+    if hasattr(os, "sched_getaffinity"):
+        available = len(os.sched_getaffinity(0))
+    else:
+        available = os.cpu_count() or 1
+    threads = threads if threads > 0 else available
+
+    for name in _THREAD_ENV_VARS:
+        os.environ[name] = str(threads)
+    # Top-N 사전 계산 프로세스 수도 할당된 코어 수를 넘지 않도록
+    os.environ.setdefault("WARM_TOPN_WORKERS", str(available))
+
+    if nice > 0 and hasattr(os, "nice"):
+        os.nice(nice)
+    return threads
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Night training worker")
+    parser.add_argument("--run-now", action="store_true", help="즉시 한 번 실행하고 종료")
+    args = parser.parse_args()
+
+    threads = configure_process(
+        os.getenv("TRAINING_WORKER_CPUS", ""),
+        int(os.getenv("TRAINING_WORKER_THREADS", "0")),
+        int(os.getenv("TRAINING_WORKER_NICE", "10")),
+    )
+
+    import torch
+    torch.set_num_threads(threads)
+    torch.set_num_interop_threads(1)
+    logger.info(f"Training worker started (pid={os.getpid()}, torch_threads={threads})")
+
+    from app.core.scheduler import NIGHT_TRAINING_HOUR, NIGHT_TRAINING_MINUTE
+    from app.services.training_jobs import run_training_job
+
+    if args.run_now:
+        return 1 if run_training_job() == "failed" else 0
+
+    from apscheduler.schedulers.blocking import BlockingScheduler
+    from apscheduler.triggers.cron import CronTrigger
+
+    scheduler = BlockingScheduler()
+    scheduler.add_job(
+        run_training_job,
+        trigger=CronTrigger(hour=NIGHT_TRAINING_HOUR, minute=NIGHT_TRAINING_MINUTE),
+        id="train_night_model",
+        max_instances=1,
+        coalesce=True,
+    )
+    logger.info(f"Night training scheduled at {NIGHT_TRAINING_HOUR:02d}:{NIGHT_TRAINING_MINUTE:02d}.")
+    try:
+        scheduler.start()
+    except (KeyboardInterrupt, SystemExit):
+        logger.info("Training worker stopped.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())